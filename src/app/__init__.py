@@ -51,6 +51,7 @@ from .commands import (
     CommandStatus,
     CommandUndoneEvent,
     CopyFileCommand,
+    CreateDirectoriesCommand,
     CreateDirectoryCommand,
     DeleteFileCommand,
     ICommand,
@@ -293,6 +294,7 @@ __all__ = [
     "CopyFileCommand",
     "DeleteFileCommand",
     "CreateDirectoryCommand",
+    "CreateDirectoriesCommand",
     "BatchFileCommand",
     "CommandInvoker",
     "ICommandInvoker",
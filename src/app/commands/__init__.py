@@ -21,6 +21,7 @@ from .composite_commands import BatchFileOperationCommand, BatchOperationConfig,
 from .file_commands import (
     BatchFileCommand,
     CopyFileCommand,
+    CreateDirectoriesCommand,
     CreateDirectoryCommand,
     DeleteFileCommand,
     MoveFileCommand,
@@ -36,6 +37,7 @@ __all__ = [
     "CopyFileCommand",
     "DeleteFileCommand",
     "CreateDirectoryCommand",
+    "CreateDirectoriesCommand",
     "BatchFileCommand",
     "BatchFileOperationCommand",
     "ConditionalCommand",
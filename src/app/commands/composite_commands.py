@@ -16,10 +16,13 @@ from typing import Any
 from src.app.commands.base_command import BaseCommand, CommandResult
 from src.app.commands.file_commands import (
     CopyFileCommand,
+    CreateDirectoriesCommand,
     CreateDirectoryCommand,
     DeleteFileCommand,
     MoveFileCommand,
 )
+from src.core.utils.directory_batch import DirectoryCache, destination_directories
+from src.core.utils.subtitle_utils import SidecarIndex
 
 
 @dataclass
@@ -56,6 +59,10 @@ class BatchFileOperationCommand(BaseCommand):
         self._total_operations = len(operations)
         self._completed_operations = 0
         self._current_operation = ""
+        # 배치 전체가 공유하는 자막 색인 (원본 디렉토리마다 목록 조회 한 번)
+        self._sidecar_index = SidecarIndex()
+        # 대상 디렉토리는 배치 시작 시 한 번에 만들고 하위 Command는 캐시만 확인
+        self._directory_cache = DirectoryCache()
         self.logger.info(f"배치 파일 작업 Command 생성: {self._total_operations}개 작업")
 
     def _get_default_description(self) -> str:
@@ -88,6 +95,7 @@ class BatchFileOperationCommand(BaseCommand):
                 "started", f"배치 작업 시작: {self._total_operations}개 작업"
             )
         try:
+            self._create_destination_directories()
             for i, operation in enumerate(self.operations):
                 try:
                     self._current_operation = f"작업 {i + 1}/{self._total_operations}: {operation.get('operation_type', 'unknown')}"
@@ -141,6 +149,27 @@ class BatchFileOperationCommand(BaseCommand):
                 self.config.status_callback("failed", f"배치 작업 실패: {e}")
             raise
 
+    def _create_destination_directories(self) -> None:
+        """이동/복사 대상 디렉토리를 얕은 것부터 한 번씩 생성 (하나의 Command로 기록)"""
+        destinations = [
+            operation["destination_path"]
+            for operation in self.operations
+            if operation.get("operation_type") in ("move", "copy")
+            and operation.get("destination_path")
+        ]
+        if not destinations:
+            return
+        command = CreateDirectoriesCommand(
+            destination_directories(destinations), directory_cache=self._directory_cache
+        )
+        result = command.execute()
+        if not result.is_success:
+            error_msg = result.error.message if result.error else "알 수 없는 오류"
+            raise RuntimeError(f"대상 디렉토리 생성 실패: {error_msg}")
+        # 취소할 때 파일을 되돌린 뒤 마지막에 디렉토리를 삭제하도록 가장 먼저 기록
+        self._executed_commands.append(command)
+        self._integrate_command_result(result)
+
     def _create_command_for_operation(self, operation: dict[str, Any]) -> BaseCommand | None:
         """작업에 맞는 Command 생성"""
         try:
@@ -151,16 +180,22 @@ class BatchFileOperationCommand(BaseCommand):
                 return MoveFileCommand(
                     source=source_path,
                     destination=Path(destination_path) if destination_path else source_path,
+                    sidecar_index=self._sidecar_index,
+                    directory_cache=self._directory_cache,
                 )
             if operation_type == "copy":
                 return CopyFileCommand(
                     source=source_path,
                     destination=Path(destination_path) if destination_path else source_path,
+                    sidecar_index=self._sidecar_index,
+                    directory_cache=self._directory_cache,
                 )
             if operation_type == "delete":
                 return DeleteFileCommand(file_path=source_path)
-                if operation_type == "create_directory":
-                    return CreateDirectoryCommand(directory_path=source_path)
+            if operation_type == "create_directory":
+                return CreateDirectoryCommand(
+                    directory_path=source_path, directory_cache=self._directory_cache
+                )
             self.logger.warning(f"지원하지 않는 작업 타입: {operation_type}")
             return None
         except Exception as e:
@@ -8,11 +8,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 import shutil
-from contextlib import suppress
+from collections.abc import Sequence
 from pathlib import Path
 
 from src.app.commands.base_command import BaseCommand, CompositeCommand, ICommand
+from src.core.utils.copy_engine import copy_file, move_file
+from src.core.utils.directory_batch import DirectoryCache, remove_created_directories
 from src.core.utils.subtitle_utils import (
+    SidecarIndex,
     find_subtitle_files,
     get_subtitle_destination_path,
     is_video_file,
@@ -29,12 +32,18 @@ class MoveFileCommand(BaseCommand):
         create_dirs: bool = True,
         overwrite: bool = False,
         move_subtitles: bool = True,
+        sidecar_index: SidecarIndex | None = None,
+        directory_cache: DirectoryCache | None = None,
     ):
         self.source = Path(source)
         self.destination = Path(destination)
         self.create_dirs = create_dirs
         self.overwrite = overwrite
         self.move_subtitles = move_subtitles
+        # 일괄 작업에서 공유하는 자막 색인 (없으면 원본 디렉토리를 한 번 색인)
+        self.sidecar_index = sidecar_index
+        # 일괄 작업에서 공유하는 디렉토리 캐시 (대상 디렉토리는 배치 시작 시 한 번에 생성)
+        self.directory_cache = directory_cache or DirectoryCache()
         super().__init__(f"{self.source.name} → {self.destination}")
 
     def _get_default_description(self) -> str:
@@ -52,9 +61,9 @@ class MoveFileCommand(BaseCommand):
             if self.destination.is_dir():
                 self.logger.error(f"대상이 디렉토리임: {self.destination}")
                 return False
-        if self.create_dirs and not self.destination.parent.exists():
+        if self.create_dirs:
             try:
-                self.destination.parent.mkdir(parents=True, exist_ok=True)
+                self.directory_cache.ensure_parent(self.destination)
             except PermissionError:
                 self.logger.error(f"대상 디렉토리 생성 권한 없음: {self.destination.parent}")
                 return False
@@ -70,14 +79,14 @@ class MoveFileCommand(BaseCommand):
         self._store_undo_data("original_destination", self.destination)
         if self.destination.exists():
             backup_path = self.destination.with_suffix(f"{self.destination.suffix}.backup")
-            shutil.move(str(self.destination), str(backup_path))
+            move_file(str(self.destination), str(backup_path))
             self._store_undo_data("backup_path", backup_path)
         if self.create_dirs:
-            self.destination.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(self.source), str(self.destination))
+            self.directory_cache.ensure_parent(self.destination)
+        move_file(str(self.source), str(self.destination))
         moved_subtitles = []
         if self.move_subtitles and is_video_file(self.source):
-            subtitle_files = find_subtitle_files(self.source)
+            subtitle_files = find_subtitle_files(self.source, self.sidecar_index)
             for subtitle_file in subtitle_files:
                 try:
                     subtitle_dest = get_subtitle_destination_path(
@@ -85,9 +94,11 @@ class MoveFileCommand(BaseCommand):
                     )
                     if subtitle_dest.exists():
                         backup_path = subtitle_dest.with_suffix(f"{subtitle_dest.suffix}.backup")
-                        shutil.move(str(subtitle_dest), str(backup_path))
+                        move_file(str(subtitle_dest), str(backup_path))
                         self._store_undo_data(f"subtitle_backup_{subtitle_file}", backup_path)
-                    shutil.move(subtitle_file, subtitle_dest)
+                    move_file(subtitle_file, subtitle_dest)
+                    if self.sidecar_index is not None:
+                        self.sidecar_index.discard(subtitle_file)
                     moved_subtitles.append((subtitle_file, subtitle_dest))
                     self.logger.debug(f"자막 파일 이동: {subtitle_file} -> {subtitle_dest}")
                 except Exception as e:
@@ -107,13 +118,13 @@ class MoveFileCommand(BaseCommand):
         backup_path = self._get_undo_data("backup_path")
         moved_subtitles = self._get_undo_data("moved_subtitles", [])
         if self.destination.exists():
-            shutil.move(str(self.destination), str(original_source))
+            move_file(str(self.destination), str(original_source))
         if backup_path and backup_path.exists():
-            shutil.move(str(backup_path), str(original_destination))
+            move_file(str(backup_path), str(original_destination))
         for subtitle_src, subtitle_dest in moved_subtitles:
             try:
                 if subtitle_dest.exists():
-                    shutil.move(str(subtitle_dest), str(subtitle_src))
+                    move_file(str(subtitle_dest), str(subtitle_src))
                     self.logger.debug(f"자막 파일 복원: {subtitle_dest} -> {subtitle_src}")
             except Exception as e:
                 self.logger.warning(f"자막 파일 복원 실패: {subtitle_dest} - {e}")
@@ -125,7 +136,7 @@ class MoveFileCommand(BaseCommand):
                     subtitle_dest = get_subtitle_destination_path(
                         original_source, original_destination, subtitle_src
                     )
-                    shutil.move(str(subtitle_backup), str(subtitle_dest))
+                    move_file(str(subtitle_backup), str(subtitle_dest))
                     self.logger.debug(f"자막 파일 백업 복원: {subtitle_backup} -> {subtitle_dest}")
                 except Exception as e:
                     self.logger.warning(f"자막 파일 백업 복원 실패: {subtitle_backup} - {e}")
@@ -141,12 +152,16 @@ class CopyFileCommand(BaseCommand):
         create_dirs: bool = True,
         overwrite: bool = False,
         copy_subtitles: bool = True,
+        sidecar_index: SidecarIndex | None = None,
+        directory_cache: DirectoryCache | None = None,
     ):
         self.source = Path(source)
         self.destination = Path(destination)
         self.create_dirs = create_dirs
         self.overwrite = overwrite
         self.copy_subtitles = copy_subtitles
+        self.sidecar_index = sidecar_index
+        self.directory_cache = directory_cache or DirectoryCache()
         super().__init__(f"{self.source.name} 복사 → {self.destination}")
 
     def _get_default_description(self) -> str:
@@ -166,14 +181,14 @@ class CopyFileCommand(BaseCommand):
         """파일 복사 실행"""
         if self.destination.exists():
             backup_path = self.destination.with_suffix(f"{self.destination.suffix}.backup")
-            shutil.copy2(str(self.destination), str(backup_path))
+            copy_file(str(self.destination), str(backup_path))
             self._store_undo_data("backup_path", backup_path)
         if self.create_dirs:
-            self.destination.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(self.source), str(self.destination))
+            self.directory_cache.ensure_parent(self.destination)
+        copy_file(str(self.source), str(self.destination))
         copied_subtitles = []
         if self.copy_subtitles and is_video_file(self.source):
-            subtitle_files = find_subtitle_files(self.source)
+            subtitle_files = find_subtitle_files(self.source, self.sidecar_index)
             for subtitle_file in subtitle_files:
                 try:
                     subtitle_dest = get_subtitle_destination_path(
@@ -181,9 +196,9 @@ class CopyFileCommand(BaseCommand):
                     )
                     if subtitle_dest.exists():
                         backup_path = subtitle_dest.with_suffix(f"{subtitle_dest.suffix}.backup")
-                        shutil.copy2(str(subtitle_dest), str(backup_path))
+                        copy_file(str(subtitle_dest), str(backup_path))
                         self._store_undo_data(f"subtitle_backup_{subtitle_file}", backup_path)
-                    shutil.copy2(subtitle_file, subtitle_dest)
+                    copy_file(subtitle_file, subtitle_dest)
                     copied_subtitles.append((subtitle_file, subtitle_dest))
                     self.logger.debug(f"자막 파일 복사: {subtitle_file} -> {subtitle_dest}")
                 except Exception as e:
@@ -202,7 +217,7 @@ class CopyFileCommand(BaseCommand):
         if self.destination.exists():
             self.destination.unlink()
         if backup_path and backup_path.exists():
-            shutil.move(str(backup_path), str(self.destination))
+            move_file(str(backup_path), str(self.destination))
         for _, subtitle_dest in copied_subtitles:
             try:
                 if subtitle_dest.exists():
@@ -215,7 +230,7 @@ class CopyFileCommand(BaseCommand):
             subtitle_backup = self._get_undo_data(backup_key)
             if subtitle_backup and subtitle_backup.exists():
                 try:
-                    shutil.move(str(subtitle_backup), str(subtitle_dest))
+                    move_file(str(subtitle_backup), str(subtitle_dest))
                     self.logger.debug(f"자막 파일 백업 복원: {subtitle_backup} -> {subtitle_dest}")
                 except Exception as e:
                     self.logger.warning(f"자막 파일 백업 복원 실패: {subtitle_backup} - {e}")
@@ -271,9 +286,15 @@ class DeleteFileCommand(BaseCommand):
 class CreateDirectoryCommand(BaseCommand):
     """디렉토리 생성 Command"""
 
-    def __init__(self, directory_path: str | Path, parents: bool = True):
+    def __init__(
+        self,
+        directory_path: str | Path,
+        parents: bool = True,
+        directory_cache: DirectoryCache | None = None,
+    ):
         self.directory_path = Path(directory_path)
         self.parents = parents
+        self.directory_cache = directory_cache or DirectoryCache()
         super().__init__(f"{self.directory_path.name} 디렉토리 생성")
 
     def _get_default_description(self) -> str:
@@ -289,14 +310,55 @@ class CreateDirectoryCommand(BaseCommand):
 
     def _execute_impl(self) -> None:
         """디렉토리 생성 실행"""
-        self.directory_path.mkdir(parents=self.parents, exist_ok=False)
-        self._add_created_file(self.directory_path)
+        if self.parents:
+            created = self.directory_cache.ensure(self.directory_path)
+        else:
+            self.directory_path.mkdir()
+            created = [self.directory_path]
+        self._store_undo_data("created_directories", created)
+        for directory in created:
+            self._add_created_file(directory)
+
+    def _undo_impl(self) -> None:
+        """디렉토리 생성 취소 (함께 만든 상위 디렉토리 포함, 비어 있을 때만)"""
+        remove_created_directories(
+            self._get_undo_data("created_directories", []), self.directory_cache
+        )
+
+
+class CreateDirectoriesCommand(BaseCommand):
+    """여러 대상 디렉토리를 한 번에 생성하는 Command
+
+    일괄 작업의 대상 디렉토리를 얕은 것부터 한 번씩만 만들고, 새로 만든 디렉토리 전체를
+    하나의 작업으로 기록해서 한 번에 취소합니다.
+    """
+
+    def __init__(
+        self,
+        directories: Sequence[str | Path],
+        directory_cache: DirectoryCache | None = None,
+    ):
+        self.directories = [Path(directory) for directory in directories]
+        self.directory_cache = directory_cache or DirectoryCache()
+        super().__init__(f"대상 디렉토리 {len(self.directories)}개 생성")
+
+    def _get_default_description(self) -> str:
+        return f"디렉토리 일괄 생성: {len(self.directories)}개"
+
+    def _execute_impl(self) -> None:
+        """디렉토리 일괄 생성 실행"""
+        created = self.directory_cache.ensure_all(self.directories)
+        self._store_undo_data("created_directories", created)
+        for directory in created:
+            self._add_created_file(directory)
+        self._set_metadata("created_directories", len(created))
+        self._set_metadata("mkdir_calls", self.directory_cache.mkdir_calls)
 
     def _undo_impl(self) -> None:
-        """디렉토리 생성 취소"""
-        if self.directory_path.exists() and self.directory_path.is_dir():
-            with suppress(OSError):
-                self.directory_path.rmdir()
+        """새로 만든 디렉토리 삭제 (비어 있지 않은 디렉토리는 남겨 둠)"""
+        remove_created_directories(
+            self._get_undo_data("created_directories", []), self.directory_cache
+        )
 
 
 class BatchFileCommand(CompositeCommand):
@@ -80,6 +80,8 @@ class FileProcessingProgressEvent(BaseEvent):
     success_count: int = 0
     error_count: int = 0
     skip_count: int = 0
+    # 최근 몇 초 동안 실제로 읽고 쓴 처리량 (I/O 제한이 적용된 값)
+    bytes_per_second: float = 0.0
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
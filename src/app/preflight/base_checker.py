@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Any, Protocol
 from uuid import UUID, uuid4
 
+from src.core.file_snapshot import StatCache
+
 
 class PreflightSeverity(Enum):
     """프리플라이트 검사 문제의 심각도"""
@@ -119,6 +121,17 @@ class BasePreflightChecker(ABC):
         self._name = name or self._get_default_name()
         self._description = description or self._get_default_description()
         self.logger = logging.getLogger(f"Preflight.{self._name}")
+        self._bound_stat_cache: StatCache | None = None
+        self._local_stat_cache = StatCache()
+
+    def bind_stat_cache(self, cache: StatCache | None) -> None:
+        """코디네이터가 한 번의 검사 동안 여러 검사기가 같은 stat 결과를 쓰도록 연결"""
+        self._bound_stat_cache = cache
+
+    @property
+    def stats(self) -> StatCache:
+        """현재 검사에서 사용할 stat 캐시"""
+        return self._bound_stat_cache or self._local_stat_cache
 
     @property
     def name(self) -> str:
@@ -139,6 +152,8 @@ class BasePreflightChecker(ABC):
             import time
 
             start_time = time.time()
+            if self._bound_stat_cache is None:
+                self._local_stat_cache = StatCache()
             if not self.is_applicable(source_path, destination_path):
                 self.logger.debug(f"검사 적용 불가: {self.name}")
                 result.metadata["skipped"] = "not_applicable"
@@ -32,9 +32,9 @@ class FileConflictChecker(BasePreflightChecker):
     ) -> None:
         if not destination_path:
             return
-        if destination_path.exists():
+        if self.stats.exists(destination_path):
             try:
-                if source_path.resolve() == destination_path.resolve():
+                if self.stats.same_file(source_path, destination_path):
                     self._add_warning(
                         result,
                         "같은 파일로 이동/복사",
@@ -45,11 +45,11 @@ class FileConflictChecker(BasePreflightChecker):
                     return
             except (OSError, ValueError):
                 pass
-            source_is_file = source_path.is_file()
-            dest_is_file = destination_path.is_file()
+            source_is_file = self.stats.is_file(source_path)
+            dest_is_file = self.stats.is_file(destination_path)
             if source_is_file and dest_is_file:
-                source_size = source_path.stat().st_size
-                dest_size = destination_path.stat().st_size
+                source_size = self.stats.size(source_path)
+                dest_size = self.stats.size(destination_path)
                 self._add_error(
                     result,
                     "파일 덮어쓰기",
@@ -61,7 +61,7 @@ class FileConflictChecker(BasePreflightChecker):
                         "덮어쓰기를 확인해주세요.",
                     ],
                 )
-            elif source_path.is_dir() and destination_path.is_dir():
+            elif self.stats.is_dir(source_path) and self.stats.is_dir(destination_path):
                 dest_contents = list(destination_path.iterdir())
                 if dest_contents:
                     self._add_warning(
@@ -124,9 +124,12 @@ class PermissionChecker(BasePreflightChecker):
             )
         if destination_path:
             dest_parent = destination_path.parent
-            if not dest_parent.exists():
+            if not self.stats.exists(dest_parent):
                 existing_parent = dest_parent
-                while not existing_parent.exists() and existing_parent != existing_parent.parent:
+                while (
+                    not self.stats.exists(existing_parent)
+                    and existing_parent != existing_parent.parent
+                ):
                     existing_parent = existing_parent.parent
                 if not os.access(existing_parent, os.W_OK):
                     self._add_critical(
@@ -150,7 +153,7 @@ class PermissionChecker(BasePreflightChecker):
                         "관리자 권한으로 실행해주세요.",
                     ],
                 )
-            if destination_path.exists() and not os.access(destination_path, os.W_OK):
+            if self.stats.exists(destination_path) and not os.access(destination_path, os.W_OK):
                 self._add_critical(
                     result,
                     "대상 파일 덮어쓰기 권한 없음",
@@ -178,8 +181,9 @@ class DiskSpaceChecker(BasePreflightChecker):
         if not destination_path:
             return False
         try:
-            source_drive = source_path.resolve().parts[0]
-            dest_drive = destination_path.resolve().parts[0]
+            # 드라이브만 비교하므로 resolve(stat) 없이 절대 경로로 충분
+            source_drive = source_path.absolute().parts[0]
+            dest_drive = destination_path.absolute().parts[0]
             return source_drive != dest_drive
         except (IndexError, OSError):
             return True
@@ -190,9 +194,9 @@ class DiskSpaceChecker(BasePreflightChecker):
         if not destination_path:
             return
         try:
-            if source_path.is_file():
-                source_size = source_path.stat().st_size
-            elif source_path.is_dir():
+            if self.stats.is_file(source_path):
+                source_size = self.stats.size(source_path)
+            elif self.stats.is_dir(source_path):
                 source_size = self._get_directory_size(source_path)
             else:
                 self._add_warning(
@@ -202,8 +206,18 @@ class DiskSpaceChecker(BasePreflightChecker):
                     [source_path],
                 )
                 return
+            if source_size is None:
+                self._add_warning(
+                    result,
+                    "파일 크기 확인 불가",
+                    f"원본 크기를 확인할 수 없어 디스크 용량을 검사하지 않았습니다: {source_path}",
+                    [source_path],
+                    ["수동으로 디스크 용량을 확인해주세요."],
+                )
+                return
             dest_parent = destination_path.parent
             dest_parent.mkdir(parents=True, exist_ok=True)
+            self.stats.forget(dest_parent)
             free_space = shutil.disk_usage(dest_parent).free
             if source_size > free_space:
                 self._add_critical(
@@ -365,12 +379,12 @@ class CircularReferenceChecker(BasePreflightChecker):
 
     def is_applicable(self, source_path: Path, destination_path: Path | None = None) -> bool:
         """디렉토리 이동/복사에만 적용"""
-        return destination_path is not None and source_path.is_dir()
+        return destination_path is not None and self.stats.is_dir(source_path)
 
     def _check_impl(
         self, source_path: Path, destination_path: Path | None, result: PreflightResult
     ) -> None:
-        if not destination_path or not source_path.is_dir():
+        if not destination_path or not self.stats.is_dir(source_path):
             return
         try:
             source_resolved = source_path.resolve()
@@ -409,12 +423,12 @@ class FileLockChecker(BasePreflightChecker):
         self, source_path: Path, destination_path: Path | None, result: PreflightResult
     ) -> None:
         self._check_file_lock(source_path, "원본", result)
-        if destination_path and destination_path.exists():
+        if destination_path and self.stats.exists(destination_path):
             self._check_file_lock(destination_path, "대상", result)
 
     def _check_file_lock(self, file_path: Path, file_type: str, result: PreflightResult) -> None:
         """개별 파일의 잠금 상태 확인"""
-        if not file_path.is_file():
+        if not self.stats.is_file(file_path):
             return
         try:
             with file_path.open("r+b"):
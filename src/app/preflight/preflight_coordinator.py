@@ -26,6 +26,7 @@ from src.app.preflight.file_checkers import (
     PathValidityChecker,
     PermissionChecker,
 )
+from src.core.file_snapshot import FileSnapshot, StatCache
 
 
 @dataclass
@@ -91,13 +92,18 @@ class IPreflightCoordinator(Protocol):
     """프리플라이트 코디네이터 인터페이스"""
 
     def check_operation(
-        self, source_path: Path, destination_path: Path | None = None
+        self,
+        source_path: Path,
+        destination_path: Path | None = None,
+        snapshot: FileSnapshot | None = None,
     ) -> PreflightCheckResult:
         """단일 작업 검사"""
         ...
 
     def check_batch_operations(
-        self, operations: list[tuple[Path, Path | None]]
+        self,
+        operations: list[tuple[Path, Path | None]],
+        snapshots: dict[Path, FileSnapshot] | None = None,
     ) -> PreflightCheckResult:
         """배치 작업 검사"""
         ...
@@ -166,10 +172,23 @@ class PreflightCoordinator:
         """활성화된 검사기 목록"""
         return [name for name, enabled in self._enabled_checkers.items() if enabled]
 
+    def _bind_stat_cache(self, cache: StatCache | None) -> None:
+        """검사기들이 같은 stat 캐시를 쓰도록 연결 (None이면 해제)"""
+        for checker in self._checkers.values():
+            bind = getattr(checker, "bind_stat_cache", None)
+            if bind is not None:
+                bind(cache)
+
     def check_operation(
-        self, source_path: Path, destination_path: Path | None = None
+        self,
+        source_path: Path,
+        destination_path: Path | None = None,
+        snapshot: FileSnapshot | None = None,
     ) -> PreflightCheckResult:
-        """단일 작업 검사"""
+        """단일 작업 검사
+
+        snapshot이 있으면 원본은 stat 하지 않고, 나머지 경로도 검사기들이 한 번씩만 stat 합니다.
+        """
         self.logger.info(f"프리플라이트 검사 시작: {source_path} -> {destination_path}")
         result = PreflightCheckResult()
         result.total_operations = 1
@@ -179,6 +198,7 @@ class PreflightCoordinator:
         import time
 
         start_time = time.time()
+        self._bind_stat_cache(StatCache([snapshot] if snapshot else ()))
         try:
             for checker_name in self.get_enabled_checkers():
                 checker = self._checkers[checker_name]
@@ -234,12 +254,19 @@ class PreflightCoordinator:
                 )
             )
             result.checker_results["coordinator"] = error_result
+        finally:
+            self._bind_stat_cache(None)
         return result
 
     def check_batch_operations(
-        self, operations: list[tuple[Path, Path | None]]
+        self,
+        operations: list[tuple[Path, Path | None]],
+        snapshots: dict[Path, FileSnapshot] | None = None,
     ) -> PreflightCheckResult:
-        """배치 작업 검사"""
+        """배치 작업 검사
+
+        snapshots: 스캔 시점의 원본 스냅샷 (원본 경로별)
+        """
         self.logger.info(f"배치 프리플라이트 검사 시작: {len(operations)}개 작업")
         result = PreflightCheckResult()
         result.total_operations = len(operations)
@@ -250,6 +277,7 @@ class PreflightCoordinator:
         import time
 
         start_time = time.time()
+        self._bind_stat_cache(StatCache((snapshots or {}).values()))
         try:
             for checker_name in self.get_enabled_checkers():
                 checker = self._checkers[checker_name]
@@ -316,6 +344,8 @@ class PreflightCoordinator:
                 )
             )
             result.checker_results["batch_coordinator"] = error_result
+        finally:
+            self._bind_stat_cache(None)
         return result
 
     def get_checker_info(self) -> dict[str, dict[str, Any]]:
@@ -20,6 +20,8 @@ from src.app.safety_events import (
     BackupFailedEvent,
     BackupStartedEvent,
 )
+from src.core.utils.io_throttle import get_io_throttle
+from src.core.utils.verified_copy import VerificationMode, copy_and_verify, file_digest
 
 
 class BackupStrategy:
@@ -83,6 +85,7 @@ class BackupConfiguration:
         self.backup_before_operations = True
         self.compression_level = 6
         self.verify_backups = True
+        self.verification_mode = VerificationMode.STREAM
 
 
 class BackupManager:
@@ -94,6 +97,8 @@ class BackupManager:
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
         self.config.backup_directory.mkdir(parents=True, exist_ok=True)
         self._backups: dict[UUID, BackupInfo] = {}
+        # 복사 중 계산한 파일 해시 (체크섬 계산 시 다시 읽지 않도록 사용)
+        self._stream_digests: dict[Path, str] = {}
         self._load_backup_index()
 
     def create_backup(
@@ -115,6 +120,7 @@ class BackupManager:
                 backup_type="auto" if self.config.auto_backup_enabled else "manual",
             )
         )
+        self._stream_digests.clear()
         try:
             if strategy == BackupStrategy.ZIP:
                 success = self._create_zip_backup(source_paths, backup_location)
@@ -162,6 +168,25 @@ class BackupManager:
                 )
             )
             return None
+        finally:
+            self._stream_digests.clear()
+
+    def _copy_verified(self, source: str | Path, destination: str | Path) -> Path:
+        """설정된 방식으로 검증하며 복사 (shutil.copytree의 copy_function으로도 사용)"""
+        mode = (
+            self.config.verification_mode if self.config.verify_backups else VerificationMode.NONE
+        )
+        # 백업은 손상된 원본도 있는 그대로 보존해야 하므로 파일명 CRC32 불일치로 실패하지 않음
+        result = copy_and_verify(
+            source,
+            destination,
+            mode,
+            throttle=get_io_throttle("backup"),
+            strict_crc32=False,
+        )
+        if result.digest:
+            self._stream_digests[Path(destination)] = result.digest
+        return Path(destination)
 
     def _create_copy_backup(self, source_paths: list[Path], backup_location: Path) -> bool:
         """단순 복사 백업"""
@@ -172,10 +197,15 @@ class BackupManager:
                     continue
                 if source_path.is_file():
                     dest_path = backup_location / source_path.name
-                    shutil.copy2(source_path, dest_path)
+                    self._copy_verified(source_path, dest_path)
                 elif source_path.is_dir():
                     dest_path = backup_location / source_path.name
-                    shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
+                    shutil.copytree(
+                        source_path,
+                        dest_path,
+                        copy_function=self._copy_verified,
+                        dirs_exist_ok=True,
+                    )
             return True
         except Exception as e:
             self.logger.error(f"복사 백업 실패: {e}")
@@ -335,12 +365,9 @@ class BackupManager:
             return ""
 
     def _calculate_file_checksum(self, file_path: Path) -> str:
-        """파일 체크섬 계산"""
-        hash_md5 = hashlib.md5(usedforsecurity=False)
-        with file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        """파일 체크섬 계산 (복사 중 계산한 해시가 있으면 재사용)"""
+        digest = self._stream_digests.pop(file_path, None)
+        return digest or file_digest(file_path)
 
     def _calculate_directory_checksum(self, dir_path: Path) -> str:
         """디렉토리 체크섬 계산"""
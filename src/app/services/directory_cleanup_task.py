@@ -0,0 +1,69 @@
+"""
+빈 디렉토리 정리 백그라운드 작업
+
+파일 정리가 끝난 뒤 이번 작업에서 파일이 빠져나간 디렉토리만 아래에서 위로 정리합니다.
+UI 스레드를 막지 않도록 BaseTask로 실행하며, 취소하면 남은 디렉토리는 건너뜁니다.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+from pathlib import Path
+
+from src.app.background_events import TaskPriority
+from src.app.background_task import BaseTask, TaskResult
+from src.core.utils.empty_dir_cleanup import remove_empty_directories
+
+
+class DirectoryCleanupTask(BaseTask):
+    """빈 디렉토리 정리 백그라운드 작업"""
+
+    def __init__(
+        self,
+        touched_directories: set[str] | list[str],
+        protected_roots: list[str] | None = None,
+        event_bus=None,
+        priority: TaskPriority = TaskPriority.LOW,
+    ):
+        super().__init__(
+            event_bus=event_bus,
+            task_name=f"빈 디렉토리 정리: {len(touched_directories)}개 위치",
+            priority=priority,
+            metadata={
+                "touched_directories": len(touched_directories),
+                "protected_roots": list(protected_roots or []),
+            },
+        )
+        self.touched_directories = [Path(directory) for directory in touched_directories]
+        self.protected_roots = [Path(root) for root in protected_roots or []]
+
+    def execute(self) -> TaskResult:
+        """빈 디렉토리 정리 실행"""
+        self.logger.info(f"빈 디렉토리 정리 시작: {len(self.touched_directories)}개 위치")
+
+        def on_progress(done: int, total: int, directory: Path) -> None:
+            self.increment_processed()
+            self.update_progress(int(done / total * 100), f"정리 중: {directory.name}")
+
+        cleanup = remove_empty_directories(
+            self.touched_directories,
+            self.protected_roots,
+            progress_callback=on_progress,
+            is_cancelled=self.is_cancelled,
+        )
+        self.logger.info(
+            f"빈 디렉토리 정리 완료: {cleanup.removed_count}개 삭제 "
+            f"(후보 {cleanup.candidates}개{', 취소됨' if cleanup.cancelled else ''})"
+        )
+        return TaskResult(
+            task_id=self.task_id,
+            status=self._status,
+            success=not cleanup.errors,
+            result_data={
+                "removed_directories": [str(path) for path in cleanup.removed],
+                "removed_count": cleanup.removed_count,
+                "candidates": cleanup.candidates,
+                "cancelled": cleanup.cancelled,
+            },
+            error_message="; ".join(cleanup.errors),
+        )
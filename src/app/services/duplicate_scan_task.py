@@ -0,0 +1,107 @@
+"""
+내용 기반 중복 파일 검사 백그라운드 작업
+
+폴더를 scandir로 한 번 훑어 크기 → 부분 지문 → 전체 해시 순으로 중복을 찾습니다.
+UI 스레드를 막지 않도록 BaseTask로 실행하며, 묶음을 찾을 때마다 group_found
+시그널로 알려 중복 탭을 점진적으로 채웁니다. 취소하면 남은 후보는 건너뜁니다.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from src.app.background_events import TaskPriority
+from src.app.background_task import BaseTask, TaskResult
+from src.core.duplicate_detector import FingerprintCache, find_duplicates
+from src.core.file_snapshot import FileSnapshot, iter_file_snapshots
+
+
+class DuplicateScanSignals(QObject):
+    """중복 검사 시그널 (작업 스레드 → UI 스레드)"""
+
+    group_found = pyqtSignal(object)
+
+
+class DuplicateScanTask(BaseTask):
+    """중복 파일 검사 백그라운드 작업"""
+
+    def __init__(
+        self,
+        directories: list[str] | list[Path],
+        cache: FingerprintCache | None = None,
+        extensions: set[str] | None = None,
+        event_bus=None,
+        priority: TaskPriority = TaskPriority.LOW,
+    ):
+        super().__init__(
+            event_bus=event_bus,
+            task_name=f"중복 파일 검사: {len(directories)}개 폴더",
+            priority=priority,
+            metadata={"directories": [str(directory) for directory in directories]},
+        )
+        self.directories = [Path(directory) for directory in directories]
+        self.cache = cache if cache is not None else FingerprintCache()
+        self.extensions = extensions
+        self.duplicate_signals = DuplicateScanSignals()
+
+    def _collect_snapshots(self, errors: list[str]) -> list[FileSnapshot]:
+        snapshots: list[FileSnapshot] = []
+        for directory in self.directories:
+            for snapshot in iter_file_snapshots(
+                directory,
+                extensions=self.extensions,
+                on_error=lambda path, e: errors.append(f"{path}: {e}"),
+            ):
+                if self.is_cancelled():
+                    return snapshots
+                snapshots.append(snapshot)
+        return snapshots
+
+    def execute(self) -> TaskResult:
+        """중복 검사 실행"""
+        self.logger.info(f"중복 파일 검사 시작: {', '.join(map(str, self.directories))}")
+        self.update_progress(0, "파일 목록 수집 중")
+        scan_errors: list[str] = []
+        snapshots = self._collect_snapshots(scan_errors)
+        self.cache.load()
+
+        def on_group(group) -> None:
+            self.increment_processed()
+            if not self.is_cancelled():
+                self.duplicate_signals.group_found.emit(group)
+
+        def on_progress(done: int, total: int) -> None:
+            self.update_progress(int(done / total * 100), f"비교 중: {done}/{total}")
+
+        scan = find_duplicates(
+            snapshots,
+            self.cache,
+            on_group=on_group,
+            progress_callback=on_progress,
+            is_cancelled=self.is_cancelled,
+        )
+        self.cache.save()
+        errors = scan_errors + scan.errors
+        self.logger.info(
+            f"중복 파일 검사 완료: {len(scan.groups)}개 묶음, "
+            f"{scan.wasted_bytes / (1024 * 1024):.1f}MB 중복"
+            f"{', 취소됨' if scan.cancelled else ''}"
+        )
+        return TaskResult(
+            task_id=self.task_id,
+            status=self._status,
+            success=True,
+            result_data={
+                "groups": scan.groups,
+                "group_count": len(scan.groups),
+                "wasted_bytes": scan.wasted_bytes,
+                "files_scanned": scan.files_scanned,
+                "partial_hashed": scan.partial_hashed,
+                "full_hashed": scan.full_hashed,
+                "cancelled": scan.cancelled,
+            },
+            error_message="; ".join(errors[:20]),
+        )
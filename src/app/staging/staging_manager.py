@@ -17,6 +17,10 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
+from src.core.utils.copy_engine import copy_file
+from src.core.utils.io_throttle import get_io_throttle
+from src.core.utils.verified_copy import VerificationMode, copy_and_verify, file_digest
+
 
 @dataclass
 class StagingConfiguration:
@@ -32,6 +36,7 @@ class StagingConfiguration:
     max_staging_size_mb: int = 1000
     preserve_original_permissions: bool = True
     validate_file_integrity: bool = True
+    verification_mode: VerificationMode = VerificationMode.STREAM
     create_backup_before_staging: bool = True
     use_hard_links: bool = False
     batch_operations: bool = True
@@ -131,18 +136,27 @@ class StagingManager:
             if self.config.create_backup_before_staging:
                 backup_name = f"backup_{staging_name}"
                 backup_path = self.config.staging_directory / "backups" / backup_name
-                shutil.copy2(source_path, backup_path)
+                copy_file(source_path, backup_path, throttle=get_io_throttle("staging"))
                 self.logger.debug(f"백업 생성: {backup_path}")
+            checksum = None
             if self.config.use_hard_links and hasattr(os, "link"):
                 os.link(source_path, staging_path)
+                if self.config.validate_file_integrity:
+                    checksum = self._calculate_checksum(staging_path)
             else:
-                shutil.copy2(source_path, staging_path)
+                # 복사하면서 해시를 계산하여 체크섬을 위한 별도 읽기를 생략
+                mode = (
+                    self.config.verification_mode
+                    if self.config.validate_file_integrity
+                    else VerificationMode.NONE
+                )
+                checksum = copy_and_verify(
+                    source_path, staging_path, mode, throttle=get_io_throttle("staging")
+                ).digest
+                if checksum is None and self.config.validate_file_integrity:
+                    # 해시를 남기지 않는 검증 방식(크기 비교 등)이면 복사본을 한 번 더 읽음
+                    checksum = self._calculate_checksum(staging_path)
             file_size = staging_path.stat().st_size
-            checksum = (
-                self._calculate_checksum(staging_path)
-                if self.config.validate_file_integrity
-                else None
-            )
             staged_file = StagedFile(
                 staging_id=staging_id,
                 original_path=source_path,
@@ -317,13 +331,7 @@ class StagingManager:
     def _calculate_checksum(self, file_path: Path) -> str | None:
         """파일 체크섬 계산"""
         try:
-            import hashlib
-
-            hash_md5 = hashlib.md5(usedforsecurity=False)
-            with file_path.open("rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            return file_digest(file_path)
         except Exception as e:
             self.logger.warning(f"체크섬 계산 실패: {e}")
             return None
@@ -8,7 +8,6 @@ providing a centralized way to execute, undo, and manage file operations.
 import logging
 
 logger = logging.getLogger(__name__)
-import shutil
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -16,6 +15,12 @@ from pathlib import Path
 from typing import Any
 
 from src.core.interfaces.file_organization_interface import FileOperationType
+from src.core.utils.copy_engine import copy_file, move_file
+from src.core.utils.directory_batch import (
+    DirectoryCache,
+    destination_directories,
+    remove_created_directories,
+)
 
 
 @dataclass
@@ -61,11 +66,13 @@ class FileOperationCommand(IFileCommand):
         target_path: Path,
         operation_type: FileOperationType,
         logger: logging.Logger = None,
+        directory_cache: DirectoryCache | None = None,
     ):
         self.source_path = source_path
         self.target_path = target_path
         self.operation_type = operation_type
         self.logger = logger or logging.getLogger(__name__)
+        self.directory_cache = directory_cache or DirectoryCache()
         self._executed = False
         self._backup_path: Path | None = None
 
@@ -84,7 +91,7 @@ class FileOperationCommand(IFileCommand):
                     message=f"Source file does not exist: {self.source_path}",
                     error="Source file not found",
                 )
-            self.target_path.parent.mkdir(parents=True, exist_ok=True)
+            self.directory_cache.ensure_parent(self.target_path)
             if self.target_path.exists():
                 self._backup_path = self._create_backup()
                 if not self._backup_path:
@@ -122,7 +129,7 @@ class FileOperationCommand(IFileCommand):
                     error="Undo not supported for this operation type",
                 )
             if self._backup_path and self._backup_path.exists():
-                shutil.move(str(self._backup_path), str(self.target_path))
+                move_file(str(self._backup_path), str(self.target_path))
                 self._backup_path.unlink()
                 self.logger.info(f"File operation undone: {self.get_description()}")
                 return CommandResult(success=True, message="Operation undone successfully")
@@ -148,7 +155,7 @@ class FileOperationCommand(IFileCommand):
             backup_path = self.target_path.with_suffix(
                 f"{self.target_path.suffix}.backup_{timestamp}"
             )
-            shutil.copy2(self.target_path, backup_path)
+            copy_file(self.target_path, backup_path)
             return backup_path
         except Exception as e:
             self.logger.error(f"Backup creation failed: {e}")
@@ -158,9 +165,9 @@ class FileOperationCommand(IFileCommand):
         """Perform the actual file operation"""
         try:
             if self.operation_type == FileOperationType.COPY:
-                shutil.copy2(self.source_path, self.target_path)
+                copy_file(self.source_path, self.target_path)
             elif self.operation_type == FileOperationType.MOVE:
-                shutil.move(self.source_path, self.target_path)
+                move_file(self.source_path, self.target_path)
             elif self.operation_type == FileOperationType.RENAME:
                 self.source_path.rename(self.target_path)
             else:
@@ -183,7 +190,7 @@ class FileOperationCommand(IFileCommand):
             if self.operation_type == FileOperationType.COPY:
                 self.target_path.unlink()
             elif self.operation_type == FileOperationType.MOVE:
-                shutil.move(self.target_path, self.source_path)
+                move_file(self.target_path, self.source_path)
             else:
                 return CommandResult(
                     success=False,
@@ -204,10 +211,18 @@ class BatchFileOperationCommand(IFileCommand):
         self.operations = operations
         self.logger = logger or logging.getLogger(__name__)
         self._executed_operations: list[FileOperationCommand] = []
+        # Target directories are created once up front and undone together with the batch
+        self.directory_cache = DirectoryCache()
+        self._created_directories: list[Path] = []
 
     def execute(self) -> CommandResult:
         """Execute all operations in the batch"""
         try:
+            for operation in self.operations:
+                operation.directory_cache = self.directory_cache
+            self._created_directories = self.directory_cache.ensure_all(
+                destination_directories(operation.target_path for operation in self.operations)
+            )
             successful_operations = []
             failed_operations = []
             for operation in self.operations:
@@ -225,6 +240,7 @@ class BatchFileOperationCommand(IFileCommand):
                     "successful_count": len(successful_operations),
                     "failed_count": len(failed_operations),
                     "total_count": len(self.operations),
+                    "created_directories": [str(path) for path in self._created_directories],
                 },
             )
         except Exception as e:
@@ -250,6 +266,9 @@ class BatchFileOperationCommand(IFileCommand):
                     else:
                         failed_undos += 1
                         self.logger.error(f"Undo failed: {result.message}")
+            removed_directories = remove_created_directories(
+                self._created_directories, self.directory_cache
+            )
             return CommandResult(
                 success=failed_undos == 0,
                 message=f"Batch undo completed: {successful_undos} successful, {failed_undos} failed",
@@ -257,6 +276,7 @@ class BatchFileOperationCommand(IFileCommand):
                     "successful_undos": successful_undos,
                     "failed_undos": failed_undos,
                     "total_undos": len(self._executed_operations),
+                    "removed_directories": len(removed_directories),
                 },
             )
         except Exception as e:
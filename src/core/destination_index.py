@@ -0,0 +1,369 @@
+"""
+대상 라이브러리 중복 판정
+
+이미 정리된 라이브러리(대상 폴더)에 같은 에피소드가 있는지 계획 단계에서 확인합니다.
+시리즈/시즌 폴더마다 목록을 한 번만 읽어 (정규화한 제목, 시즌, 에피소드)로 색인하고,
+들어오는 파일을 옮기기 전에 건너뜀/교체/기존 유지로 분류합니다. 같은 배치를 다시
+가져와도 복사 대신 목록 조회만 하게 됩니다.
+
+- DuplicateAction: 분류 결과 (NEW, SKIP, REPLACE, KEEP_EXISTING)
+- LibraryEntry / DedupDecision: 기존 파일 정보와 판정
+- DestinationLibraryIndex: 대상 라이브러리 색인과 판정
+- partial_content_hash: 파일 앞/가운데/뒤 일부만 읽는 내용 해시
+- replace_file_in_place / retire_replaced_file: 기존 파일을 잃지 않는 교체
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import TypeVar
+
+from src.core.duplicate_detector import partial_fingerprint
+from src.core.quality_planner import UNKNOWN_RESOLUTION, resolution_from_filename
+from src.core.resolution_normalizer import get_resolution_priority, normalize_resolution
+
+logger = logging.getLogger(__name__)
+
+# 화질이 낮은 파일을 두는 폴더 (대상 루트 바로 아래)
+LOW_RES_FOLDER = "_low res"
+# 부분 해시에서 구간마다 읽는 크기
+PARTIAL_HASH_SAMPLE = 1024 * 1024
+# 같은 이름의 기존 파일을 교체할 때 새 파일을 먼저 두는 임시 파일 접미사
+REPLACING_SUFFIX = ".replacing"
+
+T = TypeVar("T")
+
+# 디렉토리의 (파일명, 크기) 목록을 반환하는 함수
+LibraryLister = Callable[[Path], Iterable[tuple[str, int]]]
+# 파일명에서 에피소드 번호를 찾는 함수
+EpisodeParser = Callable[[str], int | None]
+# 파일 내용 해시 함수
+ContentHasher = Callable[[Path], str]
+
+EpisodeKey = tuple[str, int, int]
+
+
+class DuplicateAction(Enum):
+    """대상 라이브러리와 비교한 결과"""
+
+    NEW = "new"  # 없는 에피소드이거나 판단할 수 없음 (그대로 정리)
+    SKIP = "skip"  # 같은 파일이 이미 있음
+    REPLACE = "replace"  # 기존 파일보다 화질이 좋음 (기존 파일 교체)
+    KEEP_EXISTING = "keep_existing"  # 기존 파일이 화질이 더 좋음
+
+
+@dataclass(frozen=True)
+class LibraryEntry:
+    """대상 라이브러리에 있는 파일"""
+
+    path: Path
+    size: int
+    resolution: str
+    low_res: bool = False
+
+    @property
+    def priority(self) -> int:
+        return get_resolution_priority(self.resolution)
+
+
+@dataclass(frozen=True)
+class DedupDecision:
+    """들어오는 파일 하나의 판정"""
+
+    action: DuplicateAction
+    existing: LibraryEntry | None = None
+    reason: str = ""
+
+    @property
+    def moves_bytes(self) -> bool:
+        """파일을 옮겨야 하는지"""
+        return self.action in (DuplicateAction.NEW, DuplicateAction.REPLACE)
+
+
+def normalize_series(title: str) -> str:
+    """시리즈 제목 비교용 키 (대소문자, 기호, 공백 차이 무시)"""
+    title = re.sub(r"[^\w\s가-힣]", "", title or "").casefold()
+    return re.sub(r"\s+", " ", title).strip()
+
+
+def season_folder(season: int) -> str:
+    return f"Season{season:02d}"
+
+
+def partial_content_hash(path: Path, sample_size: int = PARTIAL_HASH_SAMPLE) -> str:
+    """
+    파일 앞/가운데/뒤 sample_size씩과 크기로 만든 해시
+
+    크기가 같은 두 파일이 같은지 전체를 읽지 않고 확인할 때 사용합니다.
+    """
+    return partial_fingerprint(path, block_size=sample_size, middle_blocks=1)
+
+
+def backup_path_for(path: Path) -> Path:
+    """기존 파일을 같은 폴더에 보관할 이름 (이름.확장자.backup_시각)"""
+    return path.with_suffix(f"{path.suffix}.backup_{int(time.time())}")
+
+
+def retire_replaced_file(path: Path, keep_backup: bool) -> Path | None:
+    """
+    교체된 기존 파일 정리 (새 파일이 자리 잡은 뒤에 호출)
+
+    Args:
+        path: 교체된 기존 파일
+        keep_backup: True면 같은 폴더에서 이름만 바꿔 보관, False면 삭제
+
+    Returns:
+        보관한 경로 (삭제했거나 파일이 없으면 None)
+    """
+    path = Path(path)
+    try:
+        if keep_backup:
+            backup_path = backup_path_for(path)
+            path.rename(backup_path)
+            logger.info("💾 교체되는 기존 파일 보관: %s", backup_path.name)
+            return backup_path
+        path.unlink()
+        logger.info("🔄 낮은 화질의 기존 파일 교체: %s", path.name)
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def replace_file_in_place(
+    target: Path, write: Callable[[Path], T], keep_backup: bool
+) -> tuple[T, Path | None]:
+    """
+    같은 이름의 기존 파일을 새 파일로 교체
+
+    write로 대상 폴더의 임시 파일(.이름.replacing)에 새 파일을 만든 뒤 Path.replace로
+    기존 파일 자리에 원자적으로 놓습니다. write가 실패하면 기존 파일은 그대로 남습니다.
+    keep_backup이면 교체 직전에 기존 파일을 보관 이름으로 옮기고, 교체가 실패하면
+    되돌립니다.
+
+    Args:
+        target: 교체할 기존 파일 경로
+        write: 받은 경로에 새 파일을 만드는 함수 (복사/이동)
+        keep_backup: 기존 파일을 보관할지 여부
+
+    Returns:
+        (write 반환값, 보관한 기존 파일 경로 또는 None)
+    """
+    target = Path(target)
+    staging = target.with_name(f".{target.name}{REPLACING_SUFFIX}")
+    try:
+        written = write(staging)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    backup_path = None
+    if keep_backup:
+        try:
+            backup_path = backup_path_for(target)
+            target.rename(backup_path)
+        except FileNotFoundError:
+            backup_path = None
+    try:
+        staging.replace(target)
+    except OSError:
+        if backup_path is not None:
+            backup_path.rename(target)
+        raise
+    if backup_path is not None:
+        logger.info("💾 교체되는 기존 파일 보관: %s", backup_path.name)
+    else:
+        logger.info("🔄 낮은 화질의 기존 파일 교체: %s", target.name)
+    return written, backup_path
+
+
+def _list_files(directory: Path) -> Iterable[tuple[str, int]]:
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                (entry.name, entry.stat().st_size)
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _default_episode_parser() -> EpisodeParser:
+    from src.core.file_parser import FileParser
+
+    parser = FileParser()
+
+    def parse(filename: str) -> int | None:
+        return parser.get_episode_info(filename)[1]
+
+    return parse
+
+
+class DestinationLibraryIndex:
+    """대상 라이브러리 색인
+
+    대상 구조(루트/제목/SeasonNN, 저화질은 루트/_low res/제목/SeasonNN)를 따라 필요한
+    시즌 폴더만 처음 조회할 때 한 번 읽습니다. 에피소드 번호는 기존 파일명에서 파싱하고,
+    해상도는 파일명 태그로 판단합니다 (컨테이너 분석 없음).
+
+    판정 순서:
+    1. 크기가 같은 기존 파일이 있으면 (partial_hash면 부분 해시까지 같으면) SKIP
+    2. 들어오는 파일과 기존 파일의 해상도를 모두 알 때 더 좋으면 REPLACE,
+       기존 파일이 더 좋으면 KEEP_EXISTING
+    3. 그 밖에는 NEW (다른 릴리스의 같은 화질 파일 등은 지금처럼 함께 보관)
+    """
+
+    def __init__(
+        self,
+        destination_root: Path,
+        *,
+        lister: LibraryLister | None = None,
+        episode_parser: EpisodeParser | None = None,
+        partial_hash: bool = False,
+        hasher: ContentHasher | None = None,
+    ):
+        """
+        Args:
+            destination_root: 정리 대상 루트
+            lister: 디렉토리의 (파일명, 크기) 목록 함수 (테스트용 교체 가능)
+            episode_parser: 파일명에서 에피소드 번호를 찾는 함수 (None이면 FileParser 사용)
+            partial_hash: 크기가 같을 때 부분 내용 해시로 한 번 더 확인
+            hasher: 부분 내용 해시 함수
+        """
+        self.destination_root = Path(destination_root)
+        self._lister = lister or _list_files
+        self._episode_parser = episode_parser
+        self.partial_hash = partial_hash
+        self._hasher = hasher or partial_content_hash
+        self._entries: dict[EpisodeKey, list[LibraryEntry]] = {}
+        self._indexed: set[tuple[str, int]] = set()
+        self._hashes: dict[Path, str] = {}
+        self._lock = threading.Lock()
+        self.listings = 0
+
+    def season_directories(self, title: str, season: int) -> list[Path]:
+        """시리즈/시즌의 정리 폴더 (일반, 저화질)"""
+        return [
+            self.destination_root / title / season_folder(season),
+            self.destination_root / LOW_RES_FOLDER / title / season_folder(season),
+        ]
+
+    def _parse_episode(self, filename: str) -> int | None:
+        if self._episode_parser is None:
+            self._episode_parser = _default_episode_parser()
+        episode = self._episode_parser(filename)
+        try:
+            return int(episode) if episode is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _index_season(self, title: str, season: int) -> None:
+        key = (normalize_series(title), season)
+        if key in self._indexed:
+            return
+        self._indexed.add(key)
+        for directory in self.season_directories(title, season):
+            low_res = directory.parent.parent.name == LOW_RES_FOLDER
+            self.listings += 1
+            for name, size in self._lister(directory):
+                episode = self._parse_episode(name)
+                if episode is None:
+                    continue
+                entry = LibraryEntry(
+                    directory / name, size, resolution_from_filename(name), low_res
+                )
+                self._entries.setdefault((*key, episode), []).append(entry)
+
+    def entries(self, title: str, season: int, episode: int) -> list[LibraryEntry]:
+        """해당 에피소드의 기존 파일"""
+        with self._lock:
+            self._index_season(title, season)
+            return list(self._entries.get((normalize_series(title), season, episode), ()))
+
+    def _content_hash(self, path: Path) -> str:
+        digest = self._hashes.get(path)
+        if digest is None:
+            digest = self._hasher(path)
+            self._hashes[path] = digest
+        return digest
+
+    def _same_content(self, source: Path, entry: LibraryEntry) -> bool:
+        if not self.partial_hash:
+            return True
+        try:
+            return self._content_hash(source) == self._content_hash(entry.path)
+        except OSError as e:
+            logger.debug("부분 해시 비교 실패 (%s): %s", entry.path, e)
+            return False
+
+    def classify(
+        self,
+        title: str,
+        season: int,
+        episode: int | None,
+        source_path: Path,
+        size: int,
+        resolution: str | None = None,
+    ) -> DedupDecision:
+        """
+        들어오는 파일을 기존 라이브러리와 비교
+
+        Args:
+            title: 대상 폴더 제목 (정리 경로와 같은 이름)
+            season: 시즌 번호
+            episode: 에피소드 번호 (None이면 판단하지 않음)
+            source_path: 들어오는 파일
+            size: 들어오는 파일 크기
+            resolution: 들어오는 파일 해상도 (없으면 파일명 태그 사용)
+        """
+        if episode is None:
+            return DedupDecision(DuplicateAction.NEW, reason="에피소드 번호 없음")
+        existing = self.entries(title, season, episode)
+        if not existing:
+            return DedupDecision(DuplicateAction.NEW)
+
+        source_path = Path(source_path)
+        for entry in existing:
+            if entry.size == size and self._same_content(source_path, entry):
+                return DedupDecision(DuplicateAction.SKIP, entry, "같은 파일이 이미 있음")
+
+        incoming = normalize_resolution(resolution or "")
+        if incoming == UNKNOWN_RESOLUTION:
+            incoming = resolution_from_filename(source_path.name)
+        incoming_priority = get_resolution_priority(incoming)
+        ranked = [entry for entry in existing if not entry.low_res and entry.priority > 0]
+        if not incoming_priority or not ranked:
+            return DedupDecision(DuplicateAction.NEW, reason="화질 비교 불가")
+        best = max(ranked, key=lambda entry: entry.priority)
+        if incoming_priority > best.priority:
+            return DedupDecision(DuplicateAction.REPLACE, best, f"{best.resolution} → {incoming}")
+        if incoming_priority < best.priority:
+            return DedupDecision(
+                DuplicateAction.KEEP_EXISTING, best, f"기존 {best.resolution} > {incoming}"
+            )
+        return DedupDecision(DuplicateAction.NEW, reason="같은 화질의 다른 릴리스")
+
+    def record(self, title: str, season: int, episode: int, target_path: Path, size: int) -> None:
+        """이번 계획에서 배정한 파일도 색인에 추가 (같은 배치 안의 중복 판정용)"""
+        with self._lock:
+            self._index_season(title, season)
+            target_path = Path(target_path)
+            entry = LibraryEntry(
+                target_path,
+                size,
+                resolution_from_filename(target_path.name),
+                target_path.parent.parent.parent.name == LOW_RES_FOLDER,
+            )
+            self._entries.setdefault((normalize_series(title), season, episode), []).append(entry)
+
+    def forget(self, path: Path) -> None:
+        """교체되어 사라질 기존 파일을 색인에서 제거"""
+        path = Path(path)
+        with self._lock:
+            for entries in self._entries.values():
+                entries[:] = [entry for entry in entries if entry.path != path]
@@ -0,0 +1,400 @@
+"""
+장치별 병렬 파일 작업 스케줄러
+
+파일 작업을 원본/대상 파일 시스템(st_dev) 기준으로 분류하여 동시에 실행합니다.
+같은 파일 시스템 안의 이동(이름 변경)은 자유롭게 실행하고, 데이터를 실제로 복사하는
+작업은 장치마다 동시에 실행할 수 있는 수를 제한합니다. 같은 경로를 다루는 작업이나
+앞선 작업이 만든 디렉토리 안으로 들어가는 작업은 계획 순서대로 실행됩니다.
+
+시작 가능한 작업 중 무엇을 먼저 시작할지는 교체 가능한 순서 정책이 정합니다.
+- PlanOrder: 계획 순서 그대로 (기본값)
+- PhysicalLocalityOrder: 원본 장치, 디렉토리, 디스크 위치(inode) 순서로 정렬하고
+  같은 원본 장치에서 동시에 읽지 않음 (HDD의 탐색 시간 감소)
+
+작업자 스레드에서 report_progress()로 보낸 진행 정보는 run()을 호출한 스레드에서
+on_progress 콜백으로 전달됩니다.
+"""
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_DEVICE_LIMIT = 2
+
+# 같은 장치 안에서 이름 변경만으로 끝나는 작업 종류
+RENAME_LIKE_OPERATIONS = {"move", "rename"}
+
+
+# 작업자 스레드별로 실행 중인 작업의 진행 보고 함수
+_reporter = threading.local()
+
+
+def report_progress(payload: Any) -> bool:
+    """
+    실행 중인 작업의 진행 정보를 스케줄러로 보냄 (작업자 스레드에서 호출)
+
+    Returns:
+        전달했으면 True (스케줄러 밖에서 호출했거나 on_progress가 없으면 False)
+    """
+    report = getattr(_reporter, "report", None)
+    if report is None:
+        return False
+    report(payload)
+    return True
+
+
+@dataclass
+class _WorkerFailure:
+    """on_error까지 실패했거나 execute가 Exception 밖의 예외를 던진 작업"""
+
+    error: BaseException
+
+
+def _operation_kind(operation_type: Any) -> str:
+    return str(getattr(operation_type, "value", operation_type)).lower()
+
+
+@dataclass
+class ScheduledOperation:
+    """스케줄러가 다루는 작업 하나"""
+
+    index: int
+    item: Any
+    devices: frozenset[Hashable] = field(default_factory=frozenset)
+    heavy: bool = True
+    dependencies: set[int] = field(default_factory=set)
+    source_device: Hashable | None = None
+
+
+class PlanOrder:
+    """계획 순서 그대로 시작 (기본 순서 정책)"""
+
+    name = "plan"
+    # 원본 장치 하나에서 동시에 읽는 작업 수 제한 (None이면 per_device_limit만 적용)
+    max_reads_per_device: int | None = None
+
+    def rank(self, operations: list[ScheduledOperation]) -> list[int]:
+        """작업 번호별 시작 우선순위 (작을수록 먼저)"""
+        return [operation.index for operation in operations]
+
+
+def inode_position(path: Path) -> int | None:
+    """디스크 위치 대신 쓰는 inode 번호 (ext4/XFS에서는 할당 순서와 대체로 일치)"""
+    try:
+        return Path(path).stat().st_ino or None
+    except OSError:
+        return None
+
+
+class PhysicalLocalityOrder(PlanOrder):
+    """HDD용 물리적 위치 순서 정책
+
+    데이터를 복사하는 작업을 원본 장치별로 모으고, 같은 디렉토리의 파일을 연달아, 디스크
+    위치 순서로 실행합니다. 같은 원본 장치에서는 한 번에 하나만 읽어서 두 파일의 읽기가
+    번갈아 일어나며 헤드가 왕복하지 않게 합니다. 다른 장치의 작업은 계속 동시에 실행됩니다.
+
+    디스크 위치는 스캔 스냅샷의 inode를 먼저 사용하고 (추가 stat 없음), 없으면
+    position_of로 구합니다. 익스텐트 시작 위치를 구하는 함수로 교체할 수 있습니다.
+    """
+
+    name = "locality"
+
+    def __init__(
+        self,
+        position_of: Callable[[Path], int | None] | None = None,
+        max_reads_per_device: int | None = 1,
+    ):
+        self.position_of = position_of or inode_position
+        self.max_reads_per_device = max_reads_per_device
+
+    def _position(self, plan: Any) -> int | None:
+        snapshot = getattr(plan, "source_snapshot", None)
+        if snapshot is not None and snapshot.inode:
+            return snapshot.inode
+        return self.position_of(Path(plan.source_path))
+
+    def rank(self, operations: list[ScheduledOperation]) -> list[int]:
+        positions = {operation.index: self._position(operation.item) for operation in operations}
+        # 디렉토리는 그 안에서 가장 앞선 파일의 위치 순서로 방문
+        directory_start: dict[tuple[Hashable, Path], int] = {}
+        for operation in operations:
+            position = positions[operation.index]
+            if position is None:
+                continue
+            key = (operation.source_device, Path(operation.item.source_path).parent)
+            directory_start[key] = min(directory_start.get(key, position), position)
+
+        def sort_key(operation: ScheduledOperation) -> tuple:
+            device = operation.source_device
+            directory = Path(operation.item.source_path).parent
+            start = directory_start.get((device, directory))
+            position = positions[operation.index]
+            return (
+                # 이름 변경만 하는 작업은 디스크를 읽지 않으므로 먼저 처리
+                operation.heavy,
+                device is None,
+                str(device),
+                start is None,
+                start or 0,
+                str(directory),
+                position is None,
+                position or 0,
+                operation.index,
+            )
+
+        rank = [0] * len(operations)
+        for order, operation in enumerate(sorted(operations, key=sort_key)):
+            rank[operation.index] = order
+        return rank
+
+
+ORDERING_POLICIES: dict[str, type[PlanOrder]] = {
+    PlanOrder.name: PlanOrder,
+    PhysicalLocalityOrder.name: PhysicalLocalityOrder,
+}
+
+
+def create_ordering(name: str | None) -> PlanOrder:
+    """이름으로 순서 정책 생성 (알 수 없는 이름이면 계획 순서)"""
+    policy = ORDERING_POLICIES.get((name or PlanOrder.name).lower())
+    if policy is None:
+        logger.warning(f"알 수 없는 작업 순서 정책: {name} (계획 순서 사용)")
+        policy = PlanOrder
+    return policy()
+
+
+class DeviceResolver:
+    """경로가 속한 장치 번호를 구하는 클래스 (디렉토리 단위로 캐시)
+
+    아직 존재하지 않는 대상 경로는 가장 가까운 존재하는 상위 디렉토리의 장치를 사용합니다.
+    """
+
+    def __init__(self):
+        self._cache: dict[Path, int | None] = {}
+
+    def device_of(self, path: Path) -> int | None:
+        path = Path(path)
+        directory = path.parent
+        try:
+            if path.is_dir():
+                directory = path
+        except OSError:
+            pass
+        lookup = directory
+        visited = []
+        while True:
+            if lookup in self._cache:
+                device = self._cache[lookup]
+                break
+            visited.append(lookup)
+            try:
+                device = lookup.stat().st_dev
+                break
+            except OSError:
+                if lookup.parent == lookup:
+                    device = None
+                    break
+                lookup = lookup.parent
+        for directory in visited:
+            self._cache[directory] = device
+        return device
+
+
+class DeviceAwareScheduler:
+    """장치별 동시 실행 수를 제한하는 파일 작업 스케줄러
+
+    - 같은 장치 안의 move/rename: 장치 제한 없이 작업자 수만큼 동시에 실행
+    - 복사, 장치 간 이동: 관련된 원본/대상 장치마다 per_device_limit개까지 동시에 실행
+    - 같은 원본/대상 경로를 다루거나, 앞선 작업의 대상 경로(디렉토리) 아래를 다루는
+      작업은 앞선 작업이 끝난 뒤에 실행
+
+    실행과 완료 처리는 호출한 스레드에서 조율하므로 on_start, on_progress, on_complete
+    콜백은 항상 run()을 호출한 스레드에서 순서대로 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_device_limit: int = DEFAULT_PER_DEVICE_LIMIT,
+        device_resolver: DeviceResolver | None = None,
+        ordering: PlanOrder | None = None,
+    ):
+        """
+        Args:
+            max_workers: 동시에 실행할 최대 작업 수
+            per_device_limit: 장치 하나에서 동시에 실행할 최대 복사 작업 수
+            device_resolver: 경로의 장치 번호를 구하는 객체 (테스트용 교체 가능)
+            ordering: 시작 가능한 작업의 우선순위 정책 (None이면 계획 순서)
+        """
+        self.max_workers = max(1, max_workers)
+        self.per_device_limit = max(1, per_device_limit)
+        self.device_resolver = device_resolver or DeviceResolver()
+        self.ordering = ordering or PlanOrder()
+
+    def schedule(self, plans: list[Any]) -> list[ScheduledOperation]:
+        """
+        작업 계획을 장치/의존성 정보가 붙은 작업 목록으로 변환
+
+        Args:
+            plans: source_path, target_path, operation_type 속성을 가진 작업 계획 리스트
+        """
+        operations = []
+        # 경로 → 그 경로를 마지막으로 다룬 작업 번호
+        last_touch: dict[Path, int] = {}
+        for index, plan in enumerate(plans):
+            source = Path(plan.source_path)
+            target = Path(plan.target_path)
+            source_device = self.device_resolver.device_of(source)
+            target_device = self.device_resolver.device_of(target)
+            heavy = not (
+                _operation_kind(plan.operation_type) in RENAME_LIKE_OPERATIONS
+                and source_device is not None
+                and source_device == target_device
+            )
+            devices = frozenset(d for d in (source_device, target_device) if d is not None)
+            operation = ScheduledOperation(index, plan, devices, heavy, source_device=source_device)
+
+            for path in (source, target, *target.parents, *source.parents):
+                previous = last_touch.get(path)
+                if previous is not None:
+                    operation.dependencies.add(previous)
+            last_touch[source] = index
+            last_touch[target] = index
+            operations.append(operation)
+        return operations
+
+    def run(
+        self,
+        plans: list[Any],
+        execute: Callable[[Any], Any],
+        on_error: Callable[[Any, Exception], Any],
+        on_complete: Callable[[int, Any, Any], None] | None = None,
+        on_start: Callable[[int, Any], None] | None = None,
+        on_progress: Callable[[int, Any, Any], None] | None = None,
+    ) -> list[Any]:
+        """
+        작업 실행
+
+        Args:
+            plans: 작업 계획 리스트
+            execute: 계획 하나를 실행하여 결과를 반환하는 함수 (작업자 스레드에서 호출)
+            on_error: execute가 예외를 던졌을 때 결과를 만드는 함수
+            on_complete: 작업이 끝날 때마다 (계획 순번, 계획, 결과)로 호출
+            on_start: 작업을 시작할 때마다 (계획 순번, 계획)으로 호출
+            on_progress: execute 안에서 report_progress()로 보낸 정보를
+                (계획 순번, 계획, 정보)로 전달
+
+        Returns:
+            계획 순서와 같은 순서의 결과 리스트
+
+        Raises:
+            on_error가 던진 예외나 execute가 던진 Exception 밖의 예외 (KeyboardInterrupt 등)
+            - 새 작업은 시작하지 않고 실행 중인 작업이 끝나면 호출한 스레드에서 다시 던짐
+        """
+        operations = self.schedule(plans)
+        results: list[Any] = [None] * len(operations)
+        if not operations:
+            return results
+
+        dependents: dict[int, list[int]] = {}
+        remaining_dependencies = {}
+        for operation in operations:
+            remaining_dependencies[operation.index] = len(operation.dependencies)
+            for dependency in operation.dependencies:
+                dependents.setdefault(dependency, []).append(operation.index)
+
+        ready = [op.index for op in operations if not op.dependencies]
+        rank = self.ordering.rank(operations)
+        read_limit = self.ordering.max_reads_per_device
+        device_load: dict[Hashable, int] = {}
+        read_load: dict[Hashable, int] = {}
+        running = 0
+        # (완료 여부, 작업, 결과 또는 진행 정보)
+        events: queue.Queue[tuple[bool, ScheduledOperation, Any]] = queue.Queue()
+
+        def worker(operation: ScheduledOperation) -> None:
+            if on_progress is not None:
+                _reporter.report = lambda payload: events.put((False, operation, payload))
+            result: Any = None
+            try:
+                try:
+                    result = execute(operation.item)
+                except Exception as e:
+                    logger.error(f"파일 작업 실행 중 오류: {e}")
+                    result = on_error(operation.item, e)
+            except BaseException as e:
+                logger.error(f"파일 작업 오류 처리 실패: {e}")
+                result = _WorkerFailure(e)
+            finally:
+                _reporter.report = None
+                # 어떤 경우에도 완료를 알려야 호출한 스레드가 events.get()에서 멈추지 않음
+                events.put((True, operation, result))
+
+        def can_start(operation: ScheduledOperation) -> bool:
+            if not operation.heavy:
+                return True
+            if (
+                read_limit is not None
+                and operation.source_device is not None
+                and read_load.get(operation.source_device, 0) >= read_limit
+            ):
+                return False
+            return all(
+                device_load.get(device, 0) < self.per_device_limit for device in operation.devices
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="file-operation"
+        ) as executor:
+            finished = 0
+            while finished < len(operations):
+                # 순서 정책의 우선순위대로 시작 가능한 작업을 모두 시작
+                ready.sort(key=rank.__getitem__)
+                waiting = []
+                for index in ready:
+                    operation = operations[index]
+                    if running >= self.max_workers or not can_start(operation):
+                        waiting.append(index)
+                        continue
+                    if operation.heavy:
+                        for device in operation.devices:
+                            device_load[device] = device_load.get(device, 0) + 1
+                        if operation.source_device is not None:
+                            source = operation.source_device
+                            read_load[source] = read_load.get(source, 0) + 1
+                    running += 1
+                    if on_start:
+                        on_start(index, operation.item)
+                    executor.submit(worker, operation)
+                ready = waiting
+
+                done, operation, result = events.get()
+                if not done:
+                    if on_progress is not None:
+                        on_progress(operation.index, operation.item, result)
+                    continue
+                running -= 1
+                finished += 1
+                if isinstance(result, _WorkerFailure):
+                    raise result.error
+                if operation.heavy:
+                    for device in operation.devices:
+                        device_load[device] -= 1
+                    if operation.source_device is not None:
+                        read_load[operation.source_device] -= 1
+                results[operation.index] = result
+                if on_complete:
+                    on_complete(operation.index, operation.item, result)
+                for dependent in dependents.get(operation.index, ()):
+                    remaining_dependencies[dependent] -= 1
+                    if remaining_dependencies[dependent] == 0:
+                        ready.append(dependent)
+        return results
@@ -0,0 +1,424 @@
+"""
+가상 파일 시스템 기반 드라이런
+
+관련 디렉토리를 한 번씩만 읽어 스냅샷을 만들고, 그 위의 메모리 오버레이에 계획을
+순서대로 적용하여 결과를 예측합니다. 계획마다 stat/exists를 호출하지 않고, 대상
+디렉토리를 만들지도 않습니다.
+
+예측 항목:
+    - 충돌 (기존 파일 및 앞선 계획이 만든 파일과의 충돌, 실행 시 바뀔 이름)
+    - 원본 누락 (앞선 계획이 옮긴 파일 포함)
+    - 장치별 필요 공간과 남은 공간
+    - 새로 만들어질 디렉토리와 바뀌는 디렉토리의 최종 파일 목록
+
+화질이 더 좋은 파일로 교체하는 계획(metadata["replaces"])은 실행기처럼 처리합니다.
+대상이 교체할 파일과 같으면 덮어쓰고, 다르면 교체할 파일이 목록에서 빠집니다.
+"""
+
+import errno
+import logging
+import os
+import shutil
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MAX_UNIQUE_ATTEMPTS = 1000
+
+# 실제 이동이 데이터 복사 없이 이름 변경으로 끝날 수 있는 작업 종류
+RENAME_LIKE_OPERATIONS = {"move", "rename"}
+
+STATUS_SUCCESS = "success"
+STATUS_CONFLICT = "conflict"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class VirtualEntry:
+    """가상 파일 시스템의 항목 (크기는 필요할 때 한 번만 stat)"""
+
+    name: str
+    is_dir: bool
+    size: int | None = None
+    dir_entry: os.DirEntry | None = field(default=None, repr=False)
+
+    def get_size(self) -> int:
+        if self.size is None:
+            try:
+                self.size = self.dir_entry.stat().st_size if self.dir_entry else 0
+            except OSError:
+                self.size = 0
+        return self.size
+
+
+DirectoryLister = Callable[[Path], Iterable[VirtualEntry] | None]
+
+
+def scan_directory_entries(directory: Path) -> list[VirtualEntry] | None:
+    """디렉토리 항목 목록 (디렉토리가 없으면 None)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [VirtualEntry(entry.name, entry.is_dir(), dir_entry=entry) for entry in entries]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except PermissionError:
+        logger.warning(f"디렉토리를 읽을 수 없습니다: {directory}")
+        return []
+
+
+def _operation_kind(operation_type: Any) -> str:
+    return str(getattr(operation_type, "value", operation_type)).lower()
+
+
+class VirtualFileSystem:
+    """디렉토리 스냅샷 위의 메모리 오버레이
+
+    디렉토리는 처음 필요할 때 한 번만 읽습니다. 상위 디렉토리를 이미 읽었고 그 안에
+    없는 하위 디렉토리는 읽지 않고 없는 것으로 처리합니다. 이후의 생성/삭제/이동은
+    오버레이에만 반영되며 실제 파일 시스템은 바뀌지 않습니다.
+    """
+
+    def __init__(
+        self,
+        lister: DirectoryLister | None = None,
+        stat: Callable[[Path], os.stat_result] | None = None,
+        disk_usage: Callable[[Path], Any] | None = None,
+    ):
+        """
+        Args:
+            lister: 디렉토리 항목 목록을 반환하는 함수 (없는 디렉토리는 None)
+            stat: 장치 번호 조회용 stat 함수
+            disk_usage: 남은 공간 조회 함수 (shutil.disk_usage 형식)
+        """
+        self._lister = lister or scan_directory_entries
+        self._stat = stat or os.stat
+        self._disk_usage = disk_usage or shutil.disk_usage
+        self._dirs: dict[Path, dict[str, VirtualEntry] | None] = {}
+        self._devices: dict[Path, int | None] = {}
+        self._free_space: dict[int, int] = {}
+        self._writable: dict[Path, bool] = {}
+        self.created_directories: list[Path] = []
+        self._created: set[Path] = set()
+        self.touched_directories: set[Path] = set()
+        self.listings = 0
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return os.path.normcase(name)
+
+    def _load(self, directory: Path) -> dict[str, VirtualEntry] | None:
+        if directory in self._dirs:
+            return self._dirs[directory]
+        parent = directory.parent
+        if parent != directory and parent in self._dirs:
+            # 상위 디렉토리 목록으로 존재 여부를 알 수 있으면 읽지 않음
+            siblings = self._dirs[parent]
+            entry = siblings.get(self._key(directory.name)) if siblings is not None else None
+            if entry is None or not entry.is_dir:
+                self._dirs[directory] = None
+                return None
+        entries = self._lister(directory)
+        self.listings += 1
+        listing = None if entries is None else {self._key(e.name): e for e in entries}
+        self._dirs[directory] = listing
+        return listing
+
+    def entry(self, path: Path) -> VirtualEntry | None:
+        path = Path(path)
+        listing = self._load(path.parent)
+        return listing.get(self._key(path.name)) if listing is not None else None
+
+    def exists(self, path: Path) -> bool:
+        return self.entry(path) is not None
+
+    def is_dir(self, path: Path) -> bool:
+        path = Path(path)
+        return self._load(path) is not None
+
+    def listdir(self, directory: Path) -> list[str]:
+        listing = self._load(Path(directory))
+        return sorted(entry.name for entry in (listing or {}).values())
+
+    def makedirs(self, directory: Path) -> dict[str, VirtualEntry]:
+        """
+        디렉토리 생성 (오버레이에만 반영)
+
+        Returns:
+            디렉토리의 항목 목록
+
+        Raises:
+            NotADirectoryError: 경로 중간에 같은 이름의 파일이 있는 경우
+        """
+        directory = Path(directory)
+        listing = self._load(directory)
+        if listing is not None:
+            return listing
+        parent = directory.parent
+        if parent != directory:
+            siblings = self.makedirs(parent)
+            key = self._key(directory.name)
+            existing = siblings.get(key)
+            if existing is not None and not existing.is_dir:
+                raise NotADirectoryError(
+                    errno.ENOTDIR, "같은 이름의 파일이 있습니다", str(directory)
+                )
+            siblings[key] = VirtualEntry(directory.name, True)
+            self.touched_directories.add(parent)
+        listing = {}
+        self._dirs[directory] = listing
+        self.created_directories.append(directory)
+        self._created.add(directory)
+        return listing
+
+    def add_file(self, path: Path, size: int) -> None:
+        path = Path(path)
+        self.makedirs(path.parent)[self._key(path.name)] = VirtualEntry(path.name, False, size)
+        self.touched_directories.add(path.parent)
+
+    def remove(self, path: Path) -> None:
+        path = Path(path)
+        listing = self._load(path.parent)
+        if listing is not None and listing.pop(self._key(path.name), None) is not None:
+            self.touched_directories.add(path.parent)
+
+    def existing_ancestor(self, path: Path) -> Path:
+        """실제로 존재하는 가장 가까운 상위 디렉토리 (오버레이에서 만든 디렉토리 제외)"""
+        current = Path(path)
+        while current.parent != current and (current in self._created or not self.is_dir(current)):
+            current = current.parent
+        return current
+
+    def device_of(self, path: Path) -> int | None:
+        """경로가 놓일 장치 번호 (없는 경로는 가장 가까운 실제 상위 디렉토리 기준)"""
+        ancestor = self.existing_ancestor(Path(path))
+        if ancestor not in self._devices:
+            try:
+                self._devices[ancestor] = self._stat(ancestor).st_dev
+            except OSError:
+                self._devices[ancestor] = None
+        return self._devices[ancestor]
+
+    def free_space(self, path: Path) -> int | None:
+        """경로가 놓일 장치의 남은 공간 (장치마다 한 번 조회)"""
+        device = self.device_of(path)
+        if device is None:
+            return None
+        if device not in self._free_space:
+            try:
+                self._free_space[device] = self._disk_usage(self.existing_ancestor(path)).free
+            except OSError:
+                return None
+        return self._free_space[device]
+
+    def can_create(self, path: Path) -> bool:
+        """경로를 만들 수 있는지 (실제 상위 디렉토리의 쓰기 권한, 디렉토리마다 한 번 확인)"""
+        ancestor = self.existing_ancestor(Path(path).parent)
+        if ancestor not in self._writable:
+            self._writable[ancestor] = os.access(ancestor, os.W_OK)
+        return self._writable[ancestor]
+
+    def resulting_tree(self) -> dict[str, list[str]]:
+        """내용이 바뀌는 디렉토리별 최종 항목 목록"""
+        return {
+            str(directory): self.listdir(directory)
+            for directory in sorted(self.touched_directories)
+        }
+
+    def unique_name(self, target_path: Path) -> Path:
+        """오버레이 기준으로 비어 있는 '이름_N' 경로"""
+        for counter in range(1, MAX_UNIQUE_ATTEMPTS + 1):
+            candidate = target_path.with_name(f"{target_path.stem}_{counter}{target_path.suffix}")
+            if not self.exists(candidate):
+                return candidate
+        raise FileExistsError(f"{target_path}: 사용할 수 있는 이름이 없습니다")
+
+
+@dataclass
+class PlanSimulation:
+    """계획 하나의 드라이런 결과"""
+
+    index: int
+    source: Path
+    target: Path
+    operation: str
+    status: str = STATUS_SUCCESS
+    issues: list[str] = field(default_factory=list)
+    size: int = 0
+    resolved_target: Path | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        detail: dict[str, Any] = {
+            "source": str(self.source),
+            "target": str(self.target),
+            "operation": self.operation,
+            "status": self.status,
+            "issues": list(self.issues),
+            "size": self.size,
+        }
+        if self.resolved_target is not None:
+            detail["resolved_target"] = str(self.resolved_target)
+        return detail
+
+
+@dataclass
+class SpaceEstimate:
+    """장치 하나의 필요 공간 예측"""
+
+    device: int
+    path: Path
+    required_bytes: int = 0
+    free_bytes: int | None = None
+
+    @property
+    def sufficient(self) -> bool:
+        return self.free_bytes is None or self.required_bytes <= self.free_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "device": self.device,
+            "path": str(self.path),
+            "required_bytes": self.required_bytes,
+            "free_bytes": self.free_bytes,
+            "sufficient": self.sufficient,
+        }
+
+
+@dataclass
+class DryRunReport:
+    """드라이런 전체 결과"""
+
+    simulations: list[PlanSimulation] = field(default_factory=list)
+    space: list[SpaceEstimate] = field(default_factory=list)
+    created_directories: list[Path] = field(default_factory=list)
+    resulting_tree: dict[str, list[str]] = field(default_factory=dict)
+    listings: int = 0
+
+    def count(self, status: str) -> int:
+        return sum(1 for simulation in self.simulations if simulation.status == status)
+
+    @property
+    def total_size(self) -> int:
+        return sum(simulation.size for simulation in self.simulations)
+
+    @property
+    def space_sufficient(self) -> bool:
+        return all(estimate.sufficient for estimate in self.space)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_plans": len(self.simulations),
+            "successful": self.count(STATUS_SUCCESS),
+            "conflicts": self.count(STATUS_CONFLICT),
+            "errors": self.count(STATUS_ERROR),
+            "total_size": self.total_size,
+            "details": [simulation.to_dict() for simulation in self.simulations],
+            "space": [estimate.to_dict() for estimate in self.space],
+            "space_sufficient": self.space_sufficient,
+            "created_directories": [str(path) for path in self.created_directories],
+            "resulting_tree": self.resulting_tree,
+        }
+
+
+def simulate_plans(
+    plans: list[Any],
+    fs: VirtualFileSystem | None = None,
+    rename_on_conflict: bool = True,
+    max_path_length: int | None = None,
+) -> DryRunReport:
+    """
+    작업 계획을 가상 파일 시스템에 순서대로 적용하여 결과 예측
+
+    Args:
+        plans: source_path, target_path, operation_type 속성을 가진 작업 계획 리스트
+        fs: 사용할 가상 파일 시스템 (None이면 새로 생성)
+        rename_on_conflict: 실행 시처럼 충돌하면 '이름_N'으로 바꾼다고 가정할지 여부
+            (False면 기존 대상을 덮어쓴다고 가정)
+        max_path_length: 대상 경로 길이 경고 기준
+    """
+    fs = fs or VirtualFileSystem()
+    report = DryRunReport()
+    required: dict[int, SpaceEstimate] = {}
+
+    for index, plan in enumerate(plans):
+        source = Path(plan.source_path)
+        target = Path(plan.target_path)
+        operation = _operation_kind(plan.operation_type)
+        simulation = PlanSimulation(index, source, target, operation)
+        report.simulations.append(simulation)
+
+        source_entry = fs.entry(source)
+        if source_entry is None or source_entry.is_dir:
+            simulation.status = STATUS_ERROR
+            simulation.issues.append("Source file does not exist")
+            continue
+        # 스캔 스냅샷이 있으면 크기를 다시 stat 하지 않음
+        snapshot = getattr(plan, "source_snapshot", None)
+        simulation.size = snapshot.size if snapshot is not None else source_entry.get_size()
+        if max_path_length and len(str(target)) > max_path_length:
+            simulation.issues.append(f"Target path too long: {len(str(target))} characters")
+        if not fs.can_create(target):
+            simulation.status = STATUS_ERROR
+            simulation.issues.append(f"Cannot create target directory: {target.parent}")
+            continue
+        try:
+            fs.makedirs(target.parent)
+        except NotADirectoryError as e:
+            simulation.status = STATUS_ERROR
+            simulation.issues.append(f"Target directory path is a file: {e.filename}")
+            continue
+
+        final_target = target
+        replaced_bytes = 0
+        replaces = (getattr(plan, "metadata", None) or {}).get("replaces")
+        replaced = Path(replaces) if replaces else None
+        existing = fs.entry(target)
+        if existing is not None and replaced == target:
+            # 같은 이름의 낮은 화질 파일은 실행 시 덮어씀
+            replaced_bytes = existing.get_size()
+        elif existing is not None:
+            simulation.status = STATUS_CONFLICT
+            simulation.issues.append("Target file already exists")
+            if rename_on_conflict:
+                final_target = fs.unique_name(target)
+                simulation.resolved_target = final_target
+            else:
+                # 덮어쓰면 기존 파일 크기만큼 공간이 돌아옴
+                replaced_bytes = existing.get_size()
+        if replaced is not None and replaced != target:
+            # 이름이 다른 낮은 화질 파일은 새 파일이 들어온 뒤 정리됨
+            replaced_entry = fs.entry(replaced)
+            if replaced_entry is not None and not replaced_entry.is_dir:
+                replaced_bytes += replaced_entry.get_size()
+                fs.remove(replaced)
+
+        source_device = fs.device_of(source)
+        target_device = fs.device_of(final_target)
+        copies_data = not (
+            operation in RENAME_LIKE_OPERATIONS
+            and source_device is not None
+            and source_device == target_device
+        )
+        delta = (simulation.size if copies_data else 0) - replaced_bytes
+        if delta and target_device is not None:
+            estimate = required.get(target_device)
+            if estimate is None:
+                estimate = SpaceEstimate(
+                    target_device,
+                    fs.existing_ancestor(final_target),
+                    free_bytes=fs.free_space(final_target),
+                )
+                required[target_device] = estimate
+            estimate.required_bytes += delta
+
+        fs.add_file(final_target, simulation.size)
+        if operation in RENAME_LIKE_OPERATIONS:
+            fs.remove(source)
+
+    report.space = list(required.values())
+    report.created_directories = list(fs.created_directories)
+    report.resulting_tree = fs.resulting_tree()
+    report.listings = fs.listings
+    return report
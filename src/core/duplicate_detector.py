@@ -0,0 +1,345 @@
+"""
+내용 기반 중복 파일 찾기
+
+라이브러리 전체를 해시하지 않도록 단계를 나눠 후보를 줄입니다.
+
+1. 크기: 크기가 같은 파일이 없으면 중복일 수 없음 (stat만 사용)
+2. 부분 지문: 앞/뒤 블록과 가운데에서 고르게 뽑은 블록만 읽은 해시
+3. 전체 해시: 부분 지문까지 같은 파일만 끝까지 읽어 확인
+   (파일이 지문 블록보다 작으면 부분 지문이 곧 전체 내용이므로 생략)
+
+지문은 (장치, inode, 크기, 수정 시각)을 키로 캐시하므로 바뀌지 않은 파일은 다시 읽지
+않습니다. 같은 inode를 가리키는 하드 링크는 같은 파일로 보고 한 번만 셉니다.
+
+- FingerprintCache: 부분/전체 해시 캐시 (JSON 파일로 저장 가능)
+- partial_fingerprint / full_content_hash: 파일 지문
+- DuplicateGroup / DuplicateScanResult: 찾은 중복 묶음과 검사 결과
+- find_duplicates: 단계별 중복 검사 (묶음을 찾을 때마다 콜백)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.core.file_snapshot import FileSnapshot
+from src.core.utils.atomic_file import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# 부분 지문 블록 크기와 가운데에서 읽는 블록 수
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+FINGERPRINT_MIDDLE_BLOCKS = 4
+# 전체 해시 읽기 단위
+FULL_HASH_BUFFER_SIZE = 1024 * 1024
+# 캐시 파일 형식 버전 (지문 방식이 바뀌면 올림)
+CACHE_VERSION = 1
+
+PARTIAL = "partial"
+FULL = "full"
+
+FingerprintKey = tuple[int, int, int, int]
+
+
+def fingerprint_key(snapshot: FileSnapshot) -> FingerprintKey | None:
+    """캐시 키 (장치, inode, 크기, 수정 시각), inode를 모르면 캐시하지 않음 (None)"""
+    if not snapshot.inode:
+        return None
+    return (snapshot.device, snapshot.inode, snapshot.size, snapshot.mtime_ns)
+
+
+def _fingerprint_offsets(size: int, block_size: int, middle_blocks: int) -> list[int]:
+    """부분 지문에서 읽을 블록 시작 위치 (앞, 가운데 고르게, 뒤)"""
+    last = size - block_size
+    step = last / (middle_blocks + 1)
+    middle = [int(step * (number + 1)) for number in range(middle_blocks)]
+    return [0, *middle, last]
+
+
+def partial_fingerprint(
+    path: Path,
+    block_size: int = FINGERPRINT_BLOCK_SIZE,
+    middle_blocks: int = FINGERPRINT_MIDDLE_BLOCKS,
+) -> str:
+    """
+    파일 앞/뒤 블록과 가운데 블록 middle_blocks개, 크기로 만든 해시
+
+    파일이 읽을 블록을 모두 합친 것보다 작으면 전체 내용을 해시합니다
+    (covers_whole_file이 True인 경우).
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with Path(path).open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        hasher.update(size.to_bytes(8, "little"))
+        if covers_whole_file(size, block_size, middle_blocks):
+            hasher.update(file.read())
+            return hasher.hexdigest()
+        for offset in _fingerprint_offsets(size, block_size, middle_blocks):
+            file.seek(offset)
+            hasher.update(file.read(block_size))
+    return hasher.hexdigest()
+
+
+def covers_whole_file(
+    size: int,
+    block_size: int = FINGERPRINT_BLOCK_SIZE,
+    middle_blocks: int = FINGERPRINT_MIDDLE_BLOCKS,
+) -> bool:
+    """부분 지문이 파일 전체를 읽는지 (그러면 전체 해시가 필요 없음)"""
+    return size <= (middle_blocks + 2) * block_size
+
+
+def full_content_hash(
+    path: Path,
+    is_cancelled: Callable[[], bool] | None = None,
+    buffer_size: int = FULL_HASH_BUFFER_SIZE,
+) -> str | None:
+    """파일 전체 해시 (중간에 취소되면 None)"""
+    hasher = hashlib.blake2b()
+    with Path(path).open("rb") as file:
+        while data := file.read(buffer_size):
+            if is_cancelled is not None and is_cancelled():
+                return None
+            hasher.update(data)
+    return hasher.hexdigest()
+
+
+class FingerprintCache:
+    """(장치, inode, 크기, 수정 시각) → 부분/전체 해시 캐시
+
+    파일이 바뀌면 크기나 수정 시각이 달라져 키가 바뀌므로 오래된 값을 쓰지 않습니다.
+    path를 주면 load()/save()로 다음 검사까지 유지합니다.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else None
+        self._entries: dict[FingerprintKey, dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: FingerprintKey, kind: str) -> str | None:
+        with self._lock:
+            value = self._entries.get(key, {}).get(kind)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: FingerprintKey, kind: str, value: str) -> None:
+        with self._lock:
+            self._entries.setdefault(key, {})[kind] = value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> int:
+        """캐시 파일 읽기 (없거나 형식이 다르면 빈 캐시)
+
+        Returns:
+            읽은 항목 수
+        """
+        if self.path is None:
+            return 0
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"중복 검사 캐시를 읽을 수 없습니다: {self.path} - {e}")
+            return 0
+        if data.get("version") != CACHE_VERSION:
+            return 0
+        entries = {}
+        for raw_key, values in data.get("entries", {}).items():
+            try:
+                key = tuple(int(part) for part in raw_key.split(":"))
+            except ValueError:
+                continue
+            if len(key) == 4 and isinstance(values, dict):
+                entries[key] = {kind: str(value) for kind, value in values.items()}
+        with self._lock:
+            self._entries.update(entries)
+        return len(entries)
+
+    def save(self) -> None:
+        """캐시 파일 저장 (원자적 쓰기)"""
+        if self.path is None:
+            return
+        with self._lock:
+            entries = {
+                ":".join(str(part) for part in key): values for key, values in self._entries.items()
+            }
+        payload = json.dumps({"version": CACHE_VERSION, "entries": entries})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(self.path, payload.encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"중복 검사 캐시를 저장할 수 없습니다: {self.path} - {e}")
+
+
+@dataclass(frozen=True)
+class DuplicateGroup:
+    """내용이 같은 파일 묶음"""
+
+    size: int
+    digest: str
+    paths: tuple[Path, ...]
+
+    @property
+    def wasted_bytes(self) -> int:
+        """하나만 남기면 줄일 수 있는 용량"""
+        return self.size * (len(self.paths) - 1)
+
+
+@dataclass
+class DuplicateScanResult:
+    """중복 검사 결과와 단계별 처리량"""
+
+    groups: list[DuplicateGroup] = field(default_factory=list)
+    files_scanned: int = 0
+    size_candidates: int = 0
+    partial_hashed: int = 0
+    full_hashed: int = 0
+    cancelled: bool = False
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def wasted_bytes(self) -> int:
+        return sum(group.wasted_bytes for group in self.groups)
+
+
+def _distinct_files(snapshots: Iterable[FileSnapshot]) -> list[FileSnapshot]:
+    """같은 경로나 같은 inode(하드 링크)는 하나만 남김"""
+    seen_paths: set[Path] = set()
+    seen_inodes: set[tuple[int, int]] = set()
+    distinct = []
+    for snapshot in snapshots:
+        if snapshot.path in seen_paths:
+            continue
+        seen_paths.add(snapshot.path)
+        if snapshot.inode:
+            inode = (snapshot.device, snapshot.inode)
+            if inode in seen_inodes:
+                continue
+            seen_inodes.add(inode)
+        distinct.append(snapshot)
+    return distinct
+
+
+def find_duplicates(
+    snapshots: Iterable[FileSnapshot],
+    cache: FingerprintCache | None = None,
+    *,
+    on_group: Callable[[DuplicateGroup], None] | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+    min_size: int = 1,
+    verify_full: bool = True,
+) -> DuplicateScanResult:
+    """
+    크기 → 부분 지문 → 전체 해시 순으로 중복 파일 찾기
+
+    큰 파일부터 검사하므로 줄일 수 있는 용량이 큰 묶음이 먼저 보고됩니다.
+
+    Args:
+        snapshots: 검사할 파일 스냅샷 (스캔 결과를 그대로 사용, 추가 stat 없음)
+        cache: 지문 캐시 (None이면 이번 검사에서만 사용)
+        on_group: 묶음을 확인할 때마다 호출 (화면을 점진적으로 채울 때 사용)
+        progress_callback: (처리한 후보 수, 전체 후보 수)
+        is_cancelled: True를 반환하면 남은 후보를 건너뜀
+        min_size: 이보다 작은 파일은 검사하지 않음 (빈 파일 제외)
+        verify_full: False면 부분 지문이 같으면 중복으로 판정
+
+    Returns:
+        DuplicateScanResult
+    """
+    cache = cache if cache is not None else FingerprintCache()
+    cancelled = is_cancelled or (lambda: False)
+    result = DuplicateScanResult()
+    files = _distinct_files(snapshots)
+    result.files_scanned = len(files)
+
+    by_size: dict[int, list[FileSnapshot]] = defaultdict(list)
+    for snapshot in files:
+        if snapshot.size >= min_size:
+            by_size[snapshot.size].append(snapshot)
+    size_groups = sorted(
+        (group for group in by_size.values() if len(group) > 1),
+        key=lambda group: group[0].size,
+        reverse=True,
+    )
+    total = sum(len(group) for group in size_groups)
+    result.size_candidates = total
+    done = 0
+
+    def hashed(snapshot: FileSnapshot, kind: str) -> str | None:
+        key = fingerprint_key(snapshot)
+        digest = cache.get(key, kind) if key is not None else None
+        if digest is not None:
+            return digest
+        try:
+            if kind == PARTIAL:
+                digest = partial_fingerprint(snapshot.path)
+                result.partial_hashed += 1
+            else:
+                digest = full_content_hash(snapshot.path, cancelled)
+                if digest is None:
+                    return None
+                result.full_hashed += 1
+        except OSError as e:
+            result.errors.append(f"{snapshot.path}: {e}")
+            return None
+        if key is not None:
+            cache.put(key, kind, digest)
+        return digest
+
+    for size_group in size_groups:
+        if cancelled():
+            result.cancelled = True
+            break
+        by_partial: dict[str, list[FileSnapshot]] = defaultdict(list)
+        for snapshot in size_group:
+            digest = hashed(snapshot, PARTIAL)
+            if digest is not None:
+                by_partial[digest].append(snapshot)
+        done += len(size_group)
+        for partial, candidates in by_partial.items():
+            if len(candidates) < 2:
+                continue
+            size = candidates[0].size
+            if not verify_full or covers_whole_file(size):
+                confirmed = {partial: candidates}
+            else:
+                confirmed = defaultdict(list)
+                for snapshot in candidates:
+                    digest = hashed(snapshot, FULL)
+                    if digest is not None:
+                        confirmed[digest].append(snapshot)
+                if cancelled():
+                    result.cancelled = True
+                    break
+            for digest, members in confirmed.items():
+                if len(members) < 2:
+                    continue
+                group = DuplicateGroup(size, digest, tuple(member.path for member in members))
+                result.groups.append(group)
+                if on_group is not None:
+                    on_group(group)
+        if progress_callback is not None:
+            progress_callback(done, total)
+        if result.cancelled:
+            break
+
+    logger.info(
+        f"중복 검사: 파일 {result.files_scanned}개, 크기 후보 {result.size_candidates}개, "
+        f"부분 지문 {result.partial_hashed}개, 전체 해시 {result.full_hashed}개, "
+        f"중복 묶음 {len(result.groups)}개"
+    )
+    return result
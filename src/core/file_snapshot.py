@@ -0,0 +1,243 @@
+"""
+파일 스냅샷 (스캔 시점의 stat 정보)
+
+스캔할 때 한 번 읽은 크기/수정 시각/inode/장치 번호를 파싱, 그룹화, 계획, 프리플라이트,
+실행 단계까지 그대로 넘겨서 단계마다 stat/exists를 다시 호출하지 않습니다. NFS 같은
+네트워크 파일 시스템에서는 stat 한 번이 서버 왕복 한 번입니다.
+
+- FileSnapshot: 파일 하나의 stat 정보
+- iter_file_snapshots: os.scandir 기반 디렉토리 스캔 (확장자가 맞는 파일만 stat)
+- verify_snapshot: 파일을 바꾸기 직전에 한 번만 다시 stat 해서 스캔 이후 변경 여부 확인
+- StatCache: 한 번의 검사 동안 여러 검사기가 같은 stat 결과를 공유
+"""
+
+import logging
+import os
+import stat as stat_module
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FileSnapshot:
+    """스캔 시점의 파일 stat 정보
+
+    inode/device가 0이면 (일부 Windows/네트워크 파일 시스템) 비교에서 제외합니다.
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int = 0
+    device: int = 0
+
+    @classmethod
+    def from_stat(cls, path: Path, st: os.stat_result) -> "FileSnapshot":
+        return cls(Path(path), st.st_size, st.st_mtime_ns, st.st_ino, st.st_dev)
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> "FileSnapshot":
+        """scandir 항목에서 생성 (Windows에서는 추가 stat 호출 없음)"""
+        return cls.from_stat(Path(entry.path), entry.stat())
+
+    @classmethod
+    def capture(cls, path: Path) -> "FileSnapshot":
+        """경로를 한 번 stat 해서 생성 (없으면 OSError)"""
+        return cls.from_stat(path, Path(path).stat())
+
+    @property
+    def size_mb(self) -> float:
+        return self.size / (1024 * 1024)
+
+    def changes(self, st: os.stat_result) -> list[str]:
+        """현재 stat과 달라진 항목 이름 목록 (같으면 빈 리스트)"""
+        changed = []
+        if st.st_size != self.size:
+            changed.append("size")
+        if st.st_mtime_ns != self.mtime_ns:
+            changed.append("mtime")
+        if self.inode and st.st_ino and st.st_ino != self.inode:
+            changed.append("inode")
+        if self.device and st.st_dev and st.st_dev != self.device:
+            changed.append("device")
+        return changed
+
+    def matches(self, st: os.stat_result) -> bool:
+        return not self.changes(st)
+
+
+class StaleFileError(OSError):
+    """스캔 이후 파일이 바뀌어 스냅샷을 믿을 수 없음"""
+
+    def __init__(self, snapshot: FileSnapshot, changes: list[str]):
+        super().__init__(f"스캔 이후 파일이 변경되었습니다: {snapshot.path} ({', '.join(changes)})")
+        self.snapshot = snapshot
+        self.changes = changes
+
+
+def capture_snapshot(path: Path) -> FileSnapshot | None:
+    """스냅샷 생성 (없거나 접근할 수 없으면 None)"""
+    try:
+        return FileSnapshot.capture(path)
+    except OSError:
+        return None
+
+
+def verify_snapshot(snapshot: FileSnapshot, path: Path | None = None) -> os.stat_result:
+    """
+    파일을 바꾸기 직전에 한 번 stat 해서 스캔 이후 바뀌지 않았는지 확인
+
+    Args:
+        snapshot: 스캔 시점의 스냅샷
+        path: 확인할 경로 (None이면 스냅샷 경로)
+
+    Returns:
+        방금 읽은 stat 결과 (이후 단계에서 다시 stat 하지 않고 사용)
+
+    Raises:
+        FileNotFoundError: 파일이 없어짐
+        StaleFileError: 크기, 수정 시각, inode 또는 장치가 바뀜
+    """
+    st = Path(path or snapshot.path).stat()
+    if not stat_module.S_ISREG(st.st_mode):
+        raise StaleFileError(snapshot, ["type"])
+    changes = snapshot.changes(st)
+    if changes:
+        raise StaleFileError(snapshot, changes)
+    return st
+
+
+def iter_file_snapshots(
+    directory: Path,
+    recursive: bool = True,
+    extensions: set[str] | None = None,
+    on_error: Callable[[Path, OSError], None] | None = None,
+) -> Iterator[FileSnapshot]:
+    """
+    디렉토리의 파일 스냅샷을 scandir로 수집
+
+    확장자가 맞지 않는 파일은 stat 하지 않습니다. 심볼릭 링크 디렉토리는 순환을 피하기
+    위해 따라가지 않습니다 (파일 심볼릭 링크는 대상 파일 기준).
+
+    Args:
+        directory: 스캔할 디렉토리
+        recursive: 하위 디렉토리 포함 여부
+        extensions: 포함할 확장자 (소문자, 점 포함). None이면 전체
+        on_error: 읽을 수 없는 항목마다 호출 (경로, 예외)
+    """
+    pending = [Path(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append(Path(entry.path))
+                            continue
+                        if (
+                            extensions is not None
+                            and Path(entry.name).suffix.lower() not in extensions
+                        ):
+                            continue
+                        if not entry.is_file():
+                            continue
+                        yield FileSnapshot.from_dir_entry(entry)
+                    except OSError as e:
+                        if on_error:
+                            on_error(Path(entry.path), e)
+        except OSError as e:
+            if on_error:
+                on_error(current, e)
+
+
+class _Missing(Enum):
+    """StatCache에서 아직 조회하지 않은 경로 (없는 경로의 None과 구분)"""
+
+    MISSING = "missing"
+
+
+_MISSING = _Missing.MISSING
+
+
+class StatCache:
+    """경로별 stat 결과 캐시
+
+    한 번의 검사나 계획 동안만 사용합니다. 없는 경로도 기억하므로 같은 경로의
+    exists/is_file/is_dir/크기 조회는 stat 한 번으로 끝납니다. 스캔 스냅샷을 넣어 두면
+    그 파일은 stat 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        snapshots: Iterable[FileSnapshot] = (),
+        stat: Callable[[Path], os.stat_result] | None = None,
+    ):
+        self._stat = stat or os.stat
+        self._entries: dict[Path, FileSnapshot | os.stat_result | None] = {}
+        self.stat_calls = 0
+        for snapshot in snapshots:
+            self.seed(snapshot)
+
+    def seed(self, snapshot: FileSnapshot) -> None:
+        self._entries[snapshot.path] = snapshot
+
+    def forget(self, path: Path) -> None:
+        """경로가 바뀌었을 때 (디렉토리 생성 등) 캐시에서 제거"""
+        self._entries.pop(Path(path), None)
+
+    def lookup(self, path: Path) -> FileSnapshot | os.stat_result | None:
+        path = Path(path)
+        value = self._entries.get(path, _MISSING)
+        if value is _MISSING:
+            self.stat_calls += 1
+            try:
+                value = self._stat(path)
+            except (OSError, ValueError):
+                value = None
+            self._entries[path] = value
+        return value
+
+    def exists(self, path: Path) -> bool:
+        return self.lookup(path) is not None
+
+    def is_file(self, path: Path) -> bool:
+        value = self.lookup(path)
+        if isinstance(value, FileSnapshot):
+            return True
+        return value is not None and stat_module.S_ISREG(value.st_mode)
+
+    def is_dir(self, path: Path) -> bool:
+        value = self.lookup(path)
+        if value is None or isinstance(value, FileSnapshot):
+            return False
+        return stat_module.S_ISDIR(value.st_mode)
+
+    def size(self, path: Path) -> int | None:
+        value = self.lookup(path)
+        if value is None:
+            return None
+        return value.size if isinstance(value, FileSnapshot) else value.st_size
+
+    def identity(self, path: Path) -> tuple[int, int] | None:
+        """(장치, inode) 쌍 (없거나 알 수 없으면 None)"""
+        value = self.lookup(path)
+        if value is None:
+            return None
+        if isinstance(value, FileSnapshot):
+            device, inode = value.device, value.inode
+        else:
+            device, inode = value.st_dev, value.st_ino
+        return (device, inode) if inode else None
+
+    def same_file(self, first: Path, second: Path) -> bool:
+        """두 경로가 같은 파일인지 (inode를 모르면 경로를 resolve 해서 비교)"""
+        first_identity, second_identity = self.identity(first), self.identity(second)
+        if first_identity is not None and second_identity is not None:
+            return first_identity == second_identity
+        return Path(first).resolve() == Path(second).resolve()
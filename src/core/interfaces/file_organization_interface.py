@@ -13,10 +13,14 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from src.core.file_snapshot import FileSnapshot
 from src.core.types import FileOperationResult
 
+if TYPE_CHECKING:
+    from src.core.planning_index import TargetNamespace
+
 
 class FileOperationType(Enum):
     """File operation types"""
@@ -48,6 +52,8 @@ class FileOperationPlan:
     conflict_resolution: FileConflictResolution = FileConflictResolution.RENAME
     estimated_size: int = 0
     metadata: dict[str, Any] | None = None
+    # 스캔 시점의 원본 stat 정보 (실행 직전 변경 여부 확인에 사용)
+    source_snapshot: FileSnapshot | None = None
 
     def __post_init__(self):
         if self.metadata is None:
@@ -62,10 +68,14 @@ class FileScanResult:
     total_size: int
     scan_duration: float
     errors: list[str] | None = None
+    # 찾은 파일별 스냅샷 (이후 단계에서 다시 stat 하지 않도록)
+    snapshots: dict[Path, FileSnapshot] | None = None
 
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
+        if self.snapshots is None:
+            self.snapshots = {}
 
 
 class IFileScanner(ABC):
@@ -92,8 +102,16 @@ class IFileNamingStrategy(ABC):
         """Generate target path based on naming strategy"""
 
     @abstractmethod
-    def resolve_conflict(self, target_path: Path, resolution: FileConflictResolution) -> Path:
-        """Resolve file naming conflicts"""
+    def resolve_conflict(
+        self,
+        target_path: Path,
+        resolution: FileConflictResolution,
+        namespace: "TargetNamespace | None" = None,
+    ) -> Path:
+        """Resolve file naming conflicts
+
+        When a namespace is given, names are checked against it instead of the filesystem.
+        """
 
 
 class IFileOperationExecutor(ABC):
@@ -0,0 +1,131 @@
+"""
+정리 계획용 경로 인덱스
+
+- index_items_by_path: 그룹별 항목을 원본 경로로 한 번에 찾을 수 있도록 색인
+- TargetNamespace: 대상 디렉토리의 기존 파일명과 이번 계획에서 예약한 파일명을 메모리에
+  모아 두고, 이름 충돌을 exists() 호출 없이 해결 (디렉토리마다 목록 조회 한 번)
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from src.core.interfaces.file_organization_interface import FileConflictResolution
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_UNIQUE_ATTEMPTS = 1000
+
+DirectoryLister = Callable[[Path], Iterable[str]]
+
+
+def index_items_by_path(grouped_items: Mapping[str, Any] | None) -> dict[Path, Any]:
+    """
+    {그룹 키: 항목 리스트}를 {원본 경로: 항목}으로 색인
+
+    같은 경로가 여러 그룹에 있으면 먼저 나온 항목을 사용합니다 (기존 순회 순서와 동일).
+    """
+    index: dict[Path, Any] = {}
+    for group_items in (grouped_items or {}).values():
+        if not isinstance(group_items, list):
+            continue
+        for item in group_items:
+            source_path = getattr(item, "sourcePath", None)
+            if source_path:
+                index.setdefault(Path(source_path), item)
+    return index
+
+
+def _list_directory(directory: Path) -> Iterable[str]:
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+class TargetNamespace:
+    """대상 파일명 네임스페이스 (기존 파일 + 계획된 파일)
+
+    디렉토리를 처음 다룰 때 한 번만 목록을 읽고, 이후 충돌 확인과 예약은 메모리에서
+    처리합니다. 같은 계획 안에서 같은 이름을 두 번 배정하지 않습니다. 대소문자를
+    구분하지 않는 파일 시스템(Windows)에서는 os.path.normcase로 비교합니다.
+    """
+
+    def __init__(
+        self,
+        lister: DirectoryLister | None = None,
+        max_unique_attempts: int = DEFAULT_MAX_UNIQUE_ATTEMPTS,
+    ):
+        """
+        Args:
+            lister: 디렉토리의 파일명 목록을 반환하는 함수 (테스트용 교체 가능)
+            max_unique_attempts: 이름 뒤에 붙일 번호의 최대값
+        """
+        self._lister = lister or _list_directory
+        self.max_unique_attempts = max_unique_attempts
+        self._names: dict[Path, set[str]] = {}
+        self._lock = threading.Lock()
+        self.listings = 0
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return os.path.normcase(name)
+
+    def _directory_names(self, directory: Path) -> set[str]:
+        names = self._names.get(directory)
+        if names is None:
+            names = {self._key(name) for name in self._lister(directory)}
+            self._names[directory] = names
+            self.listings += 1
+        return names
+
+    def is_taken(self, path: Path) -> bool:
+        """기존 파일이거나 이미 예약된 이름인지 확인"""
+        path = Path(path)
+        with self._lock:
+            return self._key(path.name) in self._directory_names(path.parent)
+
+    def reserve(self, path: Path) -> Path:
+        """이름 예약 (이미 있어도 그대로 예약)"""
+        path = Path(path)
+        with self._lock:
+            self._directory_names(path.parent).add(self._key(path.name))
+        return path
+
+    def release(self, path: Path) -> None:
+        """예약 해제 (계획에서 빠진 파일)"""
+        path = Path(path)
+        with self._lock:
+            names = self._names.get(path.parent)
+            if names is not None:
+                names.discard(self._key(path.name))
+
+    def resolve(self, target_path: Path, resolution: FileConflictResolution) -> Path:
+        """
+        충돌을 해결한 대상 경로를 정하고 예약
+
+        RENAME이면 '이름_1.확장자', '이름_2.확장자' 순으로 비어 있는 이름을 찾고,
+        SKIP/OVERWRITE/BACKUP_AND_OVERWRITE는 원래 경로를 그대로 사용합니다.
+        """
+        target_path = Path(target_path)
+        with self._lock:
+            names = self._directory_names(target_path.parent)
+            if (
+                self._key(target_path.name) not in names
+                or resolution != FileConflictResolution.RENAME
+            ):
+                names.add(self._key(target_path.name))
+                return target_path
+            stem, suffix = target_path.stem, target_path.suffix
+            for counter in range(1, self.max_unique_attempts + 1):
+                candidate = f"{stem}_{counter}{suffix}"
+                if self._key(candidate) not in names:
+                    names.add(self._key(candidate))
+                    return target_path.with_name(candidate)
+        raise FileExistsError(
+            f"{target_path}: {self.max_unique_attempts}개 이름이 모두 사용 중입니다"
+        )
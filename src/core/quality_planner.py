@@ -0,0 +1,178 @@
+"""
+화질 분리 계획
+
+그룹 안에서 최고 화질 파일과 "_low res"로 보낼 파일을 나누는 결정 로직입니다.
+파일명(파서가 추출한 해상도 태그)을 먼저 사용하고, 파일명만으로는 결정할 수 없는
+파일만 컨테이너를 분석합니다. 결정된 해상도는 항목에 저장하여 다시 계산하지 않습니다.
+"""
+
+import logging
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.core.resolution_normalizer import get_resolution_priority, normalize_resolution
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_RESOLUTION = "Unknown"
+
+# 항목에 캐시하는 속성 이름
+RESOLVED_RESOLUTION_ATTR = "resolvedResolution"
+RESOLUTION_SOURCE_ATTR = "resolutionSource"
+
+# 결정 근거
+SOURCE_PARSED = "parsed"
+SOURCE_FILENAME = "filename"
+SOURCE_PROBE = "probe"
+SOURCE_UNKNOWN = "unknown"
+
+# 파일명의 해상도 태그 (1080p, 2160p, 4K, 1920x1080 등)
+_RESOLUTION_TAG_PATTERN = re.compile(
+    r"(?<![0-9a-z])(\d{3,4}[pi]|[248]k|uhd|fhd|qhd|\d{3,4}x\d{3,4})(?![0-9a-z])",
+    re.IGNORECASE,
+)
+
+ResolutionProber = Callable[[list[str]], dict[str, str | None]]
+
+
+@dataclass
+class QualityDecision:
+    """파일 하나의 화질 분리 결정"""
+
+    item: Any
+    source_path: str
+    resolution: str
+    source: str
+    is_best: bool = False
+
+    @property
+    def priority(self) -> int:
+        return get_resolution_priority(self.resolution)
+
+
+def resolution_from_filename(filename: str) -> str:
+    """
+    파일명의 해상도 태그를 정규화하여 반환
+
+    태그가 없거나 서로 다른 해상도 태그가 여러 개 있으면 Unknown을 반환합니다.
+    """
+    claims = {
+        normalize_resolution(match.group(1)) for match in _RESOLUTION_TAG_PATTERN.finditer(filename)
+    }
+    claims.discard(UNKNOWN_RESOLUTION)
+    if len(claims) != 1:
+        return UNKNOWN_RESOLUTION
+    return claims.pop()
+
+
+def default_resolution_prober(file_paths: list[str]) -> dict[str, str | None]:
+    """VideoMetadataExtractor로 컨테이너를 분석하여 해상도 반환"""
+    from src.core.video_metadata_extractor import VideoMetadataExtractor
+
+    return VideoMetadataExtractor().probe_resolutions(file_paths)
+
+
+class QualitySeparationPlanner:
+    """그룹별 최고 화질/저화질 분리 계획을 만드는 클래스
+
+    파일마다 해상도 주장(파서 결과, 파일명 태그)을 모아 정규화하고, 두 주장이
+    서로 다르거나 아무 주장도 없을 때만 분석 대상으로 표시합니다. 파일이 하나뿐인
+    그룹은 분리할 필요가 없으므로 분석하지 않습니다. 분석 대상은 전체 그룹에서
+    모아 한 번에 prober로 넘깁니다.
+    """
+
+    def __init__(self, prober: ResolutionProber | None = None):
+        """
+        Args:
+            prober: 파일 경로 리스트를 받아 {경로: 해상도 문자열 또는 None}을 반환하는 함수
+                (None이면 VideoMetadataExtractor 사용)
+        """
+        self.prober = prober or default_resolution_prober
+
+    def _claim(self, item) -> tuple[str, str, bool]:
+        """항목의 해상도 주장 (해상도, 근거, 분석 필요 여부)"""
+        cached = getattr(item, RESOLVED_RESOLUTION_ATTR, None)
+        if cached:
+            return cached, getattr(item, RESOLUTION_SOURCE_ATTR, None) or SOURCE_PARSED, False
+
+        parsed = normalize_resolution(getattr(item, "resolution", None) or "")
+        filename = getattr(item, "filename", None) or Path(item.sourcePath).name
+        from_filename = resolution_from_filename(filename)
+
+        if parsed != UNKNOWN_RESOLUTION and from_filename != UNKNOWN_RESOLUTION:
+            # 파서와 파일명이 서로 다르면 실제 해상도를 확인
+            return parsed, SOURCE_PARSED, parsed != from_filename
+        if parsed != UNKNOWN_RESOLUTION:
+            return parsed, SOURCE_PARSED, False
+        if from_filename != UNKNOWN_RESOLUTION:
+            return from_filename, SOURCE_FILENAME, False
+        return UNKNOWN_RESOLUTION, SOURCE_UNKNOWN, True
+
+    def plan(self, grouped_items: dict[str, Iterable]) -> dict[str, list[QualityDecision]]:
+        """
+        그룹별 화질 분리 계획 생성
+
+        Args:
+            grouped_items: {그룹 키: 항목 리스트} (항목은 sourcePath 속성 필요)
+
+        Returns:
+            {그룹 키: QualityDecision 리스트} (항목이 없는 그룹은 제외)
+        """
+        decisions: dict[str, list[QualityDecision]] = {}
+        to_probe: dict[str, QualityDecision] = {}
+        for group_key, items in grouped_items.items():
+            if not isinstance(items, list):
+                continue
+            group_decisions = []
+            for item in items:
+                source_path = getattr(item, "sourcePath", None)
+                if not source_path:
+                    continue
+                resolution, source, needs_probe = self._claim(item)
+                decision = QualityDecision(item, source_path, resolution, source)
+                group_decisions.append(decision)
+                if needs_probe and len(items) > 1:
+                    to_probe[source_path] = decision
+            if group_decisions:
+                decisions[group_key] = group_decisions
+
+        if to_probe:
+            self._apply_probes(to_probe)
+        for group_decisions in decisions.values():
+            self._mark_best(group_decisions)
+            for decision in group_decisions:
+                self._remember(decision)
+        return decisions
+
+    def _apply_probes(self, to_probe: dict[str, QualityDecision]) -> None:
+        logger.info("🔍 파일명으로 화질을 결정할 수 없는 %s개 파일 분석", len(to_probe))
+        try:
+            probed = self.prober(list(to_probe))
+        except Exception as e:
+            logger.warning("⚠️ 화질 분석 실패: %s", e)
+            return
+        for source_path, decision in to_probe.items():
+            resolution = normalize_resolution(probed.get(source_path) or "")
+            if resolution != UNKNOWN_RESOLUTION:
+                decision.resolution = resolution
+                decision.source = SOURCE_PROBE
+
+    @staticmethod
+    def _mark_best(group_decisions: list[QualityDecision]) -> None:
+        highest = max(decision.priority for decision in group_decisions)
+        for decision in group_decisions:
+            decision.is_best = decision.priority == highest
+
+    @staticmethod
+    def _remember(decision: QualityDecision) -> None:
+        """결정된 해상도를 항목에 저장 (알 수 없는 해상도는 다음 계획에서 다시 시도)"""
+        if decision.resolution == UNKNOWN_RESOLUTION:
+            return
+        try:
+            setattr(decision.item, RESOLVED_RESOLUTION_ATTR, decision.resolution)
+            setattr(decision.item, RESOLUTION_SOURCE_ATTR, decision.source)
+        except AttributeError:
+            pass
@@ -6,12 +6,13 @@ backup policies across the application, including timestamp-based naming,
 metadata preservation, and proper error handling.
 """
 
-import shutil
 from datetime import datetime
 from pathlib import Path
 
 from src.core.interfaces.backup_interface import IBackupService
 from src.core.structured_logging import get_logger
+from src.core.utils.copy_engine import copy_file
+from src.core.utils.io_throttle import get_io_throttle
 
 logger = get_logger(__name__)
 
@@ -74,8 +75,8 @@ class BackupService(IBackupService):
             # Ensure backup filename is unique
             backup_path = self._ensure_unique_filename(backup_path)
 
-            # Create backup using shutil.copy2 to preserve metadata
-            shutil.copy2(source_path, backup_path)
+            # Copy with metadata (like shutil.copy2) under the backup I/O limit
+            copy_file(source_path, backup_path, throttle=get_io_throttle("backup"))
             self.logger.info(f"Backup created successfully: {source_path} -> {backup_path}")
 
             return backup_path
@@ -11,6 +11,7 @@ import re
 
 logger = logging.getLogger(__name__)
 import shutil
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -31,7 +32,22 @@ from src.core.commands.file_operation_commands import (
     FileOperationCommandInvoker,
 )
 from src.core.config.file_organization_config import FileOrganizationConfig
+from src.core.destination_index import (
+    DestinationLibraryIndex,
+    DuplicateAction,
+    replace_file_in_place,
+    retire_replaced_file,
+)
+from src.core.device_scheduler import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PER_DEVICE_LIMIT,
+    DeviceAwareScheduler,
+    create_ordering,
+    report_progress,
+)
+from src.core.dry_run import simulate_plans
 from src.core.file_parser import FileParser
+from src.core.file_snapshot import FileSnapshot, iter_file_snapshots, verify_snapshot
 from src.core.file_validation import FileValidator
 from src.core.interfaces.file_organization_interface import (
     FileConflictResolution,
@@ -45,7 +61,16 @@ from src.core.interfaces.file_organization_interface import (
     IFileOrganizationService,
     IFileScanner,
 )
+from src.core.planning_index import TargetNamespace, index_items_by_path
 from src.core.strategies.file_naming_strategies import NamingConfig, NamingStrategyFactory
+from src.core.utils.copy_engine import move_file
+from src.core.utils.directory_batch import DirectoryCache, destination_directories
+from src.core.utils.io_throttle import get_io_throttle
+from src.core.utils.subtitle_utils import SidecarIndex, get_subtitle_destination_path
+from src.core.utils.verified_copy import copy_and_verify, resolve_verification_mode
+
+# 파일 하나의 바이트 단위 진행률 이벤트 최소 간격 (초)
+BYTE_PROGRESS_INTERVAL = 0.25
 
 
 class UnifiedFileScanner(IFileScanner):
@@ -61,33 +86,36 @@ class UnifiedFileScanner(IFileScanner):
         """Scan directory for files matching criteria"""
         start_time = time.time()
         files_found: list[Path] = []
+        snapshots: dict[Path, FileSnapshot] = {}
         errors = []
         try:
-            if not directory_path.exists():
+            if not directory_path.is_dir():
                 errors.append(f"Directory does not exist: {directory_path}")
                 return FileScanResult(files_found, 0, 0, errors)
             if file_extensions is None:
                 file_extensions = self.config.video_extensions or set()
-            pattern = "**/*" if recursive else "*"
+            extensions = {extension.lower() for extension in file_extensions}
             total_size = 0
-            for file_path in directory_path.glob(pattern):
-                if file_path.is_file() and file_path.suffix.lower() in file_extensions:
-                    try:
-                        file_size = file_path.stat().st_size
-                        if file_size >= self.config.min_file_size:
-                            files_found.append(file_path)
-                            total_size += file_size
-                    except OSError as e:
-                        errors.append(f"Cannot access {file_path}: {e}")
+            # scandir 항목의 stat을 스냅샷으로 남겨 이후 단계에서 다시 stat 하지 않음
+            for snapshot in iter_file_snapshots(
+                directory_path,
+                recursive=recursive,
+                extensions=extensions,
+                on_error=lambda path, e: errors.append(f"Cannot access {path}: {e}"),
+            ):
+                if snapshot.size >= self.config.min_file_size:
+                    files_found.append(snapshot.path)
+                    snapshots[snapshot.path] = snapshot
+                    total_size += snapshot.size
             scan_duration = time.time() - start_time
             self.logger.info(
                 f"Directory scan completed: {len(files_found)} files found in {scan_duration:.2f}s"
             )
-            return FileScanResult(files_found, total_size, scan_duration, errors)
+            return FileScanResult(files_found, total_size, scan_duration, errors, snapshots)
         except Exception as e:
             errors.append(f"Scan failed: {e}")
             self.logger.error(f"Directory scan failed: {e}")
-            return FileScanResult(files_found, 0, time.time() - start_time, errors)
+            return FileScanResult(files_found, 0, time.time() - start_time, errors, snapshots)
 
     def validate_file(self, file_path: Path) -> bool:
         """Validate if file is processable"""
@@ -133,9 +161,20 @@ class StandardFileNamingStrategy(IFileNamingStrategy):
             self.logger.error(f"Target path generation failed: {e}")
             return destination_root / source_path.name
 
-    def resolve_conflict(self, target_path: Path, resolution: FileConflictResolution) -> Path:
+    def resolve_conflict(
+        self,
+        target_path: Path,
+        resolution: FileConflictResolution,
+        namespace: TargetNamespace | None = None,
+    ) -> Path:
         """Resolve file naming conflicts"""
-        if not target_path.exists():
+        if namespace is not None:
+            if resolution == FileConflictResolution.RENAME:
+                return namespace.resolve(target_path, resolution)
+            if not namespace.is_taken(target_path):
+                return namespace.reserve(target_path)
+            namespace.reserve(target_path)
+        elif not target_path.exists():
             return target_path
         if (
             resolution == FileConflictResolution.SKIP
@@ -196,12 +235,50 @@ class UnifiedFileOperationExecutor(IFileOperationExecutor):
         self.success_count = 0
         self.error_count = 0
         self.skip_count = 0
+        # 같은 장치 안의 이동은 바로, 장치 간 복사는 장치마다 몇 개씩만 동시에 실행
+        self.scheduler = DeviceAwareScheduler(
+            max_workers=getattr(config, "max_parallel_operations", DEFAULT_MAX_WORKERS),
+            per_device_limit=getattr(config, "max_operations_per_device", DEFAULT_PER_DEVICE_LIMIT),
+            # "locality": HDD에서 원본 장치/디렉토리/디스크 위치 순서로 실행
+            ordering=create_ordering(getattr(config, "operation_ordering", None)),
+        )
+        # 작업 종류별 복사 검증 방식 (none/size/stream/full)
+        self.verification_modes = getattr(config, "verification_modes", None) or {}
+        # 설정되면 진행 중인 장치 간 이동은 체크포인트를 남기고 멈추고 남은 작업은 건너뜀
+        self.cancel_event = threading.Event()
+        self._progress_lock = threading.Lock()
+        self._in_flight_bytes: dict[int, int] = {}
+        # 정리/백업 I/O 대역폭·IOPS 제한 (창 사용 중/백그라운드 제한은 설정에서)
+        self.throttle = get_io_throttle("organize")
+        self.backup_throttle = get_io_throttle("backup")
+        # 대상 디렉토리 캐시 (일괄 작업 시작 시 한 번에 생성, 작업 중에는 캐시만 확인)
+        self.directory_cache = DirectoryCache()
+        self.created_directories: list[Path] = []
+
+    def cancel(self) -> None:
+        """진행 중인 일괄 작업 취소 (중단된 이동은 다시 실행하면 이어서 복사)"""
+        self.cancel_event.set()
+
+    def execute_operation(
+        self,
+        plan: FileOperationPlan,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> FileOperationResult:
+        """Execute a single file operation
 
-    def execute_operation(self, plan: FileOperationPlan) -> FileOperationResult:
-        """Execute a single file operation"""
+        progress_callback receives (bytes copied, file size) while data is copied.
+        """
         start_time = time.time()
+        if self.cancel_event.is_set():
+            return self._failed_result(plan, Exception("Operation cancelled"))
         try:
-            if not plan.source_path.exists():
+            # 파일을 바꾸기 직전 원본을 한 번만 stat (스냅샷이 있으면 스캔 이후 변경 여부도 확인)
+            try:
+                if plan.source_snapshot is not None:
+                    source_stat = verify_snapshot(plan.source_snapshot, plan.source_path)
+                else:
+                    source_stat = plan.source_path.stat()
+            except FileNotFoundError:
                 return FileOperationResult(
                     success=False,
                     source_path=str(plan.source_path),
@@ -209,42 +286,92 @@ class UnifiedFileOperationExecutor(IFileOperationExecutor):
                     operation_type=plan.operation_type.value,
                     error_message="Source file does not exist",
                 )
+            # 파일 하나의 메타데이터 작업(stat/open/rename)도 IOPS 제한에 포함
+            self.throttle.consume(operations=1)
             if self.config.create_directories:
-                plan.target_path.parent.mkdir(parents=True, exist_ok=True)
-            if plan.target_path.exists() and not self.config.overwrite_existing:
+                self.directory_cache.ensure_parent(plan.target_path)
+            # 계획 단계에서 교체하기로 한 기존 파일 (화질이 더 낮은 같은 에피소드)
+            plan_metadata = plan.metadata or {}
+            replaces = plan_metadata.get("replaces")
+            replaced_path = Path(replaces) if replaces else None
+            # 같은 이름이면 새 파일이 자리 잡을 때까지 기존 파일을 건드리지 않음
+            in_place = replaced_path is not None and replaced_path == plan.target_path
+            target_exists = not in_place and plan.target_path.exists()
+            if target_exists and not self.config.overwrite_existing:
                 plan.target_path = self.naming_strategy.resolve_conflict(
                     plan.target_path, FileConflictResolution.RENAME
                 )
+                # 충돌 해결로 정한 이름은 비어 있는 경로
+                target_exists = False
                 logger.info("🔍 해상도 추출 시도: %s", plan.source_path.name)
                 logger.info("  ✅ 패턴 매칭: (충돌 해결) -> %s", plan.target_path.name)
             backup_path = None
             # 대상 파일이 이미 존재하면 백업 또는 삭제 처리
-            if plan.target_path.exists():
+            if target_exists:
                 if self.config.backup_before_operation:
                     backup_path = plan.target_path.with_suffix(
                         f"{plan.target_path.suffix}.backup_{int(time.time())}"
                     )
-                    shutil.copy2(plan.target_path, backup_path)
+                    copy_and_verify(
+                        plan.target_path,
+                        backup_path,
+                        resolve_verification_mode("backup", self.verification_modes),
+                        throttle=self.backup_throttle,
+                        # 백업은 손상된 기존 파일도 있는 그대로 보존
+                        strict_crc32=False,
+                    )
                     logger.info("💾 기존 파일 백업: %s", backup_path.name)
                 else:
                     # 백업이 비활성화된 경우 기존 파일 삭제 (오버라이팅)
                     plan.target_path.unlink()
                     logger.info("🔄 기존 파일 덮어쓰기: %s", plan.target_path.name)
 
-            if plan.operation_type == FileOperationType.COPY:
-                shutil.copy2(plan.source_path, plan.target_path)
-            elif plan.operation_type == FileOperationType.MOVE:
-                shutil.move(plan.source_path, plan.target_path)
-            elif plan.operation_type == FileOperationType.RENAME:
-                plan.source_path.rename(plan.target_path)
+            def transfer(destination: Path) -> str | None:
+                """원본을 destination으로 복사/이동 (복사 중 계산한 해시 반환)"""
+                if plan.operation_type == FileOperationType.COPY:
+                    return copy_and_verify(
+                        plan.source_path,
+                        destination,
+                        resolve_verification_mode("copy", self.verification_modes),
+                        progress_callback=progress_callback,
+                        throttle=self.throttle,
+                    ).digest
+                if plan.operation_type == FileOperationType.MOVE:
+                    move_file(
+                        plan.source_path,
+                        destination,
+                        progress_callback=progress_callback,
+                        cancel_event=self.cancel_event,
+                        throttle=self.throttle,
+                    )
+                elif plan.operation_type == FileOperationType.RENAME:
+                    plan.source_path.rename(destination)
+                else:
+                    raise ValueError(f"Unsupported operation type: {plan.operation_type}")
+                return None
+
+            keep_backup = self.config.backup_before_operation
+            if in_place:
+                checksum, backup_path = replace_file_in_place(
+                    plan.target_path, transfer, keep_backup
+                )
             else:
-                raise ValueError(f"Unsupported operation type: {plan.operation_type}")
+                checksum = transfer(plan.target_path)
+                if replaced_path is not None:
+                    retired_path = retire_replaced_file(replaced_path, keep_backup)
+                    backup_path = backup_path or retired_path
 
             # 자막 파일도 함께 처리 (UnifiedFileOrganizationService의 메서드 호출)
-            if hasattr(self, "service") and hasattr(self.service, "_process_subtitle_files"):
+            # 같은 배치에서 자막을 계획한 경우(metadata["sidecars"])는 그 계획이 처리
+            if (
+                "sidecars" not in plan_metadata
+                and "sidecar_of" not in plan_metadata
+                and hasattr(self, "service")
+                and hasattr(self.service, "_process_subtitle_files")
+            ):
                 self.service._process_subtitle_files(plan.source_path, plan.target_path)
 
-            actual_size = plan.target_path.stat().st_size if plan.target_path.exists() else 0
+            actual_size = source_stat.st_size
             processing_time = time.time() - start_time
             self.logger.info(
                 f"File operation completed: {plan.source_path.name} -> {plan.target_path.name}"
@@ -257,6 +384,7 @@ class UnifiedFileOperationExecutor(IFileOperationExecutor):
                 backup_path=str(backup_path) if backup_path else None,
                 file_size=actual_size,
                 processing_time=processing_time,
+                checksum=checksum,
             )
         except Exception as e:
             processing_time = time.time() - start_time
@@ -284,86 +412,132 @@ class UnifiedFileOperationExecutor(IFileOperationExecutor):
         self.success_count = 0
         self.error_count = 0
         self.skip_count = 0
-        results = []
+        self.cancel_event.clear()
+        self._in_flight_bytes = {}
+        # 배치마다 디렉토리 상태를 새로 확인 (배치 사이에 삭제되었을 수 있음)
+        self.directory_cache = DirectoryCache()
+        self.created_directories = []
+        if self.config.create_directories:
+            try:
+                self.created_directories = self.directory_cache.ensure_all(
+                    destination_directories(plan.target_path for plan in plans)
+                )
+            except OSError as e:
+                # 만들 수 없는 디렉토리는 해당 작업에서 다시 시도해서 작업별로 실패 처리
+                self.created_directories = list(self.directory_cache.created)
+                self.logger.warning(f"Target directory creation failed: {e}")
+            if self.created_directories:
+                self.logger.info(f"Created {len(self.created_directories)} target directories")
         total_plans = len(plans)
-        for i, plan in enumerate(plans):
-            progress_percentage = calculate_progress_percentage(i, total_plans)
+        finished = 0
+        plan_indexes = {id(plan): index for index, plan in enumerate(plans)}
+        last_byte_event: dict[int, float] = {}
+
+        def emit(index: int, plan: FileOperationPlan, file_bytes: int, step: str) -> None:
+            # 스케줄러가 run()을 호출한 스레드에서만 부르므로 카운터는 잠금 없이 읽음
+            if detailed_progress_callback is None:
+                return
             time_elapsed = time.time() - (self.start_time or 0)
-            speed_mbps = calculate_processing_speed(self.processed_bytes, time_elapsed)
-            remaining_time = estimate_remaining_time(
-                self.processed_bytes, self.total_bytes, time_elapsed
+            with self._progress_lock:
+                bytes_processed = self.processed_bytes + sum(self._in_flight_bytes.values())
+            progress_event = FileProcessingProgressEvent(
+                operation_id=self.operation_id,
+                current_file_index=index,
+                total_files=total_plans,
+                current_file_path=plan.source_path,
+                current_file_size=plan.estimated_size,
+                bytes_processed=bytes_processed,
+                total_bytes=self.total_bytes,
+                progress_percentage=(
+                    calculate_progress_percentage(bytes_processed, self.total_bytes)
+                    if self.total_bytes
+                    else calculate_progress_percentage(finished, total_plans)
+                ),
+                current_operation=(
+                    ProcessingFileOperationType.COPY
+                    if plan.operation_type.value == "copy"
+                    else ProcessingFileOperationType.MOVE
+                ),
+                current_step=step,
+                processing_speed_mbps=calculate_processing_speed(bytes_processed, time_elapsed),
+                estimated_remaining_seconds=estimate_remaining_time(
+                    bytes_processed, self.total_bytes, time_elapsed
+                ),
+                success_count=self.success_count,
+                error_count=self.error_count,
+                skip_count=self.skip_count,
+                bytes_per_second=self.throttle.bytes_per_second,
+                metadata={"current_file_bytes": file_bytes},
             )
-            if detailed_progress_callback:
-                progress_event = FileProcessingProgressEvent(
-                    operation_id=self.operation_id,
-                    current_file_index=i,
-                    total_files=total_plans,
-                    current_file_path=plan.source_path,
-                    current_file_size=plan.estimated_size,
-                    bytes_processed=self.processed_bytes,
-                    total_bytes=self.total_bytes,
-                    progress_percentage=progress_percentage,
-                    current_operation=(
-                        ProcessingFileOperationType.COPY
-                        if plan.operation_type.value == "copy"
-                        else ProcessingFileOperationType.MOVE
-                    ),
-                    current_step=f"Processing {plan.source_path.name}",
-                    processing_speed_mbps=speed_mbps,
-                    estimated_remaining_seconds=remaining_time,
-                    success_count=self.success_count,
-                    error_count=self.error_count,
-                    skip_count=self.skip_count,
-                )
-                detailed_progress_callback(progress_event)
-            result = self.execute_operation(plan)
-            results.append(result)
+            detailed_progress_callback(progress_event)
+
+        def on_start(index: int, plan: FileOperationPlan) -> None:
+            emit(index, plan, 0, f"Processing {plan.source_path.name}")
+
+        def execute(plan: FileOperationPlan) -> FileOperationResult:
+            index = plan_indexes[id(plan)]
+
+            def on_bytes(done: int, total: int) -> None:
+                # 작업자 스레드에서 호출되므로 파일마다 일정 간격으로만 스케줄러에 전달
+                now = time.monotonic()
+                if done < total and now - last_byte_event.get(index, 0.0) < BYTE_PROGRESS_INTERVAL:
+                    return
+                last_byte_event[index] = now
+                report_progress(done)
+
+            return self.execute_operation(
+                plan, progress_callback=on_bytes if detailed_progress_callback else None
+            )
+
+        def on_progress(index: int, plan: FileOperationPlan, done: int) -> None:
+            with self._progress_lock:
+                self._in_flight_bytes[index] = done
+            emit(index, plan, done, f"Copying {plan.source_path.name}")
+
+        def on_complete(index: int, plan: FileOperationPlan, result: FileOperationResult) -> None:
+            nonlocal finished
+            finished += 1
+            with self._progress_lock:
+                self._in_flight_bytes.pop(index, None)
+                if result.success:
+                    self.processed_bytes += plan.estimated_size
             if result.success:
                 self.success_count += 1
-                self.processed_bytes += plan.estimated_size
+            elif self.cancel_event.is_set():
+                self.skip_count += 1
             else:
                 self.error_count += 1
             if progress_callback:
-                progress_callback(i + 1, total_plans)
-        return results
+                progress_callback(finished, total_plans)
+
+        return self.scheduler.run(
+            plans,
+            execute,
+            on_error=self._failed_result,
+            on_complete=on_complete,
+            on_start=on_start,
+            on_progress=on_progress,
+        )
+
+    def _failed_result(self, plan: FileOperationPlan, error: Exception) -> FileOperationResult:
+        """예외로 끝난 작업의 실패 결과"""
+        return FileOperationResult(
+            success=False,
+            source_path=str(plan.source_path),
+            destination_path=str(plan.target_path),
+            operation_type=plan.operation_type.value,
+            error_message=str(error),
+        )
 
     def simulate_operations(self, plans: list[FileOperationPlan]) -> dict[str, Any]:
         """Simulate file operations without executing them"""
-        simulation_results: dict[str, Any] = {
-            "total_plans": len(plans),
-            "successful": 0,
-            "conflicts": 0,
-            "errors": 0,
-            "total_size": 0,
-            "details": [],
-        }
-        for plan in plans:
-            detail: dict[str, Any] = {
-                "source": str(plan.source_path),
-                "target": str(plan.target_path),
-                "operation": plan.operation_type.value,
-                "status": "success",
-                "issues": [],
-            }
-            if plan.target_path.exists():
-                detail["status"] = "conflict"
-                detail["issues"].append("Target file already exists")
-                simulation_results["conflicts"] += 1
-            else:
-                simulation_results["successful"] += 1
-            if not plan.source_path.exists():
-                detail["status"] = "error"
-                detail["issues"].append("Source file does not exist")
-                simulation_results["errors"] += 1
-            if plan.source_path.exists():
-                try:
-                    file_size = plan.source_path.stat().st_size
-                    simulation_results["total_size"] += file_size
-                    detail["size"] = file_size
-                except OSError:
-                    detail["issues"].append("Cannot access source file")
-            simulation_results["details"].append(detail)
-        return simulation_results
+        # 디렉토리 스냅샷 위의 가상 오버레이에서 실행 순서대로 적용 (실제 파일 시스템은 변경 없음)
+        report = simulate_plans(
+            plans,
+            rename_on_conflict=not self.config.overwrite_existing,
+            max_path_length=self.config.max_path_length,
+        )
+        return report.to_dict()
 
 
 class UnifiedFileBackupManager(IFileBackupManager):
@@ -381,7 +555,15 @@ class UnifiedFileBackupManager(IFileBackupManager):
             backup_name = f"{file_path.stem}_backup_{timestamp}{file_path.suffix}"
             backup_path = self.backup_root / backup_name
             backup_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, backup_path)
+            copy_and_verify(
+                file_path,
+                backup_path,
+                resolve_verification_mode(
+                    "backup", getattr(self.config, "verification_modes", None)
+                ),
+                throttle=get_io_throttle("backup"),
+                strict_crc32=False,
+            )
             self.logger.info(f"Backup created: {backup_path}")
             return backup_path
         except Exception as e:
@@ -438,10 +620,17 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
             Path("_backup"), self.config.backup_policy, self.logger
         )
         self.file_parser = FileParser()
+        # 마지막 계획에서 대상 라이브러리와 겹친 파일 {원본 경로: DedupDecision}
+        self.last_dedup_decisions: dict[Path, Any] = {}
         self.file_validator = FileValidator()
         self.command_invoker = FileOperationCommandInvoker(self.logger)
+        # 계획에 없던 자막을 실행 중에 찾을 때 쓰는 디렉토리별 자막 색인
+        self.sidecar_index = self._new_sidecar_index()
         self.logger.info("UnifiedFileOrganizationService initialized with Command pattern support")
 
+    def _new_sidecar_index(self) -> SidecarIndex:
+        return SidecarIndex(self.config.subtitle_extensions, self.config.video_extensions)
+
     def scan_and_plan_organization(
         self,
         source_directory: Path,
@@ -457,6 +646,16 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
                 self.logger.warning("No files found for organization")
                 return []
             plans = []
+            # 원본 경로 → 항목 색인과 대상 파일명 네임스페이스 (디렉토리마다 목록 조회 한 번)
+            items_by_path = index_items_by_path(grouped_items)
+            namespace = TargetNamespace()
+            # 대상 라이브러리에 이미 있는 에피소드는 바이트를 옮기기 전에 판정
+            library = self._new_library_index(destination_root)
+            self.last_dedup_decisions = {}
+            # 자막은 원본 디렉토리마다 한 번 색인하고 비디오와 같은 배치로 계획
+            sidecars = self._new_sidecar_index()
+            planned_sidecars: set[Path] = set()
+            snapshots = scan_result.snapshots or {}
             for file_path in scan_result.files_found:
                 try:
                     parsed_metadata = self.file_parser.parse_filename(str(file_path))
@@ -468,24 +667,13 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
                     season = parsed_metadata.get("season") or 1
 
                     # grouped_items에서 TMDB 매치 정보 찾기
-                    if grouped_items:
-                        for group_items in grouped_items.values():
-                            if isinstance(group_items, list):
-                                for item in group_items:
-                                    if (
-                                        hasattr(item, "sourcePath")
-                                        and Path(item.sourcePath) == file_path
-                                    ):
-                                        if (
-                                            hasattr(item, "tmdbMatch")
-                                            and item.tmdbMatch
-                                            and item.tmdbMatch.name
-                                        ):
-                                            title = item.tmdbMatch.name
-                                            self.logger.info(f"✅ TMDB 매치 제목 사용: {title}")
-                                        if hasattr(item, "season") and item.season:
-                                            season = item.season
-                                        break
+                    item = items_by_path.get(file_path)
+                    if item is not None:
+                        if hasattr(item, "tmdbMatch") and item.tmdbMatch and item.tmdbMatch.name:
+                            title = item.tmdbMatch.name
+                            self.logger.info(f"✅ TMDB 매치 제목 사용: {title}")
+                        if hasattr(item, "season") and item.season:
+                            season = item.season
                     safe_title = re.sub(r"[^\w\s가-힣]", "", title).strip()
                     safe_title = re.sub(r"\s+", " ", safe_title)
                     if not safe_title:
@@ -502,19 +690,51 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
                         "year": parsed_metadata.get("year"),
                         "group": parsed_metadata.get("group") or "Unknown",
                     }
+                    snapshot = snapshots.get(file_path) or FileSnapshot.capture(file_path)
+                    episode = parsed_metadata.get("episode")
+                    if library is not None:
+                        decision = library.classify(
+                            safe_title,
+                            season,
+                            episode,
+                            file_path,
+                            snapshot.size,
+                            str(metadata["resolution"]),
+                        )
+                        if decision.action != DuplicateAction.NEW:
+                            self.last_dedup_decisions[file_path] = decision
+                        existing = decision.existing
+                        if not decision.moves_bytes:
+                            self.logger.info(
+                                f"⏭️ 대상에 이미 있음 ({decision.action.value}): "
+                                f"{file_path.name} ↔ {existing.path.name if existing else '?'}"
+                            )
+                            continue
+                        if decision.action == DuplicateAction.REPLACE and existing is not None:
+                            # 교체할 파일 이름은 비워 두어 같은 이름이면 그 자리에 배정
+                            metadata["dedup"] = decision.action.value
+                            metadata["replaces"] = str(existing.path)
+                            namespace.release(existing.path)
+                            library.forget(existing.path)
 
                     # 파일명 충돌 해결
                     target_path = self.naming_strategy.resolve_conflict(
-                        target_path, FileConflictResolution.RENAME
+                        target_path, FileConflictResolution.RENAME, namespace=namespace
                     )
+                    if library is not None and episode is not None:
+                        library.record(safe_title, season, episode, target_path, snapshot.size)
                     plan = FileOperationPlan(
                         source_path=file_path,
                         target_path=target_path,
                         operation_type=operation_type,
-                        estimated_size=file_path.stat().st_size,
+                        estimated_size=snapshot.size,
                         metadata=metadata,
+                        source_snapshot=snapshot,
                     )
                     plans.append(plan)
+                    sidecar_plans = self._plan_sidecars(plan, sidecars, namespace, planned_sidecars)
+                    metadata["sidecars"] = [str(sidecar.source_path) for sidecar in sidecar_plans]
+                    plans.extend(sidecar_plans)
                 except Exception as e:
                     self.logger.error(f"Failed to create plan for {file_path}: {e}")
             self.logger.info(f"Created {len(plans)} organization plans")
@@ -523,6 +743,55 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
             self.logger.error(f"Organization planning failed: {e}")
             return []
 
+    def _new_library_index(self, destination_root: Path) -> DestinationLibraryIndex | None:
+        """대상 라이브러리 중복 판정 색인 (설정으로 끌 수 있음)"""
+        if not getattr(self.config, "dedup_against_destination", True):
+            return None
+        return DestinationLibraryIndex(
+            destination_root,
+            episode_parser=lambda name: self.file_parser.get_episode_info(name)[1],
+            partial_hash=getattr(self.config, "dedup_partial_hash", False),
+        )
+
+    def _plan_sidecars(
+        self,
+        video_plan: FileOperationPlan,
+        sidecars: SidecarIndex,
+        namespace: TargetNamespace,
+        planned: set[Path],
+    ) -> list[FileOperationPlan]:
+        """비디오 계획에 딸린 자막 계획 (대상 폴더는 비디오와 같고, 이름이 바뀌면 따라감)"""
+        sidecar_plans: list[FileOperationPlan] = []
+        if not self._is_video_file(video_plan.source_path):
+            return sidecar_plans
+        for subtitle_path in sidecars.find(video_plan.source_path):
+            if subtitle_path in planned:
+                continue
+            try:
+                snapshot = FileSnapshot.capture(subtitle_path)
+                target_path = get_subtitle_destination_path(
+                    video_plan.source_path, video_plan.target_path, subtitle_path
+                )
+                if not self.config.overwrite_existing:
+                    target_path = self.naming_strategy.resolve_conflict(
+                        target_path, FileConflictResolution.RENAME, namespace=namespace
+                    )
+            except Exception as e:
+                self.logger.warning(f"⚠️ 자막 파일 계획 실패: {subtitle_path} - {e}")
+                continue
+            planned.add(subtitle_path)
+            sidecar_plans.append(
+                FileOperationPlan(
+                    source_path=subtitle_path,
+                    target_path=target_path,
+                    operation_type=video_plan.operation_type,
+                    estimated_size=snapshot.size,
+                    metadata={"sidecar_of": str(video_plan.source_path)},
+                    source_snapshot=snapshot,
+                )
+            )
+        return sidecar_plans
+
     def execute_organization_plan(
         self,
         plans: list[FileOperationPlan],
@@ -536,10 +805,15 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
             # dry_run 모드에서는 빈 결과 리스트 반환
             return []
         self.logger.info("Executing organization plan")
+        self.sidecar_index = self._new_sidecar_index()
         return self.operation_executor.execute_batch_operations(
             plans, progress_callback, detailed_progress_callback
         )
 
+    def cancel_organization(self) -> None:
+        """진행 중인 execute_organization_plan 취소 (중단된 이동은 다시 실행하면 이어서 복사)"""
+        self.operation_executor.cancel()
+
     def validate_organization_plan(self, plans: list[FileOperationPlan]) -> dict[str, Any]:
         """Validate organization plan for conflicts and issues"""
         validation_result: dict[str, Any] = {
@@ -550,31 +824,40 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
             "warnings": 0,
             "issues": [],
         }
-        for i, plan in enumerate(plans):
+        # 대상 디렉토리를 만들지 않고 가상 오버레이에서 검사 (앞선 계획과의 충돌 포함)
+        report = simulate_plans(
+            plans, rename_on_conflict=False, max_path_length=self.config.max_path_length
+        )
+        for simulation in report.simulations:
             issues = []
-            if not plan.source_path.exists():
-                issues.append(f"Source file does not exist: {plan.source_path}")
-                validation_result["errors"] += 1
-            if plan.target_path.exists():
-                issues.append(f"Target file already exists: {plan.target_path}")
-                validation_result["conflicts"] += 1
-            if len(str(plan.target_path)) > self.config.max_path_length:
-                issues.append(f"Target path too long: {len(str(plan.target_path))} characters")
-                validation_result["warnings"] += 1
-            try:
-                plan.target_path.parent.mkdir(parents=True, exist_ok=True)
-            except PermissionError:
-                issues.append(f"Cannot create target directory: {plan.target_path.parent}")
-                validation_result["errors"] += 1
+            for issue in simulation.issues:
+                if issue == "Source file does not exist":
+                    issues.append(f"{issue}: {simulation.source}")
+                    validation_result["errors"] += 1
+                elif issue == "Target file already exists":
+                    issues.append(f"{issue}: {simulation.target}")
+                    validation_result["conflicts"] += 1
+                elif issue.startswith("Target path too long"):
+                    issues.append(issue)
+                    validation_result["warnings"] += 1
+                else:
+                    issues.append(issue)
+                    validation_result["errors"] += 1
             if issues:
                 validation_result["issues"].append(
                     {
-                        "plan_index": i,
-                        "source": str(plan.source_path),
-                        "target": str(plan.target_path),
+                        "plan_index": simulation.index,
+                        "source": str(simulation.source),
+                        "target": str(simulation.target),
                         "issues": issues,
                     }
                 )
+        validation_result["space"] = [estimate.to_dict() for estimate in report.space]
+        if not report.space_sufficient:
+            validation_result["errors"] += 1
+        validation_result["created_directories"] = [
+            str(path) for path in report.created_directories
+        ]
         if validation_result["errors"] > 0 or validation_result["conflicts"] > 0:
             validation_result["valid"] = False
         return validation_result
@@ -750,7 +1033,9 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
             for subtitle_path in subtitle_files:
                 try:
                     subtitle_filename = Path(subtitle_path).name
-                    subtitle_target_path = target_path.parent / subtitle_filename
+                    subtitle_target_path = get_subtitle_destination_path(
+                        source_path, target_path, subtitle_path
+                    )
 
                     # 자막 파일이 이미 존재하는 경우 처리
                     if subtitle_target_path.exists():
@@ -773,6 +1058,7 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
                         self.logger.info(f"💾 기존 자막 파일 백업: {backup_path.name}")
 
                     shutil.move(subtitle_path, subtitle_target_path)
+                    self.sidecar_index.discard(subtitle_path)
                     self.logger.info(f"✅ 자막 파일 처리 완료: {subtitle_filename}")
 
                 except Exception as e:
@@ -787,30 +1073,12 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
         return file_path.suffix.lower() in video_extensions
 
     def _find_subtitle_files(self, video_path: Path) -> list[Path]:
-        """비디오 파일과 연관된 자막 파일들을 찾습니다"""
-        subtitle_files = []
-        subtitle_extensions = self.config.subtitle_extensions or set()
-
+        """비디오 파일과 연관된 자막 파일들을 찾습니다 (디렉토리마다 목록 조회 한 번)"""
         try:
-            video_dir = video_path.parent
-            video_basename = video_path.stem
-
-            for file_path in video_dir.iterdir():
-                if not file_path.is_file():
-                    continue
-
-                file_ext = file_path.suffix.lower()
-                if file_ext not in subtitle_extensions:
-                    continue
-
-                subtitle_basename = file_path.stem
-                if subtitle_basename == video_basename:
-                    subtitle_files.append(file_path)
-
+            return self.sidecar_index.find(video_path)
         except Exception as e:
             self.logger.warning(f"⚠️ 자막 파일 검색 중 오류: {e}")
-
-        return subtitle_files
+            return []
 
     def get_backup_policy(self) -> BackupPolicy:
         """Get current backup policy"""
@@ -841,6 +1109,8 @@ class UnifiedFileOrganizationService(IFileOrganizationService):
             if hasattr(self.operation_executor, "skip_count"):
                 self.operation_executor.skip_count = 0
 
+            self.sidecar_index = self._new_sidecar_index()
+
             # Clear command history if available
             if hasattr(self.command_invoker, "clear_history"):
                 self.command_invoker.clear_history()
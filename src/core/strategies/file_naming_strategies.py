@@ -19,6 +19,7 @@ from src.core.interfaces.file_organization_interface import (
     FileConflictResolution,
     IFileNamingStrategy,
 )
+from src.core.planning_index import TargetNamespace
 
 
 @dataclass
@@ -55,9 +56,23 @@ class BaseNamingStrategy(IFileNamingStrategy):
         # 항상 원본 파일명을 유지하고 디렉토리만 변경
         return destination_root / source_path.name
 
-    def resolve_conflict(self, target_path: Path, resolution: FileConflictResolution) -> Path:
+    def resolve_conflict(
+        self,
+        target_path: Path,
+        resolution: FileConflictResolution,
+        namespace: TargetNamespace | None = None,
+    ) -> Path:
         """Resolve file naming conflicts"""
-        if not target_path.exists():
+        if namespace is not None:
+            if resolution == FileConflictResolution.RENAME:
+                try:
+                    return namespace.resolve(target_path, resolution)
+                except FileExistsError:
+                    return namespace.reserve(self._generate_unique_name(target_path))
+            if not namespace.is_taken(target_path):
+                return namespace.reserve(target_path)
+            namespace.reserve(target_path)
+        elif not target_path.exists():
             return target_path
         if (
             resolution == FileConflictResolution.SKIP
@@ -4,74 +4,299 @@ TMDB 캐시 관리 모듈
 TMDB API 응답을 위한 캐시 시스템을 관리합니다.
 """
 
+import gzip
 import json
 import logging
 
 logger = logging.getLogger(__name__)
+import re
 import threading
 import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
+from src.core.utils.atomic_file import (
+    LOCK_DIR_NAME,
+    StripedFileLock,
+    atomic_write_bytes,
+    cleanup_temp_files,
+)
+
+CACHE_META_KEY = "__cache_meta__"
+PLAIN_SUFFIX = ".json"
+COMPRESSED_SUFFIX = ".json.gz"
+
+# 작품(TV ID) 단위로 묶이는 캐시 키 패턴
+SHOW_KEY_PATTERN = re.compile(r"^(?:details_sections|details|season|episode|translations)_(\d+)")
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목과 재검증(revalidation) 메타데이터"""
+
+    key: str
+    data: Any
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    request: dict[str, Any] | None = None
+    size_bytes: int = 0
+    packed: bytes | None = field(default=None, repr=False)
+    file_signature: tuple = field(default=(), repr=False, compare=False)
+
+    @property
+    def age(self) -> float:
+        """저장 후 경과 시간 (초)"""
+        return time.time() - self.stored_at
+
+    @property
+    def memory_bytes(self) -> int:
+        """메모리 캐시에서 차지하는 대략적인 크기 (압축 보관 시 압축 크기)"""
+        return len(self.packed) if self.packed is not None else self.size_bytes
+
+    def is_expired(self, expiry_seconds: float) -> bool:
+        """만료 여부 (만료되어도 stale 허용 기간 동안은 제공 가능)"""
+        return self.age >= expiry_seconds
+
+    def to_meta(self) -> dict[str, Any]:
+        """파일에 기록할 메타데이터"""
+        return {
+            "stored_at": self.stored_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "request": self.request,
+        }
+
 
 class TMDBCacheManager:
-    """TMDB 캐시를 관리하는 클래스"""
+    """TMDB 캐시를 관리하는 클래스
+
+    만료(cache_expiry)된 항목은 바로 삭제하지 않고 stale_ttl 동안 보관하여
+    백그라운드 재검증이 끝날 때까지 기존 데이터를 제공할 수 있게 합니다.
+    직렬화 크기가 compress_threshold 이상인 항목은 디스크와 메모리 모두 gzip으로 보관합니다.
+    캐시 디렉토리는 여러 프로세스가 함께 사용할 수 있습니다. 파일은 임시 파일 교체로
+    원자적으로 기록하고, 키별 잠금 파일로 쓰기를 직렬화하며, 메모리 캐시는 파일
+    서명(inode, 수정 시각, 크기)이 바뀌면 디스크에서 다시 읽습니다.
+    """
 
-    def __init__(self, cache_dir: Path, cache_expiry: int = 3600, memory_cache_size: int = 1000):
+    def __init__(
+        self,
+        cache_dir: Path,
+        cache_expiry: int = 3600,
+        memory_cache_size: int = 1000,
+        stale_ttl: int = 7 * 24 * 3600,
+        compress_threshold: int = 32 * 1024,
+    ):
         """
         Args:
             cache_dir: 캐시 디렉토리 경로
             cache_expiry: 캐시 만료 시간 (초)
             memory_cache_size: 메모리 캐시 최대 크기
+            stale_ttl: 만료 후에도 stale 데이터로 제공할 수 있는 추가 시간 (초)
+            compress_threshold: 압축 저장을 시작할 직렬화 크기 (바이트)
         """
         self.cache_dir = cache_dir
         self.cache_expiry = cache_expiry
+        self.stale_ttl = stale_ttl
+        self.compress_threshold = compress_threshold
         self.memory_cache_size = memory_cache_size
         self.cache_enabled = True
-        self.memory_cache: dict[str, Any] = {}
+        self.memory_cache: dict[str, CacheEntry] = {}
         self.cache_lock = threading.Lock()
         self.cache_dir.mkdir(exist_ok=True)
+        self.file_locks = StripedFileLock(self.cache_dir / LOCK_DIR_NAME)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info(f"TMDB 캐시 관리자 초기화 완료: {cache_dir}")
 
+    def _plain_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{PLAIN_SUFFIX}"
+
+    def _compressed_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{COMPRESSED_SUFFIX}"
+
+    def _iter_cache_files(self) -> Iterator[Path]:
+        """캐시 파일 목록 (일반 + 압축)"""
+        yield from self.cache_dir.glob(f"*{PLAIN_SUFFIX}")
+        yield from self.cache_dir.glob(f"*{COMPRESSED_SUFFIX}")
+
+    @staticmethod
+    def _key_from_file(cache_file: Path) -> str:
+        name = cache_file.name
+        for suffix in (COMPRESSED_SUFFIX, PLAIN_SUFFIX):
+            if name.endswith(suffix):
+                return name[: -len(suffix)]
+        return cache_file.stem
+
+    def _file_signature(self, key: str) -> tuple:
+        """디스크 캐시 파일 서명 (다른 프로세스의 교체/삭제 감지용, 파일이 없으면 빈 튜플)"""
+        signature: tuple = ()
+        for cache_file in (self._compressed_file(key), self._plain_file(key)):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            signature += (cache_file.name, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        return signature
+
     def get_cache(self, key: str) -> Any | None:
-        """캐시에서 데이터 가져오기"""
+        """캐시에서 데이터 가져오기 (만료되지 않은 항목만)"""
+        entry = self.get_cache_entry(key)
+        if entry is None or entry.is_expired(self.cache_expiry):
+            return None
+        return entry.data
+
+    def get_cache_entry(self, key: str) -> CacheEntry | None:
+        """캐시 항목 가져오기 (stale 허용 기간 내의 만료된 항목 포함)"""
         if not self.cache_enabled:
             return None
         with self.cache_lock:
-            if key in self.memory_cache:
-                return self.memory_cache[key]
+            entry = self.memory_cache.get(key)
+        if entry is not None and entry.file_signature != self._file_signature(key):
+            # 다른 프로세스가 파일을 교체하거나 삭제함
+            with self.cache_lock:
+                self.memory_cache.pop(key, None)
+            entry = None
+        if entry is None:
+            entry = self._read_entry(key)
+            if entry is None:
+                return None
+            self._remember(entry)
+        if entry.age >= self.cache_expiry + self.stale_ttl:
+            self.remove_cache(key)
+            return None
+        if entry.packed is not None:
+            decoded = self._decode(key, entry.packed, compressed=True)
+            decoded.file_signature = entry.file_signature
+            return decoded
+        return entry
+
+    def _decode(self, key: str, raw: bytes, compressed: bool, mtime: float = 0.0) -> CacheEntry:
+        """직렬화된 캐시 파일 내용을 항목으로 변환 (메타데이터 없는 이전 형식 호환)"""
+        text = gzip.decompress(raw) if compressed else raw
+        payload = json.loads(text.decode("utf-8"))
+        if isinstance(payload, dict) and CACHE_META_KEY in payload:
+            meta = payload[CACHE_META_KEY]
+            return CacheEntry(
+                key=key,
+                data=payload.get("data"),
+                stored_at=meta.get("stored_at", mtime),
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                request=meta.get("request"),
+                size_bytes=len(text),
+                packed=raw if compressed else None,
+            )
+        return CacheEntry(key=key, data=payload, stored_at=mtime, size_bytes=len(text))
+
+    def _encode(self, entry: CacheEntry) -> tuple[bytes, bool]:
+        """캐시 항목 직렬화 (임계값 이상이면 gzip 압축)"""
+        raw = json.dumps(
+            {CACHE_META_KEY: entry.to_meta(), "data": entry.data},
+            ensure_ascii=False,
+            indent=2,
+        ).encode("utf-8")
+        entry.size_bytes = len(raw)
+        if len(raw) >= self.compress_threshold:
+            return gzip.compress(raw, compresslevel=6), True
+        return raw, False
+
+    def _read_entry(self, key: str) -> CacheEntry | None:
+        """디스크에서 캐시 항목 읽기 (압축 파일 우선)"""
         try:
-            cache_file = self.cache_dir / f"{key}.json"
-            if cache_file.exists():
-                if time.time() - cache_file.stat().st_mtime < self.cache_expiry:
-                    with cache_file.open(encoding="utf-8") as f:
-                        data = json.load(f)
-                        with self.cache_lock:
-                            if len(self.memory_cache) >= self.memory_cache_size:
-                                oldest_key = next(iter(self.memory_cache))
-                                del self.memory_cache[oldest_key]
-                            self.memory_cache[key] = data
-                        return data
-                else:
-                    cache_file.unlink()
+            # 읽기 전에 서명을 잡아 두면 읽는 도중 교체되어도 다음 조회에서 다시 읽음
+            signature = self._file_signature(key)
+            for cache_file, compressed in (
+                (self._compressed_file(key), True),
+                (self._plain_file(key), False),
+            ):
+                try:
+                    stat = cache_file.stat()
+                    raw = cache_file.read_bytes()
+                except FileNotFoundError:
+                    continue
+                entry = self._decode(key, raw, compressed, stat.st_mtime)
+                entry.file_signature = signature
+                return entry
         except Exception as e:
             self.logger.warning(f"캐시 읽기 오류: {e}")
         return None
 
-    def set_cache(self, key: str, data: Any) -> None:
-        """데이터를 캐시에 저장"""
+    def _remember(self, entry: CacheEntry) -> None:
+        """메모리 캐시에 항목 저장 (가장 오래된 항목부터 제거, 압축 항목은 본문 없이 보관)"""
+        if entry.packed is not None:
+            entry = replace(entry, data=None)
+        with self.cache_lock:
+            self.memory_cache.pop(entry.key, None)
+            if len(self.memory_cache) >= self.memory_cache_size:
+                oldest_key = next(iter(self.memory_cache))
+                del self.memory_cache[oldest_key]
+            self.memory_cache[entry.key] = entry
+
+    def set_cache(
+        self,
+        key: str,
+        data: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        request: dict[str, Any] | None = None,
+    ) -> None:
+        """데이터를 캐시에 저장
+
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+            etag: 응답의 ETag 헤더 (조건부 재검증용)
+            last_modified: 응답의 Last-Modified 헤더 (조건부 재검증용)
+            request: 재검증 시 다시 보낼 요청 정보 ({"path": ..., "params": ...})
+        """
         if not self.cache_enabled:
             return
+        entry = CacheEntry(
+            key=key,
+            data=data,
+            stored_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+            request=request,
+        )
+        self._write_entry(entry)
+
+    def touch_cache(
+        self, key: str, etag: str | None = None, last_modified: str | None = None
+    ) -> bool:
+        """304 Not Modified 응답 후 본문 변경 없이 저장 시각만 갱신
+
+        잠금을 잡은 상태에서 디스크의 최신 항목을 다시 읽어 갱신하므로
+        그 사이 다른 프로세스가 기록한 본문을 이전 본문으로 덮어쓰지 않습니다.
+        """
+        if not self.cache_enabled:
+            return False
+        with self.file_locks.for_key(key):
+            entry = self._read_entry(key)
+            if entry is None:
+                return False
+            if entry.packed is not None:
+                entry = self._decode(key, entry.packed, compressed=True)
+            entry.stored_at = time.time()
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+            self._write_entry(entry)
+        return True
+
+    def _write_entry(self, entry: CacheEntry) -> None:
+        """메모리 및 디스크에 캐시 항목 기록 (키 잠금 안에서 원자적으로 교체)"""
         try:
-            with self.cache_lock:
-                if len(self.memory_cache) >= self.memory_cache_size:
-                    oldest_key = next(iter(self.memory_cache))
-                    del self.memory_cache[oldest_key]
-                self.memory_cache[key] = data
-            cache_file = self.cache_dir / f"{key}.json"
-            with cache_file.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            raw, compressed = self._encode(entry)
+            entry.packed = raw if compressed else None
+            target = self._compressed_file(entry.key) if compressed else self._plain_file(entry.key)
+            other = self._plain_file(entry.key) if compressed else self._compressed_file(entry.key)
+            with self.file_locks.for_key(entry.key):
+                atomic_write_bytes(target, raw)
+                other.unlink(missing_ok=True)
+                entry.file_signature = self._file_signature(entry.key)
+                self._remember(entry)
         except Exception as e:
             self.logger.warning(f"캐시 저장 오류: {e}")
 
@@ -80,21 +305,26 @@ class TMDBCacheManager:
         try:
             with self.cache_lock:
                 self.memory_cache.clear()
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            for cache_file in list(self._iter_cache_files()):
+                cache_file.unlink(missing_ok=True)
             self.logger.info("TMDB 캐시가 초기화되었습니다.")
         except Exception as e:
             self.logger.error(f"캐시 초기화 오류: {e}")
 
     def clear_expired_cache(self) -> int:
-        """만료된 캐시 정리"""
+        """stale 허용 기간까지 지난 캐시 정리"""
         try:
             cleaned_count = 0
             current_time = time.time()
-            for cache_file in self.cache_dir.glob("*.json"):
-                if current_time - cache_file.stat().st_mtime > self.cache_expiry:
-                    cache_file.unlink()
+            max_age = self.cache_expiry + self.stale_ttl
+            for cache_file in list(self._iter_cache_files()):
+                try:
+                    expired = current_time - cache_file.stat().st_mtime > max_age
+                except FileNotFoundError:
+                    continue
+                if expired and self.remove_cache(self._key_from_file(cache_file)):
                     cleaned_count += 1
+            cleanup_temp_files(self.cache_dir)
             if cleaned_count > 0:
                 self.logger.info(f"만료된 캐시 {cleaned_count}개 정리 완료")
             return cleaned_count
@@ -105,7 +335,7 @@ class TMDBCacheManager:
     def get_cache_info(self) -> dict[str, Any]:
         """캐시 정보 반환"""
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
+            cache_files = list(self._iter_cache_files())
             total_size = sum(f.stat().st_size for f in cache_files)
             with self.cache_lock:
                 memory_cache_size = len(self.memory_cache)
@@ -116,6 +346,7 @@ class TMDBCacheManager:
                 "total_size_bytes": total_size,
                 "total_size_mb": total_size / (1024 * 1024),
                 "expiry_seconds": self.cache_expiry,
+                "stale_ttl_seconds": self.stale_ttl,
                 "memory_cache_size": memory_cache_size,
                 "memory_cache_max_size": self.memory_cache_size,
             }
@@ -132,6 +363,11 @@ class TMDBCacheManager:
         self.cache_expiry = expiry_seconds
         self.logger.info(f"TMDB 캐시 만료 시간: {expiry_seconds}초")
 
+    def set_stale_ttl(self, stale_seconds: int) -> None:
+        """만료 후 stale 데이터 제공 허용 시간 설정"""
+        self.stale_ttl = stale_seconds
+        self.logger.info(f"TMDB 캐시 stale 허용 시간: {stale_seconds}초")
+
     def set_memory_cache_size(self, size: int) -> None:
         """메모리 캐시 크기 설정"""
         with self.cache_lock:
@@ -145,8 +381,7 @@ class TMDBCacheManager:
     def get_cache_keys(self) -> list[str]:
         """캐시된 키 목록 반환"""
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            return [f.stem for f in cache_files]
+            return [self._key_from_file(f) for f in self._iter_cache_files()]
         except Exception as e:
             self.logger.error(f"캐시 키 목록 조회 오류: {e}")
             return []
@@ -156,20 +391,50 @@ class TMDBCacheManager:
         try:
             with self.cache_lock:
                 self.memory_cache.pop(key, None)
-            cache_file = self.cache_dir / f"{key}.json"
-            if cache_file.exists():
-                cache_file.unlink()
+            removed = False
+            with self.file_locks.for_key(key):
+                for cache_file in (self._plain_file(key), self._compressed_file(key)):
+                    try:
+                        cache_file.unlink()
+                        removed = True
+                    except FileNotFoundError:
+                        continue
+            if removed:
                 self.logger.debug(f"캐시 제거 완료: {key}")
-                return True
-            return False
+            return removed
         except Exception as e:
             self.logger.error(f"캐시 제거 오류: {e}")
             return False
 
+    def get_show_footprint(self) -> dict[int, dict[str, int]]:
+        """작품(TV ID)별 디스크/메모리 사용량 반환"""
+        footprint: dict[int, dict[str, int]] = {}
+
+        def bucket(key: str) -> dict[str, int] | None:
+            match = SHOW_KEY_PATTERN.match(key)
+            if not match:
+                return None
+            return footprint.setdefault(
+                int(match.group(1)), {"entries": 0, "disk_bytes": 0, "memory_bytes": 0}
+            )
+
+        for cache_file in self._iter_cache_files():
+            stats = bucket(self._key_from_file(cache_file))
+            if stats is not None:
+                stats["entries"] += 1
+                stats["disk_bytes"] += cache_file.stat().st_size
+        with self.cache_lock:
+            entries = list(self.memory_cache.values())
+        for entry in entries:
+            stats = bucket(entry.key)
+            if stats is not None:
+                stats["memory_bytes"] += entry.memory_bytes
+        return footprint
+
     def get_cache_stats(self) -> dict[str, Any]:
         """캐시 통계 정보 반환"""
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
+            cache_files = list(self._iter_cache_files())
             current_time = time.time()
             expired_count = sum(
                 1 for f in cache_files if current_time - f.stat().st_mtime > self.cache_expiry
@@ -185,12 +450,19 @@ class TMDBCacheManager:
                     size_distribution["5-10MB"] = size_distribution.get("5-10MB", 0) + 1
                 else:
                     size_distribution[">10MB"] = size_distribution.get(">10MB", 0) + 1
+            with self.cache_lock:
+                memory_bytes = sum(entry.memory_bytes for entry in self.memory_cache.values())
+                memory_usage = len(self.memory_cache) / self.memory_cache_size
             return {
                 "total_files": len(cache_files),
                 "expired_files": expired_count,
                 "valid_files": len(cache_files) - expired_count,
+                "compressed_files": sum(1 for f in cache_files if f.name.endswith(".gz")),
+                "disk_bytes": sum(f.stat().st_size for f in cache_files),
+                "memory_bytes": memory_bytes,
                 "size_distribution": size_distribution,
-                "memory_cache_usage": len(self.memory_cache) / self.memory_cache_size,
+                "memory_cache_usage": memory_usage,
+                "per_show": self.get_show_footprint(),
             }
         except Exception as e:
             return {"error": str(e)}
@@ -9,6 +9,7 @@ import logging
 import sys
 
 logger = logging.getLogger(__name__)
+from collections.abc import Callable
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
@@ -18,10 +19,20 @@ import tmdbsimple as tmdb
 
 from src.core.tmdb_cache import TMDBCacheManager
 from src.core.tmdb_image import TMDBImageManager
-from src.core.tmdb_models import TMDBAnimeInfo
+from src.core.tmdb_models import HEAVY_SECTIONS, TMDBAnimeInfo
+from src.core.tmdb_prefetcher import TMDBSeasonPrefetcher
 from src.core.tmdb_rate_limiter import TMDBRateLimiter
+from src.core.tmdb_revalidator import TMDBRevalidator
 from src.core.unified_config import unified_config_manager
 
+# 상세 정보 재검증 시 한 번의 요청으로 받아올 부가 정보
+DETAIL_APPEND_TO_RESPONSE = (
+    "credits,images,external_ids,videos,keywords,recommendations,similar,"
+    "translations,content_ratings,watch/providers"
+)
+# 지연 로드 섹션만 다시 받아올 때 사용하는 append_to_response
+SECTION_APPEND_TO_RESPONSE = ",".join(HEAVY_SECTIONS)
+
 
 class TMDBClient:
     """
@@ -69,6 +80,10 @@ class TMDBClient:
         self.cache_manager = TMDBCacheManager(self.cache_dir)
         self.image_manager = TMDBImageManager(self.cache_dir / "posters")
         self.rate_limiter = TMDBRateLimiter(requests_per_second=4, burst_limit=8)
+        self.revalidator = TMDBRevalidator(
+            self.cache_manager, api_key=self.api_key, rate_limiter=self.rate_limiter
+        )
+        self.season_prefetcher = TMDBSeasonPrefetcher(self)
         self.logger.info(
             f"TMDB 클라이언트 초기화 완료 (캐시 디렉토리: {self.cache_dir.absolute()})"
         )
@@ -80,13 +95,14 @@ class TMDBClient:
         include_adult: bool = False,
         first_air_date_year: int | None = None,
         use_fallback: bool = True,
+        language: str | None = None,
     ) -> list[TMDBAnimeInfo]:
         """애니메이션 제목으로 검색 (리팩토링됨)"""
         try:
+            language = language or self.language
             self.logger.info(f"TMDB 검색 시작: '{query}' (year: {year}, adult: {include_adult})")
-            self.rate_limiter.wait_if_needed()
-            cache_key = f"search_{query}_{year}_{include_adult}_{first_air_date_year}"
-            cached_result = self.cache_manager.get_cache(cache_key)
+            cache_key = f"search_{query}_{year}_{include_adult}_{first_air_date_year}_{language}"
+            cached_result = self.revalidator.get(cache_key, self._search_cache_transform)
             if cached_result:
                 self.logger.info(f"캐시된 결과 사용: {len(cached_result)}개")
                 for item in cached_result:
@@ -95,10 +111,11 @@ class TMDBClient:
                 return [TMDBAnimeInfo(**item) for item in cached_result]
 
             self.logger.info(f"TMDB API 호출 시작: {query}")
+            self.rate_limiter.wait_if_needed()
             search = tmdb.Search()
             search_params = {
                 "query": query,
-                "language": self.language,
+                "language": language,
                 "include_adult": include_adult,
             }
             if year:
@@ -111,31 +128,24 @@ class TMDBClient:
                 search_params["with_first_air_date_lte"] = f"{current_year}-12-31"
 
             self.logger.info(f"검색 파라미터: {search_params}")
-            response = search.tv(**search_params)
+            response = search.tv(**dict(search_params))
             self.logger.info(f"TMDB API 응답 받음: {len(response.get('results', []))}개 결과")
 
-            anime_results = []
-            for result in response.get("results", []):
-                genre_ids = result.get("genre_ids", [])
-                if any(genre_id in genre_ids for genre_id in [16, 10759]):
-                    anime_results.append(result)
-
-            self.logger.info(f"애니메이션 필터링 후: {len(anime_results)}개 결과")
-            limited_results = anime_results[:10]
-            anime_info_list = []
-            for result in limited_results:
-                anime_info = self._convert_to_anime_info(result)
-                if anime_info:
-                    anime_info_list.append(anime_info)
-
-            self.cache_manager.set_cache(cache_key, [asdict(info) for info in anime_info_list])
+            anime_info_list = self._filter_search_results(response)
+            self.logger.info(f"애니메이션 필터링 후: {len(anime_info_list)}개 결과")
+
+            self.cache_manager.set_cache(
+                cache_key,
+                [asdict(info) for info in anime_info_list],
+                request={"path": "search/tv", "params": search_params},
+            )
             self.logger.info(f"TMDB 검색 완료: {len(anime_info_list)}개 결과 반환")
 
             # 검색 결과가 없고 fallback이 활성화된 경우 fallback 검색 시도
             if len(anime_info_list) == 0 and use_fallback:
                 self.logger.info(f"검색 결과 없음 - fallback 검색 시도: '{query}'")
                 fallback_results = self._search_anime_with_fallback(
-                    query, year, include_adult, first_air_date_year
+                    query, year, include_adult, first_air_date_year, language
                 )
                 if fallback_results:
                     self.logger.info(f"Fallback 검색 성공: {len(fallback_results)}개 결과")
@@ -155,6 +165,7 @@ class TMDBClient:
         year: int | None = None,
         include_adult: bool = False,
         first_air_date_year: int | None = None,
+        language: str | None = None,
     ) -> list[TMDBAnimeInfo]:
         """마지막 단어를 하나씩 제거하면서 재검색하는 fallback 검색"""
         try:
@@ -179,6 +190,7 @@ class TMDBClient:
                         include_adult=include_adult,
                         first_air_date_year=first_air_date_year,
                         use_fallback=False,
+                        language=language,
                     )
 
                     if results:
@@ -202,15 +214,23 @@ class TMDBClient:
     def get_anime_details(self, tv_id: int, language: str | None = None) -> TMDBAnimeInfo | None:
         """애니메이션 상세 정보 조회 (리팩토링됨)"""
         try:
-            self.rate_limiter.wait_if_needed()
-            cache_key = f"details_{tv_id}_{language or self.language}"
-            cached_result = self.cache_manager.get_cache(cache_key)
+            language = language or self.language
+            cache_key = f"details_{tv_id}_{language}"
+            cached_result = self.revalidator.get(
+                cache_key, lambda response: self._details_cache_transform(response, language)
+            )
             if cached_result:
                 if "tmdb_id" in cached_result and "id" not in cached_result:
                     cached_result["id"] = cached_result["tmdb_id"]
-                return TMDBAnimeInfo(**cached_result)
+                anime_info = TMDBAnimeInfo(**cached_result)
+                if anime_info.has_loaded_sections():
+                    # 섹션이 함께 저장된 이전 형식 캐시는 코어/섹션으로 분리하여 다시 저장
+                    self._store_anime_details(anime_info, language)
+                anime_info.set_section_loader(self._make_section_loader(tv_id, language))
+                return anime_info
+            self.rate_limiter.wait_if_needed()
             tv = tmdb.TV(tv_id)
-            response = tv.info(language=language or self.language)
+            response = tv.info(language=language)
             try:
                 credits = tv.credits()
                 images = tv.images()
@@ -236,86 +256,298 @@ class TMDBClient:
                         "watch_providers": watch_providers,
                     }
                 )
+                # 번역 정보는 언어와 무관하므로 별도 키로 공유
+                self.cache_manager.set_cache(
+                    f"translations_{tv_id}",
+                    translations,
+                    request={"path": f"tv/{tv_id}/translations", "params": {}},
+                )
             except Exception as e:
                 self.logger.warning(f"추가 정보 조회 실패: {e}")
-            anime_info = self._convert_to_anime_info(response)
-            if anime_info:
-                self.cache_manager.set_cache(cache_key, asdict(anime_info))
-            return anime_info
+            converted = self._convert_to_anime_info(response)
+            if converted:
+                self._store_anime_details(converted, language)
+                converted.set_section_loader(self._make_section_loader(tv_id, language))
+            return converted
         except Exception as e:
             self.logger.error(f"TMDB 상세 정보 조회 오류: {e}")
             return None
 
+    def _store_anime_details(self, anime_info: TMDBAnimeInfo, language: str) -> None:
+        """상세 정보를 코어 / 무거운 섹션 두 항목으로 나누어 캐시하고 객체의 섹션 해제"""
+        tv_id = anime_info.id
+        self.cache_manager.set_cache(
+            f"details_{tv_id}_{language}",
+            anime_info.to_core_dict(),
+            request={
+                "path": f"tv/{tv_id}",
+                "params": {
+                    "language": language,
+                    "append_to_response": DETAIL_APPEND_TO_RESPONSE,
+                },
+            },
+        )
+        self.cache_manager.set_cache(
+            f"details_sections_{tv_id}_{language}",
+            anime_info.to_sections_dict(),
+            request={
+                "path": f"tv/{tv_id}",
+                "params": {"language": language, "append_to_response": SECTION_APPEND_TO_RESPONSE},
+            },
+        )
+        anime_info.release_sections()
+
+    def _make_section_loader(self, tv_id: int, language: str) -> Callable[[str], Any]:
+        """TMDBAnimeInfo 지연 로드 섹션용 로더 생성
+
+        속성 접근 중에 불리므로 캐시만 읽습니다 (없으면 None, 네트워크 요청 없음).
+        """
+        return lambda section: self.get_anime_section(tv_id, section, language, fetch=False)
+
+    def get_anime_section(
+        self, tv_id: int, section: str, language: str | None = None, fetch: bool = True
+    ) -> dict[str, Any] | None:
+        """
+        상세 정보의 무거운 섹션(credits, images 등) 조회 - 캐시 우선, 없으면 한 번에 재요청
+
+        Args:
+            fetch: False면 캐시에 없을 때 요청하지 않고 None 반환
+        """
+        try:
+            language = language or self.language
+            cache_key = f"details_sections_{tv_id}_{language}"
+            sections = self.revalidator.get(cache_key, self._sections_cache_transform)
+            if sections is None:
+                if not fetch:
+                    return None
+                path = f"tv/{tv_id}"
+                params = {"language": language, "append_to_response": SECTION_APPEND_TO_RESPONSE}
+                response = self.revalidator.fetch(path, params)
+                if response.data is None:
+                    return None
+                sections = self._sections_cache_transform(response.data)
+                self.cache_manager.set_cache(
+                    cache_key,
+                    sections,
+                    etag=response.etag,
+                    last_modified=response.last_modified,
+                    request={"path": path, "params": params},
+                )
+            return sections.get(section)
+        except Exception as e:
+            self.logger.error(f"TMDB 상세 섹션 조회 오류: {e}")
+            return None
+
     def search_anime_optimized(self, query: str, language: str = "ko-KR") -> list[TMDBAnimeInfo]:
         """최적화된 애니메이션 검색 (캐시됨)"""
         try:
-            self.rate_limiter.wait_if_needed()
             cache_key = f"optimized_search_{query}_{language}"
-            cached_result = self.cache_manager.get_cache(cache_key)
+            cached_result = self.revalidator.get(cache_key, self._search_cache_transform)
             if cached_result:
                 for item in cached_result:
                     if "tmdb_id" in item and "id" not in item:
                         item["id"] = item["tmdb_id"]
                 return [TMDBAnimeInfo(**item) for item in cached_result]
-            search = tmdb.Search()
-            response = search.tv(
-                query=query, language=language, first_air_date_year=2020, sort_by="popularity.desc"
+            self.rate_limiter.wait_if_needed()
+            search_params = {
+                "query": query,
+                "language": language,
+                "first_air_date_year": 2020,
+                "sort_by": "popularity.desc",
+            }
+            response = tmdb.Search().tv(**dict(search_params))
+            anime_info_list = self._filter_search_results(response)
+            self.cache_manager.set_cache(
+                cache_key,
+                [asdict(info) for info in anime_info_list],
+                request={"path": "search/tv", "params": search_params},
             )
-            anime_results = []
-            for result in response.get("results", []):
-                genre_ids = result.get("genre_ids", [])
-                if any(genre_id in genre_ids for genre_id in [16, 10759]):
-                    anime_results.append(result)
-            limited_results = anime_results[:10]
-            anime_info_list = []
-            for result in limited_results:
-                anime_info = self._convert_to_anime_info(result)
-                if anime_info:
-                    anime_info_list.append(anime_info)
-            self.cache_manager.set_cache(cache_key, [asdict(info) for info in anime_info_list])
             return anime_info_list
         except Exception as e:
             self.logger.error(f"TMDB 최적화 검색 오류: {e}")
             return []
 
     def get_anime_season(
-        self, tv_id: int, season_number: int, language: str | None = None
+        self,
+        tv_id: int,
+        season_number: int,
+        language: str | None = None,
+        background: bool = False,
     ) -> dict[str, Any] | None:
-        """시즌 정보 조회 (최적화됨)"""
+        """시즌 정보 조회 (최적화됨)
+
+        background가 True면 프리페치 요청으로 간주하여 대화형 대기 대신
+        호출자가 확보한 백그라운드 슬롯을 사용하고, 요청을 공유 예산에 기록합니다.
+        """
         try:
-            self.rate_limiter.wait_if_needed()
             cache_key = f"season_{tv_id}_{season_number}_{language or self.language}"
-            cached_result = self.cache_manager.get_cache(cache_key)
+            cached_result = self.revalidator.get(cache_key)
             if cached_result:
                 return cached_result
+            if not background:
+                self.rate_limiter.wait_if_needed()
             season = tmdb.TV_Seasons(tv_id, season_number)
-            response = season.info(language=language or self.language)
-            self.cache_manager.set_cache(cache_key, response)
+            try:
+                response = season.info(language=language or self.language)
+            except Exception:
+                if background:
+                    self.rate_limiter.record_request(success=False)
+                raise
+            if background:
+                self.rate_limiter.record_request(success=True)
+            self.cache_manager.set_cache(
+                cache_key,
+                response,
+                request={
+                    "path": f"tv/{tv_id}/season/{season_number}",
+                    "params": {"language": language or self.language},
+                },
+            )
             return response
         except Exception as e:
             self.logger.error(f"TMDB 시즌 정보 조회 오류: {e}")
             return None
 
+    def has_cached_season(
+        self, tv_id: int, season_number: int, language: str | None = None
+    ) -> bool:
+        """시즌 정보가 캐시에 있는지 여부 (stale 항목 포함)"""
+        cache_key = f"season_{tv_id}_{season_number}_{language or self.language}"
+        return self.cache_manager.get_cache_entry(cache_key) is not None
+
+    def prefetch_seasons(self, anime_info: TMDBAnimeInfo, language: str | None = None) -> int:
+        """매칭된 작품의 시즌 정보를 백그라운드에서 미리 받아오도록 예약"""
+        return self.season_prefetcher.prefetch_anime(anime_info, language)
+
+    def _get_episode_from_season_cache(
+        self, tv_id: int, season_number: int, episode_number: int, language: str
+    ) -> dict[str, Any] | None:
+        """캐시된 시즌 정보에서 에피소드 찾기 (프리페치된 시즌이면 API 호출 불필요)"""
+        cache_key = f"season_{tv_id}_{season_number}_{language}"
+        season = self.revalidator.get(cache_key)
+        if not season:
+            return None
+        for episode in season.get("episodes", []):
+            if episode.get("episode_number") == episode_number:
+                return episode
+        return None
+
+    def get_anime_translations(self, tv_id: int) -> dict[str, Any] | None:
+        """번역 정보 조회 (언어와 무관하게 한 번만 요청하여 캐시)"""
+        try:
+            cache_key = f"translations_{tv_id}"
+            cached_result = self.revalidator.get(cache_key)
+            if cached_result:
+                return cached_result
+            self.rate_limiter.wait_if_needed()
+            response = tmdb.TV(tv_id).translations()
+            self.cache_manager.set_cache(
+                cache_key, response, request={"path": f"tv/{tv_id}/translations", "params": {}}
+            )
+            return response
+        except Exception as e:
+            self.logger.error(f"TMDB 번역 정보 조회 오류: {e}")
+            return None
+
+    def get_localized_names(self, tv_id: int, languages: list[str]) -> dict[str, str]:
+        """번역 정보에서 언어별 제목 추출 (예: {"ko-KR": "...", "en-US": "..."})
+
+        언어+지역이 정확히 일치하는 번역을 우선 사용하고, 없으면 언어 코드만 일치하는
+        번역을 사용합니다. 제목이 비어 있는 번역은 건너뜁니다.
+        """
+        payload = self.get_anime_translations(tv_id) or {}
+        translations = payload.get("translations", [])
+        names: dict[str, str] = {}
+        for language in languages:
+            lang, _, region = language.partition("-")
+            exact = None
+            partial = None
+            for translation in translations:
+                name = (translation.get("data") or {}).get("name", "")
+                if not name or translation.get("iso_639_1") != lang:
+                    continue
+                if region and translation.get("iso_3166_1") == region:
+                    exact = name
+                    break
+                if partial is None:
+                    partial = name
+            name = exact or partial
+            if name:
+                names[language] = name
+        return names
+
     def get_anime_episode(
         self, tv_id: int, season_number: int, episode_number: int, language: str | None = None
     ) -> dict[str, Any] | None:
         """에피소드 정보 조회 (최적화됨)"""
         try:
-            self.rate_limiter.wait_if_needed()
             cache_key = (
                 f"episode_{tv_id}_{season_number}_{episode_number}_{language or self.language}"
             )
-            cached_result = self.cache_manager.get_cache(cache_key)
+            cached_result = self.revalidator.get(cache_key)
             if cached_result:
                 return cached_result
+            season_episode = self._get_episode_from_season_cache(
+                tv_id, season_number, episode_number, language or self.language
+            )
+            if season_episode:
+                return season_episode
+            self.rate_limiter.wait_if_needed()
             episode = tmdb.TV_Episodes(tv_id, season_number, episode_number)
             response = episode.info(language=language or self.language)
-            self.cache_manager.set_cache(cache_key, response)
+            self.cache_manager.set_cache(
+                cache_key,
+                response,
+                request={
+                    "path": f"tv/{tv_id}/season/{season_number}/episode/{episode_number}",
+                    "params": {"language": language or self.language},
+                },
+            )
             return response
         except Exception as e:
             self.logger.error(f"TMDB 에피소드 정보 조회 오류: {e}")
             return None
 
+    def _filter_search_results(self, response: dict[str, Any]) -> list[TMDBAnimeInfo]:
+        """검색 응답에서 애니메이션 장르만 골라 최대 10개를 TMDBAnimeInfo로 변환"""
+        anime_info_list = []
+        for result in response.get("results", []):
+            genre_ids = result.get("genre_ids", [])
+            if not any(genre_id in genre_ids for genre_id in [16, 10759]):
+                continue
+            anime_info = self._convert_to_anime_info(result)
+            if anime_info:
+                anime_info_list.append(anime_info)
+            if len(anime_info_list) >= 10:
+                break
+        return anime_info_list
+
+    def _search_cache_transform(self, response: dict[str, Any]) -> list[dict[str, Any]]:
+        """재검증된 검색 응답을 캐시 형식으로 변환"""
+        return [asdict(info) for info in self._filter_search_results(response)]
+
+    def _details_cache_transform(
+        self, response: dict[str, Any], language: str
+    ) -> dict[str, Any] | None:
+        """append_to_response로 재검증된 상세 응답을 코어 캐시 형식으로 변환 (섹션은 별도 저장)"""
+        response["watch_providers"] = response.pop("watch/providers", {})
+        anime_info = self._convert_to_anime_info(response)
+        if not anime_info:
+            return None
+        self.cache_manager.set_cache(
+            f"details_sections_{anime_info.id}_{language}",
+            anime_info.to_sections_dict(),
+            request={
+                "path": f"tv/{anime_info.id}",
+                "params": {"language": language, "append_to_response": SECTION_APPEND_TO_RESPONSE},
+            },
+        )
+        return anime_info.to_core_dict()
+
+    def _sections_cache_transform(self, response: dict[str, Any]) -> dict[str, Any]:
+        """append_to_response 응답에서 무거운 섹션만 추출"""
+        return {name: response.get(name) or {} for name in HEAVY_SECTIONS}
+
     def _convert_to_anime_info(self, tmdb_data: dict[str, Any]) -> TMDBAnimeInfo | None:
         """TMDB 응답을 TMDBAnimeInfo 객체로 변환"""
         try:
@@ -377,8 +609,11 @@ class TMDBClient:
             image_cache_info = self.image_manager.get_image_cache_info()
             return {
                 "api_cache": cache_info,
+                "show_footprint": self.cache_manager.get_show_footprint(),
                 "image_cache": image_cache_info,
                 "rate_limiter": self.rate_limiter.get_health_status(),
+                "revalidation": self.revalidator.get_status(),
+                "season_prefetch": self.season_prefetcher.get_status(),
             }
         except Exception as e:
             return {"error": str(e)}
@@ -419,6 +654,14 @@ class TMDBClient:
         """포스터 이미지 경로 반환 (다운로드 포함)"""
         return self.image_manager.get_poster_path(poster_path, size)
 
+    def get_poster_thumbnail_path(self, poster_path: str, variant: str) -> str | None:
+        """용도별 포스터 썸네일 경로 반환 (다운로드 포함)"""
+        return self.image_manager.get_thumbnail_path(poster_path, variant)
+
+    def get_cached_poster_thumbnail_path(self, poster_path: str, variant: str) -> str | None:
+        """이미 만들어진 포스터 썸네일 경로만 반환 (네트워크 요청 없음)"""
+        return self.image_manager.get_cached_thumbnail_path(poster_path, variant)
+
     def get_backdrop_path(self, backdrop_path: str, size: str = "w1280") -> str | None:
         """배경 이미지 경로 반환 (다운로드 포함)"""
         return self.image_manager.get_backdrop_path(backdrop_path, size)
@@ -448,6 +691,7 @@ class TMDBClient:
         if new_api_key and new_api_key != self.api_key:
             self.api_key = new_api_key
             tmdb.API_KEY = new_api_key
+            self.revalidator.api_key = new_api_key
             tmdb_config = unified_config_manager.get("services", "tmdb_api", {})
             tmdb_config["api_key"] = new_api_key
             unified_config_manager.set("services", "tmdb_api", tmdb_config)
@@ -470,6 +714,12 @@ class TMDBClient:
         """속도 제한 관리자 초기화"""
         self.rate_limiter.reset()
 
+    def get_revalidation_status(self) -> dict[str, Any]:
+        """백그라운드 캐시 재검증 상태 반환"""
+        return self.revalidator.get_status()
+
     async def close_resources(self) -> None:
         """리소스 정리"""
+        self.season_prefetcher.stop()
+        self.revalidator.shutdown()
         await self.image_manager.close_async_session()
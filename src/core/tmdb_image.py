@@ -2,10 +2,19 @@
 TMDB 이미지 다운로드 모듈
 
 TMDB 포스터, 배경 이미지 등의 다운로드를 관리합니다.
+
+캐시 디렉토리 구조 (내용 주소 방식):
+    refs/{size}_{filename}          → 이미지 내용 해시 (크기/작품 간 같은 이미지 중복 제거)
+    objects/{해시 앞 2자리}/{해시}{확장자} → 원본 이미지
+    thumbs/{용도}/{해시}.jpg         → 표시 크기로 미리 줄인 썸네일
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import shutil
+import time
 
 logger = logging.getLogger(__name__)
 from pathlib import Path
@@ -13,17 +22,60 @@ from pathlib import Path
 import aiohttp
 import requests
 
+from src.core.utils.atomic_file import (
+    LOCK_DIR_NAME,
+    StripedFileLock,
+    atomic_write_bytes,
+    is_temp_file,
+)
+
+TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
+REFS_DIR_NAME = "refs"
+OBJECTS_DIR_NAME = "objects"
+THUMBS_DIR_NAME = "thumbs"
+
+# 용도별 썸네일 크기 (테이블 툴팁, 상세 패널, 검색 다이얼로그 카드)
+THUMBNAIL_SIZES: dict[str, tuple[int, int]] = {
+    "tooltip": (200, 300),
+    "detail": (184, 276),
+    "card": (100, 150),
+}
+# 썸네일을 만들 원본 크기 - 모든 용도보다 커서 확대 없이 줄이기만 함
+THUMBNAIL_SOURCE_SIZE = "w342"
+THUMBNAIL_QUALITY = 90
+
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+# 상한을 넘으면 이 비율까지 오래 쓰지 않은 이미지를 정리
+EVICTION_LOW_WATERMARK = 0.9
+# 최근 사용 시각 갱신 간격 (초) - 조회마다 utime을 호출하지 않도록
+ACCESS_TOUCH_INTERVAL = 60.0
+
 
 class TMDBImageManager:
-    """TMDB 이미지를 관리하는 클래스"""
+    """TMDB 이미지를 관리하는 클래스
+
+    이미지는 내용 해시로 한 번만 저장하고, 전체 크기가 max_cache_bytes를 넘으면
+    가장 오래 사용하지 않은 이미지부터 정리합니다(LRU, 파일 수정 시각 기준).
+    썸네일 원본 크기(THUMBNAIL_SOURCE_SIZE) 포스터를 받을 때 용도별 썸네일을 함께 만들어
+    화면에서는 원본을 매번 디코딩/축소하지 않고 썸네일을 바로 사용합니다.
+    """
 
-    def __init__(self, poster_cache_dir: Path):
+    def __init__(
+        self,
+        poster_cache_dir: Path,
+        max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        base_url: str = TMDB_IMAGE_BASE_URL,
+    ):
         """
         Args:
             poster_cache_dir: 포스터 이미지 캐시 디렉토리
+            max_cache_bytes: 이미지 캐시 최대 크기 (바이트, 원본 + 썸네일)
+            base_url: TMDB 이미지 기본 URL (테스트에서는 로컬 서버 주소)
         """
         self.poster_cache_dir = poster_cache_dir
-        self.poster_cache_dir.mkdir(exist_ok=True)
+        self.max_cache_bytes = max_cache_bytes
+        self.base_url = base_url.rstrip("/")
+        self._init_layout()
         self.async_session: aiohttp.ClientSession | None = None
         self.async_lock = asyncio.Lock()
         self.session = requests.Session()
@@ -38,6 +90,16 @@ class TMDBImageManager:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info(f"TMDB 이미지 관리자 초기화 완료: {poster_cache_dir}")
 
+    def _init_layout(self) -> None:
+        self.poster_cache_dir.mkdir(exist_ok=True)
+        self.refs_dir = self.poster_cache_dir / REFS_DIR_NAME
+        self.objects_dir = self.poster_cache_dir / OBJECTS_DIR_NAME
+        self.thumbs_dir = self.poster_cache_dir / THUMBS_DIR_NAME
+        for directory in (self.refs_dir, self.objects_dir, self.thumbs_dir):
+            directory.mkdir(exist_ok=True)
+        self.file_locks = StripedFileLock(self.poster_cache_dir / LOCK_DIR_NAME, stripes=16)
+        self._total_bytes: int | None = None
+
     async def _get_async_session(self) -> aiohttp.ClientSession:
         """비동기 세션 가져오기 (싱글톤 패턴)"""
         if self.async_session is None or self.async_session.closed:
@@ -61,48 +123,249 @@ class TMDBImageManager:
         if self.async_session and not self.async_session.closed:
             await self.async_session.close()
 
+    # ----- 내용 주소 저장소 -----
+
+    def _object_file(self, digest: str, suffix: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}{suffix}"
+
+    def _thumbnail_file(self, digest: str, variant: str) -> Path:
+        return self.thumbs_dir / variant / f"{digest}.jpg"
+
+    def _read_ref(self, cache_filename: str) -> Path | None:
+        """참조 파일이 가리키는 원본 경로 (원본이 정리되었으면 None)"""
+        try:
+            digest = (self.refs_dir / cache_filename).read_text(encoding="ascii").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        object_file = self._object_file(digest, Path(cache_filename).suffix)
+        return object_file if object_file.exists() else None
+
+    def _lookup(self, cache_filename: str) -> Path | None:
+        """캐시된 이미지 경로 조회 (이전 평면 구조 파일은 저장소로 옮김)"""
+        object_file = self._read_ref(cache_filename)
+        if object_file is not None:
+            self._touch(object_file)
+            return object_file
+        legacy_file = self.poster_cache_dir / cache_filename
+        if legacy_file.is_file():
+            try:
+                object_file = self._store(cache_filename, legacy_file.read_bytes())
+                legacy_file.unlink(missing_ok=True)
+                return object_file
+            except OSError as e:
+                self.logger.debug(f"이전 캐시 파일 이전 실패: {legacy_file} - {e}")
+                return legacy_file
+        return None
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """LRU 정리를 위해 최근 사용 시각 갱신"""
+        try:
+            now = time.time()
+            if now - path.stat().st_mtime > ACCESS_TOUCH_INTERVAL:
+                os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def _store(self, cache_filename: str, content: bytes, make_thumbnails: bool = False) -> Path:
+        """이미지를 내용 해시로 저장하고 참조를 기록"""
+        digest = hashlib.sha256(content).hexdigest()
+        object_file = self._object_file(digest, Path(cache_filename).suffix)
+        added = 0
+        if not object_file.exists():
+            object_file.parent.mkdir(exist_ok=True)
+            atomic_write_bytes(object_file, content)
+            added += len(content)
+        else:
+            self._touch(object_file)
+        if make_thumbnails:
+            added += self._make_thumbnails(digest, content)
+        atomic_write_bytes(self.refs_dir / cache_filename, digest.encode("ascii"))
+        self._account(added)
+        return object_file
+
+    def _make_thumbnails(self, digest: str, content: bytes) -> int:
+        """용도별 썸네일 생성 (이미 있으면 건너뜀)
+
+        Returns:
+            새로 기록한 바이트 수
+        """
+        missing = {
+            variant: size
+            for variant, size in THUMBNAIL_SIZES.items()
+            if not self._thumbnail_file(digest, variant).exists()
+        }
+        if not missing:
+            return 0
+        try:
+            from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, Qt
+            from PyQt5.QtGui import QImage
+        except ImportError:
+            return 0
+        image = QImage()
+        if not image.loadFromData(content):
+            self.logger.debug(f"썸네일 생성 실패 (이미지 디코딩 불가): {digest}")
+            return 0
+        written = 0
+        for variant, (width, height) in missing.items():
+            scaled = image.scaled(
+                width,
+                height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            if not scaled.save(buffer, "JPG", THUMBNAIL_QUALITY):
+                continue
+            thumbnail_file = self._thumbnail_file(digest, variant)
+            thumbnail_file.parent.mkdir(exist_ok=True)
+            atomic_write_bytes(thumbnail_file, bytes(data))
+            written += data.size()
+        return written
+
+    def _account(self, added: int) -> None:
+        """저장 크기 누적 후 상한을 넘으면 정리"""
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_store_bytes()
+        else:
+            self._total_bytes += added
+        if self._total_bytes > self.max_cache_bytes:
+            self.evict()
+
+    def _iter_store_files(self):
+        for root in (self.objects_dir, self.thumbs_dir):
+            for image_file in root.rglob("*"):
+                if image_file.is_file() and not is_temp_file(image_file):
+                    yield image_file
+
+    def _scan_store_bytes(self) -> int:
+        total = 0
+        for image_file in self._iter_store_files():
+            try:
+                total += image_file.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def evict(self, target_bytes: int | None = None) -> int:
+        """오래 사용하지 않은 이미지부터 정리하여 목표 크기 이하로 유지
+
+        Args:
+            target_bytes: 목표 크기 (None이면 최대 크기 × EVICTION_LOW_WATERMARK)
+
+        Returns:
+            정리한 원본 이미지 수
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_cache_bytes * EVICTION_LOW_WATERMARK)
+        removed = 0
+        # 여러 프로세스가 동시에 정리하지 않도록 전역 잠금 사용
+        with self.file_locks.for_key("__evict__"):
+            objects: list[tuple[float, int, Path]] = []
+            for object_file in self.objects_dir.rglob("*"):
+                if not object_file.is_file() or is_temp_file(object_file):
+                    continue
+                try:
+                    stat = object_file.stat()
+                except OSError:
+                    continue
+                objects.append((stat.st_mtime, stat.st_size, object_file))
+            total = self._scan_store_bytes()
+            for _mtime, size, object_file in sorted(objects, key=lambda item: item[0]):
+                if total <= target_bytes:
+                    break
+                digest = object_file.stem
+                object_file.unlink(missing_ok=True)
+                total -= size
+                for variant in THUMBNAIL_SIZES:
+                    thumbnail_file = self._thumbnail_file(digest, variant)
+                    try:
+                        total -= thumbnail_file.stat().st_size
+                        thumbnail_file.unlink()
+                    except OSError:
+                        continue
+                removed += 1
+            if removed:
+                self._prune_refs()
+            self._total_bytes = total
+        if removed:
+            self.logger.info(
+                f"이미지 캐시 정리: {removed}개 제거 (현재 {total / (1024 * 1024):.1f}MB)"
+            )
+        return removed
+
+    def _prune_refs(self) -> None:
+        """원본이 정리된 참조 파일 제거"""
+        for ref_file in self.refs_dir.iterdir():
+            if (
+                ref_file.is_file()
+                and not is_temp_file(ref_file)
+                and self._read_ref(ref_file.name) is None
+            ):
+                ref_file.unlink(missing_ok=True)
+
+    # ----- 다운로드 -----
+
     async def download_poster_async(self, poster_path: str, size: str = "w185") -> str | None:
         """TMDB 포스터 이미지 비동기 다운로드"""
         if not poster_path:
             return None
         try:
-            base_url = "https://image.tmdb.org/t/p"
-            image_url = f"{base_url}/{size}{poster_path}"
-            filename = poster_path.split("/")[-1]
-            cache_filename = f"{size}_{filename}"
-            cache_path = self.poster_cache_dir / cache_filename
-            if cache_path.exists():
-                return str(cache_path)
+            image_url = self.get_image_url(poster_path, size)
+            cache_filename = f"{size}_{poster_path.split('/')[-1]}"
+            cached = self._lookup(cache_filename)
+            if cached is not None:
+                return str(cached)
             session = await self._get_async_session()
             async with session.get(image_url) as response:
                 response.raise_for_status()
                 content = await response.read()
-            with cache_path.open("wb") as f:
-                f.write(content)
+            object_file = self._store(
+                cache_filename, content, make_thumbnails=size == THUMBNAIL_SOURCE_SIZE
+            )
             self.logger.info(f"포스터 다운로드 완료: {cache_filename}")
-            return str(cache_path)
+            return str(object_file)
         except Exception as e:
             self.logger.error(f"포스터 다운로드 실패: {e}")
             return None
 
+    def _download(self, image_path: str, size: str, prefix: str = "") -> tuple[Path, bool]:
+        """이미지를 받아 저장소에 저장
+
+        파일별 잠금을 잡고 캐시를 다시 확인하므로 여러 프로세스가 같은 이미지를
+        요청해도 한 번만 다운로드합니다.
+
+        Returns:
+            (이미지 경로, 새로 다운로드했는지 여부)
+        """
+        cache_filename = f"{prefix}{size}_{image_path.split('/')[-1]}"
+        cached = self._lookup(cache_filename)
+        if cached is not None:
+            return cached, False
+        with self.file_locks.for_key(cache_filename):
+            cached = self._lookup(cache_filename)
+            if cached is not None:
+                return cached, False
+            response = self.session.get(self.get_image_url(image_path, size), timeout=10)
+            response.raise_for_status()
+            object_file = self._store(
+                cache_filename,
+                response.content,
+                make_thumbnails=not prefix and size == THUMBNAIL_SOURCE_SIZE,
+            )
+        return object_file, True
+
     def download_poster(self, poster_path: str, size: str = "w185") -> str | None:
         """TMDB 포스터 이미지 다운로드 (동기 버전)"""
         if not poster_path:
             return None
         try:
-            base_url = "https://image.tmdb.org/t/p"
-            image_url = f"{base_url}/{size}{poster_path}"
-            filename = poster_path.split("/")[-1]
-            cache_filename = f"{size}_{filename}"
-            cache_path = self.poster_cache_dir / cache_filename
-            if cache_path.exists():
-                return str(cache_path)
-            response = self.session.get(image_url, timeout=10)
-            response.raise_for_status()
-            with cache_path.open("wb") as f:
-                f.write(response.content)
-            self.logger.info(f"포스터 다운로드 완료: {cache_filename}")
-            return str(cache_path)
+            object_file, downloaded = self._download(poster_path, size)
+            if downloaded:
+                self.logger.info(f"포스터 다운로드 완료: {size}_{poster_path.split('/')[-1]}")
+            return str(object_file)
         except Exception as e:
             self.logger.error(f"포스터 다운로드 실패: {e}")
             return None
@@ -112,19 +375,12 @@ class TMDBImageManager:
         if not backdrop_path:
             return None
         try:
-            base_url = "https://image.tmdb.org/t/p"
-            image_url = f"{base_url}/{size}{backdrop_path}"
-            filename = backdrop_path.split("/")[-1]
-            cache_filename = f"backdrop_{size}_{filename}"
-            cache_path = self.poster_cache_dir / cache_filename
-            if cache_path.exists():
-                return str(cache_path)
-            response = self.session.get(image_url, timeout=10)
-            response.raise_for_status()
-            with cache_path.open("wb") as f:
-                f.write(response.content)
-            self.logger.info(f"배경 이미지 다운로드 완료: {cache_filename}")
-            return str(cache_path)
+            object_file, downloaded = self._download(backdrop_path, size, prefix="backdrop_")
+            if downloaded:
+                self.logger.info(
+                    f"배경 이미지 다운로드 완료: backdrop_{size}_{backdrop_path.split('/')[-1]}"
+                )
+            return str(object_file)
         except Exception as e:
             self.logger.error(f"배경 이미지 다운로드 실패: {e}")
             return None
@@ -134,19 +390,12 @@ class TMDBImageManager:
         if not profile_path:
             return None
         try:
-            base_url = "https://image.tmdb.org/t/p"
-            image_url = f"{base_url}/{size}{profile_path}"
-            filename = profile_path.split("/")[-1]
-            cache_filename = f"profile_{size}_{filename}"
-            cache_path = self.poster_cache_dir / cache_filename
-            if cache_path.exists():
-                return str(cache_path)
-            response = self.session.get(image_url, timeout=10)
-            response.raise_for_status()
-            with cache_path.open("wb") as f:
-                f.write(response.content)
-            self.logger.info(f"프로필 이미지 다운로드 완료: {cache_filename}")
-            return str(cache_path)
+            object_file, downloaded = self._download(profile_path, size, prefix="profile_")
+            if downloaded:
+                self.logger.info(
+                    f"프로필 이미지 다운로드 완료: profile_{size}_{profile_path.split('/')[-1]}"
+                )
+            return str(object_file)
         except Exception as e:
             self.logger.error(f"프로필 이미지 다운로드 실패: {e}")
             return None
@@ -157,6 +406,52 @@ class TMDBImageManager:
             return None
         return self.download_poster(poster_path, size)
 
+    def get_cached_poster_path(self, poster_path: str, size: str = "w185") -> str | None:
+        """이미 캐시된 포스터 경로만 반환 (네트워크 요청 없음)"""
+        if not poster_path:
+            return None
+        cached = self._lookup(f"{size}_{poster_path.split('/')[-1]}")
+        return str(cached) if cached is not None else None
+
+    def get_thumbnail_path(self, poster_path: str, variant: str) -> str | None:
+        """용도별 포스터 썸네일 경로 반환 (필요하면 원본 다운로드 후 생성)
+
+        Args:
+            poster_path: TMDB 포스터 경로
+            variant: THUMBNAIL_SIZES의 용도 ("tooltip", "detail", "card")
+        """
+        if not poster_path or variant not in THUMBNAIL_SIZES:
+            return None
+        cached = self.get_cached_thumbnail_path(poster_path, variant)
+        if cached is not None:
+            return cached
+        source = self.download_poster(poster_path, THUMBNAIL_SOURCE_SIZE)
+        if source is None:
+            return None
+        source_file = Path(source)
+        digest = source_file.stem
+        thumbnail_file = self._thumbnail_file(digest, variant)
+        if not thumbnail_file.exists():
+            # 썸네일 기능 이전에 받은 원본이면 지금 생성
+            try:
+                self._account(self._make_thumbnails(digest, source_file.read_bytes()))
+            except OSError as e:
+                self.logger.debug(f"썸네일 생성 실패: {e}")
+        return str(thumbnail_file) if thumbnail_file.exists() else source
+
+    def get_cached_thumbnail_path(self, poster_path: str, variant: str) -> str | None:
+        """이미 만들어진 썸네일 경로만 반환 (네트워크 요청/디코딩 없음, UI 스레드용)"""
+        if not poster_path or variant not in THUMBNAIL_SIZES:
+            return None
+        source_file = self._read_ref(f"{THUMBNAIL_SOURCE_SIZE}_{poster_path.split('/')[-1]}")
+        if source_file is None:
+            return None
+        thumbnail_file = self._thumbnail_file(source_file.stem, variant)
+        if not thumbnail_file.exists():
+            return None
+        self._touch(source_file)
+        return str(thumbnail_file)
+
     def get_backdrop_path(self, backdrop_path: str, size: str = "w1280") -> str | None:
         """배경 이미지 경로 반환 (다운로드 포함)"""
         if not backdrop_path:
@@ -173,18 +468,21 @@ class TMDBImageManager:
         """TMDB 이미지 URL 생성"""
         if not image_path:
             return ""
-        base_url = "https://image.tmdb.org/t/p"
-        return f"{base_url}/{size}{image_path}"
+        return f"{self.base_url}/{size}{image_path}"
+
+    # ----- 관리 -----
 
     def clear_image_cache(self) -> int:
         """이미지 캐시 정리"""
         try:
-            image_files = list(self.poster_cache_dir.glob("*"))
-            cleaned_count = 0
-            for image_file in image_files:
-                if image_file.is_file():
-                    image_file.unlink()
+            cleaned_count = sum(1 for _ in self._iter_store_files())
+            for directory in (self.refs_dir, self.objects_dir, self.thumbs_dir):
+                shutil.rmtree(directory, ignore_errors=True)
+            for legacy_file in self.poster_cache_dir.glob("*"):
+                if legacy_file.is_file() and not is_temp_file(legacy_file):
+                    legacy_file.unlink(missing_ok=True)
                     cleaned_count += 1
+            self._init_layout()
             self.logger.info(f"이미지 캐시 {cleaned_count}개 정리 완료")
             return cleaned_count
         except Exception as e:
@@ -194,35 +492,47 @@ class TMDBImageManager:
     def get_image_cache_info(self) -> dict:
         """이미지 캐시 정보 반환"""
         try:
-            image_files = list(self.poster_cache_dir.glob("*"))
-            total_size = sum(f.stat().st_size for f in image_files if f.is_file())
             image_types: dict[str, int] = {}
-            for image_file in image_files:
-                if image_file.is_file():
-                    filename = image_file.name
-                    if filename.startswith(("w185_", "w342_", "w500_")):
-                        image_types["poster"] = image_types.get("poster", 0) + 1
-                    elif filename.startswith("backdrop_"):
-                        image_types["backdrop"] = image_types.get("backdrop", 0) + 1
-                    elif filename.startswith("profile_"):
-                        image_types["profile"] = image_types.get("profile", 0) + 1
-                    else:
-                        image_types["other"] = image_types.get("other", 0) + 1
+            for ref_file in self.refs_dir.iterdir():
+                if not ref_file.is_file() or is_temp_file(ref_file):
+                    continue
+                filename = ref_file.name
+                if filename.startswith("backdrop_"):
+                    image_types["backdrop"] = image_types.get("backdrop", 0) + 1
+                elif filename.startswith("profile_"):
+                    image_types["profile"] = image_types.get("profile", 0) + 1
+                elif filename.startswith("w"):
+                    image_types["poster"] = image_types.get("poster", 0) + 1
+                else:
+                    image_types["other"] = image_types.get("other", 0) + 1
+            object_files = [f for f in self._iter_store_files() if self.objects_dir in f.parents]
+            object_bytes = sum(f.stat().st_size for f in object_files)
+            total_size = self._scan_store_bytes()
+            self._total_bytes = total_size
             return {
                 "cache_dir": str(self.poster_cache_dir),
-                "total_files": len(image_files),
+                "total_files": len(object_files),
                 "total_size_bytes": total_size,
                 "total_size_mb": total_size / (1024 * 1024),
+                "object_bytes": object_bytes,
+                "thumbnail_bytes": total_size - object_bytes,
+                "max_size_bytes": self.max_cache_bytes,
                 "image_types": image_types,
             }
         except Exception as e:
             return {"error": str(e)}
 
+    def set_max_cache_size(self, max_bytes: int) -> None:
+        """이미지 캐시 최대 크기 설정 (초과분은 즉시 정리)"""
+        self.max_cache_bytes = max_bytes
+        self._account(0)
+        self.logger.info(f"이미지 캐시 최대 크기: {max_bytes / (1024 * 1024):.0f}MB")
+
     def set_poster_cache_dir(self, new_dir: Path) -> bool:
         """포스터 캐시 디렉토리 변경"""
         try:
-            new_dir.mkdir(exist_ok=True)
             self.poster_cache_dir = new_dir
+            self._init_layout()
             self.logger.info(f"포스터 캐시 디렉토리 변경: {new_dir}")
             return True
         except Exception as e:
@@ -4,16 +4,60 @@ TMDB 데이터 모델
 TMDB API 응답을 위한 데이터 클래스들을 정의합니다.
 """
 
+import copy
 import logging
 
 logger = logging.getLogger(__name__)
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
 from typing import Any
 
+# 상세 정보 중 크기가 큰 섹션 - 코어 정보와 분리하여 필요할 때만 로드
+HEAVY_SECTIONS = ("images", "credits", "videos", "recommendations", "similar", "translations")
+
+
+class _LazySection:
+    """무거운 상세 섹션 디스크립터
+
+    객체에 값이 직접 설정되어 있으면 (빈 섹션 {} 포함) 그대로 반환하고, 없으면 연결된
+    section_loader로 처음 접근할 때 한 번만 로드해서 객체에 기억합니다. 로더가 값을
+    찾지 못하면 빈 섹션으로 기억하여 다시 부르지 않습니다. release_sections()로 객체가
+    들고 있는 섹션을 해제할 수 있습니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return None
+        value = obj.__dict__.get(self.name)
+        if value is not None:
+            return value
+        loaded = obj.__dict__.setdefault("_loaded_sections", {})
+        if self.name not in loaded:
+            loader = obj.__dict__.get("_section_loader")
+            section = loader(self.name) if loader is not None else None
+            loaded[self.name] = section if section is not None else {}
+        return loaded[self.name]
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        # 기본값으로 디스크립터 자신이 전달되면 "값 없음"(None)으로 처리, 빈 섹션은 그대로 보관
+        obj.__dict__[self.name] = None if isinstance(value, _LazySection) else value
+
+
+def _lazy_section(name: str) -> Any:
+    """지연 로드 섹션 필드 (repr/비교 시 로더가 호출되지 않도록 제외)"""
+    return field(default=_LazySection(name), repr=False, compare=False)
+
 
 @dataclass
 class TMDBAnimeInfo:
-    """TMDB 애니메이션 정보"""
+    """TMDB 애니메이션 정보
+
+    images/credits/videos/recommendations/similar/translations는 지연 로드 섹션입니다.
+    캐시에서 복원된 객체는 코어 정보만 들고 있고, 섹션은 접근할 때 로더를 통해 읽습니다.
+    """
 
     id: int
     name: str
@@ -41,15 +85,15 @@ class TMDBAnimeInfo:
     next_episode_to_air: dict[str, Any] | None
     seasons: list[dict[str, Any]]
     external_ids: dict[str, Any]
-    images: dict[str, Any]
-    credits: dict[str, Any]
-    videos: dict[str, Any]
-    keywords: dict[str, Any]
-    recommendations: dict[str, Any]
-    similar: dict[str, Any]
-    translations: dict[str, Any]
-    content_ratings: dict[str, Any]
-    watch_providers: dict[str, Any]
+    images: dict[str, Any] = _lazy_section("images")
+    credits: dict[str, Any] = _lazy_section("credits")
+    videos: dict[str, Any] = _lazy_section("videos")
+    keywords: dict[str, Any] = field(default_factory=dict)
+    recommendations: dict[str, Any] = _lazy_section("recommendations")
+    similar: dict[str, Any] = _lazy_section("similar")
+    translations: dict[str, Any] = _lazy_section("translations")
+    content_ratings: dict[str, Any] = field(default_factory=dict)
+    watch_providers: dict[str, Any] = field(default_factory=dict)
     tmdb_id: int | None = field(default=None)
 
     def __post_init__(self):
@@ -59,6 +103,40 @@ class TMDBAnimeInfo:
         else:
             self.tmdb_id = self.id
 
+    def set_section_loader(self, loader: Callable[[str], dict[str, Any] | None] | None) -> None:
+        """지연 로드 섹션 로더 연결 (섹션 이름을 받아 해당 데이터를 반환)
+
+        로더는 속성 접근 중에 호출되므로 (UI 스레드일 수 있음) 네트워크 요청 없이
+        캐시만 읽어야 합니다.
+        """
+        self.__dict__["_section_loader"] = loader
+        self.__dict__.pop("_loaded_sections", None)
+
+    def has_loaded_sections(self) -> bool:
+        """무거운 섹션이 객체 안에 직접 들어 있는지 여부"""
+        return any(self.__dict__.get(name) is not None for name in HEAVY_SECTIONS)
+
+    def to_core_dict(self) -> dict[str, Any]:
+        """무거운 섹션을 제외한 코어 정보 (캐시 저장용)"""
+        return {
+            f.name: copy.deepcopy(getattr(self, f.name))
+            for f in fields(self)
+            if f.name not in HEAVY_SECTIONS
+        }
+
+    def to_sections_dict(self) -> dict[str, Any]:
+        """객체에 직접 들어 있는 무거운 섹션 (로더는 호출하지 않음)"""
+        return {
+            name: {} if self.__dict__.get(name) is None else self.__dict__[name]
+            for name in HEAVY_SECTIONS
+        }
+
+    def release_sections(self) -> None:
+        """객체에 들고 있는 무거운 섹션 해제 (이후 접근은 로더 사용)"""
+        for name in HEAVY_SECTIONS:
+            self.__dict__[name] = None
+        self.__dict__.pop("_loaded_sections", None)
+
 
 @dataclass
 class TMDBSeasonInfo:
@@ -0,0 +1,144 @@
+"""
+TMDB 시즌 프리페치 모듈
+
+그룹이 TMDB 작품과 매칭되면 해당 작품의 시즌 정보를 백그라운드에서 미리 받아
+캐시에 저장합니다. 에피소드 조회는 시즌 캐시에서 바로 응답할 수 있으므로
+에피소드마다 API를 호출할 필요가 없어집니다.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+import itertools
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.tmdb_client import TMDBClient
+
+
+class TMDBSeasonPrefetcher:
+    """매칭된 작품의 시즌 정보를 낮은 우선순위로 미리 받아오는 클래스"""
+
+    def __init__(self, tmdb_client: "TMDBClient"):
+        """
+        Args:
+            tmdb_client: 시즌 조회와 캐시/속도 제한을 공유할 TMDB 클라이언트
+        """
+        self.tmdb_client = tmdb_client
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._pending: set[tuple[int, int, str]] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.stats = {"queued": 0, "fetched": 0, "skipped": 0, "failed": 0}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def prefetch_show(
+        self, tv_id: int, season_numbers: list[int], language: str | None = None
+    ) -> int:
+        """작품의 시즌들을 프리페치 대기열에 추가
+
+        Args:
+            tv_id: TMDB 작품 ID
+            season_numbers: 받아올 시즌 번호 목록
+            language: 조회 언어 (None이면 클라이언트 기본 언어)
+
+        Returns:
+            새로 대기열에 추가된 시즌 수
+        """
+        language = language or self.tmdb_client.language
+        added = 0
+        with self._lock:
+            for season_number in season_numbers:
+                job = (tv_id, season_number, language)
+                if job in self._pending:
+                    continue
+                self._pending.add(job)
+                # 시즌 번호가 낮을수록 먼저 (보통 정주행 순서), 같으면 요청 순서
+                self._queue.put((season_number, next(self._order), job))
+                added += 1
+            self.stats["queued"] += added
+        if added:
+            self._ensure_worker()
+        return added
+
+    def prefetch_anime(self, anime_info: Any, language: str | None = None) -> int:
+        """TMDBAnimeInfo/검색 결과의 시즌 목록으로 프리페치 요청"""
+        tv_id = getattr(anime_info, "id", None) or getattr(anime_info, "tmdb_id", None)
+        if not tv_id:
+            return 0
+        seasons = getattr(anime_info, "seasons", None) or []
+        season_numbers: list[int] = [
+            int(season["season_number"])
+            for season in seasons
+            if isinstance(season, dict) and season.get("season_number") is not None
+        ]
+        if not season_numbers:
+            number_of_seasons = getattr(anime_info, "number_of_seasons", 0) or 1
+            season_numbers = list(range(1, number_of_seasons + 1))
+        return self.prefetch_show(tv_id, season_numbers, language)
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="tmdb-season-prefetch", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """대기열 처리 루프 - 대화형 요청에 속도 제한 예산을 양보하며 하나씩 처리"""
+        while not self._stop_event.is_set():
+            try:
+                _priority, _order, job = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            tv_id, season_number, language = job
+            try:
+                if self.tmdb_client.has_cached_season(tv_id, season_number, language):
+                    self.stats["skipped"] += 1
+                    continue
+                if not self.tmdb_client.rate_limiter.wait_for_background_slot(
+                    should_stop=self._stop_event.is_set
+                ):
+                    break
+                result = self.tmdb_client.get_anime_season(
+                    tv_id, season_number, language, background=True
+                )
+                self.stats["fetched" if result else "failed"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                self.logger.warning(f"시즌 프리페치 실패: {tv_id} S{season_number} - {e}")
+            finally:
+                with self._lock:
+                    self._pending.discard(job)
+                self._queue.task_done()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """대기열이 빌 때까지 대기 (테스트/종료 처리용)"""
+        done = threading.Event()
+
+        def _join():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=_join, daemon=True).start()
+        return done.wait(timeout)
+
+    def get_status(self) -> dict[str, Any]:
+        """프리페치 상태 반환"""
+        with self._lock:
+            pending = len(self._pending)
+        return {**self.stats, "pending": pending}
+
+    def stop(self) -> None:
+        """프리페치 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
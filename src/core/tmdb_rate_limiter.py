@@ -9,6 +9,7 @@ import logging
 logger = logging.getLogger(__name__)
 import time
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -32,6 +33,7 @@ class TMDBRateLimiter:
         self.total_requests = 0
         self.total_delays = 0
         self.total_delay_time = 0.0
+        self.last_interactive_time: float | None = None
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info(
             f"TMDB 속도 제한 관리자 초기화: {requests_per_second} req/s, 버스트: {burst_limit}"
@@ -51,8 +53,9 @@ class TMDBRateLimiter:
         return True
 
     def wait_if_needed(self) -> float:
-        """필요한 경우 대기하고 대기 시간 반환"""
+        """필요한 경우 대기하고 대기 시간 반환 (대화형 요청)"""
         current_time = time.time()
+        self.last_interactive_time = current_time
         delay_time = 0.0
         if not self.can_make_request():
             if self.request_times:
@@ -76,6 +79,36 @@ class TMDBRateLimiter:
                         current_time = time.time()
         return delay_time
 
+    def wait_for_background_slot(
+        self,
+        reserved: int = 1,
+        quiet_period: float = 0.5,
+        poll_interval: float = 0.05,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> bool:
+        """백그라운드(프리페치) 요청 슬롯 대기
+
+        대화형 요청이 quiet_period 안에 있었거나, 최근 1초 요청 수가
+        (requests_per_second - reserved) 이상이면 양보하고 기다립니다.
+
+        Returns:
+            슬롯을 얻었으면 True, should_stop으로 중단되면 False
+        """
+        budget = max(1, self.requests_per_second - reserved)
+        while True:
+            if should_stop and should_stop():
+                return False
+            current_time = time.time()
+            while self.request_times and self.request_times[0] < current_time - 1.0:
+                self.request_times.popleft()
+            interactive_active = (
+                self.last_interactive_time is not None
+                and current_time - self.last_interactive_time < quiet_period
+            )
+            if not interactive_active and len(self.request_times) < budget:
+                return True
+            time.sleep(poll_interval * (self.backoff_multiplier if self.error_count else 1.0))
+
     def record_request(self, success: bool = True, response_time: float | None = None) -> None:
         """요청 기록"""
         current_time = time.time()
@@ -0,0 +1,232 @@
+"""
+TMDB 캐시 재검증 모듈
+
+만료된 캐시 항목을 즉시 제공하면서 백그라운드에서 조건부 요청
+(If-None-Match / If-Modified-Since)으로 갱신하는 stale-while-revalidate 처리를 담당합니다.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from src.core.tmdb_cache import TMDBCacheManager
+from src.core.tmdb_rate_limiter import TMDBRateLimiter
+
+TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
+
+
+@dataclass
+class ConditionalResponse:
+    """조건부 요청 결과"""
+
+    status_code: int
+    data: Any | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        """304 Not Modified 여부"""
+        return self.status_code == 304
+
+
+class TMDBRevalidator:
+    """만료된 TMDB 캐시 항목을 백그라운드에서 조건부 요청으로 재검증하는 클래스"""
+
+    def __init__(
+        self,
+        cache_manager: TMDBCacheManager,
+        api_key: str | None = None,
+        rate_limiter: TMDBRateLimiter | None = None,
+        base_url: str = TMDB_API_BASE_URL,
+        session: requests.Session | None = None,
+        max_workers: int = 2,
+        timeout: float = 10.0,
+    ):
+        """
+        Args:
+            cache_manager: 재검증 결과를 기록할 캐시 관리자
+            api_key: TMDB API 키 (요청 파라미터에만 추가되며 캐시에는 저장하지 않음)
+            rate_limiter: 요청 속도 제한 관리자 (대화형 요청과 예산 공유)
+            base_url: TMDB API 기본 URL (테스트에서는 로컬 서버 주소)
+            session: 재사용할 requests 세션
+            max_workers: 백그라운드 재검증 스레드 수
+            timeout: 요청 타임아웃 (초)
+        """
+        self.cache_manager = cache_manager
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.base_url = base_url.rstrip("/")
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tmdb-revalidate"
+        )
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"revalidated": 0, "not_modified": 0, "updated": 0, "failed": 0}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def fetch(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        background: bool = False,
+    ) -> ConditionalResponse:
+        """조건부 GET 요청 수행 (검증자가 있으면 If-None-Match / If-Modified-Since 전송)
+
+        background가 True면 대화형 요청에 속도 제한 예산을 양보한 뒤 요청합니다.
+        """
+        headers = {"Accept": "application/json"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        query = {
+            key: ("true" if value is True else "false" if value is False else value)
+            for key, value in (params or {}).items()
+        }
+        if self.api_key:
+            query["api_key"] = self.api_key
+        if self.rate_limiter:
+            if background:
+                self.rate_limiter.wait_for_background_slot()
+            else:
+                self.rate_limiter.wait_if_needed()
+        try:
+            response = self.session.get(
+                f"{self.base_url}/{path.lstrip('/')}",
+                params=query,
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.RequestException:
+            if self.rate_limiter:
+                self.rate_limiter.record_request(success=False)
+            raise
+        if self.rate_limiter:
+            self.rate_limiter.record_request(success=response.status_code < 400)
+        if response.status_code == 304:
+            return ConditionalResponse(
+                status_code=304,
+                etag=response.headers.get("ETag") or etag,
+                last_modified=response.headers.get("Last-Modified") or last_modified,
+            )
+        response.raise_for_status()
+        response.encoding = "utf-8"
+        return ConditionalResponse(
+            status_code=response.status_code,
+            data=response.json(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def get(self, key: str, transform: Callable[[Any], Any] | None = None) -> Any | None:
+        """캐시 조회 - 만료된 항목은 즉시 반환하고 백그라운드 재검증을 예약
+
+        Args:
+            key: 캐시 키
+            transform: 재검증 응답 본문을 캐시 형식으로 변환하는 함수
+
+        Returns:
+            캐시된 데이터 (없거나 stale 허용 기간이 지났으면 None)
+        """
+        entry = self.cache_manager.get_cache_entry(key)
+        if entry is None:
+            return None
+        if entry.is_expired(self.cache_manager.cache_expiry):
+            self.schedule(key, transform)
+        return entry.data
+
+    def schedule(self, key: str, transform: Callable[[Any], Any] | None = None) -> Future | None:
+        """백그라운드 재검증 예약 (같은 키는 한 번만 진행)"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None and not future.done():
+                return future
+            try:
+                future = self._executor.submit(self.revalidate, key, transform)
+            except RuntimeError:
+                # 종료된 실행기
+                return None
+            self._in_flight[key] = future
+
+        def forget(_future: Future) -> None:
+            self._forget(key)
+
+        future.add_done_callback(forget)
+        return future
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None and future.done():
+                del self._in_flight[key]
+
+    def _count(self, name: str) -> None:
+        """통계 증가 (작업 스레드에서 호출되므로 잠금 안에서)"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def revalidate(self, key: str, transform: Callable[[Any], Any] | None = None) -> bool:
+        """캐시 항목을 조건부 요청으로 재검증 (304면 저장 시각만 갱신, 200이면 본문 교체)"""
+        entry = self.cache_manager.get_cache_entry(key)
+        if entry is None or not entry.request:
+            return False
+        request = entry.request
+        try:
+            response = self.fetch(
+                request["path"],
+                request.get("params"),
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                background=True,
+            )
+            self._count("revalidated")
+            if response.not_modified:
+                self._count("not_modified")
+                self.cache_manager.touch_cache(key, response.etag, response.last_modified)
+                self.logger.debug(f"캐시 재검증 (304): {key}")
+                return True
+            data = transform(response.data) if transform else response.data
+            if data is None:
+                raise ValueError("변환 결과가 비어 있습니다")
+            self.cache_manager.set_cache(
+                key,
+                data,
+                etag=response.etag,
+                last_modified=response.last_modified,
+                request=request,
+            )
+            self._count("updated")
+            self.logger.debug(f"캐시 재검증 (갱신): {key}")
+            return True
+        except Exception as e:
+            self._count("failed")
+            self.logger.warning(f"캐시 재검증 실패: {key} - {e}")
+            return False
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """진행 중인 재검증이 모두 끝날 때까지 대기"""
+        with self._lock:
+            futures = list(self._in_flight.values())
+        _done, not_done = wait(futures, timeout=timeout)
+        return not not_done
+
+    def get_status(self) -> dict[str, Any]:
+        """재검증 통계 반환"""
+        with self._lock:
+            return {**self.stats, "in_flight": len(self._in_flight)}
+
+    def shutdown(self, wait_for_pending: bool = False) -> None:
+        """백그라운드 실행기 종료"""
+        self._executor.shutdown(wait=wait_for_pending, cancel_futures=not wait_for_pending)
@@ -22,6 +22,7 @@ class FileOperationResult:
     file_size: int | None = None
     processing_time: float | None = None
     backup_path: str | None = None
+    checksum: str | None = None
 
     @property
     def error(self) -> str | None:
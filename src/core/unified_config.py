@@ -104,6 +104,15 @@ class ApplicationSettings:
     def fallback_parser(self, value: str):
         self.file_organization["fallback_parser"] = value
 
+    @property
+    def io_throttle(self) -> dict[str, Any]:
+        """I/O 종류별 대역폭/IOPS 제한 (organize/backup/staging → interactive/idle)"""
+        return self.performance_settings.get("io_throttle", {})
+
+    @io_throttle.setter
+    def io_throttle(self, value: dict[str, Any]):
+        self.performance_settings["io_throttle"] = value
+
     @property
     def log_level(self) -> str:
         return self.logging_config.get("log_level", "INFO")
@@ -0,0 +1,182 @@
+"""
+여러 프로세스가 함께 쓰는 캐시 디렉토리를 위한 파일 유틸리티
+
+같은 디렉토리의 임시 파일에 기록한 뒤 os.replace로 교체하는 원자적 쓰기와,
+잠금 파일 기반의 프로세스 간 잠금을 제공합니다.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+TEMP_SUFFIX = ".tmp"
+LOCK_DIR_NAME = ".locks"
+
+
+def atomic_write_bytes(path: str | Path, data: bytes, fsync: bool = False) -> None:
+    """
+    파일을 원자적으로 기록합니다.
+
+    다른 프로세스는 기존 내용 또는 새 내용 전체만 볼 수 있고,
+    중간에 끊긴 쓰기로 인한 잘린 파일은 남지 않습니다.
+
+    Args:
+        path: 대상 파일 경로
+        data: 기록할 내용
+        fsync: 교체 전에 디스크 동기화 여부 (캐시는 내구성보다 속도 우선)
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=TEMP_SUFFIX, dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        _replace_with_retry(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _replace_with_retry(source: str, target: Path, attempts: int = 5) -> None:
+    """os.replace 수행 (Windows에서 다른 프로세스가 대상을 읽는 중이면 잠시 후 재시도)"""
+    for attempt in range(attempts):
+        try:
+            Path(source).replace(target)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.01 * (attempt + 1))
+
+
+def is_temp_file(path: Path) -> bool:
+    """atomic_write_bytes가 남긴 임시 파일 여부"""
+    return path.name.startswith(".") and path.name.endswith(TEMP_SUFFIX)
+
+
+def cleanup_temp_files(directory: Path, max_age: float = 3600.0) -> int:
+    """
+    중단된 쓰기가 남긴 오래된 임시 파일을 정리합니다.
+
+    Args:
+        directory: 정리할 디렉토리
+        max_age: 이 시간(초)보다 오래된 임시 파일만 삭제 (진행 중인 쓰기 보호)
+
+    Returns:
+        삭제한 파일 수
+    """
+    removed = 0
+    now = time.time()
+    for temp_file in directory.glob(f".*{TEMP_SUFFIX}"):
+        try:
+            if now - temp_file.stat().st_mtime > max_age:
+                temp_file.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+class InterProcessLock:
+    """잠금 파일 기반의 프로세스 간 배타 잠금
+
+    획득할 때마다 잠금 파일을 새로 열기 때문에 같은 프로세스의 다른 스레드와도 배타적입니다.
+    """
+
+    def __init__(self, lock_path: str | Path):
+        """
+        Args:
+            lock_path: 잠금 파일 경로 (없으면 생성)
+        """
+        self.lock_path = Path(lock_path)
+        self._local = threading.local()
+
+    def acquire(self) -> None:
+        """잠금 획득 (다른 소유자가 해제할 때까지 대기)"""
+        depth = getattr(self._local, "depth", 0)
+        if depth:
+            # 같은 스레드의 재진입
+            self._local.depth = depth + 1
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == "win32":
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK은 약 10초 후 실패하므로 계속 대기
+                        continue
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._local.fd = fd
+        self._local.depth = 1
+
+    def release(self) -> None:
+        """잠금 해제"""
+        depth = getattr(self._local, "depth", 0)
+        if not depth:
+            return
+        self._local.depth = depth - 1
+        if self._local.depth:
+            return
+        fd = self._local.fd
+        self._local.fd = None
+        try:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> "InterProcessLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class StripedFileLock:
+    """키별 프로세스 간 잠금을 고정된 수의 잠금 파일로 나누어 제공하는 클래스
+
+    키마다 잠금 파일을 만들지 않고 해시로 stripes개 중 하나를 골라 사용합니다.
+    """
+
+    def __init__(self, directory: str | Path, stripes: int = 64):
+        """
+        Args:
+            directory: 잠금 파일을 둘 디렉토리
+            stripes: 잠금 파일 수
+        """
+        self.directory = Path(directory)
+        self.stripes = stripes
+        self._locks = [
+            InterProcessLock(self.directory / f"{index:02x}.lock") for index in range(stripes)
+        ]
+
+    def for_key(self, key: str) -> InterProcessLock:
+        """키에 해당하는 잠금 반환"""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4).digest()
+        return self._locks[int.from_bytes(digest, "big") % self.stripes]
@@ -0,0 +1,373 @@
+"""
+대용량 파일 복사 엔진
+
+동영상처럼 큰 파일을 복사할 때 커널 내 복사(os.copy_file_range, os.sendfile)를
+우선 사용하고, 지원하지 않는 환경에서는 큰 버퍼로 직접 복사합니다.
+posix_fadvise로 순차 읽기를 알리고 복사가 끝난 구간은 페이지 캐시에서 내보내어
+다른 프로세스가 쓰던 캐시를 밀어내지 않도록 합니다.
+
+벤치마크: python -m src.core.utils.copy_engine [크기MB] [디렉토리]
+"""
+
+import contextlib
+import errno
+import logging
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.core.utils.io_throttle import IOThrottle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024  # 커널 내 복사 한 번에 요청하는 크기
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024  # 사용자 공간 복사 버퍼 크기
+CACHE_DROP_WINDOW = 64 * 1024 * 1024  # 이 크기만큼 복사할 때마다 캐시 해제 요청
+
+ProgressCallback = Callable[[int, int], None]
+
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_HAS_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# 커널 내 복사를 지원하지 않는 경우 다시 시도하지 않고 다음 방법으로 넘어가는 오류
+_UNSUPPORTED_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EBADF,
+    errno.ETXTBSY,
+}
+
+
+def _fadvise(fd: int, offset: int, length: int, advice_name: str) -> None:
+    if not _HAS_FADVISE:
+        return
+    with contextlib.suppress(OSError):
+        os.posix_fadvise(fd, offset, length, getattr(os, advice_name))
+
+
+class _CacheDropper:
+    """복사가 끝난 구간을 페이지 캐시에서 내보내는 도우미
+
+    쓰기 쪽은 아직 디스크에 기록되지 않은 페이지가 남아 있을 수 있으므로 한 구간 늦게
+    해제를 요청합니다 (커널이 기록을 시작한 페이지부터 내보냄).
+    """
+
+    def __init__(self, source_fd: int, target_fd: int, enabled: bool):
+        self.source_fd = source_fd
+        self.target_fd = target_fd
+        self.enabled = enabled and _HAS_FADVISE
+        self._dropped_until = 0
+        self._previous_window = 0
+
+    def advance(self, position: int) -> None:
+        if not self.enabled or position - self._dropped_until < CACHE_DROP_WINDOW:
+            return
+        _fadvise(
+            self.source_fd,
+            self._dropped_until,
+            position - self._dropped_until,
+            "POSIX_FADV_DONTNEED",
+        )
+        if self._previous_window < self._dropped_until:
+            _fadvise(
+                self.target_fd,
+                self._previous_window,
+                self._dropped_until - self._previous_window,
+                "POSIX_FADV_DONTNEED",
+            )
+        self._previous_window = self._dropped_until
+        self._dropped_until = position
+
+    def finish(self) -> None:
+        if not self.enabled:
+            return
+        _fadvise(self.source_fd, 0, 0, "POSIX_FADV_DONTNEED")
+        _fadvise(self.target_fd, 0, 0, "POSIX_FADV_DONTNEED")
+
+
+def _copy_with_copy_file_range(
+    source_fd: int,
+    target_fd: int,
+    total: int,
+    position: int,
+    on_chunk: Callable[[int], None],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    while position < total:
+        copied = os.copy_file_range(
+            source_fd, target_fd, min(chunk_size, total - position), position, position
+        )
+        if copied == 0:
+            break
+        position += copied
+        on_chunk(position)
+    return position
+
+
+def _copy_with_sendfile(
+    source_fd: int,
+    target_fd: int,
+    total: int,
+    position: int,
+    on_chunk: Callable[[int], None],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    os.lseek(target_fd, position, os.SEEK_SET)
+    while position < total:
+        sent = os.sendfile(target_fd, source_fd, position, min(chunk_size, total - position))
+        if sent == 0:
+            break
+        position += sent
+        on_chunk(position)
+    return position
+
+
+def _copy_with_buffer(
+    source_fd: int,
+    target_fd: int,
+    position: int,
+    buffer_size: int,
+    on_chunk: Callable[[int], None],
+) -> int:
+    os.lseek(source_fd, position, os.SEEK_SET)
+    os.lseek(target_fd, position, os.SEEK_SET)
+    while True:
+        data = os.read(source_fd, buffer_size)
+        if not data:
+            break
+        view = memoryview(data)
+        written = 0
+        while written < len(data):
+            written += os.write(target_fd, view[written:])
+        position += len(data)
+        on_chunk(position)
+    return position
+
+
+def copy_file(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    progress_callback: ProgressCallback | None = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    drop_cache: bool = True,
+    preserve_metadata: bool = True,
+    throttle: IOThrottle | None = None,
+) -> int:
+    """
+    파일 복사 (shutil.copy2 대체)
+
+    Args:
+        source: 원본 파일 경로
+        destination: 대상 파일 경로 (디렉토리면 같은 이름으로 복사)
+        progress_callback: (복사한 바이트 수, 전체 바이트 수)를 받는 콜백
+        buffer_size: 커널 내 복사를 사용할 수 없을 때의 버퍼 크기
+        drop_cache: 복사가 끝난 구간을 페이지 캐시에서 내보낼지 여부
+        preserve_metadata: 수정 시각/권한 등 메타데이터 복사 여부 (shutil.copystat)
+        throttle: 대역폭/IOPS 제한기 (None이면 제한 없음)
+
+    Returns:
+        복사한 바이트 수
+    """
+    source = Path(source)
+    destination = Path(destination)
+    if destination.is_dir():
+        destination = destination / source.name
+    if destination.exists() and source.samefile(destination):
+        raise shutil.SameFileError(f"{source} and {destination} are the same file")
+
+    source_fd = os.open(source, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        source_stat = os.fstat(source_fd)
+        if stat.S_ISDIR(source_stat.st_mode):
+            raise IsADirectoryError(errno.EISDIR, "Is a directory", str(source))
+        total = source_stat.st_size
+        target_fd = os.open(
+            destination,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o666,
+        )
+        try:
+            copied = _copy_fds(
+                source_fd,
+                target_fd,
+                total,
+                0,
+                progress_callback,
+                buffer_size,
+                drop_cache,
+                throttle,
+            )
+        finally:
+            os.close(target_fd)
+    finally:
+        os.close(source_fd)
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    return copied
+
+
+def _copy_fds(
+    source_fd: int,
+    target_fd: int,
+    total: int,
+    position: int,
+    progress_callback: ProgressCallback | None,
+    buffer_size: int,
+    drop_cache: bool,
+    throttle: IOThrottle | None = None,
+) -> int:
+    """열린 파일 디스크립터 사이의 복사 (position부터 끝까지)"""
+    _fadvise(source_fd, position, 0, "POSIX_FADV_SEQUENTIAL")
+    dropper = _CacheDropper(source_fd, target_fd, drop_cache)
+    chunk_size = DEFAULT_CHUNK_SIZE
+    if throttle is not None:
+        # 제한이 있으면 조금씩 복사해서 다른 프로그램의 I/O가 사이사이 끼어들 수 있게 함
+        chunk_size = throttle.chunk_size(DEFAULT_CHUNK_SIZE)
+        buffer_size = min(buffer_size, chunk_size)
+    last_position = position
+
+    def on_chunk(current: int) -> None:
+        nonlocal last_position
+        dropper.advance(current)
+        if throttle is not None:
+            throttle.consume(current - last_position, operations=1)
+        last_position = current
+        if progress_callback:
+            progress_callback(current, total)
+
+    try:
+        for method in (_copy_with_copy_file_range, _copy_with_sendfile):
+            if method is _copy_with_copy_file_range and not _HAS_COPY_FILE_RANGE:
+                continue
+            if method is _copy_with_sendfile and not _HAS_SENDFILE:
+                continue
+            # 실패한 방법이 보고한 위치는 버리고 position부터 다시 셈 (제한기에 음수를 넘기지 않음)
+            last_position = position
+            try:
+                position = method(source_fd, target_fd, total, position, on_chunk, chunk_size)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                logger.debug(f"{method.__name__} 사용 불가, 다음 방법 사용: {e}")
+                continue
+            if position >= total:
+                return position
+        # 크기가 바뀌는 파일이나 커널 내 복사를 지원하지 않는 경우
+        last_position = position
+        return _copy_with_buffer(source_fd, target_fd, position, buffer_size, on_chunk)
+    finally:
+        dropper.finish()
+
+
+def move_file(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    progress_callback: ProgressCallback | None = None,
+    drop_cache: bool = True,
+    cancel_event: threading.Event | None = None,
+    throttle: IOThrottle | None = None,
+) -> Path:
+    """
+    파일 이동 (shutil.move 대체)
+
+    같은 파일 시스템이면 이름만 바꾸고, 다른 파일 시스템이면 resumable_copy로
+    대상 디렉토리의 임시 파일에 복사하여 원자적으로 교체한 뒤 원본을 삭제합니다.
+    취소되거나 중단된 이동은 다시 요청하면 마지막 체크포인트부터 이어서 복사합니다.
+    디렉토리는 shutil.move에 맡깁니다.
+
+    Args:
+        cancel_event: 설정되면 장치 간 복사를 멈추고 TransferCancelledError
+        throttle: 장치 간 복사의 대역폭/IOPS 제한기
+
+    Returns:
+        최종 대상 경로
+    """
+    source = Path(source)
+    destination = Path(destination)
+    if destination.is_dir():
+        destination = destination / source.name
+    try:
+        source.rename(destination)
+        return destination
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    if source.is_dir():
+        return Path(shutil.move(str(source), str(destination)))
+    from src.core.utils.resumable_copy import resumable_copy  # 순환 import 방지
+
+    resumable_copy(
+        source,
+        destination,
+        remove_source=True,
+        progress_callback=progress_callback,
+        cancel_event=cancel_event,
+        drop_cache=drop_cache,
+        throttle=throttle,
+    )
+    return destination
+
+
+def benchmark(
+    size_mb: int = 512, directory: str | Path | None = None, rounds: int = 3
+) -> dict[str, float]:
+    """
+    copy_file과 shutil.copy2의 처리량 비교 (라운드별 최고 MB/s)
+
+    매 라운드 전에 원본을 페이지 캐시에서 내보내 같은 조건에서 시작하고, 대상 파일을
+    fsync할 때까지의 시간을 재어 페이지 캐시에만 기록된 상태로 빨라 보이지 않게 합니다.
+
+    Args:
+        size_mb: 시험 파일 크기 (MB)
+        directory: 시험 파일을 만들 디렉토리 (기본: 임시 디렉토리)
+        rounds: 방법별 반복 횟수
+    """
+    import tempfile
+
+    methods: dict[str, Callable[[Path, Path], object]] = {
+        "shutil.copy2": shutil.copy2,
+        "copy_file": copy_file,
+        "copy_file(cache)": lambda src, dst: copy_file(src, dst, drop_cache=False),
+    }
+    with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+        source = Path(temp_dir) / "source.bin"
+        chunk = os.urandom(1024 * 1024)
+        with source.open("wb") as f:
+            for _ in range(size_mb):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        results = dict.fromkeys(methods, 0.0)
+        for _ in range(rounds):
+            for name, function in methods.items():
+                fd = os.open(source, os.O_RDONLY)
+                _fadvise(fd, 0, 0, "POSIX_FADV_DONTNEED")
+                os.close(fd)
+                target = Path(temp_dir) / "target.bin"
+                started = time.perf_counter()
+                function(source, target)
+                fd = os.open(target, os.O_RDWR)
+                os.fsync(fd)
+                os.close(fd)
+                elapsed = time.perf_counter() - started
+                results[name] = max(results[name], size_mb / elapsed if elapsed else 0.0)
+                target.unlink()
+        return results
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    target_directory = sys.argv[2] if len(sys.argv) > 2 else None
+    for method_name, throughput in benchmark(size, target_directory).items():
+        print(f"{method_name:>16}: {throughput:8.1f} MB/s")
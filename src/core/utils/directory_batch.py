@@ -0,0 +1,146 @@
+"""
+대상 디렉토리 일괄 생성 (생성한 디렉토리 캐시)
+
+파일마다 mkdir(parents=True, exist_ok=True)를 부르면 파일 하나에 경로 구성 요소 수만큼
+시스템 호출이 생깁니다. 계획 전체의 대상 디렉토리를 모아 얕은 것부터 한 번씩만 만들고,
+있는 것으로 확인된 디렉토리는 기억해서 다시 확인하지 않습니다.
+
+- destination_directories: 대상 파일 경로들의 상위 디렉토리 (중복 제거, 얕은 것부터)
+- DirectoryCache: 디렉토리 생성과 존재 여부 캐시 (스레드 안전), 새로 만든 디렉토리 기록
+- remove_created_directories: 기록한 디렉토리를 깊은 것부터 삭제 (취소용)
+"""
+
+import logging
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def destination_directories(targets: Iterable[str | Path]) -> list[Path]:
+    """대상 파일 경로들의 상위 디렉토리 목록 (중복 제거, 얕은 것부터)"""
+    directories = {Path(target).parent for target in targets}
+    return sorted(directories, key=lambda path: (len(path.parts), str(path)))
+
+
+class DirectoryCache:
+    """디렉토리 생성 캐시
+
+    mkdir을 먼저 시도하고 실패 종류로 상태를 판단하므로 이미 있는 디렉토리는 호출 한 번,
+    새 디렉토리는 없는 구성 요소 수만큼만 호출합니다. 한 번 확인한 디렉토리와 그 상위는
+    다시 확인하지 않습니다. 새로 만든 디렉토리는 만든 순서대로 created에 기록됩니다.
+    """
+
+    def __init__(self):
+        self._known: set[Path] = set()
+        self._lock = threading.Lock()
+        self.created: list[Path] = []
+        self.mkdir_calls = 0
+
+    def ensure(self, directory: str | Path) -> list[Path]:
+        """디렉토리가 있도록 보장
+
+        Returns:
+            이번에 새로 만든 디렉토리 (상위부터)
+        """
+        directory = Path(directory)
+        with self._lock:
+            if directory in self._known:
+                return []
+            return self._create(directory)
+
+    def ensure_all(self, directories: Iterable[str | Path]) -> list[Path]:
+        """여러 디렉토리를 얕은 것부터 한 번씩 생성
+
+        Returns:
+            이번에 새로 만든 디렉토리 (상위부터)
+        """
+        created: list[Path] = []
+        for directory in sorted(
+            {Path(directory) for directory in directories},
+            key=lambda path: (len(path.parts), str(path)),
+        ):
+            created.extend(self.ensure(directory))
+        return created
+
+    def ensure_parent(self, path: str | Path) -> list[Path]:
+        """파일 경로의 상위 디렉토리가 있도록 보장"""
+        return self.ensure(Path(path).parent)
+
+    def forget(self, directory: str | Path) -> None:
+        """삭제된 디렉토리와 그 하위를 캐시에서 제거"""
+        directory = Path(directory)
+        with self._lock:
+            self._known = {
+                path for path in self._known if path != directory and directory not in path.parents
+            }
+
+    def _remember(self, directory: Path) -> None:
+        self._known.add(directory)
+        self._known.update(directory.parents)
+
+    def _create(self, directory: Path) -> list[Path]:
+        missing: list[Path] = []
+        created: list[Path] = []
+        current = directory
+        # 있는 상위 디렉토리를 찾을 때까지 올라감 (없는 구성 요소만 기록)
+        while current not in self._known:
+            self.mkdir_calls += 1
+            try:
+                current.mkdir()
+            except FileExistsError:
+                self._remember(current)
+                break
+            except FileNotFoundError:
+                if current.parent == current:
+                    raise
+                missing.append(current)
+                current = current.parent
+                continue
+            self._remember(current)
+            created.append(current)
+            break
+        # 찾은 위치 아래로 없던 구성 요소를 차례로 생성
+        for path in reversed(missing):
+            self.mkdir_calls += 1
+            try:
+                path.mkdir()
+            except FileExistsError:
+                self._remember(path)
+                continue
+            self._remember(path)
+            created.append(path)
+        self.created.extend(created)
+        return created
+
+
+def remove_created_directories(
+    directories: Iterable[str | Path], cache: DirectoryCache | None = None
+) -> list[Path]:
+    """
+    새로 만든 디렉토리를 깊은 것부터 삭제 (비어 있지 않으면 남겨 둠)
+
+    Args:
+        directories: DirectoryCache가 기록한 디렉토리
+        cache: 주면 삭제한 디렉토리를 캐시에서도 제거
+
+    Returns:
+        삭제한 디렉토리
+    """
+    removed = []
+    for directory in sorted(
+        {Path(directory) for directory in directories},
+        key=lambda path: (-len(path.parts), str(path)),
+    ):
+        try:
+            directory.rmdir()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("생성한 디렉토리 유지 (%s): %s", directory, e)
+            continue
+        removed.append(directory)
+        if cache is not None:
+            cache.forget(directory)
+    return removed
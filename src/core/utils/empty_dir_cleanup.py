@@ -0,0 +1,106 @@
+"""
+정리 후 빈 디렉토리 삭제 (작업이 건드린 디렉토리만)
+
+파일을 옮긴 원본 디렉토리 목록만 받아서 그 디렉토리와 보호 루트 아래의 상위 디렉토리를
+깊은 것부터 삭제 시도합니다. 원본 트리 전체를 다시 훑지 않고, 디렉토리 내용을 읽지도
+않습니다. rmdir은 비어 있을 때만 성공하므로 삭제 시도 자체가 빈 디렉토리 확인입니다.
+"""
+
+import errno
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 비어 있지 않아서 rmdir이 실패한 경우 (플랫폼마다 다름)
+_NOT_EMPTY_ERRNOS = {errno.ENOTEMPTY, errno.EEXIST}
+
+
+@dataclass
+class DirectoryCleanupResult:
+    """빈 디렉토리 정리 결과"""
+
+    removed: list[Path] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    candidates: int = 0
+    cancelled: bool = False
+
+    @property
+    def removed_count(self) -> int:
+        return len(self.removed)
+
+
+def _is_protected(directory: Path) -> bool:
+    """파일 시스템 루트와 홈 디렉토리는 지우지 않음"""
+    return directory == directory.parent or directory == Path.home()
+
+
+def cleanup_candidates(
+    touched: Iterable[str | Path], roots: Iterable[str | Path] = ()
+) -> list[Path]:
+    """
+    삭제를 시도할 디렉토리 목록 (깊은 것부터)
+
+    Args:
+        touched: 이번 작업에서 파일이 빠져나간 디렉토리
+        roots: 보호할 루트 (소스 폴더). 루트 아래에서는 루트 직전까지 상위 디렉토리도 포함하고,
+            루트 자체와 그 위는 포함하지 않습니다. 어느 루트에도 속하지 않는 디렉토리는
+            그 디렉토리만 포함합니다.
+    """
+    root_paths = {Path(root).absolute() for root in roots}
+    candidates: set[Path] = set()
+    for directory in touched:
+        current = Path(directory).absolute()
+        root = next((r for r in root_paths if r == current or r in current.parents), None)
+        if root is None:
+            if not _is_protected(current):
+                candidates.add(current)
+            continue
+        while current != root and not _is_protected(current) and current not in candidates:
+            candidates.add(current)
+            current = current.parent
+    return sorted(candidates, key=lambda path: (-len(path.parts), str(path)))
+
+
+def remove_empty_directories(
+    touched: Iterable[str | Path],
+    roots: Iterable[str | Path] = (),
+    progress_callback: Callable[[int, int, Path], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> DirectoryCleanupResult:
+    """
+    작업이 건드린 디렉토리 중 빈 것을 아래에서 위로 삭제
+
+    비어 있지 않은 디렉토리를 만나면 그 상위 디렉토리는 시도하지 않습니다.
+
+    Args:
+        touched: 이번 작업에서 파일이 빠져나간 디렉토리
+        roots: 보호할 루트 (cleanup_candidates 참고)
+        progress_callback: (처리한 수, 전체 수, 현재 디렉토리)
+        is_cancelled: True를 반환하면 남은 디렉토리는 건너뜀
+    """
+    candidates = cleanup_candidates(touched, roots)
+    result = DirectoryCleanupResult(candidates=len(candidates))
+    kept: set[Path] = set()
+    for index, directory in enumerate(candidates, 1):
+        if is_cancelled and is_cancelled():
+            result.cancelled = True
+            break
+        if directory not in kept:
+            try:
+                directory.rmdir()
+                result.removed.append(directory)
+                logger.info("🗑️ 빈 디렉토리 삭제: %s", directory)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                # 비어 있지 않은 디렉토리의 상위도 비어 있지 않음
+                kept.update(directory.parents)
+                if e.errno not in _NOT_EMPTY_ERRNOS:
+                    result.errors.append(f"{directory}: {e}")
+                    logger.info("⚠️ 디렉토리 삭제 실패 (%s): %s", directory, e)
+        if progress_callback:
+            progress_callback(index, len(candidates), directory)
+    return result
@@ -0,0 +1,210 @@
+"""
+디스크 I/O 대역폭/IOPS 제한
+
+큰 폴더를 정리하는 동안 디스크를 다 써 버려서 같은 디스크에서 스트리밍하는 미디어 서버나
+다른 프로그램이 멈추지 않도록 정리, 백업, 스테이징 I/O의 초당 바이트 수와 초당 I/O 요청
+수를 제한합니다. 창을 사용 중일 때(interactive)와 백그라운드일 때(idle)의 제한을
+따로 설정할 수 있습니다.
+
+- ThrottleLimits: 초당 바이트/요청 수 제한 (None이면 제한 없음)
+- IOThrottle: 여러 작업자 스레드가 공유하는 제한기, 실제 처리량(bytes/s) 측정
+- get_io_throttle / configure_io_throttles / set_ui_interactive: 종류별 공용 제한기 관리
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# I/O 종류 (종류마다 제한기 하나)
+IO_CATEGORIES = ("organize", "backup", "staging")
+
+# 제한이 있을 때 한 번에 복사하는 최소 크기
+MIN_THROTTLED_CHUNK = 256 * 1024
+# 처리량 측정 구간 (초)
+METER_WINDOW = 2.0
+
+
+@dataclass(frozen=True)
+class ThrottleLimits:
+    """초당 바이트/요청 수 제한 (None 또는 0이면 제한 없음)"""
+
+    bytes_per_second: int | None = None
+    operations_per_second: float | None = None
+
+    @property
+    def unlimited(self) -> bool:
+        return not self.bytes_per_second and not self.operations_per_second
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> "ThrottleLimits":
+        data = data or {}
+        return cls(data.get("bytes_per_second") or None, data.get("operations_per_second") or None)
+
+
+class IOThrottle:
+    """대역폭/IOPS 제한기
+
+    GCRA(토큰 버킷과 같은 방식)로 누적 사용량이 제한을 넘으면 호출한 스레드를 그만큼
+    재웁니다. I/O를 마친 뒤 consume()으로 사용량을 알리므로, burst_seconds 동안의
+    사용량까지는 기다리지 않습니다.
+    """
+
+    def __init__(
+        self,
+        interactive: ThrottleLimits | None = None,
+        idle: ThrottleLimits | None = None,
+        *,
+        burst_seconds: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._interactive_limits = interactive or ThrottleLimits()
+        self._idle_limits = idle or ThrottleLimits()
+        self.burst_seconds = burst_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._interactive = True
+        self._byte_tat = 0.0
+        self._operation_tat = 0.0
+        self._meter: deque[tuple[float, int]] = deque()
+        self._meter_started: float | None = None
+        self.total_bytes = 0
+        self.total_wait = 0.0
+
+    @property
+    def interactive(self) -> bool:
+        return self._interactive
+
+    @property
+    def limits(self) -> ThrottleLimits:
+        """현재 적용 중인 제한"""
+        return self._interactive_limits if self._interactive else self._idle_limits
+
+    def configure(self, interactive: ThrottleLimits, idle: ThrottleLimits) -> None:
+        with self._lock:
+            self._interactive_limits = interactive
+            self._idle_limits = idle
+            self._reset_schedule()
+
+    def set_interactive(self, interactive: bool) -> None:
+        """창 사용 상태 변경 (바뀐 제한은 다음 consume부터 적용)"""
+        with self._lock:
+            if self._interactive != interactive:
+                self._interactive = interactive
+                self._reset_schedule()
+
+    def _reset_schedule(self) -> None:
+        now = self._clock()
+        self._byte_tat = now
+        self._operation_tat = now
+
+    def chunk_size(self, default: int) -> int:
+        """한 번에 복사할 크기 (제한이 있으면 약 burst_seconds 분량)"""
+        rate = self.limits.bytes_per_second
+        if not rate:
+            return default
+        return max(MIN_THROTTLED_CHUNK, min(default, int(rate * self.burst_seconds)))
+
+    def consume(self, nbytes: int = 0, operations: int = 0) -> float:
+        """
+        I/O 사용량을 기록하고 제한을 넘었으면 기다림
+
+        Args:
+            nbytes: 읽거나 쓴 바이트 수
+            operations: I/O 요청 수
+
+        Returns:
+            기다린 시간 (초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._record(now, nbytes)
+            limits = self.limits
+            wait = 0.0
+            if limits.bytes_per_second and nbytes:
+                self._byte_tat = max(self._byte_tat, now) + nbytes / limits.bytes_per_second
+                wait = max(wait, self._byte_tat - now - self.burst_seconds)
+            if limits.operations_per_second and operations:
+                self._operation_tat = (
+                    max(self._operation_tat, now) + operations / limits.operations_per_second
+                )
+                wait = max(wait, self._operation_tat - now - self.burst_seconds)
+            if wait > 0:
+                self.total_wait += wait
+        if wait > 0:
+            self._sleep(wait)
+        return max(wait, 0.0)
+
+    def _record(self, now: float, nbytes: int) -> None:
+        if self._meter_started is None:
+            self._meter_started = now
+        self.total_bytes += nbytes
+        if nbytes:
+            self._meter.append((now, nbytes))
+        while self._meter and now - self._meter[0][0] > METER_WINDOW:
+            self._meter.popleft()
+
+    @property
+    def bytes_per_second(self) -> float:
+        """최근 METER_WINDOW초 동안의 실제 처리량"""
+        with self._lock:
+            now = self._clock()
+            while self._meter and now - self._meter[0][0] > METER_WINDOW:
+                self._meter.popleft()
+            if not self._meter or self._meter_started is None:
+                return 0.0
+            span = min(METER_WINDOW, now - self._meter_started)
+            if span <= 0:
+                return 0.0
+            return sum(nbytes for _, nbytes in self._meter) / span
+
+
+_throttles: dict[str, IOThrottle] = {}
+_registry_lock = threading.Lock()
+_ui_interactive = True
+
+
+def get_io_throttle(category: str) -> IOThrottle:
+    """I/O 종류별 공용 제한기 (설정 전에는 제한 없음)"""
+    with _registry_lock:
+        throttle = _throttles.get(category)
+        if throttle is None:
+            throttle = IOThrottle()
+            throttle.set_interactive(_ui_interactive)
+            _throttles[category] = throttle
+        return throttle
+
+
+def configure_io_throttles(settings: Mapping[str, Any] | None) -> None:
+    """
+    설정으로 종류별 제한 적용
+
+    Args:
+        settings: {"organize": {"interactive": {"bytes_per_second": ...,
+            "operations_per_second": ...}, "idle": {...}}, "backup": ..., "staging": ...}
+    """
+    settings = settings or {}
+    for category in IO_CATEGORIES:
+        section = settings.get(category) or {}
+        interactive = ThrottleLimits.from_dict(section.get("interactive"))
+        idle = ThrottleLimits.from_dict(section.get("idle"))
+        get_io_throttle(category).configure(interactive, idle)
+        if not (interactive.unlimited and idle.unlimited):
+            logger.info(f"I/O 제한 설정 ({category}): 사용 중 {interactive}, 백그라운드 {idle}")
+
+
+def set_ui_interactive(interactive: bool) -> None:
+    """창 사용 상태를 모든 제한기에 반영"""
+    global _ui_interactive
+    with _registry_lock:
+        _ui_interactive = interactive
+        throttles = list(_throttles.values())
+    for throttle in throttles:
+        throttle.set_interactive(interactive)
@@ -0,0 +1,320 @@
+"""
+이어받기 가능한 원자적 파일 전송
+
+다른 파일 시스템으로 큰 파일을 옮길 때 대상 디렉토리의 임시 파일(.이름.partial)에
+복사하고, 일정 크기마다 체크포인트(.이름.partial.json)를 남깁니다. 복사가 끝나면
+임시 파일을 최종 이름으로 원자적으로 교체한 뒤 원본을 삭제합니다.
+
+중간에 취소되거나 프로세스가 죽어도 임시 파일과 체크포인트가 남으므로, 같은 전송을
+다시 요청하면 마지막 체크포인트부터 이어서 복사합니다. 최종 이름에는 완성된 파일만
+나타나므로 미디어 서버가 잘린 파일을 색인하지 않습니다.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.core.utils.atomic_file import atomic_write_bytes
+from src.core.utils.copy_engine import DEFAULT_BUFFER_SIZE, ProgressCallback, _copy_fds
+from src.core.utils.io_throttle import IOThrottle
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_SUFFIX = ".partial"
+CHECKPOINT_SUFFIX = ".partial.json"
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_INTERVAL = 256 * 1024 * 1024  # 이 크기만큼 복사할 때마다 체크포인트 기록
+
+
+class TransferCancelledError(Exception):
+    """전송이 취소됨 (임시 파일과 체크포인트는 이어받기를 위해 남김)"""
+
+    def __init__(self, destination: Path, bytes_done: int):
+        super().__init__(f"전송 취소됨: {destination} ({bytes_done} bytes 완료)")
+        self.destination = destination
+        self.bytes_done = bytes_done
+
+
+@dataclass
+class TransferCheckpoint:
+    """진행 중인 전송의 체크포인트
+
+    원본의 크기/수정 시각/inode가 그대로일 때만 이어받습니다.
+    bytes_done까지는 임시 파일에 fsync된 상태입니다.
+    """
+
+    source: str
+    destination: str
+    size: int
+    mtime_ns: int
+    inode: int
+    bytes_done: int = 0
+    updated_at: float = 0.0
+    version: int = CHECKPOINT_VERSION
+
+    @classmethod
+    def for_source(cls, source: Path, destination: Path, source_stat: os.stat_result):
+        return cls(
+            source=str(source),
+            destination=str(destination),
+            size=source_stat.st_size,
+            mtime_ns=source_stat.st_mtime_ns,
+            inode=source_stat.st_ino,
+        )
+
+    def matches(self, source_stat: os.stat_result) -> bool:
+        """원본이 체크포인트를 기록한 뒤 바뀌지 않았는지 확인"""
+        return (
+            self.size == source_stat.st_size
+            and self.mtime_ns == source_stat.st_mtime_ns
+            and self.inode == source_stat.st_ino
+        )
+
+    @property
+    def progress(self) -> float:
+        return self.bytes_done / self.size if self.size else 1.0
+
+
+def partial_path_for(destination: str | Path) -> Path:
+    """전송 중 사용하는 임시 파일 경로"""
+    destination = Path(destination)
+    return destination.with_name(f".{destination.name}{PARTIAL_SUFFIX}")
+
+
+def checkpoint_path_for(destination: str | Path) -> Path:
+    """전송 체크포인트 파일 경로"""
+    destination = Path(destination)
+    return destination.with_name(f".{destination.name}{CHECKPOINT_SUFFIX}")
+
+
+def load_checkpoint(destination: str | Path) -> TransferCheckpoint | None:
+    """대상 경로의 체크포인트 로드 (없거나 손상되었으면 None)"""
+    checkpoint_path = checkpoint_path_for(destination)
+    try:
+        data = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        if data.get("version") != CHECKPOINT_VERSION:
+            return None
+        return TransferCheckpoint(**data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"체크포인트를 읽을 수 없습니다: {checkpoint_path} ({e})")
+        return None
+
+
+def _save_checkpoint(destination: Path, checkpoint: TransferCheckpoint) -> None:
+    checkpoint.updated_at = time.time()
+    atomic_write_bytes(
+        checkpoint_path_for(destination),
+        json.dumps(asdict(checkpoint), ensure_ascii=False).encode("utf-8"),
+        fsync=True,
+    )
+
+
+def find_pending_transfers(
+    directory: str | Path, recursive: bool = False
+) -> list[TransferCheckpoint]:
+    """
+    디렉토리에 남아 있는 미완료 전송 목록
+
+    Args:
+        directory: 대상 디렉토리
+        recursive: 하위 디렉토리까지 검색할지 여부
+    """
+    directory = Path(directory)
+    pattern = f".*{CHECKPOINT_SUFFIX}"
+    paths = directory.rglob(pattern) if recursive else directory.glob(pattern)
+    pending = []
+    for checkpoint_path in paths:
+        name = checkpoint_path.name[1 : -len(CHECKPOINT_SUFFIX)]
+        checkpoint = load_checkpoint(checkpoint_path.with_name(name))
+        if checkpoint:
+            pending.append(checkpoint)
+    return pending
+
+
+def discard_partial(destination: str | Path) -> None:
+    """미완료 전송의 임시 파일과 체크포인트 삭제"""
+    partial_path_for(destination).unlink(missing_ok=True)
+    checkpoint_path_for(destination).unlink(missing_ok=True)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """이름 변경을 디스크에 반영 (지원하지 않는 플랫폼은 무시)"""
+    if os.name == "nt":
+        return
+    with contextlib.suppress(OSError):
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _resume_position(
+    checkpoint: TransferCheckpoint | None, source_stat: os.stat_result, partial: Path
+) -> int:
+    """이어받을 위치 (이어받을 수 없으면 0)"""
+    if checkpoint is None:
+        return 0
+    if not checkpoint.matches(source_stat):
+        logger.info(f"원본이 변경되어 처음부터 다시 복사합니다: {checkpoint.source}")
+        return 0
+    try:
+        partial_size = partial.stat().st_size
+    except OSError:
+        return 0
+    if partial_size < checkpoint.bytes_done:
+        return 0
+    return checkpoint.bytes_done
+
+
+def resumable_copy(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    remove_source: bool = False,
+    progress_callback: ProgressCallback | None = None,
+    cancel_event: threading.Event | None = None,
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    drop_cache: bool = True,
+    throttle: IOThrottle | None = None,
+) -> int:
+    """
+    이어받기 가능한 파일 복사 (remove_source=True면 이동)
+
+    대상 디렉토리의 임시 파일에 복사하면서 checkpoint_interval마다 임시 파일을
+    fsync하고 체크포인트를 기록합니다. 같은 원본/대상으로 다시 호출하면 원본이
+    바뀌지 않은 경우 마지막 체크포인트부터 이어서 복사합니다.
+
+    Args:
+        source: 원본 파일 경로
+        destination: 최종 대상 파일 경로
+        remove_source: 교체가 끝난 뒤 원본 삭제 여부
+        progress_callback: (완료한 바이트 수, 전체 바이트 수)를 받는 콜백
+            (이어받는 경우 이어받은 위치부터 보고)
+        cancel_event: 설정되면 현재 위치까지 체크포인트를 남기고 TransferCancelledError
+        checkpoint_interval: 체크포인트 간격 (바이트)
+        buffer_size: 커널 내 복사를 사용할 수 없을 때의 버퍼 크기
+        drop_cache: 복사가 끝난 구간을 페이지 캐시에서 내보낼지 여부
+        throttle: 대역폭/IOPS 제한기 (None이면 제한 없음)
+
+    Returns:
+        파일 크기 (바이트)
+    """
+    source = Path(source)
+    destination = Path(destination)
+    partial = partial_path_for(destination)
+    checkpoint = load_checkpoint(destination)
+
+    source_fd = os.open(source, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        source_stat = os.fstat(source_fd)
+        total = source_stat.st_size
+
+        if (
+            checkpoint
+            and checkpoint.matches(source_stat)
+            and checkpoint.bytes_done == total
+            and not partial.exists()
+            and destination.exists()
+            and destination.stat().st_size == total
+        ):
+            # 교체까지 끝났지만 원본 삭제 전에 중단된 경우
+            logger.info(f"이미 교체된 전송 마무리: {destination.name}")
+        else:
+            position = _resume_position(checkpoint, source_stat, partial)
+            if position:
+                logger.info(f"⏯️ 전송 이어받기: {destination.name} ({position}/{total} bytes)")
+            checkpoint = TransferCheckpoint.for_source(source, destination, source_stat)
+            checkpoint.bytes_done = position
+            _copy_to_partial(
+                source_fd,
+                partial,
+                destination,
+                checkpoint,
+                progress_callback,
+                cancel_event,
+                checkpoint_interval,
+                buffer_size,
+                drop_cache,
+                throttle,
+            )
+            shutil.copystat(source, partial)
+            partial.replace(destination)
+            _fsync_directory(destination.parent)
+    finally:
+        os.close(source_fd)
+
+    if remove_source:
+        source.unlink()
+    checkpoint_path_for(destination).unlink(missing_ok=True)
+    return total
+
+
+def _copy_to_partial(
+    source_fd: int,
+    partial: Path,
+    destination: Path,
+    checkpoint: TransferCheckpoint,
+    progress_callback: ProgressCallback | None,
+    cancel_event: threading.Event | None,
+    checkpoint_interval: int,
+    buffer_size: int,
+    drop_cache: bool,
+    throttle: IOThrottle | None = None,
+) -> None:
+    """체크포인트 위치부터 임시 파일에 복사하고 완료 체크포인트 기록"""
+    total = checkpoint.size
+    position = checkpoint.bytes_done
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    target_fd = os.open(partial, flags, 0o666)
+    last_checkpoint = position
+    try:
+        # 체크포인트 이후에 기록된 부분은 fsync되지 않았을 수 있으므로 버림
+        os.ftruncate(target_fd, position)
+
+        def checkpoint_at(current: int) -> None:
+            nonlocal last_checkpoint
+            os.fsync(target_fd)
+            checkpoint.bytes_done = current
+            _save_checkpoint(destination, checkpoint)
+            last_checkpoint = current
+
+        def on_chunk(current: int, _total: int) -> None:
+            if current - last_checkpoint >= checkpoint_interval:
+                checkpoint_at(current)
+            if progress_callback:
+                progress_callback(current, total)
+            if cancel_event is not None and cancel_event.is_set():
+                checkpoint_at(current)
+                raise TransferCancelledError(destination, current)
+
+        if progress_callback:
+            progress_callback(position, total)
+        try:
+            position = _copy_fds(
+                source_fd, target_fd, total, position, on_chunk, buffer_size, drop_cache, throttle
+            )
+        except TransferCancelledError:
+            raise
+        except BaseException:
+            if last_checkpoint == 0:
+                # 이어받을 내용이 없으면 흔적을 남기지 않음
+                os.close(target_fd)
+                target_fd = -1
+                discard_partial(destination)
+            raise
+        if position != total:
+            raise OSError(f"원본 크기가 복사 중에 바뀌었습니다: {checkpoint.source}")
+        checkpoint_at(position)
+    finally:
+        if target_fd >= 0:
+            os.close(target_fd)
@@ -3,43 +3,167 @@
 """
 
 import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.core.constants import SUBTITLE_EXTENSIONS, VIDEO_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
+# 자막 파일명에서 비디오 이름 뒤에 붙는 구분자 (예: 'Show - 01.en.srt', 'Show - 01_eng.ass')
+SIDECAR_SEPARATORS = frozenset(". _-[(")
 
-def find_subtitle_files(video_file_path: str | Path) -> list[str]:
+DirectoryLister = Callable[[Path], Iterable[tuple[str, bool]]]
+
+
+def _list_files(directory: Path) -> list[tuple[str, bool]]:
+    """(파일명, 일반 파일 여부) 목록 (scandir 항목의 파일 종류는 추가 stat 없이 확인)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [(entry.name, entry.is_file()) for entry in entries]
+    except OSError:
+        return []
+
+
+def _stem_candidates(stem: str) -> list[str]:
+    """자막 파일명에서 나올 수 있는 비디오 이름 후보 (긴 것부터)
+
+    'Show - 01.en' → ['Show - 01.en', 'Show - 01', 'Show -', 'Show']처럼 구분자 위치마다
+    자른 앞부분입니다.
+    """
+    candidates = [stem]
+    for position in range(len(stem) - 1, 0, -1):
+        if stem[position] in SIDECAR_SEPARATORS:
+            candidate = stem[:position].rstrip(" ")
+            if candidate and candidate not in candidates:
+                candidates.append(candidate)
+    return candidates
+
+
+@dataclass
+class _DirectoryIndex:
+    video_stems: set[str] = field(default_factory=set)
+    # 비디오 이름 후보 → [(후보 목록, 자막 경로)]
+    by_stem: dict[str, list[tuple[list[str], Path]]] = field(default_factory=dict)
+    # 이미 옮겨서 더 이상 연결하지 않을 자막
+    removed: set[Path] = field(default_factory=set)
+
+
+class SidecarIndex:
+    """디렉토리별 자막(사이드카) 색인
+
+    디렉토리마다 목록을 한 번만 읽어 '비디오 이름 → 자막 파일'을 만들어 두고, 비디오마다
+    디렉토리 전체를 다시 훑지 않습니다. 자막은 같은 디렉토리의 비디오 중 파일명 앞부분이
+    가장 길게 일치하는 비디오 하나에만 연결됩니다 (언어 접미사 포함:
+    'Show - 01.ko.srt', 'Show - 01 [eng].ass'). 그래서 'Show.mkv'가 'Show - 01.srt'를
+    가져가지 않습니다.
+    """
+
+    def __init__(
+        self,
+        subtitle_extensions: Iterable[str] | None = None,
+        video_extensions: Iterable[str] | None = None,
+        lister: DirectoryLister | None = None,
+    ):
+        """
+        Args:
+            subtitle_extensions: 자막 확장자 (기본: SUBTITLE_EXTENSIONS)
+            video_extensions: 비디오 확장자 (기본: VIDEO_EXTENSIONS)
+            lister: 디렉토리의 (파일명, 파일 여부) 목록을 반환하는 함수 (테스트용 교체 가능)
+        """
+        self.subtitle_extensions = {
+            extension.lower() for extension in (subtitle_extensions or SUBTITLE_EXTENSIONS)
+        }
+        self.video_extensions = {
+            extension.lower() for extension in (video_extensions or VIDEO_EXTENSIONS)
+        }
+        self._lister = lister or _list_files
+        self._directories: dict[Path, _DirectoryIndex] = {}
+        self._lock = threading.Lock()
+        self.listings = 0
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return os.path.normcase(name)
+
+    def _directory(self, directory: Path) -> _DirectoryIndex:
+        index = self._directories.get(directory)
+        if index is not None:
+            return index
+        index = _DirectoryIndex()
+        self.listings += 1
+        for name, is_file in self._lister(directory):
+            if not is_file:
+                continue
+            path = directory / name
+            extension = path.suffix.lower()
+            if extension in self.video_extensions:
+                index.video_stems.add(self._key(path.stem))
+            elif extension in self.subtitle_extensions:
+                candidates = [self._key(stem) for stem in _stem_candidates(path.stem)]
+                for candidate in candidates:
+                    index.by_stem.setdefault(candidate, []).append((candidates, path))
+        self._directories[directory] = index
+        return index
+
+    def find(self, video_path: str | Path) -> list[Path]:
+        """비디오에 연결된 자막 파일 목록 (디렉토리 목록은 처음 한 번만 읽음)"""
+        video_path = Path(video_path)
+        video_key = self._key(video_path.stem)
+        with self._lock:
+            index = self._directory(video_path.parent)
+            subtitles = []
+            for candidates, subtitle_path in index.by_stem.get(video_key, ()):
+                if subtitle_path in index.removed:
+                    continue
+                # 더 길게 일치하는 다른 비디오가 있으면 그 비디오의 자막
+                owner = next(
+                    candidate
+                    for candidate in candidates
+                    if candidate == video_key or candidate in index.video_stems
+                )
+                if owner == video_key:
+                    subtitles.append(subtitle_path)
+            return sorted(subtitles)
+
+    def associate(self, video_paths: Iterable[str | Path]) -> dict[Path, list[Path]]:
+        """여러 비디오의 자막을 한 번에 연결 (자막 하나는 한 비디오에만)"""
+        associations: dict[Path, list[Path]] = {}
+        claimed: set[Path] = set()
+        for video_path in video_paths:
+            video_path = Path(video_path)
+            subtitles = [path for path in self.find(video_path) if path not in claimed]
+            claimed.update(subtitles)
+            associations[video_path] = subtitles
+        return associations
+
+    def discard(self, subtitle_path: str | Path) -> None:
+        """옮긴 자막을 색인에서 제거"""
+        subtitle_path = Path(subtitle_path)
+        with self._lock:
+            index = self._directories.get(subtitle_path.parent)
+            if index is not None:
+                index.removed.add(subtitle_path)
+
+
+def find_subtitle_files(
+    video_file_path: str | Path, index: SidecarIndex | None = None
+) -> list[str]:
     """
     비디오 파일과 연관된 자막 파일들을 찾습니다.
 
     Args:
         video_file_path: 비디오 파일 경로
+        index: 일괄 작업에서 공유하는 자막 색인 (없으면 이 디렉토리만 새로 색인)
 
     Returns:
         연관된 자막 파일 경로들의 리스트
     """
     try:
-        video_path = Path(video_file_path)
-        video_name = video_path.stem
-        video_dir = video_path.parent
-        subtitle_files = []
-        for file_path in video_dir.iterdir():
-            if not file_path.is_file():
-                continue
-            if file_path.suffix.lower() not in SUBTITLE_EXTENSIONS:
-                continue
-            subtitle_name = file_path.stem
-            if subtitle_name == video_name:
-                subtitle_files.append(str(file_path))
-                continue
-            if subtitle_name.startswith(f"{video_name}."):
-                subtitle_files.append(str(file_path))
-                continue
-            if video_name in subtitle_name and subtitle_name != video_name:
-                subtitle_files.append(str(file_path))
-                continue
+        subtitle_files = [str(path) for path in (index or SidecarIndex()).find(video_file_path)]
         logger.debug(f"자막 파일 검색: {video_file_path} -> {len(subtitle_files)}개 발견")
         return subtitle_files
     except Exception as e:
@@ -92,4 +216,7 @@ def get_subtitle_destination_path(
     subtitle_source = Path(subtitle_source)
     video_dest_dir = video_destination.parent
     subtitle_name = subtitle_source.name
+    # 비디오 이름이 바뀌면 자막도 같은 이름을 따라감 ('ep.en.srt' → 'ep_1.en.srt')
+    if video_source.stem != video_destination.stem and subtitle_name.startswith(video_source.stem):
+        subtitle_name = video_destination.stem + subtitle_name[len(video_source.stem) :]
     return video_dest_dir / subtitle_name
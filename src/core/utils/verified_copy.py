@@ -0,0 +1,294 @@
+"""
+복사 중 검증 (단일 패스 해시)
+
+복사하면서 읽은 데이터를 그대로 해시하여, 원본과 대상을 따로 다시 읽는 검증 패스를
+없앱니다. 파일명에 CRC32가 들어 있으면 ([ABCD1234]) 복사 중에 계산한 CRC32와 비교하여
+원본 자체의 손상도 확인합니다 (불일치하면 VerificationError, strict_crc32=False면
+verified=False로만 알림).
+
+검증 방식 (작업 종류별로 설정):
+    none   - 검증하지 않음 (커널 내 복사)
+    size   - 복사 후 크기만 비교 (커널 내 복사)
+    stream - 복사 중 원본 스트림을 해시하고, 대상의 앞/뒤 구간만 다시 읽어 비교
+    full   - stream에 더해 대상 전체를 다시 읽어 해시 비교
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+from src.core.utils.copy_engine import (
+    DEFAULT_BUFFER_SIZE,
+    ProgressCallback,
+    _fadvise,
+    copy_file,
+)
+from src.core.utils.io_throttle import IOThrottle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HASH_ALGORITHM = "md5"
+HASH_CHUNK_SIZE = 1024 * 1024  # 파일 해시 계산 시 읽기 크기
+SAMPLE_SIZE = 1024 * 1024  # stream 검증에서 대상의 앞/뒤를 다시 읽는 크기
+
+# 파일명 끝쪽의 [ABCD1234] 또는 (ABCD1234) 형식 CRC32
+_FILENAME_CRC32_PATTERN = re.compile(r"[\[(]([0-9A-Fa-f]{8})[\])]")
+
+
+class VerificationMode(str, Enum):
+    """복사 검증 방식"""
+
+    NONE = "none"
+    SIZE = "size"
+    STREAM = "stream"
+    FULL = "full"
+
+
+# 작업 종류별 기본 검증 방식
+DEFAULT_VERIFICATION_MODES: dict[str, VerificationMode] = {
+    "copy": VerificationMode.SIZE,
+    "move": VerificationMode.SIZE,
+    "backup": VerificationMode.STREAM,
+    "staging": VerificationMode.STREAM,
+}
+
+
+class VerificationError(OSError):
+    """복사한 파일이 원본과 일치하지 않음"""
+
+
+@dataclass
+class CopyVerification:
+    """복사 검증 결과"""
+
+    mode: VerificationMode
+    bytes_copied: int
+    digest: str | None = None
+    crc32: str | None = None
+    expected_crc32: str | None = None
+    verified: bool = True
+
+
+def resolve_verification_mode(
+    operation_type: str, overrides: Mapping[str, str | VerificationMode] | None = None
+) -> VerificationMode:
+    """
+    작업 종류의 검증 방식
+
+    Args:
+        operation_type: copy, move, backup, staging 등
+        overrides: 설정에서 지정한 {작업 종류: 검증 방식}
+    """
+    operation_type = str(getattr(operation_type, "value", operation_type)).lower()
+    mode = (overrides or {}).get(operation_type)
+    if mode is None:
+        mode = DEFAULT_VERIFICATION_MODES.get(operation_type, VerificationMode.SIZE)
+    try:
+        return VerificationMode(mode)
+    except ValueError:
+        logger.warning(f"알 수 없는 검증 방식 '{mode}', size 검증 사용")
+        return VerificationMode.SIZE
+
+
+def expected_crc32_from_filename(filename: str) -> str | None:
+    """파일명에 포함된 CRC32 (여러 개면 마지막 것, 없으면 None)"""
+    matches = _FILENAME_CRC32_PATTERN.findall(Path(filename).stem)
+    return matches[-1].upper() if matches else None
+
+
+def file_digest(path: str | Path, algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
+    """파일 전체 해시 (큰 버퍼로 한 번 읽음)"""
+    hasher = hashlib.new(algorithm, usedforsecurity=False)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with Path(path).open("rb", buffering=0) as f:
+        _fadvise(f.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+        while read := f.readinto(buffer):
+            hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
+def _read_range(fd: int, offset: int, length: int) -> bytes:
+    os.lseek(fd, offset, os.SEEK_SET)
+    parts = []
+    while length > 0:
+        data = os.read(fd, length)
+        if not data:
+            break
+        parts.append(data)
+        length -= len(data)
+    return b"".join(parts)
+
+
+def _sample_ranges(total: int) -> list[tuple[int, int]]:
+    """stream 검증에서 대상을 다시 읽는 구간 (앞/뒤 SAMPLE_SIZE)"""
+    if total <= 2 * SAMPLE_SIZE:
+        return [(0, total)]
+    return [(0, SAMPLE_SIZE), (total - SAMPLE_SIZE, SAMPLE_SIZE)]
+
+
+def _stream_copy(
+    source: Path,
+    destination: Path,
+    algorithm: str,
+    buffer_size: int,
+    progress_callback: ProgressCallback | None,
+    throttle: IOThrottle | None = None,
+) -> tuple[int, str, str, list[str]]:
+    """
+    원본을 한 번 읽어 대상에 쓰면서 해시/CRC32와 앞/뒤 구간 해시를 계산
+
+    Returns:
+        (복사한 바이트 수, 전체 해시, CRC32, 구간별 해시)
+    """
+    hasher = hashlib.new(algorithm, usedforsecurity=False)
+    crc = 0
+    flags = getattr(os, "O_BINARY", 0)
+    source_fd = os.open(source, os.O_RDONLY | flags)
+    try:
+        total = os.fstat(source_fd).st_size
+        ranges = _sample_ranges(total)
+        sample_hashers = [hashlib.new(algorithm, usedforsecurity=False) for _ in ranges]
+        _fadvise(source_fd, 0, 0, "POSIX_FADV_SEQUENTIAL")
+        target_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | flags, 0o666)
+        if throttle is not None:
+            buffer_size = min(buffer_size, throttle.chunk_size(buffer_size))
+        try:
+            position = 0
+            while data := os.read(source_fd, buffer_size):
+                view = memoryview(data)
+                hasher.update(view)
+                crc = zlib.crc32(view, crc)
+                for (start, length), sample_hasher in zip(ranges, sample_hashers, strict=True):
+                    low = max(start, position)
+                    high = min(start + length, position + len(data))
+                    if low < high:
+                        sample_hasher.update(view[low - position : high - position])
+                written = 0
+                while written < len(data):
+                    written += os.write(target_fd, view[written:])
+                position += len(data)
+                if throttle is not None:
+                    throttle.consume(len(data), operations=1)
+                if progress_callback:
+                    progress_callback(position, total)
+        finally:
+            os.close(target_fd)
+    finally:
+        os.close(source_fd)
+    samples = [sample_hasher.hexdigest() for sample_hasher in sample_hashers]
+    return position, hasher.hexdigest(), f"{crc:08X}", samples
+
+
+def _destination_samples(destination: Path, total: int, algorithm: str) -> list[str]:
+    fd = os.open(destination, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return [
+            hashlib.new(
+                algorithm, _read_range(fd, start, length), usedforsecurity=False
+            ).hexdigest()
+            for start, length in _sample_ranges(total)
+        ]
+    finally:
+        os.close(fd)
+
+
+def copy_and_verify(
+    source: str | Path,
+    destination: str | Path,
+    mode: VerificationMode | str = VerificationMode.STREAM,
+    *,
+    expected_crc32: str | None = None,
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+    progress_callback: ProgressCallback | None = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    preserve_metadata: bool = True,
+    throttle: IOThrottle | None = None,
+    strict_crc32: bool = True,
+) -> CopyVerification:
+    """
+    파일을 복사하고 지정한 방식으로 검증
+
+    검증에 실패하면 대상 파일을 삭제하고 VerificationError를 던집니다.
+
+    Args:
+        source: 원본 파일 경로
+        destination: 대상 파일 경로 (디렉토리면 같은 이름으로 복사)
+        mode: 검증 방식
+        expected_crc32: 기대 CRC32 (None이면 파일명에서 추출)
+        algorithm: stream/full 검증에 사용할 해시 알고리즘
+        progress_callback: (복사한 바이트 수, 전체 바이트 수)를 받는 콜백
+        buffer_size: stream/full 검증 시 읽기 버퍼 크기
+        preserve_metadata: 수정 시각/권한 등 메타데이터 복사 여부
+        throttle: 복사의 대역폭/IOPS 제한기 (검증을 위한 다시 읽기는 제한하지 않음)
+        strict_crc32: 원본이 파일명의 CRC32와 다를 때 실패로 볼지 여부
+            (False면 복사본을 남기고 verified=False로만 알림)
+
+    Returns:
+        CopyVerification (stream/full이면 원본 스트림의 해시와 CRC32 포함)
+    """
+    source = Path(source)
+    destination = Path(destination)
+    if destination.is_dir():
+        destination = destination / source.name
+    mode = VerificationMode(mode)
+    source_size = source.stat().st_size
+
+    if mode in (VerificationMode.NONE, VerificationMode.SIZE):
+        copied = copy_file(
+            source,
+            destination,
+            progress_callback=progress_callback,
+            preserve_metadata=preserve_metadata,
+            throttle=throttle,
+        )
+        result = CopyVerification(mode, copied)
+        if mode == VerificationMode.SIZE:
+            _check(destination, destination.stat().st_size == source_size, "크기가 다릅니다")
+        return result
+
+    if destination.exists() and source.samefile(destination):
+        raise shutil.SameFileError(f"{source} and {destination} are the same file")
+    expected_crc32 = (expected_crc32 or expected_crc32_from_filename(source.name) or "").upper()
+    copied, digest, crc32, samples = _stream_copy(
+        source, destination, algorithm, buffer_size, progress_callback, throttle
+    )
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    result = CopyVerification(mode, copied, digest, crc32, expected_crc32 or None)
+
+    if expected_crc32 and crc32 != expected_crc32:
+        # 복사는 원본과 같지만 원본 자체가 파일명의 CRC32와 다름
+        if strict_crc32:
+            _check(destination, False, f"파일명 CRC32 불일치: {crc32} != {expected_crc32}")
+        result.verified = False
+        logger.warning(f"⚠️ 파일명 CRC32 불일치: {source.name} ({crc32} != {expected_crc32})")
+    _check(
+        destination,
+        copied == source_size == destination.stat().st_size,
+        "크기가 다릅니다",
+    )
+    if mode == VerificationMode.FULL:
+        _check(destination, file_digest(destination, algorithm) == digest, "해시가 다릅니다")
+    else:
+        _check(
+            destination,
+            _destination_samples(destination, copied, algorithm) == samples,
+            "앞/뒤 구간 해시가 다릅니다",
+        )
+    return result
+
+
+def _check(destination: Path, condition: bool, message: str) -> None:
+    if condition:
+        return
+    destination.unlink(missing_ok=True)
+    logger.error(f"복사 검증 실패: {destination} ({message})")
+    raise VerificationError(f"복사 검증 실패: {destination} ({message})")
@@ -0,0 +1,441 @@
+"""
+비디오 컨테이너 헤더 리더
+
+Matroska(MKV/WebM)와 ISO-BMFF(MP4/M4V/MOV) 컨테이너의 헤더만 읽어
+해상도, 코덱, 재생 시간을 구합니다. ffprobe 프로세스를 띄우지 않고 필요한
+요소만 찾아 이동하며 읽기 때문에 파일 크기와 관계없이 수 KB만 읽습니다.
+"""
+
+import logging
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# Matroska 요소 ID
+EBML_HEADER_ID = 0x1A45DFA3
+EBML_DOC_TYPE_ID = 0x4282
+SEGMENT_ID = 0x18538067
+SEEK_HEAD_ID = 0x114D9B74
+SEEK_ID = 0x4DBB
+SEEK_ID_ID = 0x53AB
+SEEK_POSITION_ID = 0x53AC
+INFO_ID = 0x1549A966
+TIMECODE_SCALE_ID = 0x2AD7B1
+DURATION_ID = 0x4489
+TRACKS_ID = 0x1654AE6B
+TRACK_ENTRY_ID = 0xAE
+TRACK_TYPE_ID = 0x83
+CODEC_ID_ID = 0x86
+VIDEO_ID = 0xE0
+PIXEL_WIDTH_ID = 0xB0
+PIXEL_HEIGHT_ID = 0xBA
+CLUSTER_ID = 0x1F43B675
+
+MATROSKA_VIDEO_TRACK = 1
+DEFAULT_TIMECODE_SCALE = 1_000_000
+
+# 손상된 크기 값 때문에 큰 데이터를 읽지 않도록 한 요소에서 읽는 최대 바이트 수
+MAX_ELEMENT_READ = 1024 * 1024
+# 세그먼트 앞부분에서 확인할 최상위 요소 수 (이후는 SeekHead가 가리키는 위치로 이동)
+MAX_TOP_LEVEL_ELEMENTS = 64
+
+# ffprobe codec_name과 같은 이름으로 맞춤
+MATROSKA_CODECS = {
+    "V_MPEG4/ISO/AVC": "h264",
+    "V_MPEGH/ISO/HEVC": "hevc",
+    "V_AV1": "av1",
+    "V_VP9": "vp9",
+    "V_VP8": "vp8",
+    "V_MPEG2": "mpeg2video",
+    "V_MPEG1": "mpeg1video",
+    "V_MPEG4/ISO/ASP": "mpeg4",
+    "V_MPEG4/ISO/SP": "mpeg4",
+    "V_THEORA": "theora",
+    "V_REAL/RV40": "rv40",
+}
+
+MP4_CODECS = {
+    "avc1": "h264",
+    "avc3": "h264",
+    "hvc1": "hevc",
+    "hev1": "hevc",
+    "av01": "av1",
+    "vp09": "vp9",
+    "vp08": "vp8",
+    "mp4v": "mpeg4",
+    "mp4a": "aac",
+}
+
+MP4_TOP_LEVEL_BOXES = {b"ftyp", b"moov", b"mdat", b"free", b"skip", b"wide", b"uuid", b"pdin"}
+
+
+class HeaderParseError(Exception):
+    """헤더 구조가 예상과 다를 때 발생하는 예외"""
+
+
+def read_video_header(file_path: str | Path) -> dict[str, Any] | None:
+    """
+    컨테이너 헤더에서 비디오 메타데이터 추출
+
+    Args:
+        file_path: 비디오 파일 경로
+
+    Returns:
+        width, height, codec_name, duration 등을 담은 딕셔너리.
+        지원하지 않는 컨테이너이거나 비디오 트랙을 찾지 못하면 None
+    """
+    try:
+        with Path(file_path).open("rb") as f:
+            magic = f.read(12)
+            f.seek(0)
+            if magic[:4] == b"\x1a\x45\xdf\xa3":
+                metadata = _read_matroska(f)
+            elif magic[4:8] in MP4_TOP_LEVEL_BOXES:
+                metadata = _read_mp4(f)
+            else:
+                return None
+    except (OSError, EOFError, HeaderParseError, struct.error, ValueError) as e:
+        logger.debug(f"헤더 분석 실패: {file_path} - {e}")
+        return None
+    if not metadata or not metadata.get("width") or not metadata.get("height"):
+        return None
+    return metadata
+
+
+def _format_duration(seconds: float | None) -> str | None:
+    """ffprobe와 같은 형식의 재생 시간 문자열"""
+    if seconds is None or seconds <= 0:
+        return None
+    return f"{seconds:.6f}"
+
+
+# ----------------------------------------------------------------------
+# Matroska
+# ----------------------------------------------------------------------
+
+
+def _read_vint(f: BinaryIO, keep_marker: bool) -> tuple[int, int]:
+    """EBML 가변 길이 정수 읽기 (값, 길이 바이트 수)"""
+    first = f.read(1)
+    if not first:
+        raise EOFError
+    first_byte = first[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first_byte & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise HeaderParseError("잘못된 EBML 가변 길이 정수")
+    value = first_byte if keep_marker else first_byte & (mask - 1)
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        raise EOFError
+    for byte in rest:
+        value = (value << 8) | byte
+    return value, length
+
+
+def _read_element_header(f: BinaryIO) -> tuple[int, int | None, int]:
+    """요소 ID, 크기(알 수 없으면 None), 데이터 시작 위치"""
+    element_id, _ = _read_vint(f, keep_marker=True)
+    raw_size, size_length = _read_vint(f, keep_marker=False)
+    size: int | None = raw_size
+    if raw_size == (1 << (7 * size_length)) - 1:
+        size = None
+    return element_id, size, f.tell()
+
+
+def _iter_elements(f: BinaryIO, start: int, end: int | None, limit: int = 4096):
+    """[start, end) 범위의 자식 요소를 순회 (데이터는 읽지 않고 건너뜀)"""
+    position = start
+    for _ in range(limit):
+        if end is not None and position >= end:
+            return
+        f.seek(position)
+        try:
+            element_id, size, data_start = _read_element_header(f)
+        except EOFError:
+            return
+        yield element_id, size, data_start
+        if size is None:
+            return
+        position = data_start + size
+
+
+def _read_data(f: BinaryIO, data_start: int, size: int | None) -> bytes:
+    if size is None or size > MAX_ELEMENT_READ:
+        raise HeaderParseError("요소 크기가 너무 큼")
+    f.seek(data_start)
+    data = f.read(size)
+    if len(data) != size:
+        raise EOFError
+    return data
+
+
+def _read_uint(f: BinaryIO, data_start: int, size: int | None) -> int:
+    return int.from_bytes(_read_data(f, data_start, size), "big")
+
+
+def _read_float(f: BinaryIO, data_start: int, size: int | None) -> float:
+    data = _read_data(f, data_start, size)
+    if size == 4:
+        return struct.unpack(">f", data)[0]
+    if size == 8:
+        return struct.unpack(">d", data)[0]
+    raise HeaderParseError("잘못된 부동소수점 크기")
+
+
+def _read_matroska(f: BinaryIO) -> dict[str, Any] | None:
+    element_id, size, data_start = _read_element_header(f)
+    if element_id != EBML_HEADER_ID or size is None:
+        return None
+    doc_type = None
+    for child_id, child_size, child_start in _iter_elements(f, data_start, data_start + size):
+        if child_id == EBML_DOC_TYPE_ID:
+            doc_type = _read_data(f, child_start, child_size).rstrip(b"\0").decode("ascii")
+    if doc_type not in ("matroska", "webm"):
+        return None
+
+    f.seek(data_start + size)
+    element_id, segment_size, segment_start = _read_element_header(f)
+    if element_id != SEGMENT_ID:
+        return None
+    segment_end = None if segment_size is None else segment_start + segment_size
+
+    info_position = tracks_position = None
+    seek_positions: dict[int, int] = {}
+    for child_id, child_size, child_start in _iter_elements(
+        f, segment_start, segment_end, MAX_TOP_LEVEL_ELEMENTS
+    ):
+        if child_id == SEEK_HEAD_ID:
+            seek_positions.update(_read_seek_head(f, child_start, child_size, segment_start))
+        elif child_id == INFO_ID:
+            info_position = child_start, child_size
+        elif child_id == TRACKS_ID:
+            tracks_position = child_start, child_size
+        elif child_id == CLUSTER_ID:
+            break
+        if info_position and tracks_position:
+            break
+
+    # 클러스터 뒤에 있는 요소는 SeekHead가 가리키는 위치로 바로 이동
+    for target_id in (INFO_ID, TRACKS_ID):
+        already_found = info_position if target_id == INFO_ID else tracks_position
+        if already_found or target_id not in seek_positions:
+            continue
+        f.seek(seek_positions[target_id])
+        element_id, element_size, element_start = _read_element_header(f)
+        if element_id != target_id:
+            continue
+        if target_id == INFO_ID:
+            info_position = element_start, element_size
+        else:
+            tracks_position = element_start, element_size
+
+    if tracks_position is None:
+        return None
+    metadata = _read_matroska_tracks(f, *tracks_position)
+    if metadata is None:
+        return None
+    if info_position is not None:
+        metadata["duration"] = _format_duration(_read_matroska_duration(f, *info_position))
+    metadata["format_name"] = doc_type
+    return metadata
+
+
+def _read_seek_head(f: BinaryIO, start: int, size: int | None, segment_start: int) -> dict:
+    positions = {}
+    end = None if size is None else start + size
+    for seek_id, seek_size, seek_start in _iter_elements(f, start, end):
+        if seek_id != SEEK_ID or seek_size is None:
+            continue
+        target_id = target_position = None
+        for child_id, child_size, child_start in _iter_elements(
+            f, seek_start, seek_start + seek_size
+        ):
+            if child_id == SEEK_ID_ID:
+                target_id = _read_uint(f, child_start, child_size)
+            elif child_id == SEEK_POSITION_ID:
+                target_position = _read_uint(f, child_start, child_size)
+        if target_id is not None and target_position is not None:
+            positions[target_id] = segment_start + target_position
+    return positions
+
+
+def _read_matroska_duration(f: BinaryIO, start: int, size: int | None) -> float | None:
+    timecode_scale = DEFAULT_TIMECODE_SCALE
+    duration = None
+    end = None if size is None else start + size
+    for child_id, child_size, child_start in _iter_elements(f, start, end):
+        if child_id == TIMECODE_SCALE_ID:
+            timecode_scale = _read_uint(f, child_start, child_size)
+        elif child_id == DURATION_ID:
+            duration = _read_float(f, child_start, child_size)
+    if duration is None:
+        return None
+    return duration * timecode_scale / 1_000_000_000
+
+
+def _read_matroska_tracks(f: BinaryIO, start: int, size: int | None) -> dict[str, Any] | None:
+    end = None if size is None else start + size
+    for entry_id, entry_size, entry_start in _iter_elements(f, start, end):
+        if entry_id != TRACK_ENTRY_ID or entry_size is None:
+            continue
+        track_type = codec_id = width = height = None
+        for child_id, child_size, child_start in _iter_elements(
+            f, entry_start, entry_start + entry_size
+        ):
+            if child_id == TRACK_TYPE_ID:
+                track_type = _read_uint(f, child_start, child_size)
+            elif child_id == CODEC_ID_ID:
+                codec_id = _read_data(f, child_start, child_size).rstrip(b"\0").decode("ascii")
+            elif child_id == VIDEO_ID and child_size is not None:
+                for video_id, video_size, video_start in _iter_elements(
+                    f, child_start, child_start + child_size
+                ):
+                    if video_id == PIXEL_WIDTH_ID:
+                        width = _read_uint(f, video_start, video_size)
+                    elif video_id == PIXEL_HEIGHT_ID:
+                        height = _read_uint(f, video_start, video_size)
+        if track_type == MATROSKA_VIDEO_TRACK:
+            return {
+                "width": width,
+                "height": height,
+                "codec_name": MATROSKA_CODECS.get(codec_id or "", codec_id),
+            }
+    return None
+
+
+# ----------------------------------------------------------------------
+# ISO-BMFF (MP4)
+# ----------------------------------------------------------------------
+
+
+def _iter_boxes(f: BinaryIO, start: int, end: int | None, limit: int = 4096):
+    """[start, end) 범위의 박스 순회 (박스 타입, 데이터 시작 위치, 데이터 크기)"""
+    position = start
+    for _ in range(limit):
+        if end is not None and position + 8 > end:
+            return
+        f.seek(position)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            large = f.read(8)
+            if len(large) < 8:
+                return
+            size = struct.unpack(">Q", large)[0]
+            header_size = 16
+        elif size == 0:
+            yield box_type, position + header_size, None
+            return
+        if size < header_size:
+            raise HeaderParseError("잘못된 박스 크기")
+        yield box_type, position + header_size, size - header_size
+        position += size
+
+
+def _find_box(f: BinaryIO, start: int, end: int | None, box_type: bytes):
+    for found_type, data_start, data_size in _iter_boxes(f, start, end):
+        if found_type == box_type:
+            return data_start, data_size
+    return None
+
+
+def _read_mp4(f: BinaryIO) -> dict[str, Any] | None:
+    moov = _find_box(f, 0, None, b"moov")
+    if moov is None:
+        return None
+    moov_start, moov_size = moov
+    moov_end = None if moov_size is None else moov_start + moov_size
+
+    duration = None
+    video: dict[str, Any] | None = None
+    for box_type, data_start, data_size in _iter_boxes(f, moov_start, moov_end):
+        if box_type == b"mvhd":
+            duration = _read_mp4_duration(_read_data(f, data_start, data_size))
+        elif box_type == b"trak" and video is None:
+            video = _read_mp4_track(f, data_start, data_size)
+    if video is None:
+        return None
+    track_duration = video.pop("duration")
+    video["duration"] = _format_duration(duration if duration is not None else track_duration)
+    video["format_name"] = "mp4"
+    return video
+
+
+def _read_mp4_duration(data: bytes) -> float | None:
+    """mvhd/mdhd 박스의 timescale과 duration으로 재생 시간(초) 계산"""
+    version = data[0]
+    if version == 1:
+        timescale, duration = struct.unpack(">IQ", data[20:32])
+    else:
+        timescale, duration = struct.unpack(">II", data[12:20])
+    if not timescale or duration in (0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+        return None
+    return duration / timescale
+
+
+def _read_mp4_track(f: BinaryIO, start: int, size: int | None) -> dict[str, Any] | None:
+    end = None if size is None else start + size
+    tkhd = _find_box(f, start, end, b"tkhd")
+    mdia = _find_box(f, start, end, b"mdia")
+    if mdia is None:
+        return None
+    mdia_start, mdia_size = mdia
+    mdia_end = None if mdia_size is None else mdia_start + mdia_size
+
+    hdlr = _find_box(f, mdia_start, mdia_end, b"hdlr")
+    if hdlr is None or _read_data(f, *hdlr)[8:12] != b"vide":
+        return None
+
+    width = height = None
+    if tkhd is not None:
+        data = _read_data(f, *tkhd)
+        offset = 76 if data[0] == 0 else 88
+        # 16.16 고정소수점 표시 크기
+        width, height = (value >> 16 for value in struct.unpack(">II", data[offset : offset + 8]))
+
+    track_duration = None
+    mdhd = _find_box(f, mdia_start, mdia_end, b"mdhd")
+    if mdhd is not None:
+        track_duration = _read_mp4_duration(_read_data(f, *mdhd))
+
+    codec_name = None
+    stsd = _find_stsd(f, mdia_start, mdia_end)
+    if stsd is not None:
+        data = _read_data(f, *stsd)
+        # 버전/플래그(4) + 항목 수(4) 다음이 첫 샘플 항목 (크기(4) + 타입(4) + 본문)
+        if len(data) >= 16:
+            entry_type = data[12:16].decode("latin-1")
+            codec_name = MP4_CODECS.get(entry_type, entry_type)
+            # VisualSampleEntry: 예약(6) + 참조 인덱스(2) + 예약(16) 다음에 부호화 크기
+            if len(data) >= 16 + 28:
+                coded_width, coded_height = struct.unpack(">HH", data[16 + 24 : 16 + 28])
+                if coded_width and coded_height:
+                    width, height = coded_width, coded_height
+
+    return {
+        "width": width,
+        "height": height,
+        "codec_name": codec_name,
+        "duration": track_duration,
+    }
+
+
+def _find_stsd(f: BinaryIO, start: int, end: int | None):
+    minf = _find_box(f, start, end, b"minf")
+    if minf is None:
+        return None
+    minf_end = None if minf[1] is None else minf[0] + minf[1]
+    stbl = _find_box(f, minf[0], minf_end, b"stbl")
+    if stbl is None:
+        return None
+    stbl_end = None if stbl[1] is None else stbl[0] + stbl[1]
+    return _find_box(f, stbl[0], stbl_end, b"stsd")
@@ -4,15 +4,26 @@
 비디오 파일에서 해상도, 코덱 등의 메타데이터를 추출하는 기능을 제공합니다.
 """
 
+import atexit
 import json
 import logging
 
 logger = logging.getLogger(__name__)
+import os
+import shutil
 import subprocess  # nosec B404 - ffprobe 실행을 위해 필요
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from src.core.utils.atomic_file import InterProcessLock, atomic_write_bytes
+from src.core.video_header_reader import read_video_header
+
 
 class MediaQuality(Enum):
     """미디어 품질"""
@@ -26,13 +37,217 @@ class MediaQuality(Enum):
     UHD_8K = "8k"
 
 
-class VideoMetadataExtractor:
-    """비디오 파일 메타데이터 추출기"""
+FFPROBE_ENV_VAR = "ANIMESORTER_FFPROBE"
+PROBE_CACHE_FILENAME = "video_probe_cache.json"
+
+_ffprobe_lock = threading.Lock()
+_ffprobe_resolved = False
+_ffprobe_path: str | None = None
+# 종료 시 기록하지 못한 분석 결과를 저장할 캐시들
+_open_probe_caches: "weakref.WeakSet[VideoProbeCache]" = weakref.WeakSet()
+
+
+def _default_cache_dir() -> Path:
+    """TMDB 캐시와 같은 위치의 캐시 디렉토리 (PyInstaller 환경은 실행 파일 옆)"""
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).parent / ".animesorter_cache"
+    return Path(".animesorter_cache")
+
+
+def _ffprobe_candidates() -> list[str]:
+    """ffprobe 후보 경로 (환경 변수 → PATH → 실행 파일 옆 → WinGet 링크 폴더)"""
+    candidates = []
+    configured = os.environ.get(FFPROBE_ENV_VAR)
+    if configured:
+        candidates.append(configured)
+    for name in ("ffprobe", "ffprobe.exe"):
+        found = shutil.which(name)
+        if found:
+            candidates.append(found)
+    if getattr(sys, "frozen", False):
+        candidates.append(str(Path(sys.executable).parent / "ffprobe.exe"))
+    local_app_data = os.environ.get("LOCALAPPDATA")
+    if local_app_data:
+        candidates.append(
+            str(Path(local_app_data) / "Microsoft" / "WinGet" / "Links" / "ffprobe.exe")
+        )
+    return candidates
+
+
+def find_ffprobe(refresh: bool = False) -> str | None:
+    """
+    ffprobe 실행 파일 경로를 찾습니다 (프로세스당 한 번만 탐색).
+
+    Args:
+        refresh: 이전 탐색 결과를 무시하고 다시 찾을지 여부
+
+    Returns:
+        ffprobe 경로 또는 None
+    """
+    global _ffprobe_resolved, _ffprobe_path
+    with _ffprobe_lock:
+        if _ffprobe_resolved and not refresh:
+            return _ffprobe_path
+        _ffprobe_path = None
+        for candidate in _ffprobe_candidates():
+            if Path(candidate).is_file() and os.access(candidate, os.X_OK):
+                _ffprobe_path = candidate
+                break
+        _ffprobe_resolved = True
+        if _ffprobe_path:
+            logger.info(f"ffprobe 발견: {_ffprobe_path}")
+        else:
+            logger.warning("ffprobe를 찾을 수 없습니다. 비디오 메타데이터 추출이 제한됩니다.")
+        return _ffprobe_path
+
+
+class VideoProbeCache:
+    """비디오 분석 결과를 (경로, 크기, 수정 시각) 기준으로 디스크에 보관하는 캐시
+
+    파일이 바뀌면(크기나 수정 시각이 다르면) 캐시 항목은 무시됩니다. 저장은
+    잠금 안에서 디스크 내용과 병합한 뒤 원자적으로 교체하므로 여러 프로세스가
+    함께 사용해도 서로의 결과를 잃지 않습니다. 기록하지 못한 항목은 프로세스 종료 시
+    한 번 더 기록합니다.
+    """
+
+    def __init__(self, cache_file: Path | None, max_entries: int = 50000):
+        """
+        Args:
+            cache_file: 캐시 파일 경로 (None이면 메모리에만 보관)
+            max_entries: 보관할 최대 항목 수 (초과 시 오래 분석된 항목부터 제거)
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+        self._file_lock = (
+            InterProcessLock(cache_file.with_name(f"{cache_file.name}.lock"))
+            if cache_file is not None
+            else None
+        )
+        self._load()
+        if cache_file is not None:
+            _open_probe_caches.add(self)
+
+    @staticmethod
+    def _signature(file_path: str) -> tuple[int, int] | None:
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _read_disk(self) -> dict[str, dict[str, Any]]:
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+        try:
+            payload = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            return payload.get("entries", {}) if isinstance(payload, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"비디오 분석 캐시 읽기 실패: {e}")
+            return {}
+
+    def _load(self) -> None:
+        self._entries = self._read_disk()
+
+    def get(self, file_path: str) -> dict[str, Any] | None:
+        """파일이 바뀌지 않았으면 캐시된 분석 결과 반환"""
+        signature = self._signature(file_path)
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(str(file_path))
+        if entry is None or (entry.get("size"), entry.get("mtime_ns")) != signature:
+            return None
+        return entry.get("data")
+
+    def put(self, file_path: str, data: dict[str, Any]) -> None:
+        """분석 결과 저장 (flush 전까지는 메모리에만 반영)"""
+        signature = self._signature(file_path)
+        if signature is None:
+            return
+        key = str(file_path)
+        with self._lock:
+            self._entries[key] = {
+                "size": signature[0],
+                "mtime_ns": signature[1],
+                "probed_at": time.time(),
+                "data": data,
+            }
+            self._dirty.add(key)
+
+    def flush(self) -> None:
+        """변경된 항목을 디스크 캐시와 병합하여 기록"""
+        if self.cache_file is None or self._file_lock is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            changes = {key: self._entries[key] for key in self._dirty if key in self._entries}
+            self._dirty.clear()
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock:
+                merged = self._read_disk()
+                merged.update(changes)
+                if len(merged) > self.max_entries:
+                    newest = sorted(
+                        merged.items(), key=lambda item: item[1].get("probed_at", 0), reverse=True
+                    )
+                    merged = dict(newest[: self.max_entries])
+                atomic_write_bytes(
+                    self.cache_file,
+                    json.dumps({"entries": merged}, ensure_ascii=False).encode("utf-8"),
+                )
+            with self._lock:
+                # 다른 프로세스가 기록한 결과도 함께 반영
+                merged.update(self._entries)
+                self._entries = merged
+        except Exception as e:
+            logger.warning(f"비디오 분석 캐시 저장 실패: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
-    def __init__(self):
-        """초기화"""
+
+@atexit.register
+def _flush_probe_caches() -> None:
+    for cache in list(_open_probe_caches):
+        cache.flush()
+
+
+class VideoMetadataExtractor:
+    """비디오 파일 메타데이터 추출기
+
+    MKV/MP4는 컨테이너 헤더를 직접 읽고, 그 외 컨테이너만 ffprobe로 분석합니다.
+    ffprobe는 프로세스당 한 번만 찾고, 분석 결과는 VideoProbeCache에 보관합니다.
+    여러 파일을 분류할 때는 캐시에 없는 파일만 제한된 수의 작업자로 동시에 분석합니다.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        max_workers: int | None = None,
+        use_persistent_cache: bool = True,
+        use_header_reader: bool = True,
+    ):
+        """
+        Args:
+            cache_file: 분석 결과 캐시 파일 (None이면 기본 캐시 디렉토리 사용)
+            max_workers: 동시에 실행할 최대 ffprobe 프로세스 수
+            use_persistent_cache: False면 분석 결과를 디스크에 저장하지 않음
+            use_header_reader: False면 헤더 리더 없이 항상 ffprobe 사용
+        """
         self.logger = logging.getLogger(__name__)
-        self._ffprobe_available = self._check_ffprobe_availability()
+        self._ffprobe_path = find_ffprobe()
+        self._ffprobe_available = self._ffprobe_path is not None
+        if use_persistent_cache and cache_file is None:
+            cache_file = _default_cache_dir() / PROBE_CACHE_FILENAME
+        self.probe_cache = VideoProbeCache(cache_file if use_persistent_cache else None)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 4)
+        self.use_header_reader = use_header_reader
         self._quality_priority = {
             MediaQuality.UHD_8K: 8,
             MediaQuality.UHD_4K: 7,
@@ -45,116 +260,211 @@ class VideoMetadataExtractor:
 
     def _check_ffprobe_availability(self) -> bool:
         """ffprobe 사용 가능 여부 확인"""
-        try:
-            possible_paths = [
-                "ffprobe",
-                "C:\\Users\\hyper\\AppData\\Local\\Microsoft\\WinGet\\Links\\ffprobe.exe",
-                "ffprobe.exe",
-            ]
-            for ffprobe_path in possible_paths:
-                try:
-                    result = subprocess.run(
-                        [ffprobe_path, "-version"],  # nosec B603 - ffprobe 경로는 신뢰할 수 있음
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    if result.returncode == 0:
-                        self.logger.info(f"ffprobe 발견: {ffprobe_path}")
-                        return True
-                except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-                    continue
-            self.logger.warning("ffprobe를 찾을 수 없습니다. 비디오 메타데이터 추출이 제한됩니다.")
-            return False
-        except Exception as e:
-            self.logger.warning(f"ffprobe 확인 중 오류: {e}")
-            return False
+        return find_ffprobe() is not None
 
     def _find_ffprobe_path(self) -> str | None:
-        """ffprobe 실행 파일 경로 찾기"""
-        possible_paths = [
-            "ffprobe",
-            "C:\\Users\\hyper\\AppData\\Local\\Microsoft\\WinGet\\Links\\ffprobe.exe",
-            "ffprobe.exe",
-        ]
-        for ffprobe_path in possible_paths:
-            try:
-                result = subprocess.run(
-                    [ffprobe_path, "-version"],  # nosec B603 - ffprobe 경로는 신뢰할 수 있음
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    return ffprobe_path
-            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-                continue
-        return None
-
-    def extract_resolution(self, file_path: str) -> str | None:
-        """
-        비디오 파일에서 해상도 정보 추출
-
-        Args:
-            file_path: 비디오 파일 경로
+        """ffprobe 실행 파일 경로 찾기 (프로세스당 한 번 탐색한 결과 사용)"""
+        return self._ffprobe_path
 
-        Returns:
-            해상도 문자열 (예: "1920x1080", "1280x720") 또는 None
-        """
-        if not self._ffprobe_available:
-            guessed_resolution = self._guess_resolution_from_filename(file_path)
-            if guessed_resolution:
-                self.logger.info(f"파일명에서 화질 추측: {guessed_resolution}")
-                return guessed_resolution
-            self.logger.warning("ffprobe가 사용 불가능하여 해상도 추출을 건너뜁니다.")
+    def _run_ffprobe(self, file_path: str) -> dict[str, Any] | None:
+        """ffprobe로 스트림/포맷 정보를 한 번에 분석"""
+        if self._ffprobe_path is None:
             return None
+        cmd = [
+            self._ffprobe_path,
+            "-v",
+            "quiet",
+            "-print_format",
+            "json",
+            "-show_streams",
+            "-show_format",
+            str(file_path),
+        ]
         try:
-            ffprobe_path = self._find_ffprobe_path()
-            if not ffprobe_path:
-                self.logger.warning("ffprobe를 찾을 수 없습니다.")
-                return None
-            cmd = [
-                ffprobe_path,
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_streams",
-                "-select_streams",
-                "v:0",
-                str(file_path),
-            ]
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,  # nosec B603 - ffprobe 경로는 신뢰할 수 있음
                 timeout=30,
             )
-            if result.returncode != 0:
-                self.logger.warning(f"ffprobe 실행 실패: {result.stderr}")
-                return None
-            data = json.loads(result.stdout)
-            if not data.get("streams"):
-                self.logger.warning("비디오 스트림을 찾을 수 없습니다.")
-                return None
-            video_stream = data["streams"][0]
-            width = video_stream.get("width")
-            height = video_stream.get("height")
-            if width and height:
-                resolution = f"{width}x{height}"
-                self.logger.debug(f"해상도 추출 성공: {resolution}")
-                return resolution
-            self.logger.warning("해상도 정보를 찾을 수 없습니다.")
+        except subprocess.TimeoutExpired:
+            self.logger.error("ffprobe 실행 시간 초과")
+            return None
+        if result.returncode != 0:
+            self.logger.warning(f"ffprobe 실행 실패: {result.stderr}")
             return None
+        try:
+            return json.loads(result.stdout)
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON 파싱 실패: {e}")
             return None
-        except subprocess.TimeoutExpired:
-            self.logger.error("ffprobe 실행 시간 초과")
+
+    @staticmethod
+    def _summarize_probe(data: dict[str, Any]) -> dict[str, Any]:
+        """ffprobe 출력에서 필요한 항목만 추림"""
+        metadata: dict[str, Any] = {}
+        streams = data.get("streams", [])
+        video_streams = [s for s in streams if s.get("codec_type") == "video"]
+        if video_streams:
+            video = video_streams[0]
+            metadata.update(
+                {
+                    "width": video.get("width"),
+                    "height": video.get("height"),
+                    "codec_name": video.get("codec_name"),
+                    "bit_rate": video.get("bit_rate"),
+                    "duration": video.get("duration"),
+                    "frame_rate": video.get("r_frame_rate"),
+                }
+            )
+        audio_streams = [s for s in streams if s.get("codec_type") == "audio"]
+        if audio_streams:
+            audio = audio_streams[0]
+            metadata.update(
+                {
+                    "audio_codec": audio.get("codec_name"),
+                    "audio_bit_rate": audio.get("bit_rate"),
+                    "sample_rate": audio.get("sample_rate"),
+                }
+            )
+        format_info = data.get("format", {})
+        metadata.update(
+            {
+                "file_size": format_info.get("size"),
+                "duration": format_info.get("duration"),
+                "bit_rate": format_info.get("bit_rate"),
+            }
+        )
+        return metadata
+
+    def probe(self, file_path: str, flush: bool = False) -> dict[str, Any] | None:
+        """
+        파일 분석 결과 반환 (캐시 우선)
+
+        Args:
+            file_path: 비디오 파일 경로
+            flush: 새로 분석한 결과를 바로 디스크 캐시에 기록할지 여부 (기본값은 메모리에만
+                반영하고 묶음 처리가 끝날 때나 flush_cache(), 프로세스 종료 시 기록)
+
+        Returns:
+            메타데이터 딕셔너리 또는 None
+        """
+        cached = self.probe_cache.get(file_path)
+        if cached is not None:
+            return cached
+        metadata = read_video_header(file_path) if self.use_header_reader else None
+        if metadata is None:
+            if not self._ffprobe_available:
+                return None
+            data = self._run_ffprobe(file_path)
+            if data is None:
+                return None
+            metadata = self._summarize_probe(data)
+        self.probe_cache.put(file_path, metadata)
+        if flush:
+            self.probe_cache.flush()
+        return metadata
+
+    def probe_files(self, file_paths: list[str]) -> dict[str, dict[str, Any] | None]:
+        """
+        여러 파일을 분석 (캐시에 없는 파일만 제한된 작업자 풀로 동시 분석)
+
+        Args:
+            file_paths: 비디오 파일 경로 리스트
+
+        Returns:
+            {파일 경로: 메타데이터 또는 None}
+        """
+        results: dict[str, dict[str, Any] | None] = {}
+        misses = []
+        for file_path in file_paths:
+            cached = self.probe_cache.get(file_path)
+            if cached is not None:
+                results[file_path] = cached
+            else:
+                misses.append(file_path)
+        if misses and (self._ffprobe_available or self.use_header_reader):
+            self.logger.info(
+                f"비디오 분석: {len(misses)}개 파일 (캐시 적중 {len(results)}개, "
+                f"동시 {self.max_workers}개)"
+            )
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="video-probe"
+            ) as executor:
+                for file_path, metadata in zip(
+                    misses,
+                    executor.map(self.probe, misses),
+                    strict=True,
+                ):
+                    results[file_path] = metadata
+            self.probe_cache.flush()
+        else:
+            for file_path in misses:
+                results[file_path] = None
+        return results
+
+    def flush_cache(self) -> None:
+        """메모리에만 반영된 분석 결과를 디스크 캐시에 기록"""
+        self.probe_cache.flush()
+
+    def _resolution_from_metadata(self, metadata: dict[str, Any] | None) -> str | None:
+        if not metadata:
             return None
+        width = metadata.get("width")
+        height = metadata.get("height")
+        if width and height:
+            return f"{width}x{height}"
+        return None
+
+    def extract_resolution(self, file_path: str) -> str | None:
+        """
+        비디오 파일에서 해상도 정보 추출
+
+        Args:
+            file_path: 비디오 파일 경로
+
+        Returns:
+            해상도 문자열 (예: "1920x1080", "1280x720") 또는 None
+        """
+        try:
+            resolution = self._resolution_from_metadata(self.probe(file_path))
         except Exception as e:
             self.logger.error(f"해상도 추출 중 오류 발생: {e}")
             return None
+        if resolution:
+            self.logger.debug(f"해상도 추출 성공: {resolution}")
+            return resolution
+        return self._fallback_resolution(file_path)
+
+    def _fallback_resolution(self, file_path: str) -> str | None:
+        """분석할 수 없는 파일은 ffprobe가 없을 때에 한해 파일명에서 추측"""
+        if self._ffprobe_available:
+            self.logger.warning("해상도 정보를 찾을 수 없습니다.")
+            return None
+        guessed_resolution = self._guess_resolution_from_filename(file_path)
+        if guessed_resolution:
+            self.logger.info(f"파일명에서 화질 추측: {guessed_resolution}")
+            return guessed_resolution
+        self.logger.warning("ffprobe가 사용 불가능하여 해상도 추출을 건너뜁니다.")
+        return None
+
+    def probe_resolutions(self, file_paths: list[str]) -> dict[str, str | None]:
+        """
+        여러 파일의 실제 해상도를 분석 (파일명 추측 없음)
+
+        Args:
+            file_paths: 비디오 파일 경로 리스트
+
+        Returns:
+            {파일 경로: "1920x1080" 형식의 해상도 또는 None}
+        """
+        probed = self.probe_files(file_paths)
+        return {path: self._resolution_from_metadata(probed.get(path)) for path in file_paths}
+
+    def _resolve_resolutions(self, file_paths: list[str]) -> dict[str, str | None]:
+        """여러 파일의 해상도를 한 번에 구함 (병렬 분석, 실패 시 파일명 추측)"""
+        probed = self.probe_resolutions(file_paths)
+        return {path: probed[path] or self._fallback_resolution(path) for path in file_paths}
 
     def _guess_resolution_from_filename(self, file_path: str) -> str | None:
         """
@@ -217,61 +527,8 @@ class VideoMetadataExtractor:
         Returns:
             메타데이터 딕셔너리 또는 None
         """
-        if not self._ffprobe_available:
-            return None
         try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_streams",
-                "-show_format",
-                str(file_path),
-            ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,  # nosec B603 - ffprobe 경로는 신뢰할 수 있음
-                timeout=30,
-            )
-            if result.returncode != 0:
-                return None
-            data = json.loads(result.stdout)
-            metadata = {}
-            video_streams = [s for s in data.get("streams", []) if s.get("codec_type") == "video"]
-            if video_streams:
-                video = video_streams[0]
-                metadata.update(
-                    {
-                        "width": video.get("width"),
-                        "height": video.get("height"),
-                        "codec_name": video.get("codec_name"),
-                        "bit_rate": video.get("bit_rate"),
-                        "duration": video.get("duration"),
-                        "frame_rate": video.get("r_frame_rate"),
-                    }
-                )
-            audio_streams = [s for s in data.get("streams", []) if s.get("codec_type") == "audio"]
-            if audio_streams:
-                audio = audio_streams[0]
-                metadata.update(
-                    {
-                        "audio_codec": audio.get("codec_name"),
-                        "audio_bit_rate": audio.get("bit_rate"),
-                        "sample_rate": audio.get("sample_rate"),
-                    }
-                )
-            format_info = data.get("format", {})
-            metadata.update(
-                {
-                    "file_size": format_info.get("size"),
-                    "duration": format_info.get("duration"),
-                    "bit_rate": format_info.get("bit_rate"),
-                }
-            )
-            return metadata
+            return self.probe(file_path)
         except Exception as e:
             self.logger.error(f"메타데이터 추출 중 오류 발생: {e}")
             return None
@@ -363,9 +620,10 @@ class VideoMetadataExtractor:
             return [], []
         self.logger.info(f"화질별 분류 시작: {len(file_paths)}개 파일")
         file_qualities = []
+        resolutions = self._resolve_resolutions(file_paths)
         for file_path in file_paths:
             try:
-                resolution = self.extract_resolution(file_path)
+                resolution = resolutions.get(file_path)
                 if resolution is None:
                     self.logger.warning(f"파일 {file_path}의 해상도를 추출할 수 없습니다.")
                     file_qualities.append((file_path, MediaQuality.UNKNOWN))
@@ -415,9 +673,10 @@ class VideoMetadataExtractor:
             }
         quality_counts: dict[str, int] = {}
         file_qualities = []
+        resolutions = self._resolve_resolutions(file_paths)
         for file_path in file_paths:
             try:
-                resolution = self.extract_resolution(file_path)
+                resolution = resolutions.get(file_path)
                 if resolution is None:
                     self.logger.warning(f"파일 {file_path}의 해상도를 추출할 수 없습니다.")
                     quality_counts[MediaQuality.UNKNOWN.value] = (
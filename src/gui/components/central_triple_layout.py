@@ -185,6 +185,8 @@ class CentralTripleLayout(QWidget):
     def set_group_table_model(self, model):
         """그룹 테이블 모델 설정"""
         self.group_table.setModel(model)
+        if getattr(model, "tmdb_client", None) is not None:
+            self.group_detail_panel.set_tmdb_client(model.tmdb_client)
 
     def set_file_table_model(self, model):
         """파일 테이블 모델 설정"""
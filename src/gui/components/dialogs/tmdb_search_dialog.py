@@ -9,7 +9,6 @@ from typing import Any
 logger = logging.getLogger(__name__)
 import contextlib
 
-import requests
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import (
@@ -28,6 +27,7 @@ from PyQt5.QtWidgets import (
 )
 
 from src.core.tmdb_client import TMDBAnimeInfo
+from src.gui.managers.poster_loader import PosterLoader
 from src.state.base_state import BaseState
 
 
@@ -75,6 +75,8 @@ class TMDBSearchDialog(BaseState, QDialog):
         self.file_info = file_info or ""
         self.failed_search_query = failed_search_query or group_title
         self.initial_results = initial_results or []
+        self.poster_loader: PosterLoader | None = None
+        self._poster_labels: dict[str, list[QLabel]] = {}
         self.init_ui()
         self.setup_connections()
         if self.initial_results:
@@ -209,6 +211,7 @@ class TMDBSearchDialog(BaseState, QDialog):
             return
         self.lblSearchStatus.setText("검색 중...")
         self.btnSearch.setEnabled(False)
+        self._cancel_poster_requests()
         self.resultsList.clear()
         self.search_worker = TMDBSearchWorker(self.tmdb_client, query)
         self.search_worker.search_completed.connect(self.on_search_completed)
@@ -287,26 +290,12 @@ class TMDBSearchDialog(BaseState, QDialog):
         poster_label = QLabel()
         poster_label.setFixedSize(100, 150)
         poster_label.setProperty("class", "card")
+        poster_label.setAlignment(Qt.AlignCenter)
+        poster_label.setText("🎬")
         if anime.poster_path:
-            try:
-                logger.info("🖼️ 포스터 로드 시도: %s", anime.poster_path)
-                poster_url = f"https://image.tmdb.org/t/p/w154{anime.poster_path}"
-                response = requests.get(poster_url, timeout=10)
-                if response.status_code == 200:
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(response.content)
-                    poster_label.setPixmap(
-                        pixmap.scaled(100, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    )
-                    logger.info("✅ 포스터 로드 성공: %s", poster_url)
-                else:
-                    logger.info("❌ 포스터 HTTP 오류: %s", response.status_code)
-            except Exception as e:
-                logger.info("❌ 포스터 로드 실패: %s", e)
-                poster_label.setText("🎬")
+            self._request_poster(poster_label, anime.poster_path)
         else:
             logger.info("⚠️ 포스터 경로 없음")
-            poster_label.setText("🎬")
         layout.addWidget(poster_label)
         info_layout = QVBoxLayout()
         try:
@@ -365,6 +354,60 @@ class TMDBSearchDialog(BaseState, QDialog):
         logger.info("✅ 위젯 생성 완료: ID=%s", anime.id)
         return widget
 
+    def _get_poster_loader(self) -> PosterLoader:
+        """포스터 로더 (닫힌 뒤 다시 열리면 새로 생성)"""
+        if self.poster_loader is None:
+            self.poster_loader = PosterLoader(self.tmdb_client, max_concurrent=4, parent=self)
+            self.poster_loader.poster_ready.connect(self._on_poster_ready)
+            self.poster_loader.poster_failed.connect(self._on_poster_failed)
+        return self.poster_loader
+
+    def _request_poster(self, poster_label: QLabel, poster_path: str):
+        """카드 포스터 요청 - 캐시에 있으면 바로 표시, 없으면 플레이스홀더 후 백그라운드 로드"""
+        cached_path = self._get_poster_loader().request(poster_path, "card")
+        if cached_path:
+            self._set_card_poster(poster_label, cached_path)
+            return
+        self._poster_labels.setdefault(poster_path, []).append(poster_label)
+
+    def _set_card_poster(self, poster_label: QLabel, image_path: str) -> bool:
+        pixmap = QPixmap(image_path)
+        if pixmap.isNull():
+            return False
+        if pixmap.width() > 100 or pixmap.height() > 150:
+            pixmap = pixmap.scaled(100, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            poster_label.setPixmap(pixmap)
+        except RuntimeError:
+            # 결과 목록이 다시 그려지면서 라벨이 이미 삭제됨
+            return False
+        return True
+
+    def _on_poster_ready(self, poster_path: str, variant: str, image_path: str):
+        """백그라운드 포스터 로드 완료"""
+        for poster_label in self._poster_labels.pop(poster_path, []):
+            self._set_card_poster(poster_label, image_path)
+
+    def _on_poster_failed(self, poster_path: str, variant: str):
+        """백그라운드 포스터 로드 실패 - 플레이스홀더 유지"""
+        logger.info("❌ 포스터 로드 실패: %s", poster_path)
+        self._poster_labels.pop(poster_path, None)
+
+    def _cancel_poster_requests(self):
+        """검색어 변경 시 이전 결과의 포스터 요청 취소"""
+        self._poster_labels.clear()
+        if self.poster_loader is not None:
+            self.poster_loader.cancel_pending()
+
+    def done(self, result: int):
+        """다이얼로그 종료 시 포스터 로더 정리"""
+        self._poster_labels.clear()
+        if self.poster_loader is not None:
+            self.poster_loader.shutdown()
+            self.poster_loader.deleteLater()
+            self.poster_loader = None
+        super().done(result)
+
     def on_result_selected(self, item: QListWidgetItem):
         """결과 아이템 선택"""
         index = self.resultsList.row(item)
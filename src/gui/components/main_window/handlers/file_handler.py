@@ -69,12 +69,15 @@ class MainWindowFileHandler:
             file_items = []
 
             from src.core.file_parser import FileParser
+            from src.core.file_snapshot import capture_snapshot
 
             file_parser = FileParser()
 
             for file_path in file_paths:
                 path_obj = Path(file_path)
-                if path_obj.exists():
+                # exists()와 stat() 대신 스냅샷 한 번 (이후 단계에서도 재사용)
+                snapshot = capture_snapshot(path_obj)
+                if snapshot is not None:
                     # anitopy로 파일명 파싱
                     parsed_metadata = file_parser.extract_metadata(path_obj.name)
                     title = parsed_metadata.get("title") or self._extract_title_from_filename(
@@ -85,7 +88,8 @@ class MainWindowFileHandler:
                     file_info = {
                         "file_path": str(path_obj),
                         "file_name": path_obj.name,
-                        "file_size": path_obj.stat().st_size,
+                        "file_size": snapshot.size,
+                        "snapshot": snapshot,
                         "file_extension": path_obj.suffix.lower(),
                         "status": "pending",  # 기본 상태
                         "tmdb_match": None,
@@ -135,6 +139,7 @@ class MainWindowFileHandler:
                             subtitles=parsed_metadata.get("subtitles"),
                             crc32=parsed_metadata.get("crc32"),
                             parsingConfidence=parsed_metadata.get("confidence"),
+                            snapshot=file_info["snapshot"],
                         )
                         self.main_window.anime_data_manager.add_item(parsed_item)
 
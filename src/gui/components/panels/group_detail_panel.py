@@ -34,6 +34,8 @@ class GroupDetailPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.poster_loader = None
+        self._pending_poster_path: str | None = None
         self.init_ui()
         self.setup_accessibility()
 
@@ -153,6 +155,47 @@ class GroupDetailPanel(QWidget):
                 logger.info("❌ URL 포스터 다운로드 실패: %s", e)
         self.set_poster_placeholder("200×300")
 
+    def set_tmdb_client(self, tmdb_client):
+        """TMDB 포스터를 백그라운드에서 불러올 클라이언트 설정"""
+        from src.gui.managers.poster_loader import PosterLoader
+
+        if self.poster_loader is not None:
+            self.poster_loader.shutdown()
+            self.poster_loader.deleteLater()
+            self.poster_loader = None
+        if tmdb_client is not None and hasattr(tmdb_client, "get_poster_thumbnail_path"):
+            self.poster_loader = PosterLoader(tmdb_client, max_concurrent=1, parent=self)
+            self.poster_loader.poster_ready.connect(self._on_poster_ready)
+            self.poster_loader.poster_failed.connect(self._on_poster_failed)
+
+    def set_tmdb_poster(self, tmdb_poster_path: str) -> bool:
+        """TMDB 포스터를 상세 패널용 썸네일로 표시 (없으면 플레이스홀더 후 백그라운드 로드)
+
+        Returns:
+            로더가 없어 처리하지 못했으면 False
+        """
+        if self.poster_loader is None:
+            return False
+        self.poster_loader.cancel_pending()
+        self._pending_poster_path = None
+        cached_path = self.poster_loader.request(tmdb_poster_path, "detail")
+        if cached_path:
+            self.set_poster(cached_path)
+        else:
+            self._pending_poster_path = tmdb_poster_path
+            self.set_poster_placeholder("⏳")
+        return True
+
+    def _on_poster_ready(self, tmdb_poster_path: str, variant: str, image_path: str):
+        if tmdb_poster_path == self._pending_poster_path:
+            self._pending_poster_path = None
+            self.set_poster(image_path)
+
+    def _on_poster_failed(self, tmdb_poster_path: str, variant: str):
+        if tmdb_poster_path == self._pending_poster_path:
+            self._pending_poster_path = None
+            self.set_poster_placeholder("200×300")
+
     def set_poster_placeholder(self, text: str):
         """포스터 플레이스홀더 설정"""
         self.poster_label.clear()
@@ -221,6 +264,7 @@ class GroupDetailPanel(QWidget):
 
     def clear_content(self):
         """내용 초기화"""
+        self._pending_poster_path = None
         self.set_poster_placeholder("200×300")
         self.set_metadata({})
         self.set_tags([])
@@ -255,16 +299,13 @@ class GroupDetailPanel(QWidget):
         poster_path = group_data.get("poster_path", "")
         poster_url = group_data.get("poster_url", "")
         tmdb_match = group_data.get("tmdb_match")
-        if (
-            tmdb_match
-            and hasattr(tmdb_match, "poster_path")
-            and tmdb_match.poster_path
-            and not poster_url
-        ):
-            poster_url = f"https://image.tmdb.org/t/p/w500{tmdb_match.poster_path}"
+        tmdb_poster_path = getattr(tmdb_match, "poster_path", None) if tmdb_match else None
+        if tmdb_poster_path and not poster_url:
+            poster_url = f"https://image.tmdb.org/t/p/w500{tmdb_poster_path}"
             logger.info("🎯 TMDB 포스터 URL 생성: %s", poster_url)
         tags = group_data.get("tags", [])
-        self.set_poster(poster_path, poster_url)
+        if not (tmdb_poster_path and self.set_tmdb_poster(tmdb_poster_path)):
+            self.set_poster(poster_path, poster_url)
         self.set_metadata(metadata)
         self.set_tags(tags)
         title = metadata.get("title", "제목 없음")
@@ -109,6 +109,7 @@ class ResultsView(QTabWidget):
         self.addTab(self.conflict_tab, "💥 충돌")
         self.duplicate_tab = self.create_tab_content("🔄 중복")
         self.addTab(self.duplicate_tab, "🔄 중복")
+        self.create_duplicate_files_view()
         self.completed_tab = self.create_tab_content("✅ 완료")
         self.addTab(self.completed_tab, "✅ 완료")
 
@@ -202,6 +203,25 @@ class ResultsView(QTabWidget):
             self.completed_splitter = splitter
         return tab_widget
 
+    def create_duplicate_files_view(self):
+        """중복 탭 아래에 내용이 같은 파일 검사 뷰 추가"""
+        from src.gui.components.views.duplicate_tab_view import DuplicateTabView
+
+        self.duplicate_files_view = DuplicateTabView()
+        self.duplicate_files_view.scan_requested.connect(self.start_duplicate_scan)
+        self.duplicate_splitter.addWidget(self.duplicate_files_view)
+        self.duplicate_splitter.setSizes([300, 200, 300])
+
+    def start_duplicate_scan(self):
+        """메인 윈도우의 소스/대상 폴더에서 내용이 같은 파일 검사 시작"""
+        window = self.window()
+        directories: list[str] = []
+        for attribute in ("source_directory", "destination_directory"):
+            directory = getattr(window, attribute, None)
+            if directory and directory not in directories:
+                directories.append(directory)
+        return self.duplicate_files_view.start_duplicate_scan(directories)
+
     def setup_connections(self):
         """시그널 연결 설정"""
         logger.info("🔧 setup_connections 호출됨")
@@ -251,6 +271,7 @@ class ResultsView(QTabWidget):
         for table in tables:
             table.setModel(model)
             self.adjust_group_table_columns(table, model)
+            self._install_poster_prefetcher(table)
         if not self.filter_manager:
             self.setup_filter_manager()
         if self.filter_manager:
@@ -270,6 +291,16 @@ class ResultsView(QTabWidget):
         for table in tables:
             table.setModel(model)
             self.adjust_detail_table_columns(table, model)
+            self._install_poster_prefetcher(table)
+
+    def _install_poster_prefetcher(self, table):
+        """보이는 행의 포스터를 백그라운드에서 미리 받아오도록 테이블에 프리페처 연결"""
+        if getattr(table, "_poster_prefetcher", None) is None:
+            from src.gui.managers.poster_loader import PosterViewportPrefetcher
+
+            table._poster_prefetcher = PosterViewportPrefetcher(table)
+        else:
+            table._poster_prefetcher.schedule()
 
     def adjust_group_table_columns(self, table, model):
         """그룹 테이블 컬럼 크기 조정"""
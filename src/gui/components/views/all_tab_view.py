@@ -5,7 +5,7 @@
 import logging
 
 logger = logging.getLogger(__name__)
-from src.base_tab_view import BaseTabView
+from src.gui.components.views.base_tab_view import BaseTabView
 
 
 class AllTabView(BaseTabView):
@@ -9,7 +9,7 @@ from PyQt5.QtCore import QModelIndex, Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QLabel, QSizePolicy, QTableView, QVBoxLayout, QWidget
 
-from src.advanced_splitter import AdvancedSplitter, SplitterControlPanel
+from src.gui.components.advanced_splitter import AdvancedSplitter, SplitterControlPanel
 
 
 class BaseTabView(QWidget):
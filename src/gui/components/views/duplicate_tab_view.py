@@ -1,15 +1,211 @@
 """
 중복 탭 뷰 클래스 - 중복 파일 그룹을 표시하는 탭
+
+DuplicateScanTask가 내용이 같은 파일 묶음을 찾을 때마다 행을 추가하므로 검사가 끝나기
+전에도 큰 중복부터 볼 수 있습니다. 결과 뷰의 중복 탭에 들어가며, 검사 버튼을 누르면
+scan_requested 시그널로 검사할 폴더를 요청합니다.
 """
 
 import logging
 
 logger = logging.getLogger(__name__)
-from src.base_tab_view import BaseTabView
+from pathlib import Path
+
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QHBoxLayout, QLabel, QPushButton
+
+from src.core.duplicate_detector import DuplicateGroup, FingerprintCache
+from src.gui.components.views.base_tab_view import BaseTabView
+
+GROUP_HEADERS = ["파일 수", "크기", "중복 용량", "대표 파일"]
+DETAIL_HEADERS = ["파일명", "폴더"]
+
+
+def _format_size(size_bytes: int) -> str:
+    size = float(size_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} TB"
 
 
 class DuplicateTabView(BaseTabView):
     """중복 탭 뷰 클래스"""
 
+    # 검사 버튼을 눌렀을 때 (검사할 폴더는 연결한 쪽에서 정해 start_duplicate_scan 호출)
+    scan_requested = pyqtSignal()
+
     def __init__(self, parent=None):
-        super().__init__("🔄 중복", "📋 중복 애니메이션 그룹", parent)
+        self._groups: list[DuplicateGroup] = []
+        self._wasted_bytes = 0
+        self._scan_task_id: str | None = None
+        # 같은 세션의 다음 검사에서 바뀌지 않은 파일은 다시 읽지 않음
+        self._fingerprint_cache = FingerprintCache()
+        super().__init__("🧬 내용이 같은 파일", "📋 중복 파일 묶음", parent)
+
+    def init_ui(self):
+        """UI 초기화 (요약 라벨과 검사/취소 버튼 추가)"""
+        super().init_ui()
+        self.summary_label = QLabel("중복 검사 전")
+        self.scan_button = QPushButton("🔍 중복 검사")
+        self.scan_button.setToolTip("소스/대상 폴더에서 내용이 같은 파일을 찾습니다")
+        self.scan_button.clicked.connect(self.scan_requested.emit)
+        self.cancel_button = QPushButton("⏹ 취소")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_duplicate_scan)
+        status_row = QHBoxLayout()
+        status_row.addWidget(self.summary_label, 1)
+        status_row.addWidget(self.scan_button)
+        status_row.addWidget(self.cancel_button)
+        self.layout().insertLayout(1, status_row)
+
+    def setup_connections(self):
+        """모델 설정 후 시그널 연결"""
+        self.duplicate_model = QStandardItemModel(0, len(GROUP_HEADERS), self)
+        self.duplicate_model.setHorizontalHeaderLabels(GROUP_HEADERS)
+        self.duplicate_files_model = QStandardItemModel(0, len(DETAIL_HEADERS), self)
+        self.duplicate_files_model.setHorizontalHeaderLabels(DETAIL_HEADERS)
+        self.set_group_model(self.duplicate_model)
+        self.set_detail_model(self.duplicate_files_model)
+        super().setup_connections()
+        self.group_selected.connect(self._show_group_files)
+
+    @staticmethod
+    def _group_data(group: DuplicateGroup) -> dict:
+        return {
+            "size": group.size,
+            "digest": group.digest,
+            "paths": [str(path) for path in group.paths],
+            "wasted_bytes": group.wasted_bytes,
+        }
+
+    @pyqtSlot(object)
+    def add_duplicate_group(self, group: DuplicateGroup):
+        """찾은 중복 묶음을 한 행으로 추가"""
+        data = self._group_data(group)
+        row = [
+            QStandardItem(str(len(group.paths))),
+            QStandardItem(_format_size(group.size)),
+            QStandardItem(_format_size(group.wasted_bytes)),
+            QStandardItem(group.paths[0].name),
+        ]
+        for item in row:
+            item.setEditable(False)
+            item.setData(data, Qt.UserRole)
+        row[3].setToolTip("\n".join(data["paths"]))
+        self.duplicate_model.appendRow(row)
+        self._groups.append(group)
+        self._wasted_bytes += group.wasted_bytes
+        self._update_summary()
+
+    def clear_duplicates(self):
+        """표시 중인 중복 묶음 모두 제거"""
+        self.duplicate_model.removeRows(0, self.duplicate_model.rowCount())
+        self.duplicate_files_model.removeRows(0, self.duplicate_files_model.rowCount())
+        self._groups.clear()
+        self._wasted_bytes = 0
+        self._update_summary()
+
+    @property
+    def duplicate_groups(self) -> list[DuplicateGroup]:
+        return list(self._groups)
+
+    def _set_scanning(self, scanning: bool):
+        self.scan_button.setEnabled(not scanning)
+        self.cancel_button.setEnabled(scanning)
+
+    def _update_summary(self, suffix: str = ""):
+        self.summary_label.setText(
+            f"중복 묶음 {len(self._groups)}개, 정리 가능 용량 {_format_size(self._wasted_bytes)}"
+            f"{suffix}"
+        )
+
+    def _show_group_files(self, group_data: dict):
+        """선택한 묶음의 파일 목록 표시"""
+        self.duplicate_files_model.removeRows(0, self.duplicate_files_model.rowCount())
+        for path in map(Path, group_data.get("paths", [])):
+            row = [QStandardItem(path.name), QStandardItem(str(path.parent))]
+            for item in row:
+                item.setEditable(False)
+            self.duplicate_files_model.appendRow(row)
+
+    def start_duplicate_scan(
+        self,
+        directories: list[str],
+        cache: FingerprintCache | None = None,
+        extensions: set[str] | None = None,
+        event_bus=None,
+    ) -> str | None:
+        """
+        중복 검사를 백그라운드 작업으로 시작 (진행 중인 검사는 취소)
+
+        Returns:
+            제출한 작업 ID (제출 실패 시 None)
+        """
+        self.cancel_duplicate_scan()
+        self.clear_duplicates()
+        if not directories:
+            self._update_summary(" (검사할 폴더를 먼저 선택하세요)")
+            return None
+        try:
+            from src.app import IBackgroundTaskService, get_service
+            from src.app.services.duplicate_scan_task import DuplicateScanTask
+
+            task = DuplicateScanTask(
+                directories,
+                cache if cache is not None else self._fingerprint_cache,
+                extensions,
+                event_bus=event_bus,
+            )
+            task.duplicate_signals.group_found.connect(self.add_duplicate_group)
+            task.signals.completed.connect(self._on_scan_completed)
+            task.signals.failed.connect(self._on_scan_failed)
+            task.signals.cancelled.connect(self._on_scan_cancelled)
+            self._scan_task_id = get_service(IBackgroundTaskService).submit_task(task)
+        except Exception as e:
+            logger.info("⚠️ 중복 검사 작업 제출 실패: %s", e)
+            self._update_summary(" (검사 시작 실패)")
+            return None
+        self._set_scanning(True)
+        self._update_summary(" (검사 중)")
+        logger.info("📋 중복 검사 작업 제출: %s", self._scan_task_id)
+        return self._scan_task_id
+
+    def cancel_duplicate_scan(self) -> bool:
+        """진행 중인 중복 검사 취소 (이미 표시한 묶음은 유지)"""
+        if not self._scan_task_id:
+            return False
+        try:
+            from src.app import IBackgroundTaskService, get_service
+
+            return get_service(IBackgroundTaskService).cancel_task(self._scan_task_id)
+        except Exception as e:
+            logger.info("⚠️ 중복 검사 취소 실패: %s", e)
+            return False
+        finally:
+            self._scan_task_id = None
+            self._set_scanning(False)
+            self._update_summary(" (취소됨)")
+
+    def _finish_scan(self, task_id: str, suffix: str) -> None:
+        if task_id != self._scan_task_id:
+            return
+        self._scan_task_id = None
+        self._set_scanning(False)
+        self._update_summary(suffix)
+
+    @pyqtSlot(str, object)
+    def _on_scan_completed(self, task_id: str, result):
+        data = getattr(result, "result_data", None) or {}
+        self._finish_scan(task_id, " (취소됨)" if data.get("cancelled") else " (검사 완료)")
+
+    @pyqtSlot(str, str, str)
+    def _on_scan_failed(self, task_id: str, error_message: str, _details: str):
+        logger.info("⚠️ 중복 검사 실패: %s", error_message)
+        self._finish_scan(task_id, " (검사 실패)")
+
+    @pyqtSlot(str, str)
+    def _on_scan_cancelled(self, task_id: str, _reason: str):
+        self._finish_scan(task_id, " (취소됨)")
@@ -15,6 +15,7 @@ from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from PyQt5.QtWidgets import QFileDialog
 
 from src.core.file_parser import FileParser
+from src.core.file_snapshot import FileSnapshot, capture_snapshot
 from src.interfaces.i_controller import IController
 from src.interfaces.i_event_bus import Event, IEventBus
 
@@ -47,7 +48,9 @@ class FileProcessingWorker(QThread):
                     progress = int(i / total_files * 100)
                     filename = Path(file_path).name
                     self.progress_updated.emit(progress, f"처리 중: {filename}")
-                    if not self._validate_file_size(file_path):
+                    # 파일마다 stat은 한 번만: 크기 검사와 sizeMB 모두 스냅샷 사용
+                    snapshot = capture_snapshot(Path(file_path))
+                    if not self._validate_file_size(snapshot):
                         self.logger.warning(f"파일 크기가 너무 작음: {filename}")
                         continue
                     parsed_metadata = self.file_parser.parse_filename(file_path)
@@ -65,12 +68,9 @@ class FileProcessingWorker(QThread):
                             group=parsed_metadata.group or "Unknown",
                             status="pending",
                             parsingConfidence=parsed_metadata.confidence or 0.0,
+                            sizeMB=snapshot.size_mb,
+                            snapshot=snapshot,
                         )
-                        try:
-                            file_size = Path(file_path).stat().st_size
-                            parsed_item.sizeMB = file_size / (1024 * 1024)
-                        except OSError:
-                            parsed_item.sizeMB = 0
                         parsed_items.append(parsed_item)
                         self.file_processed.emit(parsed_item)
                         self.logger.debug(f"파싱 성공: {filename} -> {parsed_metadata.title}")
@@ -81,6 +81,7 @@ class FileProcessingWorker(QThread):
                             title="Unknown",
                             status="error",
                             parsingConfidence=0.0,
+                            snapshot=snapshot,
                         )
                         parsed_items.append(parsed_item)
                         self.logger.warning(f"파싱 실패: {filename}")
@@ -99,13 +100,9 @@ class FileProcessingWorker(QThread):
         """처리 중단"""
         self._should_stop = True
 
-    def _validate_file_size(self, file_path: str) -> bool:
-        """파일 크기 유효성 검사"""
-        try:
-            file_size = Path(file_path).stat().st_size
-            return file_size >= 1024 * 1024
-        except OSError:
-            return False
+    def _validate_file_size(self, snapshot: FileSnapshot | None) -> bool:
+        """파일 크기 유효성 검사 (없는 파일은 실패)"""
+        return snapshot is not None and snapshot.size >= 1024 * 1024
 
 
 class FileProcessingController(IController):
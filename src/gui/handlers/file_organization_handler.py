@@ -6,17 +6,29 @@
 import logging
 
 logger = logging.getLogger(__name__)
-import os
+from functools import partial
 from pathlib import Path
 
-from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QObject, pyqtSlot
 from PyQt5.QtWidgets import QDialog, QMessageBox
 
 from src.app.file_processing_events import FileProcessingFailedEvent, FileProcessingStartedEvent
+from src.core.destination_index import (
+    DestinationLibraryIndex,
+    DuplicateAction,
+    replace_file_in_place,
+    retire_replaced_file,
+)
+from src.core.file_snapshot import StaleFileError, verify_snapshot
+from src.core.quality_planner import QualitySeparationPlanner
 from src.core.services.unified_file_organization_service import (
     FileOrganizationConfig,
     UnifiedFileOrganizationService,
 )
+from src.core.utils.copy_engine import move_file
+from src.core.utils.directory_batch import DirectoryCache
+from src.core.utils.empty_dir_cleanup import remove_empty_directories
+from src.core.utils.subtitle_utils import SidecarIndex
 from src.gui.components.dialogs.organize_preflight_dialog import OrganizePreflightDialog
 
 
@@ -32,6 +44,12 @@ class FileOrganizationHandler(QObject):
             safe_mode=True, backup_before_operation=True, overwrite_existing=False
         )
         self.unified_service = UnifiedFileOrganizationService(config)
+        self.quality_planner = QualitySeparationPlanner()
+        # False면 정리 후 빈 디렉토리 삭제를 건너뜀
+        self.cleanup_empty_directories = True
+        self._cleanup_task_id = None
+        # 백그라운드 정리 결과를 반영할 정리 결과 객체
+        self._cleanup_result = None
 
     def init_preflight_system(self):
         """Preflight System 초기화"""
@@ -149,22 +167,8 @@ class FileOrganizationHandler(QObject):
             source_directories = set()
             self._process_groups_by_quality(group_qualities, result, source_directories)
 
-            # 빈 디렉토리 정리
-            logger.info("🧹 빈 디렉토리 정리를 시작합니다...")
-            logger.info("🔍 정리할 소스 디렉토리들: %s", list(source_directories))
-            cleaned_dirs = self._cleanup_empty_directories_from_source_dirs(source_directories)
-            result.cleaned_directories = cleaned_dirs
-            logger.info("✅ 빈 디렉토리 정리 완료: %s개 디렉토리 삭제", cleaned_dirs)
-
-            # 추가로 전체 소스 디렉토리에서 빈 폴더 정리
-            if hasattr(self.main_window, "source_directory") and self.main_window.source_directory:
-                logger.info(
-                    "🗂️ 전체 소스 디렉토리에서 빈 폴더 정리 시작: %s",
-                    self.main_window.source_directory,
-                )
-                anime_cleaned = self._cleanup_anime_directories()
-                result.cleaned_directories += anime_cleaned
-                logger.info("🗑️ 전체 소스 디렉토리 정리 완료: %s개 디렉토리 삭제", anime_cleaned)
+            # 빈 디렉토리 정리 (이번 작업이 건드린 디렉토리만, 백그라운드)
+            result.cleaned_directories = self._start_directory_cleanup(source_directories, result)
 
             result.total_count = result.success_count + result.error_count + result.skip_count
         except Exception as e:
@@ -189,66 +193,116 @@ class FileOrganizationHandler(QObject):
         return result
 
     def _prepare_group_qualities(self, grouped_items):
-        """그룹별로 화질 정보를 준비"""
-        group_qualities = {}
+        """그룹별로 화질 정보를 준비 (파일명 우선, 결정할 수 없는 파일만 분석)"""
+        existing_items = {}
         for group_key, group_items in grouped_items.items():
             if not isinstance(group_items, list):
                 continue
-            files = []
-            for item in group_items:
-                if hasattr(item, "sourcePath") and Path(item.sourcePath).exists():
-                    # 해상도 정보 추출
-                    resolution = ""
-                    if hasattr(item, "resolution") and item.resolution:
-                        resolution = item.resolution
-                    else:
-                        # 파일명에서 해상도 추출 시도
-                        filename = Path(item.sourcePath).name
-                        import re
-
-                        resolution_match = re.search(r"(\d{3,4}p)", filename, re.IGNORECASE)
-                        if resolution_match:
-                            resolution = resolution_match.group(1).lower()
-
-                    files.append(
-                        {
-                            "item": item,
-                            "source_path": item.sourcePath,
-                            "normalized_path": self._norm(item.sourcePath),
-                            "resolution": resolution,
-                        }
-                    )
-            if files:
-                group_qualities[group_key] = files
+            existing_items[group_key] = [
+                item
+                for item in group_items
+                if hasattr(item, "sourcePath")
+                # 스캔 스냅샷이 있으면 존재 확인은 실행 직전 한 번으로 미룸
+                and (getattr(item, "snapshot", None) is not None or Path(item.sourcePath).exists())
+            ]
+        group_qualities = {}
+        for group_key, decisions in self.quality_planner.plan(existing_items).items():
+            group_qualities[group_key] = [
+                {
+                    "item": decision.item,
+                    "source_path": decision.source_path,
+                    "normalized_path": self._norm(decision.source_path),
+                    "resolution": decision.resolution,
+                    "is_best": decision.is_best,
+                }
+                for decision in decisions
+            ]
         return group_qualities
 
+    def _cleanup_roots(self) -> list[str]:
+        """빈 디렉토리 정리에서 보호할 루트 (소스 폴더)"""
+        source_directory = getattr(self.main_window, "source_directory", None)
+        return [source_directory] if source_directory else []
+
+    def _start_directory_cleanup(self, source_directories: set, result=None) -> int:
+        """
+        빈 디렉토리 정리를 백그라운드 작업으로 시작
+
+        Args:
+            source_directories: 이번 작업에서 파일이 빠져나간 디렉토리
+            result: 작업이 끝나면 삭제한 디렉토리 수를 반영할 정리 결과
+
+        Returns:
+            바로 삭제한 디렉토리 수 (백그라운드로 넘기면 0, 결과는 완료 시 result에 반영)
+        """
+        if not self.cleanup_empty_directories or not source_directories:
+            logger.info("⏭️ 빈 디렉토리 정리 건너뜀")
+            return 0
+        logger.info("🧹 빈 디렉토리 정리 시작: %s개 위치", len(source_directories))
+        try:
+            from src.app import IBackgroundTaskService, get_service
+            from src.app.services.directory_cleanup_task import DirectoryCleanupTask
+
+            task = DirectoryCleanupTask(
+                source_directories, self._cleanup_roots(), event_bus=self.event_bus
+            )
+            task.signals.completed.connect(self._on_cleanup_completed)
+            task.signals.failed.connect(self._on_cleanup_finished)
+            task.signals.cancelled.connect(self._on_cleanup_finished)
+            self._cleanup_result = result
+            self._cleanup_task_id = get_service(IBackgroundTaskService).submit_task(task)
+            logger.info("📋 빈 디렉토리 정리 작업 제출: %s", self._cleanup_task_id)
+            return 0
+        except Exception as e:
+            logger.info("⚠️ 백그라운드 정리 작업 제출 실패, 바로 정리합니다: %s", e)
+            return self._cleanup_empty_directories_from_source_dirs(source_directories)
+
+    @pyqtSlot(str, object)
+    def _on_cleanup_completed(self, task_id: str, task_result) -> None:
+        """백그라운드 정리 결과를 정리 결과와 상태 표시줄에 반영 (UI 스레드)"""
+        if task_id != self._cleanup_task_id:
+            return
+        data = getattr(task_result, "result_data", None) or {}
+        removed_count = data.get("removed_count", 0)
+        if self._cleanup_result is not None:
+            self._cleanup_result.cleaned_directories += removed_count
+        self._on_cleanup_finished(task_id)
+        if removed_count:
+            self.main_window.update_status_bar(f"빈 디렉토리 정리 완료: {removed_count}개 삭제")
+
+    @pyqtSlot(str)
+    @pyqtSlot(str, str)
+    @pyqtSlot(str, str, str)
+    def _on_cleanup_finished(self, task_id: str, *_details: str) -> None:
+        if task_id == self._cleanup_task_id:
+            self._cleanup_task_id = None
+            self._cleanup_result = None
+
+    def cancel_directory_cleanup(self) -> bool:
+        """진행 중인 빈 디렉토리 정리 작업 취소"""
+        if not self._cleanup_task_id:
+            return False
+        try:
+            from src.app import IBackgroundTaskService, get_service
+
+            return get_service(IBackgroundTaskService).cancel_task(self._cleanup_task_id)
+        except Exception as e:
+            logger.info("⚠️ 빈 디렉토리 정리 취소 실패: %s", e)
+            return False
+        finally:
+            self._cleanup_task_id = None
+
     def _cleanup_empty_directories_from_source_dirs(self, source_directories: set) -> int:
-        """소스 디렉토리들에서 빈 디렉토리 정리"""
-        cleaned_count = 0
-        for source_dir in source_directories:
-            try:
-                if not Path(source_dir).exists():
-                    continue
-                cleaned_count += self._remove_empty_dirs_recursive(source_dir)
-                cleaned_count += self._cleanup_parent_directories(source_dir)
-            except Exception as e:
-                logger.info("⚠️ 디렉토리 정리 중 오류 (%s): %s", source_dir, e)
-        return cleaned_count
+        """소스 디렉토리들에서 빈 디렉토리 정리 (이번 작업이 건드린 디렉토리만)"""
+        cleanup = remove_empty_directories(source_directories, self._cleanup_roots())
+        logger.info("✅ 빈 디렉토리 정리 완료: %s개 디렉토리 삭제", cleanup.removed_count)
+        return cleanup.removed_count
 
     def _cleanup_empty_directories_from_plans(self, organization_plans) -> int:
         """조직화 계획에서 소스 디렉토리들을 정리"""
-        cleaned_count = 0
-        source_directories = set()
-        for plan in organization_plans:
-            source_directories.add(str(plan.source_path.parent))
-        for source_dir in source_directories:
-            try:
-                if Path(source_dir).exists():
-                    cleaned_count += self._remove_empty_dirs_recursive(source_dir)
-                    cleaned_count += self._cleanup_parent_directories(source_dir)
-            except Exception as e:
-                logger.info("⚠️ 디렉토리 정리 중 오류 (%s): %s", source_dir, e)
-        return cleaned_count
+        return self._cleanup_empty_directories_from_source_dirs(
+            {str(plan.source_path.parent) for plan in organization_plans}
+        )
 
     def _process_subtitle_files(self, video_path: str, target_dir: Path, result):
         """비디오 파일과 연관된 자막 파일들을 처리합니다"""
@@ -260,14 +314,13 @@ class FileOrganizationHandler(QObject):
                 try:
                     subtitle_filename = Path(subtitle_path).name
                     subtitle_target_path = target_dir / subtitle_filename
-                    import shutil
 
                     # 대상 자막 파일이 이미 존재하면 삭제 (오버라이팅)
                     if subtitle_target_path.exists():
                         logger.info("🔄 기존 자막 파일 덮어쓰기: %s", subtitle_filename)
                         subtitle_target_path.unlink()
 
-                    shutil.move(subtitle_path, subtitle_target_path)
+                    move_file(subtitle_path, subtitle_target_path)
                     result.subtitle_count += 1
                     logger.info("✅ 자막 이동 성공: %s", subtitle_filename)
                 except Exception as e:
@@ -276,38 +329,18 @@ class FileOrganizationHandler(QObject):
             logger.info("⚠️ 자막 파일 처리 중 오류: %s", e)
 
     def _find_subtitle_files(self, video_path: str) -> list[str]:
-        """비디오 파일과 연관된 자막 파일들을 찾습니다"""
-        subtitle_files = []
-        subtitle_extensions = {
-            ".srt",
-            ".ass",
-            ".ssa",
-            ".sub",
-            ".vtt",
-            ".idx",
-            ".smi",
-            ".sami",
-            ".txt",
-        }
+        """비디오 파일과 연관된 자막 파일들을 찾습니다
+
+        일괄 정리 중에는 미리 연결해 둔 자막을 쓰고, 그 밖에는 디렉토리 색인으로 찾습니다.
+        """
         try:
-            video_dir = str(Path(video_path).parent)
-            video_basename = Path(video_path).stem
-            for file_path_obj in Path(video_dir).iterdir():
-                if not file_path_obj.is_file():
-                    continue
-                file_ext = file_path_obj.suffix.lower()
-                if file_ext not in subtitle_extensions:
-                    continue
-                subtitle_basename = file_path_obj.stem
-                if subtitle_basename == video_basename:
-                    subtitle_files.append(str(file_path_obj))
-                    continue
-                if video_basename in subtitle_basename:
-                    subtitle_files.append(str(file_path_obj))
-                    continue
+            sidecars = getattr(self, "_planned_sidecars", None)
+            if sidecars is not None and Path(video_path) in sidecars:
+                return [str(path) for path in sidecars[Path(video_path)]]
+            return [str(path) for path in SidecarIndex().find(video_path)]
         except Exception as e:
             logger.info("⚠️ 자막 파일 검색 중 오류: %s", e)
-        return subtitle_files
+            return []
 
     def _norm(self, path: str) -> str:
         """경로 정규화: 대소문자/유니코드/중복공백 통일"""
@@ -322,38 +355,29 @@ class FileOrganizationHandler(QObject):
 
     def _process_groups_by_quality(self, group_qualities: dict, result, source_directories: set):
         """그룹별로 화질을 분석하여 파일들을 분류하고 이동"""
-        import shutil
         from pathlib import Path
 
+        # 자막은 이동을 시작하기 전에 원본 디렉토리마다 한 번 색인해서 전체 배치로 연결
+        self._planned_sidecars = SidecarIndex().associate(
+            file_info["source_path"] for files in group_qualities.values() for file_info in files
+        )
+        # 대상 디렉토리는 처음 나올 때 한 번만 만들고 이후에는 캐시만 확인
+        self._directory_cache = DirectoryCache()
+        # 대상 라이브러리에 이미 있는 에피소드는 옮기기 전에 판정 (시즌 폴더마다 목록 조회 한 번)
+        self._library_index = DestinationLibraryIndex(Path(self.main_window.destination_directory))
         for group_key, files in group_qualities.items():
             if not files:
                 continue
             logger.info("🎬 그룹 '%s' 화질 분석 시작 (%s개 파일)", group_key, len(files))
             logger.info("🧪 plan: %s items in %s", len(files), group_key)
-            quality_priority = {
-                "4k": 5,
-                "2k": 4,
-                "1440p": 3,
-                "1080p": 2,
-                "720p": 1,
-                "480p": 0,
-                "": -1,
-            }
-            file_qualities = []
-            for file_info in files:
-                resolution = file_info["resolution"]
-                priority = quality_priority.get(resolution, -1)
-                file_qualities.append({**file_info, "priority": priority})
-            if file_qualities:
-                highest_priority = max(fq["priority"] for fq in file_qualities)
-                logger.info("🎯 그룹 '%s' 최고 화질 우선순위: %s", group_key, highest_priority)
-                for file_info in file_qualities:
+            best_resolutions = {fq["resolution"] for fq in files if fq["is_best"]}
+            logger.info("🎯 그룹 '%s' 최고 화질: %s", group_key, ", ".join(best_resolutions))
+            if files:
+                for file_info in files:
                     try:
                         item = file_info["item"]
                         source_path = file_info["source_path"]
-                        normalized_path = self._norm(source_path)
-                        priority = file_info["priority"]
-                        resolution = file_info["resolution"]
+                        normalized_path = file_info["normalized_path"]
                         logger.info("➡️ trying: %s", normalized_path)
                         if normalized_path in result._processed_sources:
                             logger.info(
@@ -362,13 +386,25 @@ class FileOrganizationHandler(QObject):
                             result.skip_count += 1
                             result.skipped_files.append(normalized_path)
                             continue
-                        if not Path(source_path).exists():
+                        # 이동 직전 한 번만 stat: 스캔 이후 바뀐 파일은 옮기지 않음
+                        snapshot = getattr(item, "snapshot", None)
+                        try:
+                            if snapshot is not None:
+                                verify_snapshot(snapshot, Path(source_path))
+                            elif not Path(source_path).exists():
+                                raise FileNotFoundError(source_path)
+                        except FileNotFoundError:
                             logger.info(
                                 "⏭️ [이동후소실] skip-missing(post-move-ghost): %s", normalized_path
                             )
                             result.skip_count += 1
                             result.skipped_files.append(normalized_path)
                             continue
+                        except StaleFileError as e:
+                            logger.warning("⚠️ [변경됨] skip-stale: %s", e)
+                            result.error_count += 1
+                            result.errors.append(f"{source_path}: {e}")
+                            continue
                         result._processed_sources.add(normalized_path)
                         source_dir = str(Path(source_path).parent)
                         source_directories.add(source_dir)
@@ -384,7 +420,7 @@ class FileOrganizationHandler(QObject):
                         safe_title = re.sub("\\s+", " ", safe_title).strip()
                         if hasattr(item, "season") and item.season:
                             season = item.season
-                        if priority == highest_priority:
+                        if file_info["is_best"]:
                             season_folder = f"Season{season:02d}"
                             target_base_dir = (
                                 Path(self.main_window.destination_directory)
@@ -401,7 +437,39 @@ class FileOrganizationHandler(QObject):
                                 / season_folder
                             )
                             quality_type = "저화질"
-                        target_base_dir.mkdir(parents=True, exist_ok=True)
+                        size = (
+                            snapshot.size
+                            if snapshot is not None
+                            else Path(source_path).stat().st_size
+                        )
+                        decision = self._library_index.classify(
+                            safe_title,
+                            season,
+                            getattr(item, "episode", None),
+                            Path(source_path),
+                            size,
+                            file_info["resolution"],
+                        )
+                        existing = decision.existing
+                        if not decision.moves_bytes:
+                            logger.info(
+                                "⏭️ [중복처리] 대상에 이미 있음 (%s): %s ↔ %s",
+                                decision.action.value,
+                                Path(source_path).name,
+                                existing.path.name if existing else "?",
+                            )
+                            result.skip_count += 1
+                            result.skipped_files.append(normalized_path)
+                            continue
+                        # 저화질 폴더로 가는 파일은 기존 최고 화질 파일을 교체하지 않음
+                        replaced_path = (
+                            existing.path
+                            if decision.action == DuplicateAction.REPLACE
+                            and existing is not None
+                            and file_info["is_best"]
+                            else None
+                        )
+                        self._directory_cache.ensure(target_base_dir)
                         filename = Path(source_path).name
                         target_path = target_base_dir / filename
                         try:
@@ -410,12 +478,28 @@ class FileOrganizationHandler(QObject):
                             )
                             self._process_subtitle_files(source_path, target_base_dir, result)
 
-                            # 대상 파일이 이미 존재하면 삭제 (오버라이팅)
-                            if target_path.exists():
-                                logger.info("🔄 기존 파일 덮어쓰기: %s", target_path.name)
-                                target_path.unlink()
-
-                            shutil.move(source_path, target_path)
+                            keep_backup = self.unified_service.config.backup_before_operation
+                            if replaced_path == target_path:
+                                # 같은 이름의 기존 파일은 새 파일이 자리 잡은 뒤에 교체
+                                replace_file_in_place(
+                                    target_path,
+                                    partial(move_file, source_path),
+                                    keep_backup,
+                                )
+                            else:
+                                # 대상 파일이 이미 존재하면 삭제 (오버라이팅)
+                                if target_path.exists():
+                                    logger.info("🔄 기존 파일 덮어쓰기: %s", target_path.name)
+                                    target_path.unlink()
+                                move_file(source_path, target_path)
+                                if replaced_path is not None:
+                                    retire_replaced_file(replaced_path, keep_backup)
+                            if replaced_path is not None:
+                                self._library_index.forget(replaced_path)
+                            if getattr(item, "episode", None) is not None:
+                                self._library_index.record(
+                                    safe_title, season, item.episode, target_path, size
+                                )
                             logger.info(
                                 "✅ [%s] 이동 성공: %s → %s/",
                                 quality_type,
@@ -439,114 +523,6 @@ class FileOrganizationHandler(QObject):
                         result.errors.append(f"{file_info['source_path']}: {e}")
                         result._processed_sources.add(file_info["normalized_path"])
 
-    def _cleanup_empty_directories(self, source_directories: set[str]) -> int:
-        """파일 이동 후 빈 디렉토리들을 정리합니다"""
-        cleaned_count = 0
-        for source_dir in source_directories:
-            try:
-                if not Path(source_dir).exists():
-                    continue
-                cleaned_count += self._remove_empty_dirs_recursive(source_dir)
-                cleaned_count += self._cleanup_parent_directories(source_dir)
-            except Exception as e:
-                logger.info("⚠️ 디렉토리 정리 중 오류 (%s): %s", source_dir, e)
-        return cleaned_count
-
-    def _remove_empty_dirs_recursive(self, directory: str) -> int:
-        """재귀적으로 빈 디렉토리를 삭제합니다 (하위부터 상위로)"""
-        cleaned_count = 0
-        try:
-            directory_path = Path(directory)
-            items = list(directory_path.iterdir())
-            for item_path in items:
-                if item_path.is_dir():
-                    cleaned_count += self._remove_empty_dirs_recursive(str(item_path))
-            if not list(directory_path.iterdir()):
-                try:
-                    directory_path.rmdir()
-                    cleaned_count += 1
-                    logger.info("🗑️ 빈 디렉토리 삭제: %s", directory)
-                except OSError as e:
-                    logger.info("⚠️ 디렉토리 삭제 실패 (%s): %s", directory, e)
-        except Exception as e:
-            logger.info("⚠️ 디렉토리 정리 중 오류 (%s): %s", directory, e)
-        return cleaned_count
-
-    def _cleanup_parent_directories(self, start_directory: str) -> int:
-        """상위 디렉토리까지 올라가면서 빈 디렉토리를 삭제합니다 (소스 폴더 보호)"""
-        cleaned_count = 0
-        current_dir = Path(start_directory).parent
-        import os
-
-        system_root = Path(os.sep).resolve()
-        user_home = Path.home()
-
-        # 소스 폴더 경로 가져오기 (보호 대상)
-        source_directory = None
-        if hasattr(self.main_window, "source_directory") and self.main_window.source_directory:
-            source_directory = Path(self.main_window.source_directory).resolve()
-
-        while current_dir and current_dir != current_dir.parent:
-            # 안전 경계선 체크
-            if (
-                current_dir in [system_root, user_home]
-                or system_root in current_dir.parents
-                or user_home in current_dir.parents
-            ):
-                logger.info("🛡️ 안전 경계선 도달, 상위 정리 중단: %s", current_dir)
-                break
-
-            # 소스 폴더 보호: 소스 폴더나 그 상위 폴더는 삭제하지 않음
-            if source_directory and (
-                current_dir == source_directory or source_directory in current_dir.parents
-            ):
-                logger.info(
-                    "🛡️ 소스 폴더 보호, 상위 정리 중단: %s (소스: %s)", current_dir, source_directory
-                )
-                break
-
-            try:
-                if current_dir.exists() and not list(current_dir.iterdir()):
-                    current_dir.rmdir()
-                    cleaned_count += 1
-                    logger.info("🗑️ 빈 상위 디렉토리 삭제: %s", current_dir)
-                    current_dir = current_dir.parent
-                else:
-                    break
-            except OSError as e:
-                logger.info("⚠️ 상위 디렉토리 삭제 실패 (%s): %s", current_dir, e)
-                break
-        return cleaned_count
-
-    def _cleanup_anime_directories(self) -> int:
-        """애니 폴더 전체에서 빈 디렉토리들을 정리합니다 (소스 폴더 자체는 보호)"""
-        cleaned_count = 0
-        try:
-            source_root = Path(self.main_window.source_directory)
-            if not source_root.exists():
-                logger.info("⚠️ 소스 디렉토리가 존재하지 않습니다")
-                return 0
-            logger.info("🗂️ 애니 폴더 스캔 시작: %s", source_root)
-            for root, dirs, _files in os.walk(str(source_root), topdown=False):
-                for dir_name in dirs:
-                    dir_path = Path(root) / dir_name
-                    try:
-                        # 소스 폴더 자체는 삭제하지 않음
-                        if dir_path == source_root:
-                            logger.info("🛡️ 소스 폴더 보호: %s", dir_path)
-                            continue
-
-                        if not any(dir_path.iterdir()):
-                            dir_path.rmdir()
-                            logger.info("🗑️ 빈 폴더 삭제: %s", dir_path)
-                            cleaned_count += 1
-                    except Exception as e:
-                        logger.info("⚠️ 폴더 삭제 실패 (%s): %s", dir_path, e)
-            logger.info("🗑️ 애니 폴더 정리 완료: %s개 빈 디렉토리 삭제", cleaned_count)
-        except Exception as e:
-            logger.info("❌ 애니 폴더 정리 중 오류: %s", e)
-        return cleaned_count
-
     def on_organization_completed(self, result):
         """파일 정리 완료 처리"""
         try:
@@ -554,7 +530,12 @@ class FileOrganizationHandler(QObject):
             message += "📊 결과 요약:\n"
             message += f"• 성공: {result.success_count}개 파일\n"
             message += f"• 실패: {result.error_count}개 파일\n"
-            message += f"• 건너뜀: {result.skip_count}개 파일\n\n"
+            message += f"• 건너뜀: {result.skip_count}개 파일\n"
+            if getattr(result, "cleaned_directories", 0) > 0:
+                message += f"• 정리된 빈 디렉토리: {result.cleaned_directories}개\n"
+            elif self._cleanup_task_id:
+                message += "• 빈 디렉토리: 백그라운드에서 정리 중\n"
+            message += "\n"
             if result.errors:
                 message += "❌ 오류 목록:\n"
                 for i, error in enumerate(result.errors[:5], 1):
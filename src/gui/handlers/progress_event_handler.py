@@ -151,7 +151,9 @@ class ProgressEventHandler(QObject):
             message_parts.append(f"({event.current_operation.value})")
         if event.current_step:
             message_parts.append(f"- {event.current_step}")
-        if event.processing_speed_mbps > 0:
+        if event.bytes_per_second > 0:
+            message_parts.append(f"@ {event.bytes_per_second / (1024 * 1024):.1f} MB/s")
+        elif event.processing_speed_mbps > 0:
             message_parts.append(f"@ {event.processing_speed_mbps:.1f} MB/s")
         if event.estimated_remaining_seconds:
             remaining_minutes = int(event.estimated_remaining_seconds // 60)
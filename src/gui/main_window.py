@@ -9,11 +9,12 @@ from pathlib import Path
 from PyQt5.QtCore import Qt
 
 logger = logging.getLogger(__name__)
-from PyQt5.QtWidgets import QHeaderView, QMainWindow, QMessageBox
+from PyQt5.QtWidgets import QApplication, QHeaderView, QMainWindow, QMessageBox
 
 from src.core.tmdb_client import TMDBClient
 from src.core.unified_config import unified_config_manager
 from src.core.unified_event_system import get_unified_event_bus
+from src.core.utils.io_throttle import configure_io_throttles, set_ui_interactive
 from src.gui.base_classes import StateInitializationMixin
 from src.gui.components.dialogs.settings_dialog import SettingsDialog
 from src.gui.components.main_window_coordinator import MainWindowCoordinator
@@ -51,6 +52,7 @@ class MainWindow(QMainWindow, StateInitializationMixin):
         # Set up additional components that need special initialization
         self.settings_manager = unified_config_manager
         self.unified_event_bus = get_unified_event_bus()
+        self._init_io_throttle()
         self.theme_manager = ThemeManager()
         theme_dir = Path(__file__).parent.parent.parent / "data" / "theme"
         self.token_loader = TokenLoader(theme_dir)
@@ -91,6 +93,20 @@ class MainWindow(QMainWindow, StateInitializationMixin):
         # Initialize UI components
         self.setup_ui()
 
+    def _init_io_throttle(self):
+        """정리/백업/스테이징 I/O 제한 설정 및 창 사용 상태 연결"""
+        try:
+            configure_io_throttles(self.settings_manager.config.application.io_throttle)
+            app = QApplication.instance()
+            if app is not None:
+                app.applicationStateChanged.connect(self._on_application_state_changed)
+        except Exception as e:
+            logger.warning("⚠️ I/O 제한 설정 실패: %s", e)
+
+    def _on_application_state_changed(self, state):
+        """창을 사용 중이면 interactive 제한, 백그라운드면 idle 제한 적용"""
+        set_ui_interactive(state == Qt.ApplicationActive)
+
     def _get_default_state_config(self):
         """Get the default state configuration for MainWindow."""
         return {
@@ -8,6 +8,7 @@ import logging
 logger = logging.getLogger(__name__)
 from .anime_data_manager import AnimeDataManager
 from .event_handler import EventHandler
+from .poster_loader import PosterLoader
 from .tmdb_manager import TMDBManager
 
-__all__ = ["AnimeDataManager", "TMDBManager", "EventHandler"]
+__all__ = ["AnimeDataManager", "TMDBManager", "EventHandler", "PosterLoader"]
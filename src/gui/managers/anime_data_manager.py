@@ -15,6 +15,7 @@ from typing import Any
 from PyQt5.QtCore import pyqtSignal
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
+from src.core.file_snapshot import FileSnapshot
 from src.core.manager_base import ManagerBase, ManagerConfig, ManagerPriority
 from src.core.tmdb_client import TMDBAnimeInfo
 from src.core.unified_event_system import EventCategory, EventPriority, get_unified_event_bus
@@ -58,6 +59,13 @@ class ParsedItem:
     subtitles: str | None = None
     crc32: str | None = None
 
+    # 화질 분리 계획에서 결정한 해상도와 그 근거 (parsed, filename, probe)
+    resolvedResolution: str | None = None
+    resolutionSource: str | None = None
+
+    # 스캔 시점의 파일 stat 정보 (이후 단계에서 다시 stat 하지 않도록)
+    snapshot: FileSnapshot | None = None
+
     def __post_init__(self):
         """초기화 후 처리"""
         if not self.id:
@@ -386,6 +394,18 @@ class AnimeDataManager(ManagerBase):
                 item.tmdbId = tmdb_anime.id
                 item.status = "tmdb_matched"
         logger.info("✅ TMDB 매치 완료: 그룹 %s → %s", group_id, tmdb_anime.name)
+        self._prefetch_seasons(tmdb_anime)
+
+    def _prefetch_seasons(self, tmdb_anime: TMDBAnimeInfo):
+        """매칭된 작품의 시즌 정보를 백그라운드에서 미리 받아오기"""
+        if not self.tmdb_client or not hasattr(self.tmdb_client, "prefetch_seasons"):
+            return
+        try:
+            queued = self.tmdb_client.prefetch_seasons(tmdb_anime)
+            if queued:
+                logger.info("📥 시즌 프리페치 예약: %s (%s개 시즌)", tmdb_anime.name, queued)
+        except Exception as e:
+            logger.warning("시즌 프리페치 예약 실패: %s", e)
 
     def get_tmdb_match_for_group(self, group_id: str) -> TMDBAnimeInfo | None:
         """그룹의 TMDB 매치 결과 반환"""
@@ -87,6 +87,7 @@ class EventHandler(QObject):
                             crc32=parsed_metadata.get("crc32"),
                             parsingConfidence=parsed_metadata.get("confidence"),
                             status="parsed",
+                            snapshot=scan_result.snapshots.get(Path(file_path)),
                         )
                     )
                 except Exception as e:
@@ -0,0 +1,255 @@
+"""
+포스터 비동기 로더
+
+TMDB 포스터 썸네일을 백그라운드 스레드에서 받아오고, 준비되면 시그널로 알려줍니다.
+다운로드와 캐시는 TMDB 클라이언트의 이미지 관리자(세션, 디스크 캐시)를 그대로 사용합니다.
+테이블용으로 크기 제한 픽스맵 캐시와 보이는 행 기준 프리페처도 제공합니다.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PyQt5.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QAbstractItemView
+
+
+class PosterLoader(QObject):
+    """포스터 썸네일을 동시 다운로드 수를 제한하여 백그라운드에서 불러오는 클래스
+
+    요청은 세대(generation) 단위로 관리되어, cancel_pending() 이후에는 이전 요청의
+    결과가 도착해도 시그널을 보내지 않습니다. 시그널은 로더가 속한 스레드(보통 UI
+    스레드)로 전달되므로 슬롯에서 바로 위젯을 갱신할 수 있습니다.
+    """
+
+    poster_ready = pyqtSignal(str, str, str)  # poster_path, variant, 로컬 파일 경로
+    poster_failed = pyqtSignal(str, str)  # poster_path, variant
+
+    def __init__(self, tmdb_client, max_concurrent: int = 4, parent: QObject | None = None):
+        """
+        Args:
+            tmdb_client: 썸네일 조회 메서드를 제공하는 TMDB 클라이언트
+            max_concurrent: 동시에 진행할 최대 다운로드 수
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.tmdb_client = tmdb_client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="poster-loader"
+        )
+        self._in_flight: dict[tuple[str, str], Future] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def cached_path(self, poster_path: str, variant: str) -> str | None:
+        """이미 준비된 썸네일 경로 (네트워크 요청 없음)"""
+        if not poster_path or not hasattr(self.tmdb_client, "get_cached_poster_thumbnail_path"):
+            return None
+        try:
+            return self.tmdb_client.get_cached_poster_thumbnail_path(poster_path, variant)
+        except Exception as e:
+            logger.debug("캐시된 포스터 조회 실패: %s", e)
+            return None
+
+    def request(self, poster_path: str, variant: str) -> str | None:
+        """포스터 썸네일 요청
+
+        Returns:
+            캐시에 있으면 즉시 경로를 반환하고, 없으면 None을 반환한 뒤
+            준비되는 대로 poster_ready/poster_failed 시그널을 보냅니다.
+        """
+        cached = self.cached_path(poster_path, variant)
+        if cached is not None or not poster_path:
+            return cached
+        key = (poster_path, variant)
+        with self._lock:
+            if self._closed or key in self._in_flight:
+                return None
+            generation = self._generation
+            try:
+                future = self._executor.submit(self._load, poster_path, variant, generation)
+            except RuntimeError:
+                return None
+            self._in_flight[key] = future
+        future.add_done_callback(lambda _f, k=key: self._forget(k, _f))
+        return None
+
+    def _forget(self, key: tuple[str, str], future: Future) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def _load(self, poster_path: str, variant: str, generation: int) -> None:
+        if generation != self._generation:
+            return
+        try:
+            path = self.tmdb_client.get_poster_thumbnail_path(poster_path, variant)
+        except Exception as e:
+            logger.debug("포스터 로드 실패: %s - %s", poster_path, e)
+            path = None
+        with self._lock:
+            if generation != self._generation or self._closed:
+                return
+        if path:
+            self.poster_ready.emit(poster_path, variant, path)
+        else:
+            self.poster_failed.emit(poster_path, variant)
+
+    def cancel_pending(self) -> None:
+        """대기 중인 요청을 취소하고 진행 중인 요청의 결과는 버림"""
+        with self._lock:
+            self._generation += 1
+            in_flight = list(self._in_flight.values())
+            self._in_flight.clear()
+        for future in in_flight:
+            future.cancel()
+
+    def pending_count(self) -> int:
+        """대기/진행 중인 요청 수"""
+        with self._lock:
+            return len(self._in_flight)
+
+    def shutdown(self) -> None:
+        """로더 종료 (진행 중인 다운로드는 기다리지 않음)"""
+        self.cancel_pending()
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PosterPixmapCache:
+    """바이트 크기로 제한되는 LRU 포스터 픽스맵 캐시
+
+    픽스맵 크기는 가로 × 세로 × 색 깊이로 계산하며, 상한을 넘으면
+    가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: 캐시가 차지할 수 있는 최대 바이트 수
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items: OrderedDict[str, tuple[QPixmap, int]] = OrderedDict()
+
+    @staticmethod
+    def pixmap_bytes(pixmap: QPixmap) -> int:
+        """픽스맵이 차지하는 대략적인 메모리 크기"""
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key: str) -> QPixmap | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key: str, pixmap: QPixmap) -> None:
+        cost = self.pixmap_bytes(pixmap)
+        if cost > self.max_bytes:
+            return
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= previous[1]
+        self._items[key] = (pixmap, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes:
+            _key, (_pixmap, evicted_cost) = self._items.popitem(last=False)
+            self.total_bytes -= evicted_cost
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.total_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class PosterViewportPrefetcher(QObject):
+    """테이블 뷰에서 현재 보이는 행의 포스터를 미리 요청하는 클래스
+
+    스크롤/크기 변경/모델 갱신 후 잠시(debounce_ms) 기다렸다가 보이는 행을 계산하고,
+    원본 모델의 prefetch_posters(rows)를 호출합니다. 프록시 모델은 원본 행으로 변환합니다.
+    """
+
+    def __init__(self, view: QAbstractItemView, debounce_ms: int = 120):
+        """
+        Args:
+            view: 대상 테이블 뷰
+            debounce_ms: 마지막 변경 후 프리페치까지 대기 시간 (밀리초)
+        """
+        super().__init__(view)
+        self.view = view
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.prefetch_visible)
+        self._connected_model = None
+        view.verticalScrollBar().valueChanged.connect(self.schedule)
+        view.viewport().installEventFilter(self)
+        self.schedule()
+
+    def eventFilter(self, watched, event) -> bool:  # noqa: N802
+        if event.type() in (QEvent.Resize, QEvent.Show):
+            self.schedule()
+        return False
+
+    def schedule(self, *_args) -> None:
+        """보이는 행 프리페치 예약 (연속 호출은 한 번으로 합침)"""
+        self._ensure_model_connections()
+        self._timer.start()
+
+    def _ensure_model_connections(self) -> None:
+        model = self.view.model()
+        if model is None or model is self._connected_model:
+            return
+        self._connected_model = model
+        model.modelReset.connect(self.schedule)
+        model.layoutChanged.connect(self.schedule)
+        model.rowsInserted.connect(self.schedule)
+
+    def visible_source_rows(self) -> list[int]:
+        """뷰포트에 보이는 행을 원본 모델 행 번호로 반환"""
+        model = self.view.model()
+        if model is None or not self.view.isVisible():
+            return []
+        first = self.view.rowAt(0)
+        if first < 0:
+            return []
+        last = self.view.rowAt(self.view.viewport().height() - 1)
+        if last < 0:
+            last = model.rowCount() - 1
+        rows = []
+        for row in range(first, last + 1):
+            index = model.index(row, 0)
+            current = model
+            while hasattr(current, "mapToSource"):
+                index = current.mapToSource(index)
+                current = current.sourceModel()
+            if index.isValid():
+                rows.append(index.row())
+        return rows
+
+    def source_model(self):
+        model = self.view.model()
+        while hasattr(model, "sourceModel"):
+            model = model.sourceModel()
+        return model
+
+    def prefetch_visible(self) -> None:
+        """보이는 행의 포스터 요청"""
+        source_model = self.source_model()
+        if source_model is None or not hasattr(source_model, "prefetch_posters"):
+            return
+        rows = self.visible_source_rows()
+        if rows:
+            source_model.prefetch_posters(rows)
@@ -8,7 +8,7 @@ import logging
 logger = logging.getLogger(__name__)
 import json
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -34,11 +34,15 @@ class TMDBSearchResult:
     media_type: str
     confidence_score: float = 0.0
     source: str = "TMDB"
+    localized_names: dict[str, str] = field(default_factory=dict)
 
 
 class TMDBManager:
     """TMDB API 관리자 (플러그인 시스템 통합)"""
 
+    AUTO_MATCH_THRESHOLD = 0.7
+    AUTO_MATCH_CANDIDATES = 3
+
     def __init__(self, api_key: str = None):
         """초기화"""
         if api_key:
@@ -111,7 +115,7 @@ class TMDBManager:
             logger.info("📋 캐시된 TMDB 검색 결과 사용: %s", query)
             return self.search_cache[cache_key]
         try:
-            results = self.tmdb_client.search_anime(query, language=language, use_fallback=True)
+            results = self.tmdb_client.search_anime(query, use_fallback=True, language=language)
             search_results = []
             for result in results:
                 confidence = self._calculate_title_confidence(query, result.name)
@@ -125,7 +129,7 @@ class TMDBManager:
                     vote_average=result.vote_average or 0.0,
                     vote_count=result.vote_count or 0,
                     popularity=result.popularity or 0.0,
-                    media_type=result.media_type or "tv",
+                    media_type=getattr(result, "media_type", None) or "tv",
                     confidence_score=confidence,
                     source="TMDB",
                 )
@@ -194,42 +198,83 @@ class TMDBManager:
             logger.info("❌ 포스터 로드 오류: %s", e)
         return None
 
+    def get_language_preference(self) -> list[str]:
+        """표시 제목 언어 우선순위 반환 (services.tmdb_api.language_preference)"""
+        tmdb_config = unified_config_manager.get("services", "tmdb_api", {}) or {}
+        preference = tmdb_config.get("language_preference") or [
+            tmdb_config.get("language", "ko-KR"),
+            "en-US",
+        ]
+        languages: list[str] = []
+        for language in preference:
+            if language and language not in languages:
+                languages.append(language)
+        return languages or ["ko-KR", "en-US"]
+
     def auto_match_anime(self, parsed_item: ParsedItem) -> TMDBSearchResult | None:
-        """파싱된 아이템을 자동으로 TMDB와 매칭"""
+        """파싱된 아이템을 자동으로 TMDB와 매칭
+
+        우선순위 첫 번째 언어로 한 번만 검색하고(플러그인 결과 포함), 제목 신뢰도가 높은
+        후보부터 확인합니다. 신뢰도 판정과 표시 제목은 캐시된 번역 정보(translations)에서
+        가져온 언어별 제목으로 결정합니다.
+        """
         if not self.is_available():
             return None
         search_query = parsed_item.detectedTitle or parsed_item.title
         if not search_query:
             return None
         logger.info("🔍 자동 매칭 시도: %s", search_query)
-        results = self.search_anime(search_query, "ko-KR")
-        if results:
-            best_match = results[0]
-            if best_match.confidence_score >= 0.7:
-                logger.info(
-                    "✅ 자동 매칭 성공: %s (신뢰도: %s)",
-                    best_match.name,
-                    best_match.confidence_score,
+        languages = self.get_language_preference()
+        # search_anime이 제목 신뢰도 순으로 정렬해 돌려줌
+        results = [r for r in self.search_anime(search_query, languages[0]) if r.tmdb_id]
+        best_match = None
+        best_confidence = 0.0
+        for candidate in results[: self.AUTO_MATCH_CANDIDATES]:
+            confidence = max(
+                candidate.confidence_score,
+                self._calculate_title_confidence(search_query, candidate.original_name),
+            )
+            localized_names = (
+                self.tmdb_client.get_localized_names(candidate.tmdb_id, languages)
+                if candidate.source == "TMDB"
+                else {}
+            )
+            for localized_name in localized_names.values():
+                confidence = max(
+                    confidence, self._calculate_title_confidence(search_query, localized_name)
                 )
-                return best_match
-        results = self.search_anime(search_query, "en-US")
-        if results:
-            best_match = results[0]
-            if best_match.confidence_score >= 0.7:
-                logger.info(
-                    "✅ 자동 매칭 성공 (영어): %s (신뢰도: %s)",
-                    best_match.name,
-                    best_match.confidence_score,
+            if confidence > best_confidence:
+                best_match = replace(
+                    candidate, confidence_score=confidence, localized_names=localized_names
                 )
-                return best_match
+                best_confidence = confidence
+            if best_confidence >= self.AUTO_MATCH_THRESHOLD:
+                break
+        if best_match and best_confidence >= self.AUTO_MATCH_THRESHOLD:
+            best_match.name = self._select_display_name(best_match, languages)
+            logger.info(
+                "✅ 자동 매칭 성공: %s (신뢰도: %s)",
+                best_match.name,
+                best_match.confidence_score,
+            )
+            return best_match
         logger.info("❌ 자동 매칭 실패: %s", search_query)
         return None
 
+    def _select_display_name(self, result: TMDBSearchResult, languages: list[str]) -> str:
+        """언어 우선순위에 따라 표시/폴더명에 사용할 제목 선택"""
+        for language in languages:
+            name = result.localized_names.get(language)
+            if name:
+                return name
+        return result.name or result.original_name
+
     def batch_search_anime(self, parsed_items: list[ParsedItem]) -> dict[str, TMDBSearchResult]:
         """여러 애니메이션을 일괄 검색"""
         if not self.is_available():
             return {}
         logger.info("🚀 일괄 검색 시작: %s개 아이템", len(parsed_items))
+        languages = self.get_language_preference()
         results = {}
         for i, item in enumerate(parsed_items):
             logger.info("진행률: %s/%s - %s", i + 1, len(parsed_items), item.detectedTitle)
@@ -239,7 +284,11 @@ class TMDBManager:
             if match_result:
                 results[item.id] = match_result
                 item.tmdbId = match_result.tmdb_id
-                item.tmdbMatch = self.get_anime_details(match_result.tmdb_id)
+                details = self.get_anime_details(match_result.tmdb_id, languages[0])
+                if details:
+                    details.name = match_result.name
+                    self.tmdb_client.prefetch_seasons(details, languages[0])
+                item.tmdbMatch = details
         logger.info("✅ 일괄 검색 완료: %s개 매칭 성공", len(results))
         return results
 
@@ -8,14 +8,103 @@ import logging
 logger = logging.getLogger(__name__)
 import re
 from pathlib import Path
-from typing import Any
 
 from managers.anime_data_manager import ParsedItem
 from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QRect, Qt, QVariant
 from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPixmap
 
+from src.gui.managers.poster_loader import PosterLoader, PosterPixmapCache
+
+POSTER_TOOLTIP_VARIANT = "tooltip"
+
+
+def _compose_tooltip_pixmap(pixmap: QPixmap) -> QPixmap:
+    """툴팁 배경과 테두리를 입힌 포스터 픽스맵 생성"""
+    if pixmap.width() > 200 or pixmap.height() > 300:
+        pixmap = pixmap.scaled(200, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if not app:
+        return pixmap
+    palette = app.palette()
+    background_color = palette.color(palette.ToolTipBase)
+    final_pixmap = QPixmap(220, 320)
+    final_pixmap.fill(background_color)
+    painter = QPainter(final_pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    border_color = palette.color(palette.ToolTipText)
+    border_color.setAlpha(50)
+    painter.setPen(border_color)
+    painter.drawRect(9, 9, 202, 302)
+    poster_rect = QRect(10, 10, 200, 300)
+    painter.drawPixmap(poster_rect, pixmap)
+    painter.end()
+    return final_pixmap
+
+
+class PosterTooltipMixin:
+    """포스터 툴팁을 UI 스레드에서 다운로드 없이 제공하는 모델 믹스인
+
+    data()에서는 메모리/디스크에 이미 있는 포스터만 반환하고, 없으면 백그라운드
+    로더에 요청한 뒤 도착하면 해당 행에 dataChanged를 보냅니다. 픽스맵은 바이트
+    크기로 제한되는 LRU 캐시에 보관합니다.
+    """
+
+    POSTER_PIXMAP_CACHE_BYTES = 24 * 1024 * 1024
+
+    def _init_poster_support(self, tmdb_client) -> None:
+        self._tooltip_cache = PosterPixmapCache(self.POSTER_PIXMAP_CACHE_BYTES)
+        self.poster_loader: PosterLoader | None = None
+        if tmdb_client is not None and hasattr(tmdb_client, "get_poster_thumbnail_path"):
+            self.poster_loader = PosterLoader(tmdb_client, max_concurrent=3, parent=self)
+            self.poster_loader.poster_ready.connect(self._on_poster_ready)
+
+    def _poster_path_for_row(self, row: int) -> str | None:
+        """행의 TMDB 포스터 경로 (하위 클래스에서 구현)"""
+        raise NotImplementedError
+
+    def _poster_tooltip(self, poster_path: str) -> QPixmap | None:
+        """캐시된 포스터 툴팁 반환 (없으면 백그라운드 로드 요청 후 None)"""
+        pixmap = self._tooltip_cache.get(poster_path)
+        if pixmap is not None or self.poster_loader is None:
+            return pixmap
+        cached_path = self.poster_loader.request(poster_path, POSTER_TOOLTIP_VARIANT)
+        if cached_path:
+            return self._load_tooltip_pixmap(poster_path, cached_path)
+        return None
 
-class GroupedListModel(QAbstractTableModel):
+    def _load_tooltip_pixmap(self, poster_path: str, image_path: str) -> QPixmap | None:
+        pixmap = QPixmap(image_path)
+        if pixmap.isNull():
+            return None
+        pixmap = _compose_tooltip_pixmap(pixmap)
+        self._tooltip_cache.put(poster_path, pixmap)
+        return pixmap
+
+    def prefetch_posters(self, rows: list[int]) -> None:
+        """보이는 행의 포스터를 미리 요청 (이전 뷰포트의 대기 요청은 취소)"""
+        if self.poster_loader is None:
+            return
+        self.poster_loader.cancel_pending()
+        for row in rows:
+            poster_path = self._poster_path_for_row(row)
+            if poster_path and poster_path not in self._tooltip_cache:
+                self.poster_loader.request(poster_path, POSTER_TOOLTIP_VARIANT)
+
+    def _on_poster_ready(self, poster_path: str, variant: str, image_path: str) -> None:
+        """포스터 도착 - 픽스맵을 준비하고 해당 행 갱신 알림"""
+        if variant != POSTER_TOOLTIP_VARIANT:
+            return
+        if self._load_tooltip_pixmap(poster_path, image_path) is None:
+            return
+        for row in range(self.rowCount()):
+            if self._poster_path_for_row(row) == poster_path:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index, [Qt.ToolTipRole])
+
+
+class GroupedListModel(PosterTooltipMixin, QAbstractTableModel):
     """그룹화된 애니메이션 목록을 표시하는 모델"""
 
     headers = [
@@ -42,7 +131,7 @@ class GroupedListModel(QAbstractTableModel):
         self.destination_directory = destination_directory or "대상 폴더"
         self._group_list = []
         self._max_title_width = 0
-        self._tooltip_cache: dict[str, Any] = {}
+        self._init_poster_support(tmdb_client)
         self._update_group_list()
 
     def set_grouped_items(self, grouped_items: dict[str, list]):
@@ -280,48 +369,11 @@ class GroupedListModel(QAbstractTableModel):
                 return status_map.get(status, status)
         elif role == Qt.ToolTipRole:
             if col == 0:
-                if (
-                    group_info.get("tmdb_match")
-                    and group_info["tmdb_match"].poster_path
-                    and self.tmdb_client
-                ):
-                    poster_path = group_info["tmdb_match"].poster_path
-                    cache_key = f"tooltip_{poster_path}"
-                    if cache_key in self._tooltip_cache:
-                        return self._tooltip_cache[cache_key]
-                    try:
-                        poster_path = self.tmdb_client.get_poster_path(
-                            group_info["tmdb_match"].poster_path, "w185"
-                        )
-                        if poster_path and Path(poster_path).exists():
-                            pixmap = QPixmap(poster_path)
-                            if not pixmap.isNull():
-                                scaled_pixmap = pixmap.scaled(
-                                    200, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                                )
-                                from PyQt5.QtWidgets import QApplication
-
-                                app = QApplication.instance()
-                                if app:
-                                    palette = app.palette()
-                                    background_color = palette.color(palette.ToolTipBase)
-                                    final_pixmap = QPixmap(220, 320)
-                                    final_pixmap.fill(background_color)
-                                    painter = QPainter(final_pixmap)
-                                    painter.setRenderHint(QPainter.Antialiasing)
-                                    border_color = palette.color(palette.ToolTipText)
-                                    border_color.setAlpha(50)
-                                    painter.setPen(border_color)
-                                    painter.drawRect(9, 9, 202, 302)
-                                    poster_rect = QRect(10, 10, 200, 300)
-                                    painter.drawPixmap(poster_rect, scaled_pixmap)
-                                    painter.end()
-                                    self._tooltip_cache[cache_key] = final_pixmap
-                                    return final_pixmap
-                                self._tooltip_cache[cache_key] = scaled_pixmap
-                                return scaled_pixmap
-                    except Exception as e:
-                        logger.info("포스터 툴팁 로드 실패: %s", e)
+                tmdb_match = group_info.get("tmdb_match")
+                if tmdb_match and tmdb_match.poster_path:
+                    pixmap = self._poster_tooltip(tmdb_match.poster_path)
+                    if pixmap is not None:
+                        return pixmap
                 title = group_info.get("title", "Unknown")
                 if group_info.get("tmdb_match") and group_info["tmdb_match"].name:
                     title = group_info["tmdb_match"].name
@@ -341,6 +393,12 @@ class GroupedListModel(QAbstractTableModel):
             return self.headers[section]
         return QVariant()
 
+    def _poster_path_for_row(self, row: int) -> str | None:
+        if 0 <= row < len(self._group_list):
+            tmdb_match = self._group_list[row].get("tmdb_match")
+            return getattr(tmdb_match, "poster_path", None) if tmdb_match else None
+        return None
+
     def get_group_at_row(self, row: int) -> dict | None:
         """특정 행의 그룹 정보 반환"""
         if 0 <= row < len(self._group_list):
@@ -366,7 +424,7 @@ class GroupedListModel(QAbstractTableModel):
         return [1]
 
 
-class DetailFileModel(QAbstractTableModel):
+class DetailFileModel(PosterTooltipMixin, QAbstractTableModel):
     """그룹 내 상세 파일 목록을 표시하는 모델"""
 
     headers = ["파일명", "시즌", "에피소드", "해상도", "코덱", "상태"]
@@ -375,7 +433,7 @@ class DetailFileModel(QAbstractTableModel):
         super().__init__()
         self.items = items or []
         self.tmdb_client = tmdb_client
-        self._tooltip_cache: dict[str, Any] = {}
+        self._init_poster_support(tmdb_client)
 
     def set_items(self, items: list[ParsedItem]):
         """아이템 목록 설정 및 테이블 새로고침"""
@@ -394,6 +452,12 @@ class DetailFileModel(QAbstractTableModel):
             self.files = files
             self.endResetModel()
 
+    def _poster_path_for_row(self, row: int) -> str | None:
+        if 0 <= row < len(self.items):
+            tmdb_match = self.items[row].tmdbMatch
+            return getattr(tmdb_match, "poster_path", None) if tmdb_match else None
+        return None
+
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self.items)
 
@@ -427,44 +491,10 @@ class DetailFileModel(QAbstractTableModel):
                 return status_map.get(item.status, item.status)
         elif role == Qt.ToolTipRole:
             if col == 0:
-                if item.tmdbMatch and item.tmdbMatch.poster_path and self.tmdb_client:
-                    poster_path = item.tmdbMatch.poster_path
-                    cache_key = f"tooltip_{poster_path}"
-                    if cache_key in self._tooltip_cache:
-                        return self._tooltip_cache[cache_key]
-                    try:
-                        poster_path = self.tmdb_client.get_poster_path(
-                            item.tmdbMatch.poster_path, "w185"
-                        )
-                        if poster_path and Path(poster_path).exists():
-                            pixmap = QPixmap(poster_path)
-                            if not pixmap.isNull():
-                                scaled_pixmap = pixmap.scaled(
-                                    200, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                                )
-                                from PyQt5.QtWidgets import QApplication
-
-                                app = QApplication.instance()
-                                if app:
-                                    palette = app.palette()
-                                    background_color = palette.color(palette.ToolTipBase)
-                                    final_pixmap = QPixmap(220, 320)
-                                    final_pixmap.fill(background_color)
-                                    painter = QPainter(final_pixmap)
-                                    painter.setRenderHint(QPainter.Antialiasing)
-                                    border_color = palette.color(palette.ToolTipText)
-                                    border_color.setAlpha(50)
-                                    painter.setPen(border_color)
-                                    painter.drawRect(9, 9, 202, 302)
-                                    poster_rect = QRect(10, 10, 200, 300)
-                                    painter.drawPixmap(poster_rect, scaled_pixmap)
-                                    painter.end()
-                                    self._tooltip_cache[cache_key] = final_pixmap
-                                    return final_pixmap
-                                self._tooltip_cache[cache_key] = scaled_pixmap
-                                return scaled_pixmap
-                    except Exception as e:
-                        logger.info("포스터 툴팁 로드 실패: %s", e)
+                if item.tmdbMatch and item.tmdbMatch.poster_path:
+                    pixmap = self._poster_tooltip(item.tmdbMatch.poster_path)
+                    if pixmap is not None:
+                        return pixmap
                 filename = Path(item.sourcePath).name if item.sourcePath else "Unknown"
                 return f"파일: {filename}"
         elif role == Qt.AccessibleTextRole:
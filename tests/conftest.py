@@ -4,11 +4,16 @@ pytest 설정 파일
 테스트에 필요한 공통 픽스처들을 정의합니다.
 """
 
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
+# 디스플레이가 없는 환경(CI 등)에서도 Qt 위젯 테스트가 가능하도록 설정
+if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 # src 디렉토리를 Python 경로에 추가
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
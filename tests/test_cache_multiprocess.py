@@ -0,0 +1,106 @@
+"""
+여러 프로세스가 같은 캐시 디렉토리를 사용할 때의 안전성 테스트
+"""
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from src.core.tmdb_cache import COMPRESSED_SUFFIX, PLAIN_SUFFIX, TMDBCacheManager
+from src.core.utils.atomic_file import atomic_write_bytes, is_temp_file
+
+KEYS = [f"season_{i}_1_ko-KR" for i in range(8)]
+
+
+def _payload(writer: int, iteration: int) -> dict:
+    # 홀수 반복은 압축 임계값을 넘겨 .json / .json.gz 변형이 번갈아 기록되게 함
+    padding = "x" * (4096 if iteration % 2 else 16)
+    return {
+        "writer": writer,
+        "iteration": iteration,
+        "padding": padding,
+        "check": writer * iteration,
+    }
+
+
+def _writer(cache_dir: str, writer: int, iterations: int) -> None:
+    cache = TMDBCacheManager(Path(cache_dir), compress_threshold=1024)
+    for iteration in range(iterations):
+        key = KEYS[(writer + iteration) % len(KEYS)]
+        cache.set_cache(key, _payload(writer, iteration), request={"path": "tv/1"})
+        entry = cache.get_cache_entry(KEYS[iteration % len(KEYS)])
+        if entry is not None:
+            data = entry.data
+            assert data["check"] == data["writer"] * data["iteration"]
+        if iteration % 5 == 0:
+            cache.touch_cache(key, etag=f'"{writer}"')
+
+
+def _incrementer(cache_dir: str, iterations: int) -> None:
+    cache = TMDBCacheManager(Path(cache_dir))
+    for _ in range(iterations):
+        with cache.file_locks.for_key("counter"):
+            entry = cache.get_cache_entry("counter")
+            cache.set_cache("counter", (entry.data if entry else 0) + 1)
+
+
+def _run(target, args_list) -> None:
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=target, args=args) for args in args_list]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+
+def test_concurrent_writers_leave_one_complete_file_per_key(tmp_path):
+    _run(_writer, [(str(tmp_path), writer, 60) for writer in range(4)])
+
+    files = [f for f in tmp_path.iterdir() if f.is_file()]
+    assert not [f for f in files if is_temp_file(f)]
+    cache = TMDBCacheManager(tmp_path, compress_threshold=1024)
+    for key in KEYS:
+        variants = [
+            f
+            for f in (tmp_path / f"{key}{PLAIN_SUFFIX}", tmp_path / f"{key}{COMPRESSED_SUFFIX}")
+            if f.exists()
+        ]
+        assert len(variants) == 1
+        data = cache.get_cache(key)
+        assert data["check"] == data["writer"] * data["iteration"]
+
+
+def test_locked_read_modify_write_loses_no_updates(tmp_path):
+    _run(_incrementer, [(str(tmp_path), 25) for _ in range(4)])
+
+    assert TMDBCacheManager(tmp_path).get_cache("counter") == 100
+
+
+def test_memory_cache_notices_writes_from_other_instance(tmp_path):
+    first = TMDBCacheManager(tmp_path)
+    second = TMDBCacheManager(tmp_path)
+    first.set_cache("details_1_ko-KR", {"name": "old"})
+    assert second.get_cache("details_1_ko-KR") == {"name": "old"}
+
+    first.set_cache("details_1_ko-KR", {"name": "new"})
+    assert second.get_cache("details_1_ko-KR") == {"name": "new"}
+
+    first.remove_cache("details_1_ko-KR")
+    assert second.get_cache("details_1_ko-KR") is None
+
+
+def test_failed_atomic_write_keeps_previous_content(tmp_path, monkeypatch):
+    target = tmp_path / "w185_poster.jpg"
+    target.write_bytes(b"old")
+
+    def _fail(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("src.core.utils.atomic_file.os.replace", _fail)
+    with pytest.raises(OSError):
+        atomic_write_bytes(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert not [f for f in tmp_path.iterdir() if is_temp_file(f)]
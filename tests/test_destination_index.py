@@ -0,0 +1,192 @@
+"""
+대상 라이브러리 중복 판정 테스트
+"""
+
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.core.destination_index import (
+    DestinationLibraryIndex,
+    DuplicateAction,
+    partial_content_hash,
+    replace_file_in_place,
+    retire_replaced_file,
+)
+
+
+def _episode(name: str) -> int | None:
+    match = re.search(r" - (\d+)", name)
+    return int(match.group(1)) if match else None
+
+
+def _library(root: Path, files: dict[str, bytes]) -> None:
+    for relative, data in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def _index(root: Path, **kwargs) -> DestinationLibraryIndex:
+    return DestinationLibraryIndex(root, episode_parser=_episode, **kwargs)
+
+
+def test_reimporting_a_batch_costs_one_listing_per_season(tmp_path):
+    library = tmp_path / "library"
+    incoming = tmp_path / "incoming"
+    names = [f"[Group] Show - {number:02d} (1080p).mkv" for number in range(1, 13)]
+    _library(library, {f"Show/Season01/{name}": b"x" * number for number, name in enumerate(names)})
+    _library(incoming, {name: b"x" * number for number, name in enumerate(names)})
+    listed = []
+
+    def lister(directory):
+        listed.append(directory)
+        if not directory.is_dir():
+            return []
+        return [(path.name, path.stat().st_size) for path in directory.iterdir()]
+
+    index = _index(library, lister=lister)
+    decisions = [
+        index.classify("Show", 1, _episode(name), incoming / name, (incoming / name).stat().st_size)
+        for name in names
+    ]
+
+    assert {decision.action for decision in decisions} == {DuplicateAction.SKIP}
+    # 일반 폴더와 저화질 폴더를 한 번씩만 조회
+    assert len(listed) == 2
+    assert index.listings == 2
+
+
+def test_better_quality_replaces_and_worse_quality_keeps_existing(tmp_path):
+    existing = "Show/Season01/[A] Show - 03 (720p).mkv"
+    _library(tmp_path, {existing: b"old"})
+    index = _index(tmp_path)
+
+    better = index.classify("Show", 1, 3, Path("[B] Show - 03 (1080p).mkv"), 10)
+    worse = index.classify("Show", 1, 3, Path("[C] Show - 03 (480p).mkv"), 20)
+    same = index.classify("Show", 1, 3, Path("[D] Show - 03 (720p).mkv"), 30)
+    unknown = index.classify("Show", 1, 3, Path("[E] Show - 03.mkv"), 40)
+
+    assert better.action == DuplicateAction.REPLACE
+    assert better.existing.path == tmp_path / existing
+    assert worse.action == DuplicateAction.KEEP_EXISTING
+    assert same.action == DuplicateAction.NEW
+    assert unknown.action == DuplicateAction.NEW
+    assert index.classify("Show", 1, 4, Path("x - 04 (1080p).mkv"), 3).action == (
+        DuplicateAction.NEW
+    )
+
+
+def test_series_key_ignores_case_and_symbols(tmp_path):
+    _library(tmp_path, {"Show Name/Season02/Show Name - 01 (1080p).mkv": b"abc"})
+    index = _index(tmp_path)
+
+    entries = index.entries("Show Name", 2, 1)
+
+    assert len(entries) == 1
+    assert index.entries("show  name!", 2, 1) == entries
+    assert index.listings == 2
+    assert index.classify("Show Name", 2, None, Path("a.mkv"), 3).action == DuplicateAction.NEW
+
+
+def test_partial_hash_separates_same_size_different_content(tmp_path):
+    _library(tmp_path / "lib", {"Show/Season01/Show - 01 (1080p).mkv": b"a" * 100})
+    _library(tmp_path / "in", {"same.mkv": b"a" * 100, "other.mkv": b"b" * 100})
+    index = _index(tmp_path / "lib", partial_hash=True)
+
+    same = index.classify("Show", 1, 1, tmp_path / "in" / "same.mkv", 100, "1080p")
+    other = index.classify("Show", 1, 1, tmp_path / "in" / "other.mkv", 100, "1080p")
+
+    assert same.action == DuplicateAction.SKIP
+    assert other.action == DuplicateAction.NEW
+
+
+def test_planned_files_are_recorded_and_replaced_files_forgotten(tmp_path):
+    old = tmp_path / "Show" / "Season01" / "Show - 01 (720p).mkv"
+    _library(tmp_path, {"Show/Season01/Show - 01 (720p).mkv": b"old"})
+    index = _index(tmp_path)
+    assert index.entries("Show", 1, 1)[0].path == old
+
+    index.forget(old)
+    index.record("Show", 1, 1, tmp_path / "Show" / "Season01" / "Show - 01 (1080p).mkv", 50)
+
+    assert [entry.resolution for entry in index.entries("Show", 1, 1)] == ["1080p"]
+    assert index.classify("Show", 1, 1, Path("dup - 01.mkv"), 50).action == DuplicateAction.SKIP
+
+
+def test_partial_content_hash_reads_head_middle_and_tail(tmp_path):
+    first, second = tmp_path / "a.bin", tmp_path / "b.bin"
+    data = bytearray(b"x" * 1000)
+    first.write_bytes(bytes(data))
+    data[500] = ord("y")
+    second.write_bytes(bytes(data))
+
+    assert partial_content_hash(first, sample_size=100) == partial_content_hash(
+        first, sample_size=100
+    )
+    assert partial_content_hash(first, sample_size=100) != partial_content_hash(
+        second, sample_size=100
+    )
+    # 샘플 밖의 차이는 부분 해시로 구분되지 않음
+    data[500] = ord("x")
+    data[200] = ord("z")
+    second.write_bytes(bytes(data))
+    assert partial_content_hash(first, sample_size=100) == partial_content_hash(
+        second, sample_size=100
+    )
+
+
+def test_failed_copy_leaves_replaced_file_in_place(tmp_path):
+    target = tmp_path / "Show - 01.mkv"
+    target.write_bytes(b"old")
+
+    def failing_copy(destination):
+        destination.write_bytes(b"ne")
+        raise OSError("디스크 오류")
+
+    with pytest.raises(OSError):
+        replace_file_in_place(target, failing_copy, keep_backup=False)
+
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == [target.name]
+
+
+@pytest.mark.parametrize("keep_backup", [True, False])
+def test_replace_in_place_swaps_after_new_file_lands(tmp_path, keep_backup):
+    source = tmp_path / "in" / "Show - 01 (1080p).mkv"
+    _library(tmp_path / "in", {source.name: b"new"})
+    target = tmp_path / "lib" / "Show - 01.mkv"
+    _library(tmp_path / "lib", {target.name: b"old"})
+
+    def copy(destination):
+        # 새 파일을 만드는 동안 기존 파일은 그대로
+        assert target.read_bytes() == b"old"
+        return shutil.copyfile(source, destination)
+
+    written, backup_path = replace_file_in_place(target, copy, keep_backup)
+
+    assert target.read_bytes() == b"new"
+    assert written.name.endswith(".replacing")
+    if keep_backup:
+        assert backup_path.read_bytes() == b"old"
+        assert sorted(path.name for path in target.parent.iterdir()) == sorted(
+            [target.name, backup_path.name]
+        )
+    else:
+        assert backup_path is None
+        assert [path.name for path in target.parent.iterdir()] == [target.name]
+
+
+def test_retire_replaced_file_keeps_backup_only_when_asked(tmp_path):
+    kept = tmp_path / "a.mkv"
+    dropped = tmp_path / "b.mkv"
+    _library(tmp_path, {kept.name: b"a", dropped.name: b"b"})
+
+    backup_path = retire_replaced_file(kept, keep_backup=True)
+
+    assert backup_path.read_bytes() == b"a" and not kept.exists()
+    assert retire_replaced_file(dropped, keep_backup=False) is None
+    assert not dropped.exists()
+    assert retire_replaced_file(dropped, keep_backup=True) is None
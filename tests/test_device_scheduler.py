@@ -0,0 +1,297 @@
+"""
+장치별 병렬 파일 작업 스케줄러 테스트
+
+실제 장치 대신 경로의 첫 구성 요소로 장치를 정하는 대역을 사용합니다.
+"""
+
+import random
+import threading
+import time
+from pathlib import Path
+
+from src.core.device_scheduler import (
+    DeviceAwareScheduler,
+    DeviceResolver,
+    PhysicalLocalityOrder,
+    PlanOrder,
+    create_ordering,
+    report_progress,
+)
+from src.core.file_snapshot import FileSnapshot
+from src.core.interfaces.file_organization_interface import FileOperationPlan, FileOperationType
+
+
+class _PrefixDeviceResolver(DeviceResolver):
+    """/disk_a/... → "disk_a" 처럼 경로의 첫 디렉토리를 장치로 간주"""
+
+    def device_of(self, path):
+        return Path(path).parts[1]
+
+
+class _RecordingExecutor:
+    """동시 실행 상황을 기록하는 작업 실행 대역"""
+
+    def __init__(self, durations=None, failures=()):
+        self.durations = durations or {}
+        self.failures = set(failures)
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.max_active: dict[str, int] = {}
+        self.events: list[tuple[str, str]] = []
+
+    def __call__(self, plan):
+        name = plan.source_path.name
+        kind = plan.operation_type.value
+        with self.lock:
+            self.active[kind] = self.active.get(kind, 0) + 1
+            self.max_active[kind] = max(self.max_active.get(kind, 0), self.active[kind])
+            self.events.append(("start", name))
+        time.sleep(self.durations.get(name, 0.01))
+        with self.lock:
+            self.active[kind] -= 1
+            self.events.append(("end", name))
+        if name in self.failures:
+            raise OSError(f"{name} 실패")
+        return ("ok", name)
+
+
+def _plan(source, target, operation=FileOperationType.MOVE):
+    return FileOperationPlan(Path(source), Path(target), operation)
+
+
+def _scheduler(**kwargs):
+    return DeviceAwareScheduler(device_resolver=_PrefixDeviceResolver(), **kwargs)
+
+
+def test_same_device_moves_do_not_wait_for_cross_device_copies():
+    plans = [_plan(f"/a/src/big{i}.mkv", f"/b/lib/big{i}.mkv") for i in range(4)]
+    plans += [_plan(f"/a/src/ep{i}.mkv", f"/a/lib/ep{i}.mkv") for i in range(8)]
+    executor = _RecordingExecutor({f"big{i}.mkv": 0.3 for i in range(4)})
+
+    started = time.monotonic()
+    results = _scheduler(max_workers=8, per_device_limit=2).run(
+        plans, executor, on_error=lambda plan, e: ("error", str(e))
+    )
+    elapsed = time.monotonic() - started
+
+    assert results == [("ok", plan.source_path.name) for plan in plans]
+    # 같은 장치 안의 이동은 앞선 장치 간 이동이 끝나기 전에 모두 끝남
+    ends = [name for event, name in executor.events if event == "end"]
+    assert all(ends.index(f"ep{i}.mkv") < ends.index("big2.mkv") for i in range(8))
+    assert elapsed < 1.0
+
+
+def test_cross_device_operations_are_limited_per_device():
+    plans = [_plan(f"/a/src/{i}.mkv", f"/b/lib/{i}.mkv", FileOperationType.COPY) for i in range(6)]
+    plans += [_plan(f"/c/src/{i}.mkv", f"/d/lib/{i}.mkv", FileOperationType.COPY) for i in range(6)]
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def execute(plan):
+        device = plan.source_path.parts[1]
+        with lock:
+            active[device] = active.get(device, 0) + 1
+            peak[device] = max(peak.get(device, 0), active[device])
+        time.sleep(0.05)
+        with lock:
+            active[device] -= 1
+        return True
+
+    _scheduler(max_workers=16, per_device_limit=2).run(plans, execute, on_error=lambda p, e: False)
+
+    assert peak == {"a": 2, "c": 2}
+
+
+def test_ordering_constraints_are_preserved():
+    plans = [
+        # 디렉토리를 먼저 옮긴 뒤 그 안으로 이동
+        _plan("/a/tmp/Show", "/a/lib/Show", FileOperationType.RENAME),
+        _plan("/a/src/ep1.mkv", "/a/lib/Show/ep1.mkv"),
+        # 같은 파일의 연속 작업
+        _plan("/a/src/ep2.mkv", "/b/stage/ep2.mkv", FileOperationType.COPY),
+        _plan("/b/stage/ep2.mkv", "/b/lib/ep2.mkv"),
+        _plan("/a/src/ep3.mkv", "/a/lib/ep3.mkv"),
+    ]
+    executor = _RecordingExecutor({"Show": 0.2, "ep2.mkv": 0.2})
+
+    _scheduler(max_workers=8).run(plans, executor, on_error=lambda p, e: None)
+
+    events = executor.events
+    assert events.index(("end", "Show")) < events.index(("start", "ep1.mkv"))
+    first_ep2_end = events.index(("end", "ep2.mkv"))
+    assert first_ep2_end < len(events) - 1 - events[::-1].index(("start", "ep2.mkv"))
+    # 관련 없는 작업은 기다리지 않음
+    assert events.index(("end", "ep3.mkv")) < events.index(("end", "Show"))
+
+
+def test_failures_are_reported_per_operation_in_plan_order():
+    plans = [_plan(f"/a/src/{i}.mkv", f"/b/lib/{i}.mkv") for i in range(5)]
+    executor = _RecordingExecutor(failures={"1.mkv", "3.mkv"})
+    completed = []
+
+    results = _scheduler(max_workers=4).run(
+        plans,
+        executor,
+        on_error=lambda plan, e: ("error", plan.source_path.name),
+        on_complete=lambda index, plan, result: completed.append(index),
+    )
+
+    assert results == [
+        ("ok", "0.mkv"),
+        ("error", "1.mkv"),
+        ("ok", "2.mkv"),
+        ("error", "3.mkv"),
+        ("ok", "4.mkv"),
+    ]
+    assert sorted(completed) == list(range(5))
+
+
+def test_failing_error_handler_is_raised_instead_of_hanging():
+    plans = [_plan(f"/a/src/{i}.mkv", f"/b/lib/{i}.mkv") for i in range(3)]
+    executor = _RecordingExecutor(failures={"1.mkv"})
+    outcome: list[BaseException] = []
+
+    def on_error(plan, error):
+        raise RuntimeError(f"오류 처리 실패: {error}")
+
+    def run():
+        try:
+            _scheduler(max_workers=2).run(plans, executor, on_error=on_error)
+        except RuntimeError as e:
+            outcome.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert [str(error) for error in outcome] == ["오류 처리 실패: 1.mkv 실패"]
+
+
+def test_progress_is_delivered_on_the_calling_thread():
+    plans = [_plan(f"/a/src/{i}.mkv", f"/b/lib/{i}.mkv", FileOperationType.COPY) for i in range(4)]
+    caller = threading.get_ident()
+    delivered = []
+
+    def execute(plan):
+        assert threading.get_ident() != caller
+        for done in (1, 2):
+            report_progress(done)
+        return plan.source_path.name
+
+    _scheduler(max_workers=4, per_device_limit=4).run(
+        plans,
+        execute,
+        on_error=lambda plan, e: None,
+        on_progress=lambda index, plan, done: delivered.append(
+            (index, done, threading.get_ident())
+        ),
+    )
+
+    assert sorted((index, done) for index, done, _ in delivered) == [
+        (index, done) for index in range(4) for done in (1, 2)
+    ]
+    assert {thread for _, _, thread in delivered} == {caller}
+    # 스케줄러 밖에서는 전달하지 않음
+    assert report_progress(3) is False
+
+
+def test_device_resolver_uses_nearest_existing_parent(tmp_path):
+    resolver = DeviceResolver()
+    expected = tmp_path.stat().st_dev
+
+    assert resolver.device_of(tmp_path / "missing" / "deeper" / "file.mkv") == expected
+    assert resolver.device_of(tmp_path) == expected
+
+
+class _SimulatedSpindle:
+    """장치마다 헤드 위치 하나를 가진 HDD 모델
+
+    블록을 읽을 때마다 헤드가 이동한 거리를 탐색 비용으로 누적합니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.head: dict[str, int] = {}
+        self.seek_distance = 0
+        self.readers: dict[str, int] = {}
+        self.peak_readers: dict[str, int] = {}
+
+    def read_file(self, device: str, start: int, blocks: int) -> None:
+        with self.lock:
+            self.readers[device] = self.readers.get(device, 0) + 1
+            self.peak_readers[device] = max(self.peak_readers.get(device, 0), self.readers[device])
+        for block in range(start, start + blocks):
+            with self.lock:
+                self.seek_distance += abs(self.head.get(device, 0) - block)
+                self.head[device] = block + 1
+            time.sleep(0.0005)
+        with self.lock:
+            self.readers[device] -= 1
+
+
+def _located_copies(count: int, blocks: int) -> list[FileOperationPlan]:
+    """디스크 위치가 뒤섞인 순서로 나열된 장치 간 복사 계획"""
+    positions = list(range(count))
+    random.Random(7).shuffle(positions)
+    plans = []
+    for number, position in enumerate(positions):
+        source = Path(f"/a/src/dir{position // 4}/ep{number:02d}.mkv")
+        plan = _plan(source, f"/b/lib/ep{number:02d}.mkv", FileOperationType.COPY)
+        plan.source_snapshot = FileSnapshot(source, blocks, 0, inode=1000 + position * blocks)
+        plans.append(plan)
+    return plans
+
+
+def _simulate(ordering, plans, blocks):
+    disk = _SimulatedSpindle()
+
+    def execute(plan):
+        disk.read_file(plan.source_path.parts[1], plan.source_snapshot.inode, blocks)
+        return plan.source_path.name
+
+    results = _scheduler(max_workers=4, per_device_limit=2, ordering=ordering).run(
+        plans, execute, on_error=lambda p, e: None
+    )
+    assert results == [plan.source_path.name for plan in plans]
+    return disk
+
+
+def test_locality_order_reduces_seeks_on_simulated_disk():
+    blocks = 20
+    plans = _located_copies(24, blocks)
+
+    plan_order = _simulate(PlanOrder(), plans, blocks)
+    locality = _simulate(PhysicalLocalityOrder(), plans, blocks)
+
+    # 위치 순서로 한 파일씩 읽으면 헤드는 거의 앞으로만 이동
+    assert locality.peak_readers == {"a": 1}
+    assert locality.seek_distance <= 1000 + blocks * len(plans)
+    assert locality.seek_distance * 4 < plan_order.seek_distance
+
+
+def test_locality_order_groups_directories_and_runs_renames_first():
+    plans = [
+        _plan("/a/x/3.mkv", "/b/3.mkv", FileOperationType.COPY),
+        _plan("/a/y/1.mkv", "/b/1.mkv", FileOperationType.COPY),
+        _plan("/a/x/2.mkv", "/a/lib/2.mkv"),
+        _plan("/a/x/9.mkv", "/b/9.mkv", FileOperationType.COPY),
+        _plan("/c/z/5.mkv", "/b/5.mkv", FileOperationType.COPY),
+    ]
+    positions = {"3.mkv": 30, "1.mkv": 10, "2.mkv": 20, "9.mkv": 90, "5.mkv": 5}
+    ordering = PhysicalLocalityOrder(position_of=lambda path: positions[path.name])
+    scheduler = _scheduler(ordering=ordering)
+
+    rank = ordering.rank(scheduler.schedule(plans))
+    order = [
+        plans[index].source_path.name for index in sorted(range(len(plans)), key=rank.__getitem__)
+    ]
+
+    assert order == ["2.mkv", "1.mkv", "3.mkv", "9.mkv", "5.mkv"]
+
+
+def test_ordering_policy_by_name():
+    assert isinstance(create_ordering("locality"), PhysicalLocalityOrder)
+    assert type(create_ordering(None)) is PlanOrder
+    assert type(create_ordering("unknown")) is PlanOrder
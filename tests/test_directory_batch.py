@@ -0,0 +1,130 @@
+"""
+대상 디렉토리 일괄 생성과 캐시 테스트
+"""
+
+from pathlib import Path
+
+from src.app.commands.composite_commands import BatchFileOperationCommand
+from src.app.commands.file_commands import CreateDirectoriesCommand
+from src.core.commands.file_operation_commands import (
+    BatchFileOperationCommand as CoreBatchCommand,
+    FileOperationCommand,
+)
+from src.core.interfaces.file_organization_interface import FileOperationType
+from src.core.utils.directory_batch import (
+    DirectoryCache,
+    destination_directories,
+    remove_created_directories,
+)
+
+
+def _episodes(root: Path, count: int) -> list[Path]:
+    root.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for number in range(count):
+        path = root / f"ep{number:02d}.mkv"
+        path.write_bytes(b"x")
+        paths.append(path)
+    return paths
+
+
+def test_each_directory_is_created_once_for_many_files(tmp_path):
+    targets = [
+        tmp_path / "out" / "Show" / f"Season{season:02d}" / f"ep{number:02d}.mkv"
+        for season in (1, 2)
+        for number in range(50)
+    ]
+    cache = DirectoryCache()
+
+    created = cache.ensure_all(destination_directories(targets))
+    for target in targets:
+        cache.ensure_parent(target)
+
+    assert created == [
+        tmp_path / "out",
+        tmp_path / "out" / "Show",
+        tmp_path / "out" / "Show" / "Season01",
+        tmp_path / "out" / "Show" / "Season02",
+    ]
+    # 새 구성 요소마다 한 번, 처음 없던 디렉토리를 찾을 때 실패한 호출만 추가
+    assert cache.mkdir_calls <= len(created) + 3
+    assert all(target.parent.is_dir() for target in targets)
+
+
+def test_existing_directories_cost_one_call_and_are_not_recorded(tmp_path):
+    (tmp_path / "Show" / "Season01").mkdir(parents=True)
+    cache = DirectoryCache()
+
+    assert cache.ensure(tmp_path / "Show" / "Season01") == []
+    assert cache.ensure(tmp_path / "Show") == []
+    assert cache.mkdir_calls == 1
+    assert cache.created == []
+
+
+def test_removing_created_directories_keeps_non_empty_ones(tmp_path):
+    cache = DirectoryCache()
+    created = cache.ensure_all([tmp_path / "a" / "b", tmp_path / "a" / "c"])
+    (tmp_path / "a" / "c" / "keep.txt").write_text("x")
+
+    removed = remove_created_directories(created, cache)
+
+    assert removed == [tmp_path / "a" / "b"]
+    assert (tmp_path / "a" / "c").is_dir()
+    assert cache.ensure(tmp_path / "a" / "b") == [tmp_path / "a" / "b"]
+
+
+def test_create_directories_command_undoes_as_a_unit(tmp_path):
+    command = CreateDirectoriesCommand([tmp_path / "x" / "1", tmp_path / "x" / "2"])
+
+    result = command.execute()
+
+    assert result.is_success
+    assert result.metadata["created_directories"] == 3
+    assert command.undo().is_success
+    assert not (tmp_path / "x").exists()
+
+
+def test_batch_command_creates_directories_first_and_removes_them_on_undo(tmp_path):
+    sources = _episodes(tmp_path / "in", 3)
+    operations = [
+        {
+            "operation_type": "move",
+            "source_path": str(source),
+            "destination_path": str(tmp_path / "out" / "Show" / "Season01" / source.name),
+        }
+        for source in sources
+    ]
+    batch = BatchFileOperationCommand(operations)
+
+    assert batch.execute().is_success
+    assert isinstance(batch._executed_commands[0], CreateDirectoriesCommand)
+    assert batch._directory_cache.created == [
+        tmp_path / "out",
+        tmp_path / "out" / "Show",
+        tmp_path / "out" / "Show" / "Season01",
+    ]
+
+    assert batch.undo().is_success
+    assert all(source.exists() for source in sources)
+    assert not (tmp_path / "out").exists()
+
+
+def test_core_batch_undo_removes_created_directories(tmp_path):
+    sources = _episodes(tmp_path / "in", 2)
+    commands = [
+        FileOperationCommand(
+            source, tmp_path / "out" / "Show" / source.name, FileOperationType.MOVE
+        )
+        for source in sources
+    ]
+    batch = CoreBatchCommand(commands)
+
+    result = batch.execute()
+
+    assert result.success
+    assert result.data["created_directories"] == [
+        str(tmp_path / "out"),
+        str(tmp_path / "out" / "Show"),
+    ]
+    assert batch.undo().data["removed_directories"] == 2
+    assert not (tmp_path / "out").exists()
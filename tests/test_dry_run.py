@@ -0,0 +1,173 @@
+"""
+가상 파일 시스템 기반 드라이런 테스트
+"""
+
+from collections import namedtuple
+from pathlib import Path
+
+from src.core.dry_run import (
+    STATUS_CONFLICT,
+    STATUS_ERROR,
+    STATUS_SUCCESS,
+    VirtualFileSystem,
+    scan_directory_entries,
+    simulate_plans,
+)
+from src.core.interfaces.file_organization_interface import FileOperationPlan, FileOperationType
+
+DiskUsage = namedtuple("DiskUsage", "total used free")
+
+
+def _plan(source: Path, target: Path, operation=FileOperationType.MOVE) -> FileOperationPlan:
+    return FileOperationPlan(source_path=source, target_path=target, operation_type=operation)
+
+
+def _tree(tmp_path):
+    incoming = tmp_path / "incoming"
+    season = tmp_path / "library" / "Show" / "Season01"
+    incoming.mkdir()
+    season.mkdir(parents=True)
+    (incoming / "ep01.mkv").write_bytes(b"1" * 100)
+    (incoming / "ep02.mkv").write_bytes(b"2" * 200)
+    (incoming / "ep03.mkv").write_bytes(b"3" * 300)
+    (season / "ep01.mkv").write_bytes(b"old" * 10)
+    return incoming, tmp_path / "library"
+
+
+def test_overlay_predicts_conflicts_errors_and_tree_without_touching_disk(tmp_path):
+    incoming, library = _tree(tmp_path)
+    season = library / "Show" / "Season01"
+    new_season = library / "Other" / "Season02"
+    plans = [
+        _plan(incoming / "ep01.mkv", season / "ep01.mkv"),
+        _plan(incoming / "ep02.mkv", new_season / "ep02.mkv", FileOperationType.COPY),
+        # 앞선 계획이 만든 파일과의 충돌
+        _plan(incoming / "ep02.mkv", new_season / "ep02.mkv"),
+        # 앞선 계획이 옮긴 원본
+        _plan(incoming / "ep01.mkv", season / "again.mkv"),
+        _plan(incoming / "missing.mkv", season / "missing.mkv"),
+    ]
+
+    report = simulate_plans(plans)
+
+    statuses = [simulation.status for simulation in report.simulations]
+    assert statuses == [
+        STATUS_CONFLICT,
+        STATUS_SUCCESS,
+        STATUS_CONFLICT,
+        STATUS_ERROR,
+        STATUS_ERROR,
+    ]
+    assert report.simulations[0].resolved_target == season / "ep01_1.mkv"
+    assert report.simulations[2].resolved_target == new_season / "ep02_1.mkv"
+    assert report.total_size == 100 + 200 + 200
+    assert report.created_directories == [library / "Other", new_season]
+    assert report.resulting_tree[str(season)] == ["ep01.mkv", "ep01_1.mkv"]
+    assert report.resulting_tree[str(new_season)] == ["ep02.mkv", "ep02_1.mkv"]
+    assert report.resulting_tree[str(incoming)] == ["ep03.mkv"]
+
+    # 실제 파일 시스템은 그대로
+    assert not (library / "Other").exists()
+    assert sorted(p.name for p in incoming.iterdir()) == ["ep01.mkv", "ep02.mkv", "ep03.mkv"]
+
+    summary = report.to_dict()
+    assert (summary["successful"], summary["conflicts"], summary["errors"]) == (1, 2, 2)
+
+
+def test_each_directory_is_listed_once(tmp_path):
+    incoming, library = _tree(tmp_path)
+    listed: list[Path] = []
+
+    def lister(directory):
+        listed.append(directory)
+        return scan_directory_entries(directory)
+
+    plans = [
+        _plan(incoming / f"ep0{index % 3 + 1}.mkv", library / f"Show{index % 5}" / f"{index}.mkv")
+        for index in range(500)
+    ]
+    simulate_plans(plans, VirtualFileSystem(lister=lister))
+
+    assert len(listed) == len(set(listed))
+    # 원본 디렉토리, 대상 루트, 존재하는 Show만 읽고 없는 Show1~4는 읽지 않음
+    assert set(listed) <= {incoming, library, library / "Show0", tmp_path}
+
+
+def test_space_is_estimated_per_device(tmp_path):
+    incoming, library = _tree(tmp_path)
+
+    def fake_stat(path):
+        device = 2 if library in (path, *path.parents) else 1
+        return type("Stat", (), {"st_dev": device})()
+
+    fs = VirtualFileSystem(stat=fake_stat, disk_usage=lambda path: DiskUsage(0, 0, 250))
+    plans = [
+        _plan(incoming / "ep01.mkv", library / "a.mkv"),
+        _plan(incoming / "ep02.mkv", library / "b.mkv", FileOperationType.COPY),
+        # 같은 장치 안의 이동은 공간이 필요 없음
+        _plan(incoming / "ep03.mkv", incoming / "renamed.mkv"),
+    ]
+    report = simulate_plans(plans, fs)
+
+    (estimate,) = report.space
+    assert estimate.device == 2 and estimate.required_bytes == 300
+    assert not report.space_sufficient
+
+
+def test_overwrite_mode_counts_replaced_bytes(tmp_path):
+    incoming, library = _tree(tmp_path)
+    season = library / "Show" / "Season01"
+    fs = VirtualFileSystem(
+        stat=lambda path: type("Stat", (), {"st_dev": 1 if path == incoming else 2})(),
+        disk_usage=lambda path: DiskUsage(0, 0, 1000),
+    )
+    report = simulate_plans(
+        [_plan(incoming / "ep01.mkv", season / "ep01.mkv")], fs, rename_on_conflict=False
+    )
+
+    assert report.simulations[0].status == STATUS_CONFLICT
+    assert report.simulations[0].resolved_target is None
+    assert report.space[0].required_bytes == 100 - 30
+    assert report.resulting_tree[str(season)] == ["ep01.mkv"]
+
+
+def test_replace_plans_overwrite_or_drop_the_replaced_file(tmp_path):
+    incoming, library = _tree(tmp_path)
+    season = library / "Show" / "Season01"
+    (season / "ep02 (720p).mkv").write_bytes(b"o" * 50)
+    fs = VirtualFileSystem(
+        stat=lambda path: type("Stat", (), {"st_dev": 1 if path == incoming else 2})(),
+        disk_usage=lambda path: DiskUsage(0, 0, 1000),
+    )
+    same_name = _plan(incoming / "ep01.mkv", season / "ep01.mkv")
+    same_name.metadata = {"replaces": str(season / "ep01.mkv")}
+    other_name = _plan(incoming / "ep02.mkv", season / "ep02 (1080p).mkv")
+    other_name.metadata = {"replaces": str(season / "ep02 (720p).mkv")}
+
+    report = simulate_plans([same_name, other_name], fs)
+
+    assert [simulation.status for simulation in report.simulations] == [STATUS_SUCCESS] * 2
+    assert [simulation.issues for simulation in report.simulations] == [[], []]
+    assert report.simulations[0].resolved_target is None
+    assert report.space[0].required_bytes == (100 - 30) + (200 - 50)
+    assert report.resulting_tree[str(season)] == ["ep01.mkv", "ep02 (1080p).mkv"]
+
+
+def test_file_in_place_of_target_directory_is_reported(tmp_path):
+    incoming, library = _tree(tmp_path)
+    (library / "Blocked").write_bytes(b"not a folder")
+    plans = [
+        _plan(incoming / "ep02.mkv", library / "Blocked" / "Season01" / "ep02.mkv"),
+        # 기존 파일 아래에 디렉토리를 만들 수 없음
+        _plan(incoming / "ep03.mkv", library / "Show" / "Season01" / "ep01.mkv" / "ep03.mkv"),
+    ]
+
+    report = simulate_plans(plans)
+
+    assert [simulation.status for simulation in report.simulations] == [STATUS_ERROR] * 2
+    assert report.simulations[0].issues == [
+        f"Target directory path is a file: {library / 'Blocked'}"
+    ]
+    assert report.created_directories == []
+    assert (library / "Blocked").read_bytes() == b"not a folder"
+    assert report.resulting_tree == {}
@@ -0,0 +1,207 @@
+"""
+내용 기반 중복 파일 찾기 테스트
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.duplicate_detector import (
+    FINGERPRINT_BLOCK_SIZE,
+    FingerprintCache,
+    covers_whole_file,
+    find_duplicates,
+)
+from src.core.file_snapshot import FileSnapshot
+
+BIG = 10 * FINGERPRINT_BLOCK_SIZE
+
+
+def _write(path: Path, data: bytes) -> FileSnapshot:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return FileSnapshot.capture(path)
+
+
+def _big(fill: bytes = b"a", patch_at: int | None = None) -> bytes:
+    data = bytearray(fill * BIG)
+    if patch_at is not None:
+        data[patch_at] ^= 0xFF
+    return bytes(data)
+
+
+def test_only_same_size_files_are_read(tmp_path):
+    snapshots = [
+        _write(tmp_path / "a.mkv", b"x" * 100),
+        _write(tmp_path / "b.mkv", b"x" * 100),
+        _write(tmp_path / "c.mkv", b"x" * 101),
+        _write(tmp_path / "d.mkv", b"y" * 102),
+        _write(tmp_path / "empty1.mkv", b""),
+        _write(tmp_path / "empty2.mkv", b""),
+    ]
+
+    result = find_duplicates(snapshots)
+
+    assert [set(group.paths) for group in result.groups] == [
+        {tmp_path / "a.mkv", tmp_path / "b.mkv"}
+    ]
+    assert result.size_candidates == 2
+    assert result.partial_hashed == 2
+    # 작은 파일은 부분 지문이 전체 내용이므로 전체 해시 생략
+    assert covers_whole_file(100)
+    assert result.full_hashed == 0
+
+
+def test_full_hash_confirms_only_partial_matches(tmp_path):
+    # 지문 블록 밖의 차이는 전체 해시에서만 드러남
+    outside_samples = FINGERPRINT_BLOCK_SIZE + 10
+    snapshots = [
+        _write(tmp_path / "a.mkv", _big()),
+        _write(tmp_path / "b.mkv", _big()),
+        _write(tmp_path / "c.mkv", _big(patch_at=outside_samples)),
+        _write(tmp_path / "d.mkv", _big(patch_at=0)),
+    ]
+
+    result = find_duplicates(snapshots)
+
+    assert [set(group.paths) for group in result.groups] == [
+        {tmp_path / "a.mkv", tmp_path / "b.mkv"}
+    ]
+    assert result.partial_hashed == 4
+    assert result.full_hashed == 3
+    assert result.wasted_bytes == BIG
+
+
+def test_cache_skips_unchanged_files_and_sees_modified_ones(tmp_path):
+    cache = FingerprintCache(tmp_path / "cache" / "fingerprints.json")
+    paths = [tmp_path / "lib" / f"{name}.mkv" for name in "ab"]
+    snapshots = [_write(path, _big()) for path in paths]
+    find_duplicates(snapshots, cache)
+    cache.save()
+
+    reloaded = FingerprintCache(cache.path)
+    assert reloaded.load() == 2
+    again = find_duplicates(snapshots, reloaded)
+    assert len(again.groups) == 1
+    assert again.partial_hashed == again.full_hashed == 0
+
+    paths[1].write_bytes(_big(patch_at=BIG - 1))
+    os.utime(paths[1], ns=(0, snapshots[1].mtime_ns + 1_000_000_000))
+    changed = find_duplicates([snapshots[0], FileSnapshot.capture(paths[1])], reloaded)
+    assert changed.groups == []
+    assert changed.partial_hashed == 1
+
+
+def test_hard_links_are_not_reported_as_duplicates(tmp_path):
+    original = _write(tmp_path / "a.mkv", b"z" * 50)
+    try:
+        os.link(tmp_path / "a.mkv", tmp_path / "b.mkv")
+    except OSError:
+        pytest.skip("하드 링크를 만들 수 없는 파일 시스템")
+
+    result = find_duplicates([original, FileSnapshot.capture(tmp_path / "b.mkv")])
+
+    assert result.files_scanned == 1
+    assert result.groups == []
+
+
+def test_groups_are_reported_incrementally_and_cancel_stops_early(tmp_path):
+    snapshots = []
+    for size in (300, 200, 100):
+        snapshots.append(_write(tmp_path / f"{size}a.mkv", b"q" * size))
+        snapshots.append(_write(tmp_path / f"{size}b.mkv", b"q" * size))
+    seen = []
+
+    result = find_duplicates(snapshots, on_group=seen.append, is_cancelled=lambda: len(seen) >= 2)
+
+    assert [group.size for group in seen] == [300, 200]
+    assert result.cancelled
+    assert result.groups == seen
+
+
+def test_scan_task_emits_groups_and_reports_totals(tmp_path):
+    pytest.importorskip("PyQt5")
+    from src.app.services.duplicate_scan_task import DuplicateScanTask
+
+    _write(tmp_path / "lib" / "Show" / "ep01.mkv", _big())
+    _write(tmp_path / "inbox" / "ep01 copy.mkv", _big())
+    _write(tmp_path / "inbox" / "other.mkv", _big(b"b"))
+    task = DuplicateScanTask([tmp_path / "lib", tmp_path / "inbox"])
+    found = []
+    task.duplicate_signals.group_found.connect(found.append)
+
+    result = task.execute()
+
+    assert result.success
+    assert result.result_data["group_count"] == 1
+    assert [set(group.paths) for group in found] == [
+        {tmp_path / "lib" / "Show" / "ep01.mkv", tmp_path / "inbox" / "ep01 copy.mkv"}
+    ]
+
+
+def test_duplicate_tab_view_fills_rows_as_groups_arrive(tmp_path):
+    pytest.importorskip("PyQt5")
+    from PyQt5.QtWidgets import QApplication
+
+    from src.core.duplicate_detector import DuplicateGroup
+    from src.gui.components.views import DuplicateTabView
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    view = DuplicateTabView()
+    paths = (tmp_path / "a" / "ep01.mkv", tmp_path / "b" / "ep01.mkv")
+
+    view.add_duplicate_group(DuplicateGroup(2048, "digest", paths))
+    view.group_table.selectRow(0)
+
+    assert view.duplicate_model.rowCount() == 1
+    assert view.duplicate_files_model.rowCount() == 2
+    assert "2.0 KB" in view.summary_label.text()
+    view.clear_duplicates()
+    assert view.duplicate_model.rowCount() == 0
+
+
+def test_duplicate_tab_view_settles_summary_when_scan_fails_or_is_cancelled():
+    pytest.importorskip("PyQt5")
+    from PyQt5.QtWidgets import QApplication
+
+    from src.gui.components.views import DuplicateTabView
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    view = DuplicateTabView()
+
+    view._scan_task_id = "task"
+    view._set_scanning(True)
+    view._on_scan_failed("other", "오류", "")
+    assert not view.scan_button.isEnabled()
+    view._on_scan_failed("task", "오류", "")
+    assert "(검사 실패)" in view.summary_label.text()
+    assert view.scan_button.isEnabled() and not view.cancel_button.isEnabled()
+
+    view._scan_task_id = "task"
+    view._on_scan_cancelled("task", "사용자 취소")
+    assert "(취소됨)" in view.summary_label.text()
+    assert view._scan_task_id is None
+
+
+def test_results_view_scans_window_directories_from_duplicate_tab(tmp_path, monkeypatch):
+    pytest.importorskip("PyQt5")
+    from PyQt5.QtWidgets import QApplication, QMainWindow
+
+    from src.gui.components.results_view import ResultsView
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    window = QMainWindow()
+    results_view = ResultsView()
+    window.setCentralWidget(results_view)
+    view = results_view.duplicate_files_view
+    assert results_view.duplicate_tab.isAncestorOf(view)
+    requested = []
+    monkeypatch.setattr(view, "start_duplicate_scan", requested.append)
+
+    view.scan_button.click()
+    window.source_directory = str(tmp_path / "inbox")
+    window.destination_directory = str(tmp_path / "lib")
+    view.scan_button.click()
+
+    assert requested == [[], [str(tmp_path / "inbox"), str(tmp_path / "lib")]]
@@ -0,0 +1,87 @@
+"""
+작업이 건드린 디렉토리만 정리하는 빈 디렉토리 삭제 테스트
+"""
+
+from pathlib import Path
+
+from src.app.services.directory_cleanup_task import DirectoryCleanupTask
+from src.core.utils.empty_dir_cleanup import cleanup_candidates, remove_empty_directories
+
+
+def _mkdirs(*paths: Path) -> None:
+    for path in paths:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def test_empty_parents_are_removed_up_to_the_root(tmp_path):
+    season = tmp_path / "Show" / "Season 1"
+    _mkdirs(season)
+
+    result = remove_empty_directories([season], roots=[tmp_path])
+
+    assert result.removed == [season, tmp_path / "Show"]
+    assert tmp_path.exists()
+    assert not result.errors
+
+
+def test_non_empty_directory_keeps_its_parents(tmp_path):
+    season = tmp_path / "Show" / "Season 1"
+    extras = tmp_path / "Show" / "Extras"
+    _mkdirs(season, extras)
+    (extras / "note.txt").write_text("x")
+
+    result = remove_empty_directories([season, extras], roots=[tmp_path])
+
+    assert result.removed == [season]
+    assert extras.exists()
+    assert result.candidates == 3
+
+
+def test_untouched_empty_directories_are_left_alone(tmp_path):
+    touched = tmp_path / "A"
+    untouched = tmp_path / "B" / "empty"
+    _mkdirs(touched, untouched)
+
+    remove_empty_directories([touched], roots=[tmp_path])
+
+    assert not touched.exists()
+    assert untouched.exists()
+
+
+def test_candidates_are_ordered_deepest_first_and_deduplicated(tmp_path):
+    deep = tmp_path / "a" / "b" / "c"
+    outside = tmp_path.parent / "elsewhere"
+
+    candidates = cleanup_candidates([deep, tmp_path / "a" / "b", outside], roots=[tmp_path])
+
+    assert candidates == [deep, tmp_path / "a" / "b", tmp_path / "a", outside]
+    assert cleanup_candidates([tmp_path], roots=[tmp_path]) == []
+
+
+def test_cancel_stops_before_remaining_directories(tmp_path):
+    first, second = tmp_path / "x" / "1", tmp_path / "x" / "2"
+    _mkdirs(first, second)
+    seen = []
+
+    result = remove_empty_directories(
+        [first, second],
+        roots=[tmp_path],
+        progress_callback=lambda done, total, directory: seen.append(done),
+        is_cancelled=lambda: len(seen) >= 1,
+    )
+
+    assert result.cancelled
+    assert result.removed == [first]
+    assert second.exists()
+
+
+def test_cleanup_task_reports_removed_directories(tmp_path):
+    season = tmp_path / "Show" / "Season 1"
+    _mkdirs(season)
+    task = DirectoryCleanupTask({str(season)}, [str(tmp_path)])
+
+    result = task.execute()
+
+    assert result.success
+    assert result.result_data["removed_count"] == 2
+    assert not (tmp_path / "Show").exists()
@@ -0,0 +1,130 @@
+"""
+파일 스냅샷 재사용과 실행 직전 변경 확인 테스트
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.app.preflight.preflight_coordinator import PreflightCoordinator
+from src.core.dry_run import simulate_plans
+from src.core.file_snapshot import (
+    FileSnapshot,
+    StaleFileError,
+    StatCache,
+    capture_snapshot,
+    iter_file_snapshots,
+    verify_snapshot,
+)
+from src.core.interfaces.file_organization_interface import FileOperationPlan, FileOperationType
+
+
+def _write(path: Path, size: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_scan_collects_snapshots_for_matching_extensions(tmp_path):
+    episode = _write(tmp_path / "Show" / "ep01.MKV", 10)
+    _write(tmp_path / "Show" / "Season01" / "ep02.mp4", 20)
+    _write(tmp_path / "Show" / "notes.txt", 5)
+    errors = []
+
+    snapshots = {
+        snapshot.path: snapshot
+        for snapshot in iter_file_snapshots(
+            tmp_path, extensions={".mkv", ".mp4"}, on_error=lambda p, e: errors.append(p)
+        )
+    }
+
+    assert set(snapshots) == {episode, tmp_path / "Show" / "Season01" / "ep02.mp4"}
+    assert snapshots[episode] == FileSnapshot.capture(episode)
+    assert not errors
+    flat = list(iter_file_snapshots(tmp_path / "Show", recursive=False, extensions={".mp4"}))
+    assert flat == []
+
+
+def test_verify_detects_changes_since_scan(tmp_path):
+    episode = _write(tmp_path / "ep01.mkv", 10)
+    snapshot = FileSnapshot.capture(episode)
+
+    assert verify_snapshot(snapshot).st_size == 10
+
+    st = episode.stat()
+    os.utime(episode, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(StaleFileError) as excinfo:
+        verify_snapshot(snapshot)
+    assert excinfo.value.changes == ["mtime"]
+
+    episode.unlink()
+    with pytest.raises(FileNotFoundError):
+        verify_snapshot(snapshot)
+    assert capture_snapshot(episode) is None
+
+
+def test_unknown_inode_and_device_are_not_compared(tmp_path):
+    episode = _write(tmp_path / "ep01.mkv", 10)
+    st = episode.stat()
+    snapshot = FileSnapshot(episode, st.st_size, st.st_mtime_ns)
+
+    assert snapshot.matches(st)
+    assert FileSnapshot(episode, 10, st.st_mtime_ns, inode=st.st_ino + 1).changes(st) == ["inode"]
+
+
+def test_stat_cache_stats_each_path_once_and_trusts_snapshots(tmp_path):
+    episode = _write(tmp_path / "ep01.mkv", 10)
+    calls: list[Path] = []
+
+    def counting_stat(path):
+        calls.append(path)
+        return Path(path).stat()
+
+    cache = StatCache([FileSnapshot(episode, 99, 0)], stat=counting_stat)
+    assert cache.is_file(episode) and cache.size(episode) == 99
+    assert cache.is_dir(tmp_path) and cache.exists(tmp_path)
+    assert not cache.exists(tmp_path / "missing") and not cache.is_file(tmp_path / "missing")
+
+    assert calls == [tmp_path, tmp_path / "missing"]
+    cache.forget(tmp_path)
+    cache.is_dir(tmp_path)
+    assert cache.stat_calls == 3
+
+    link = tmp_path / "link.mkv"
+    os.link(episode, link)
+    other = _write(tmp_path / "other.mkv", 10)
+    fresh = StatCache()
+    assert fresh.same_file(episode, link)
+    assert not fresh.same_file(episode, other)
+
+
+def test_preflight_checkers_share_one_stat_per_path(tmp_path, monkeypatch):
+    source = _write(tmp_path / "in" / "ep01.mkv", 10)
+    target = _write(tmp_path / "out" / "ep01.mkv", 20)
+    snapshot = FileSnapshot.capture(source)
+    stat_calls: list[str] = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        stat_calls.append(os.fspath(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    result = PreflightCoordinator().check_operation(source, target, snapshot)
+
+    assert any(issue.title == "파일 덮어쓰기" for issue in result.blocking_issues)
+    assert str(source) not in stat_calls
+    assert stat_calls.count(str(target)) <= 1
+
+
+def test_dry_run_uses_planned_snapshot_size(tmp_path):
+    source = _write(tmp_path / "in" / "ep01.mkv", 10)
+    plan = FileOperationPlan(
+        source_path=source,
+        target_path=tmp_path / "out" / "ep01.mkv",
+        operation_type=FileOperationType.COPY,
+        source_snapshot=FileSnapshot(source, 1234, 0),
+    )
+
+    assert simulate_plans([plan]).total_size == 1234
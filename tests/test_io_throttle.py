@@ -0,0 +1,124 @@
+"""
+I/O 대역폭/IOPS 제한 테스트
+
+실제로 기다리지 않도록 가짜 시계를 사용합니다.
+"""
+
+import pytest
+
+from src.core.utils.copy_engine import copy_file
+from src.core.utils.io_throttle import (
+    IOThrottle,
+    ThrottleLimits,
+    configure_io_throttles,
+    get_io_throttle,
+    set_ui_interactive,
+)
+from src.core.utils.verified_copy import copy_and_verify
+
+MB = 1024 * 1024
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        self.now += seconds
+
+
+def _throttle(interactive=None, idle=None, burst=0.25):
+    clock = _FakeClock()
+    throttle = IOThrottle(interactive, idle, burst_seconds=burst, clock=clock, sleep=clock.sleep)
+    return throttle, clock
+
+
+def test_bandwidth_limit_spreads_bytes_over_time():
+    throttle, clock = _throttle(ThrottleLimits(bytes_per_second=10 * MB))
+
+    for _ in range(50):
+        throttle.consume(MB)
+
+    # 50MB를 10MB/s로: 처음 burst 분량을 뺀 나머지만큼 기다림
+    assert clock.slept == pytest.approx(5.0 - 0.25)
+    assert throttle.chunk_size(64 * MB) == int(10 * MB * 0.25)
+
+
+def test_operation_limit_and_unlimited_default():
+    throttle, clock = _throttle(ThrottleLimits(operations_per_second=100), burst=0)
+    for _ in range(200):
+        throttle.consume(operations=1)
+    assert clock.slept == pytest.approx(2.0)
+
+    unlimited, unlimited_clock = _throttle()
+    unlimited.consume(100 * MB, operations=1000)
+    assert unlimited_clock.slept == 0
+    assert unlimited.chunk_size(64 * MB) == 64 * MB
+
+
+def test_idle_limits_apply_when_ui_is_not_interactive():
+    throttle, clock = _throttle(
+        interactive=ThrottleLimits(bytes_per_second=MB),
+        idle=ThrottleLimits(bytes_per_second=100 * MB),
+        burst=0,
+    )
+    throttle.consume(MB)
+    assert clock.slept == pytest.approx(1.0)
+
+    throttle.set_interactive(False)
+    throttle.consume(MB)
+    assert clock.slept == pytest.approx(1.01)
+
+
+def test_bytes_per_second_reports_recent_throughput():
+    throttle, clock = _throttle(ThrottleLimits(bytes_per_second=4 * MB), burst=0)
+    for _ in range(8):
+        throttle.consume(MB)
+
+    assert throttle.bytes_per_second == pytest.approx(4 * MB, rel=0.05)
+    clock.now += 10
+    assert throttle.bytes_per_second == 0.0
+
+
+@pytest.mark.parametrize("mode", ["none", "stream"])
+def test_copy_paths_report_every_byte_to_the_throttle(tmp_path, mode):
+    source = tmp_path / "ep01.mkv"
+    source.write_bytes(b"x" * (3 * MB + 123))
+    throttle, clock = _throttle(ThrottleLimits(bytes_per_second=MB), burst=0.25)
+
+    copy_and_verify(source, tmp_path / "copy.mkv", mode, throttle=throttle)
+
+    assert throttle.total_bytes == source.stat().st_size
+    assert clock.slept > 2.5
+    assert (tmp_path / "copy.mkv").read_bytes() == source.read_bytes()
+
+
+def test_shared_throttles_follow_configuration_and_ui_state(tmp_path):
+    try:
+        configure_io_throttles(
+            {
+                "organize": {
+                    "interactive": {"bytes_per_second": 5 * MB},
+                    "idle": {"bytes_per_second": 50 * MB},
+                }
+            }
+        )
+        organize = get_io_throttle("organize")
+        assert organize.limits.bytes_per_second == 5 * MB
+        assert get_io_throttle("backup").limits.unlimited
+
+        set_ui_interactive(False)
+        assert organize.limits.bytes_per_second == 50 * MB
+
+        source = tmp_path / "a.mkv"
+        source.write_bytes(b"x" * 1000)
+        copy_file(source, tmp_path / "b.mkv", throttle=organize)
+        assert organize.total_bytes >= 1000
+    finally:
+        set_ui_interactive(True)
+        configure_io_throttles({})
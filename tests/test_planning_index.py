@@ -0,0 +1,94 @@
+"""
+정리 계획용 경로 인덱스 테스트
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.interfaces.file_organization_interface import FileConflictResolution
+from src.core.planning_index import TargetNamespace, index_items_by_path
+from src.core.strategies.file_naming_strategies import StandardNamingStrategy
+
+RENAME = FileConflictResolution.RENAME
+
+
+def test_items_are_indexed_by_source_path():
+    first = SimpleNamespace(sourcePath="/in/a.mkv", season=2)
+    duplicate = SimpleNamespace(sourcePath="/in/a.mkv", season=3)
+    other = SimpleNamespace(sourcePath="/in/b.mkv")
+    index = index_items_by_path(
+        {"show": [first, other], "again": [duplicate], "meta": "not a list", "none": [object()]}
+    )
+
+    assert index == {Path("/in/a.mkv"): first, Path("/in/b.mkv"): other}
+    assert index_items_by_path(None) == {}
+
+
+def test_conflicts_resolved_against_existing_and_planned_names(tmp_path):
+    (tmp_path / "ep.mkv").write_bytes(b"")
+    (tmp_path / "ep_1.mkv").write_bytes(b"")
+    namespace = TargetNamespace()
+
+    assert namespace.resolve(tmp_path / "ep.mkv", RENAME) == tmp_path / "ep_2.mkv"
+    # 같은 계획 안의 두 번째 파일은 앞에서 예약한 이름을 피함
+    assert namespace.resolve(tmp_path / "ep.mkv", RENAME) == tmp_path / "ep_3.mkv"
+    assert namespace.resolve(tmp_path / "new.mkv", RENAME) == tmp_path / "new.mkv"
+    assert namespace.resolve(tmp_path / "new.mkv", RENAME) == tmp_path / "new_1.mkv"
+    # 아직 없는 디렉토리는 비어 있는 것으로 취급
+    assert namespace.resolve(tmp_path / "Show" / "ep.mkv", RENAME) == tmp_path / "Show" / "ep.mkv"
+
+    namespace.release(tmp_path / "new_1.mkv")
+    assert not namespace.is_taken(tmp_path / "new_1.mkv")
+    assert namespace.listings == 2
+
+
+def test_overwrite_keeps_target_and_exhaustion_raises():
+    namespace = TargetNamespace(
+        lister=lambda directory: ["a.mkv", "a_1.mkv"], max_unique_attempts=1
+    )
+
+    assert namespace.resolve(Path("/d/a.mkv"), FileConflictResolution.OVERWRITE) == Path("/d/a.mkv")
+    with pytest.raises(FileExistsError):
+        namespace.resolve(Path("/d/a.mkv"), RENAME)
+
+
+def test_planning_lists_each_directory_once():
+    listed: list[Path] = []
+
+    def lister(directory):
+        listed.append(directory)
+        return [f"{index:05d}.mkv" for index in range(0, 500, 2)]
+
+    namespace = TargetNamespace(lister=lister)
+    targets = [Path(f"/lib/Show{index % 100}/{index // 100:05d}.mkv") for index in range(50_000)]
+    resolved = [namespace.resolve(target, RENAME) for target in targets]
+
+    assert len(listed) == 100
+    assert len(set(resolved)) == len(resolved)
+    assert resolved[0] == Path("/lib/Show0/00000_1.mkv")
+    assert resolved[100] == Path("/lib/Show0/00001.mkv")
+
+
+def test_naming_strategy_uses_namespace_without_exists(tmp_path, monkeypatch):
+    (tmp_path / "ep.mkv").write_bytes(b"")
+    namespace = TargetNamespace()
+    namespace.is_taken(tmp_path / "ep.mkv")
+
+    def no_exists(self):
+        raise AssertionError("exists() 호출됨")
+
+    monkeypatch.setattr(Path, "exists", no_exists)
+    strategy = StandardNamingStrategy()
+
+    assert (
+        strategy.resolve_conflict(tmp_path / "ep.mkv", RENAME, namespace) == tmp_path / "ep_1.mkv"
+    )
+    assert (
+        strategy.resolve_conflict(tmp_path / "ep.mkv", RENAME, namespace) == tmp_path / "ep_2.mkv"
+    )
+    assert (
+        strategy.resolve_conflict(tmp_path / "ep.mkv", FileConflictResolution.SKIP, namespace)
+        == tmp_path / "ep.mkv"
+    )
@@ -0,0 +1,231 @@
+"""
+포스터 비동기 로더 및 TMDB 검색 다이얼로그 포스터 로딩 테스트
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.gui.managers.poster_loader import PosterLoader
+
+
+class _FakeTMDBClient:
+    """썸네일 조회만 흉내 내는 TMDB 클라이언트 대역"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.result_dir = "/cache"
+        self.cached: dict[str, str] = {}
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def get_cached_poster_thumbnail_path(self, poster_path, variant):
+        return self.cached.get(poster_path)
+
+    def get_poster_thumbnail_path(self, poster_path, variant):
+        with self._lock:
+            self.calls.append(poster_path)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.release.wait(5)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if poster_path.startswith("/missing"):
+            return None
+        return f"{self.result_dir}/{poster_path.strip('/')}"
+
+
+@pytest.fixture
+def client():
+    return _FakeTMDBClient()
+
+
+def test_cached_poster_is_returned_without_background_work(qtbot, client):
+    client.cached["/a.jpg"] = "/cache/a.jpg"
+    loader = PosterLoader(client)
+
+    assert loader.request("/a.jpg", "card") == "/cache/a.jpg"
+    assert client.calls == []
+    loader.shutdown()
+
+
+def test_misses_are_loaded_in_background_with_capped_concurrency(qtbot, client):
+    loader = PosterLoader(client, max_concurrent=2)
+    ready: list[tuple[str, str, str]] = []
+    loader.poster_ready.connect(lambda *args: ready.append(args))
+
+    for index in range(6):
+        assert loader.request(f"/p{index}.jpg", "card") is None
+    # 같은 포스터 중복 요청은 한 번만 처리
+    loader.request("/p0.jpg", "card")
+
+    qtbot.waitUntil(lambda: len(ready) == 6, timeout=5000)
+    assert client.max_active <= 2
+    assert sorted(client.calls) == sorted(f"/p{index}.jpg" for index in range(6))
+    assert ("/p0.jpg", "card", "/cache/p0.jpg") in ready
+    loader.shutdown()
+
+
+def test_failed_load_emits_failure(qtbot, client):
+    loader = PosterLoader(client)
+    with qtbot.waitSignal(loader.poster_failed, timeout=5000) as blocker:
+        loader.request("/missing.jpg", "card")
+    assert blocker.args == ["/missing.jpg", "card"]
+    loader.shutdown()
+
+
+def test_cancel_pending_drops_stale_results(qtbot, client):
+    client.release.clear()
+    loader = PosterLoader(client, max_concurrent=1)
+    ready: list[tuple] = []
+    loader.poster_ready.connect(lambda *args: ready.append(args))
+
+    for index in range(4):
+        loader.request(f"/old{index}.jpg", "card")
+    qtbot.waitUntil(lambda: client.active == 1, timeout=5000)
+    loader.cancel_pending()
+    assert loader.pending_count() == 0
+    loader.request("/new.jpg", "card")
+    client.release.set()
+
+    qtbot.waitUntil(lambda: bool(ready), timeout=5000)
+    qtbot.wait(200)
+    assert ready == [("/new.jpg", "card", "/cache/new.jpg")]
+    # 대기열에 있던 이전 요청은 시작되지 않음
+    assert client.calls == ["/old0.jpg", "/new.jpg"]
+    loader.shutdown()
+
+
+def test_search_dialog_builds_cards_without_waiting_for_posters(qtbot, client, tmp_path):
+    from PyQt5.QtGui import QImage
+
+    from src.gui.components.dialogs.tmdb_search_dialog import TMDBSearchDialog
+
+    client.result_dir = str(tmp_path)
+    results = []
+    for index in range(3):
+        QImage(100, 150, QImage.Format_RGB32).save(str(tmp_path / f"{index}.jpg"))
+        results.append(SimpleNamespace(id=index, name=f"Show {index}", poster_path=f"/{index}.jpg"))
+    client.release.clear()
+
+    started = time.monotonic()
+    dialog = TMDBSearchDialog("Show", client, initial_results=results)
+    qtbot.addWidget(dialog)
+    assert time.monotonic() - started < 1.0
+    assert len(dialog._poster_labels) == 3
+
+    client.release.set()
+    qtbot.waitUntil(lambda: not dialog._poster_labels, timeout=5000)
+    first_label = dialog.resultsList.itemWidget(dialog.resultsList.item(0)).findChildren(
+        type(dialog.lblSearchStatus)
+    )[0]
+    assert first_label.pixmap() is not None and not first_label.pixmap().isNull()
+
+    dialog.reject()
+    assert dialog.poster_loader is None
+
+
+def test_pixmap_cache_is_bounded_by_bytes(qtbot):
+    from PyQt5.QtGui import QPixmap
+
+    from src.gui.managers.poster_loader import PosterPixmapCache
+
+    pixmap = QPixmap(100, 100)
+    cost = PosterPixmapCache.pixmap_bytes(pixmap)
+    cache = PosterPixmapCache(max_bytes=cost * 2)
+
+    cache.put("a", pixmap)
+    cache.put("b", pixmap)
+    cache.get("a")
+    cache.put("c", pixmap)
+
+    assert cache.total_bytes <= cost * 2
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+
+def test_table_tooltip_never_downloads_on_ui_thread(qtbot, client, tmp_path):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPixmap
+
+    from src.gui.table_models import DetailFileModel, ParsedItem
+
+    client.result_dir = str(tmp_path)
+    items = []
+    for index in range(3):
+        QImage(200, 300, QImage.Format_RGB32).save(str(tmp_path / f"{index}.jpg"))
+        items.append(
+            ParsedItem(
+                sourcePath=f"/videos/{index}.mkv",
+                tmdbMatch=SimpleNamespace(poster_path=f"/{index}.jpg"),
+            )
+        )
+    client.release.clear()
+    model = DetailFileModel(items, client)
+    index = model.index(1, 0)
+
+    # 캐시에 없으면 텍스트 툴팁을 바로 반환하고 백그라운드로 요청
+    assert isinstance(model.data(index, Qt.ToolTipRole), str)
+    assert model.poster_loader.pending_count() == 1
+
+    with qtbot.waitSignal(model.dataChanged, timeout=5000) as blocker:
+        client.release.set()
+    assert blocker.args[0].row() == 1
+    assert isinstance(model.data(index, Qt.ToolTipRole), QPixmap)
+    assert client.calls == ["/1.jpg"]
+
+
+def test_prefetch_requests_only_given_rows(qtbot, client, tmp_path):
+    from src.gui.table_models import DetailFileModel, ParsedItem
+
+    client.release.clear()
+    items = [
+        ParsedItem(sourcePath=f"/v/{i}.mkv", tmdbMatch=SimpleNamespace(poster_path=f"/{i}.jpg"))
+        for i in range(10)
+    ]
+    model = DetailFileModel(items, client)
+
+    model.prefetch_posters([0, 1, 2])
+    assert model.poster_loader.pending_count() == 3
+    # 뷰포트가 바뀌면 이전 대기 요청은 취소
+    model.prefetch_posters([7, 8])
+    assert model.poster_loader.pending_count() == 2
+    client.release.set()
+    model.poster_loader.shutdown()
+
+
+def test_viewport_prefetcher_targets_visible_rows(qtbot, client):
+    from PyQt5.QtWidgets import QTableView
+
+    from src.gui.managers.poster_loader import PosterViewportPrefetcher
+    from src.gui.table_models import DetailFileModel, ParsedItem
+
+    client.release.clear()
+    items = [
+        ParsedItem(sourcePath=f"/v/{i}.mkv", tmdbMatch=SimpleNamespace(poster_path=f"/{i}.jpg"))
+        for i in range(200)
+    ]
+    model = DetailFileModel(items, client)
+    requested: list[list[int]] = []
+    model.prefetch_posters = lambda rows: requested.append(rows)
+    view = QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    view.resize(400, 200)
+    PosterViewportPrefetcher(view, debounce_ms=10)
+    view.show()
+
+    qtbot.waitUntil(lambda: bool(requested), timeout=5000)
+    assert requested[-1][0] == 0
+    assert len(requested[-1]) < 20
+
+    view.scrollTo(model.index(150, 0))
+    qtbot.waitUntil(lambda: requested[-1][0] > 100, timeout=5000)
+    client.release.set()
+    model.poster_loader.shutdown()
@@ -0,0 +1,108 @@
+"""
+화질 분리 계획 (파일명 우선, 필요한 파일만 분석) 테스트
+"""
+
+import pytest
+
+from src.core.quality_planner import (
+    SOURCE_FILENAME,
+    SOURCE_PARSED,
+    SOURCE_PROBE,
+    QualitySeparationPlanner,
+    resolution_from_filename,
+)
+from src.gui.managers.anime_data_manager import ParsedItem
+
+
+class _RecordingProber:
+    """분석 요청을 기록하고 정해진 해상도를 돌려주는 대역"""
+
+    def __init__(self, resolutions=None):
+        self.resolutions = resolutions or {}
+        self.calls: list[list[str]] = []
+
+    def __call__(self, paths):
+        self.calls.append(sorted(paths))
+        return {path: self.resolutions.get(path) for path in paths}
+
+
+def _item(path, resolution=None):
+    return ParsedItem(sourcePath=path, resolution=resolution)
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("[Sub] Show - 01 [1080p].mkv", "1080p"),
+        ("Show.S01E02.2160p.WEB.mkv", "4K"),
+        ("Show - 03 (BD 1920x1080 HEVC).mkv", "1080p"),
+        ("Show - 04 [720p][1080p].mkv", "Unknown"),
+        ("Show - 05.mkv", "Unknown"),
+        ("Show 1080 - 06.mkv", "Unknown"),
+    ],
+)
+def test_resolution_from_filename(filename, expected):
+    assert resolution_from_filename(filename) == expected
+
+
+def test_filename_tags_decide_split_without_probing():
+    prober = _RecordingProber()
+    items = [
+        _item("/a/Show - 01 [1080p].mkv", "1080p"),
+        _item("/a/Show - 01 [720p].mkv"),
+        _item("/a/Show - 02 [4K].mkv", "4K"),
+    ]
+
+    plan = QualitySeparationPlanner(prober).plan({"show": items})
+
+    assert prober.calls == []
+    best = [d.source_path for d in plan["show"] if d.is_best]
+    assert best == ["/a/Show - 02 [4K].mkv"]
+    assert [d.source for d in plan["show"]] == [SOURCE_PARSED, SOURCE_FILENAME, SOURCE_PARSED]
+
+
+def test_only_ambiguous_or_conflicting_files_are_probed_in_one_batch():
+    prober = _RecordingProber(
+        {"/a/Show - 02.mkv": "1920x1080", "/b/Other - 01 [720p].mkv": "3840x2160"}
+    )
+    grouped = {
+        "show": [_item("/a/Show - 01 [1080p].mkv", "1080p"), _item("/a/Show - 02.mkv")],
+        # 파서 결과와 파일명이 다름
+        "other": [_item("/b/Other - 01 [720p].mkv", "1080p"), _item("/b/Other - 02 [1080p].mkv")],
+        # 파일이 하나뿐인 그룹은 분리할 필요가 없음
+        "single": [_item("/c/Lonely - 01.mkv")],
+    }
+
+    plan = QualitySeparationPlanner(prober).plan(grouped)
+
+    assert prober.calls == [["/a/Show - 02.mkv", "/b/Other - 01 [720p].mkv"]]
+    assert all(d.is_best for d in plan["show"])
+    assert plan["show"][1].source == SOURCE_PROBE
+    assert [d.is_best for d in plan["other"]] == [True, False]
+    assert plan["single"][0].is_best
+
+
+def test_resolved_quality_is_cached_on_the_item():
+    prober = _RecordingProber({"/a/Show - 02.mkv": "1280x720"})
+    items = [_item("/a/Show - 01 [1080p].mkv"), _item("/a/Show - 02.mkv")]
+    planner = QualitySeparationPlanner(prober)
+
+    planner.plan({"show": items})
+    plan = planner.plan({"show": items})
+
+    assert len(prober.calls) == 1
+    assert items[1].resolvedResolution == "720p"
+    assert items[1].resolutionSource == SOURCE_PROBE
+    assert [d.is_best for d in plan["show"]] == [True, False]
+
+
+def test_failed_probe_keeps_filename_claims():
+    def failing_prober(paths):
+        raise RuntimeError("probe failed")
+
+    items = [_item("/a/Show - 01 [720p].mkv", "1080p"), _item("/a/Show - 02 [720p].mkv")]
+
+    plan = QualitySeparationPlanner(failing_prober).plan({"show": items})
+
+    assert [d.resolution for d in plan["show"]] == ["1080p", "720p"]
+    assert [d.is_best for d in plan["show"]] == [True, False]
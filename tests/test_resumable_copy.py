@@ -0,0 +1,159 @@
+"""
+이어받기 가능한 원자적 파일 전송 테스트
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.core.utils import copy_engine, resumable_copy
+from src.core.utils.resumable_copy import (
+    TransferCancelledError,
+    checkpoint_path_for,
+    discard_partial,
+    find_pending_transfers,
+    load_checkpoint,
+    partial_path_for,
+)
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def buffered_copy(monkeypatch):
+    """청크 단위로 진행되도록 작은 버퍼의 사용자 공간 복사만 사용"""
+    monkeypatch.setattr(copy_engine, "_HAS_COPY_FILE_RANGE", False)
+    monkeypatch.setattr(copy_engine, "_HAS_SENDFILE", False)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "src" / "episode.mkv"
+    path.parent.mkdir()
+    path.write_bytes(os.urandom(5 * MB + 77))
+    return path
+
+
+def _cancel_after(limit: int):
+    cancel_event = threading.Event()
+    seen: list[int] = []
+
+    def progress(done: int, total: int) -> None:
+        seen.append(done)
+        if done >= limit:
+            cancel_event.set()
+
+    return cancel_event, progress, seen
+
+
+def _transfer(source: Path, destination: Path, **kwargs) -> int:
+    return resumable_copy.resumable_copy(
+        source, destination, checkpoint_interval=MB, buffer_size=256 * 1024, **kwargs
+    )
+
+
+def test_cancelled_move_resumes_from_checkpoint(tmp_path, source, buffered_copy):
+    content = source.read_bytes()
+    destination = tmp_path / "library" / "episode.mkv"
+    destination.parent.mkdir()
+    cancel_event, progress, _ = _cancel_after(2 * MB)
+
+    with pytest.raises(TransferCancelledError) as cancelled:
+        _transfer(
+            source,
+            destination,
+            remove_source=True,
+            progress_callback=progress,
+            cancel_event=cancel_event,
+        )
+
+    # 최종 이름에는 아무것도 나타나지 않고 원본은 그대로
+    assert not destination.exists()
+    assert source.exists()
+    checkpoint = load_checkpoint(destination)
+    assert checkpoint.bytes_done == cancelled.value.bytes_done >= 2 * MB
+    assert partial_path_for(destination).stat().st_size >= checkpoint.bytes_done
+
+    _, progress, seen = _cancel_after(len(content) + 1)
+    _transfer(source, destination, remove_source=True, progress_callback=progress)
+
+    assert seen[0] == checkpoint.bytes_done
+    assert destination.read_bytes() == content
+    assert not source.exists()
+    assert sorted(p.name for p in destination.parent.iterdir()) == [destination.name]
+
+
+def test_changed_source_restarts_from_zero(tmp_path, source, buffered_copy):
+    destination = tmp_path / "episode.mkv"
+    cancel_event, progress, _ = _cancel_after(2 * MB)
+    with pytest.raises(TransferCancelledError):
+        _transfer(source, destination, progress_callback=progress, cancel_event=cancel_event)
+
+    source.write_bytes(os.urandom(3 * MB))
+    _, progress, seen = _cancel_after(10 * MB)
+    _transfer(source, destination, progress_callback=progress)
+
+    assert seen[0] == 0
+    assert destination.read_bytes() == source.read_bytes()
+    assert not checkpoint_path_for(destination).exists()
+
+
+def test_unflushed_tail_after_checkpoint_is_discarded(tmp_path, source, buffered_copy):
+    destination = tmp_path / "episode.mkv"
+    cancel_event, progress, _ = _cancel_after(2 * MB)
+    with pytest.raises(TransferCancelledError):
+        _transfer(source, destination, progress_callback=progress, cancel_event=cancel_event)
+    # 충돌로 체크포인트 이후에 쓰레기가 기록된 상황
+    with partial_path_for(destination).open("ab") as f:
+        f.write(b"\0" * 4096)
+
+    _transfer(source, destination)
+    assert destination.read_bytes() == source.read_bytes()
+
+
+def test_interrupted_after_publish_only_removes_source(tmp_path, source, monkeypatch):
+    destination = tmp_path / "episode.mkv"
+    destination.write_bytes(source.read_bytes())
+    checkpoint = resumable_copy.TransferCheckpoint.for_source(source, destination, source.stat())
+    checkpoint.bytes_done = checkpoint.size
+    resumable_copy._save_checkpoint(destination, checkpoint)
+
+    def unexpected_copy(*args, **kwargs):
+        raise AssertionError("이미 교체된 파일을 다시 복사함")
+
+    monkeypatch.setattr(resumable_copy, "_copy_fds", unexpected_copy)
+    _transfer(source, destination, remove_source=True)
+
+    assert not source.exists()
+    assert not checkpoint_path_for(destination).exists()
+
+
+def test_pending_transfers_can_be_listed_and_discarded(tmp_path, source, buffered_copy):
+    destination = tmp_path / "Show" / "episode.mkv"
+    destination.parent.mkdir()
+    cancel_event, progress, _ = _cancel_after(MB)
+    with pytest.raises(TransferCancelledError):
+        _transfer(source, destination, progress_callback=progress, cancel_event=cancel_event)
+
+    assert find_pending_transfers(tmp_path) == []
+    pending = find_pending_transfers(tmp_path, recursive=True)
+    assert [Path(p.destination) for p in pending] == [destination]
+    assert 0 < pending[0].progress < 1
+
+    discard_partial(destination)
+    assert find_pending_transfers(tmp_path, recursive=True) == []
+    assert list(destination.parent.iterdir()) == []
+
+
+def test_corrupt_checkpoint_is_ignored(tmp_path, source):
+    destination = tmp_path / "episode.mkv"
+    checkpoint_path_for(destination).write_text("{not json", encoding="utf-8")
+    assert load_checkpoint(destination) is None
+    checkpoint_path_for(destination).write_text(json.dumps({"version": 99}), encoding="utf-8")
+    assert load_checkpoint(destination) is None
+
+    _transfer(source, destination)
+    assert destination.read_bytes() == source.read_bytes()
@@ -0,0 +1,115 @@
+"""
+디렉토리별 자막(사이드카) 색인 테스트
+"""
+
+from pathlib import Path
+
+from src.app.commands.file_commands import MoveFileCommand
+from src.core.utils.subtitle_utils import (
+    SidecarIndex,
+    find_subtitle_files,
+    get_subtitle_destination_path,
+)
+
+
+def _touch(directory: Path, *names: str) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (directory / name).write_bytes(b"x")
+
+
+def test_language_variants_are_associated(tmp_path):
+    _touch(
+        tmp_path,
+        "Show - 01.mkv",
+        "Show - 01.srt",
+        "Show - 01.ko.srt",
+        "Show - 01.en.forced.ass",
+        "Show - 01 [eng].ass",
+        "Show - 01.mkv.txt",
+        "Show - 01.nfo",
+        "Show - 010.srt",
+    )
+    names = [path.name for path in SidecarIndex().find(tmp_path / "Show - 01.mkv")]
+
+    assert names == [
+        "Show - 01 [eng].ass",
+        "Show - 01.en.forced.ass",
+        "Show - 01.ko.srt",
+        "Show - 01.mkv.txt",
+        "Show - 01.srt",
+    ]
+
+
+def test_subtitle_belongs_to_longest_matching_video(tmp_path):
+    _touch(tmp_path, "Show.mkv", "Show.srt", "Show - 01.mkv", "Show - 01.en.srt", "Show - 02.srt")
+    index = SidecarIndex()
+
+    assert [p.name for p in index.find(tmp_path / "Show.mkv")] == ["Show - 02.srt", "Show.srt"]
+    assert [p.name for p in index.find(tmp_path / "Show - 01.mkv")] == ["Show - 01.en.srt"]
+    # 디렉토리에 없는 비디오도 자기 이름의 자막은 찾음
+    assert [p.name for p in index.find(tmp_path / "Show - 02.mp4")] == ["Show - 02.srt"]
+
+
+def test_each_directory_is_listed_once_for_a_batch():
+    listed: list[Path] = []
+    names = [
+        f"Show - {number:04d}{extension}"
+        for number in range(1000)
+        for extension in (".mkv", ".ass")
+    ]
+
+    def lister(directory):
+        listed.append(directory)
+        return [(name, True) for name in names]
+
+    index = SidecarIndex(lister=lister)
+    videos = [Path("/in") / f"Show - {number:04d}.mkv" for number in range(1000)]
+    associations = index.associate(videos)
+
+    assert listed == [Path("/in")]
+    assert all(
+        subtitles == [video.with_suffix(".ass")] for video, subtitles in associations.items()
+    )
+
+
+def test_discarded_subtitles_are_not_found_again(tmp_path):
+    _touch(tmp_path, "ep.mkv", "ep.srt", "ep.ko.srt")
+    index = SidecarIndex()
+    index.discard(tmp_path / "ep.srt")
+    index.find(tmp_path / "ep.mkv")
+    index.discard(tmp_path / "ep.srt")
+
+    assert find_subtitle_files(tmp_path / "ep.mkv", index) == [str(tmp_path / "ep.ko.srt")]
+
+
+def test_subtitle_follows_renamed_video():
+    assert get_subtitle_destination_path("/in/ep.mkv", "/out/ep_1.mkv", "/in/ep.en.srt") == Path(
+        "/out/ep_1.en.srt"
+    )
+    assert get_subtitle_destination_path("/in/ep.mkv", "/out/ep.mkv", "/in/ep.srt") == Path(
+        "/out/ep.srt"
+    )
+
+
+def test_move_commands_share_one_index(tmp_path):
+    source = tmp_path / "in"
+    _touch(source, "ep01.mkv", "ep01.srt", "ep02.mkv", "ep02.ko.srt")
+    listed = []
+
+    def lister(directory):
+        listed.append(directory)
+        return [(path.name, path.is_file()) for path in directory.iterdir()]
+
+    index = SidecarIndex(lister=lister)
+    for name in ("ep01.mkv", "ep02.mkv"):
+        command = MoveFileCommand(source / name, tmp_path / "out" / name, sidecar_index=index)
+        assert command.execute().is_success
+
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "ep01.mkv",
+        "ep01.srt",
+        "ep02.ko.srt",
+        "ep02.mkv",
+    ]
+    assert listed == [source]
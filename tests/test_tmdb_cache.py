@@ -0,0 +1,107 @@
+"""
+TMDB 캐시 압축 저장 및 지연 로드 섹션 테스트
+"""
+
+from src.core.tmdb_cache import TMDBCacheManager
+from src.core.tmdb_models import TMDBAnimeInfo
+
+
+def _anime_info(**sections) -> TMDBAnimeInfo:
+    return TMDBAnimeInfo(
+        id=42,
+        name="테스트",
+        original_name="Test",
+        overview="",
+        first_air_date="2020-01-01",
+        last_air_date="",
+        number_of_seasons=1,
+        number_of_episodes=12,
+        status="",
+        type="",
+        popularity=0.0,
+        vote_average=0.0,
+        vote_count=0,
+        genres=[],
+        poster_path="/p.jpg",
+        backdrop_path="",
+        episode_run_time=[],
+        networks=[],
+        production_companies=[],
+        languages=[],
+        origin_country=[],
+        in_production=False,
+        last_episode_to_air=None,
+        next_episode_to_air=None,
+        seasons=[{"season_number": 1}],
+        external_ids={},
+        **sections,
+    )
+
+
+def test_large_payload_is_compressed_and_round_trips(tmp_path):
+    cache = TMDBCacheManager(tmp_path, compress_threshold=1024)
+    payload = {"cast": [{"name": f"actor {i}"} for i in range(500)]}
+
+    cache.set_cache("details_sections_42_ko-KR", payload)
+    cache.set_cache("season_42_1_ko-KR", {"name": "Season 1"})
+
+    assert (tmp_path / "details_sections_42_ko-KR.json.gz").exists()
+    assert (tmp_path / "season_42_1_ko-KR.json").exists()
+    assert cache.get_cache("details_sections_42_ko-KR") == payload
+
+    reopened = TMDBCacheManager(tmp_path, compress_threshold=1024)
+    assert reopened.get_cache("details_sections_42_ko-KR") == payload
+    assert sorted(reopened.get_cache_keys()) == [
+        "details_sections_42_ko-KR",
+        "season_42_1_ko-KR",
+    ]
+
+
+def test_cache_stats_report_per_show_footprint(tmp_path):
+    cache = TMDBCacheManager(tmp_path, compress_threshold=1024)
+    cache.set_cache("details_sections_42_ko-KR", {"cast": ["x" * 10] * 1000})
+    cache.set_cache("details_42_ko-KR", {"id": 42})
+    cache.set_cache("search_foo_None_False_None_ko-KR", [])
+
+    stats = cache.get_cache_stats()
+
+    assert stats["compressed_files"] == 1
+    show = stats["per_show"][42]
+    assert show["entries"] == 2
+    assert show["disk_bytes"] > 0
+    # 압축 항목은 메모리에서도 압축된 상태로 보관됨
+    assert 0 < show["memory_bytes"] < 10 * 1000
+
+
+def test_anime_info_sections_are_lazy(tmp_path):
+    info = _anime_info(credits={"cast": ["a"]})
+    assert info.credits == {"cast": ["a"]}
+    assert "credits" not in info.to_core_dict()
+
+    info.release_sections()
+    loaded = []
+    info.set_section_loader(lambda name: loaded.append(name) or {"section": name})
+
+    assert repr(info).startswith("TMDBAnimeInfo(")
+    assert loaded == []
+    assert info.credits == {"section": "credits"}
+    assert loaded == ["credits"]
+    assert TMDBAnimeInfo(**info.to_core_dict()).images == {}
+
+
+def test_lazy_sections_are_memoized_and_empty_sections_kept(tmp_path):
+    info = _anime_info(videos={})
+    loaded = []
+    info.set_section_loader(lambda name: loaded.append(name) or None)
+
+    # 빈 섹션도 값이 있는 것으로 보고 로더를 부르지 않음
+    assert info.videos == {}
+    assert info.to_sections_dict()["videos"] == {}
+    # 찾지 못한 섹션은 빈 섹션으로 기억되어 한 번만 로드
+    assert info.credits == {}
+    assert info.credits == {}
+    assert loaded == ["credits"]
+
+    info.release_sections()
+    assert info.credits == {}
+    assert loaded == ["credits", "credits"]
@@ -0,0 +1,131 @@
+"""
+TMDB 포스터 캐시 (내용 주소 저장, 크기 제한, 썸네일) 테스트
+
+로컬 HTTP 서버를 TMDB 이미지 서버 대역으로 사용합니다.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage
+
+from src.core.tmdb_image import THUMBNAIL_SIZES, THUMBNAIL_SOURCE_SIZE, TMDBImageManager
+
+
+def _jpeg(width: int, height: int, color: int) -> bytes:
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(color)
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "JPG", 90)
+    return bytes(data)
+
+
+class _StandInImageServer:
+    """요청 경로의 파일명으로 이미지를 돌려주는 로컬 이미지 서버 대역"""
+
+    def __init__(self):
+        self.images: dict[str, bytes] = {}
+        self.requests: list[str] = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                stand_in.requests.append(self.path)
+                body = stand_in.images.get(self.path.rsplit("/", 1)[-1])
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/t/p"
+
+
+@pytest.fixture
+def server():
+    stand_in = _StandInImageServer()
+    stand_in.thread.start()
+    yield stand_in
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+
+def test_thumbnails_are_generated_once_at_download_time(tmp_path, server):
+    server.images["a.jpg"] = _jpeg(342, 513, 0xFF0000)
+    manager = TMDBImageManager(tmp_path, base_url=server.base_url)
+
+    assert manager.get_cached_thumbnail_path("/a.jpg", "tooltip") is None
+    assert manager.download_poster("/a.jpg", THUMBNAIL_SOURCE_SIZE)
+
+    for variant, (width, height) in THUMBNAIL_SIZES.items():
+        thumbnail = manager.get_cached_thumbnail_path("/a.jpg", variant)
+        assert thumbnail is not None
+        image = QImage(thumbnail)
+        assert image.width() <= width and image.height() <= height
+        assert max(image.width() / width, image.height() / height) > 0.95
+
+    assert manager.get_thumbnail_path("/a.jpg", "card") is not None
+    assert len(server.requests) == 1
+
+
+def test_identical_images_are_stored_once(tmp_path, server):
+    content = _jpeg(154, 231, 0x00FF00)
+    server.images["shared.jpg"] = content
+    server.images["other_show.jpg"] = content
+    manager = TMDBImageManager(tmp_path, base_url=server.base_url)
+
+    first = manager.download_poster("/shared.jpg", "w154")
+    second = manager.download_poster("/other_show.jpg", "w154")
+
+    assert first == second
+    objects = [f for f in (tmp_path / "objects").rglob("*") if f.is_file()]
+    assert len(objects) == 1
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used(tmp_path, server):
+    for index in range(6):
+        server.images[f"p{index}.jpg"] = os.urandom(10_000)
+    manager = TMDBImageManager(tmp_path, max_cache_bytes=35_000, base_url=server.base_url)
+
+    paths = []
+    for index in range(3):
+        paths.append(manager.download_poster(f"/p{index}.jpg", "w185"))
+        # 먼저 받은 이미지일수록 오래 사용하지 않은 것으로 만듦
+        past = time.time() - 3600 * (10 - index)
+        os.utime(paths[-1], (past, past))
+    manager.download_poster("/p3.jpg", "w185")
+
+    info = manager.get_image_cache_info()
+    assert info["total_size_bytes"] <= 35_000
+    assert manager.get_cached_poster_path("/p0.jpg", "w185") is None
+    assert manager.get_cached_poster_path("/p3.jpg", "w185") is not None
+    assert not (tmp_path / "refs" / "w185_p0.jpg").exists()
+
+
+def test_legacy_flat_cache_files_are_migrated(tmp_path, server):
+    (tmp_path / "w185_old.jpg").write_bytes(b"legacy image")
+    manager = TMDBImageManager(tmp_path, base_url=server.base_url)
+
+    path = manager.get_poster_path("/old.jpg", "w185")
+
+    assert path is not None and "objects" in path
+    assert not (tmp_path / "w185_old.jpg").exists()
+    assert server.requests == []
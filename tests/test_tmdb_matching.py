@@ -0,0 +1,172 @@
+"""
+TMDB 자동 매칭과 표시 제목 선택 테스트
+"""
+
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.core.tmdb_client import TMDBClient
+from src.gui.managers.anime_data_manager import ParsedItem
+from src.gui.managers.tmdb_manager import TMDBManager
+
+TRANSLATIONS: dict[int, dict[str, Any]] = {
+    1: {
+        "translations": [
+            {"iso_639_1": "ko", "iso_3166_1": "KR", "data": {"name": "장송의 프리렌"}},
+            {
+                "iso_639_1": "en",
+                "iso_3166_1": "US",
+                "data": {"name": "Frieren: Beyond Journey's End"},
+            },
+            {"iso_639_1": "en", "iso_3166_1": "GB", "data": {"name": "Frieren (UK)"}},
+            {"iso_639_1": "ja", "iso_3166_1": "JP", "data": {"name": ""}},
+        ]
+    },
+    2: {"translations": []},
+}
+
+
+class _StubClient:
+    """검색/번역 호출 횟수를 기록하는 TMDBClient 대역"""
+
+    def __init__(self, results):
+        self.results = results
+        self.searches: list[tuple[str, str]] = []
+        self.translation_requests: list[int] = []
+
+    def search_anime(self, query, use_fallback=True, language="ko-KR"):
+        self.searches.append((query, language))
+        return self.results
+
+    def get_localized_names(self, tv_id, languages):
+        self.translation_requests.append(tv_id)
+        return TMDBClient.get_localized_names(_translations_client(), tv_id, languages)
+
+
+class _TranslationsClient(TMDBClient):
+    """번역 정보만 TRANSLATIONS에서 돌려주는 TMDBClient (네트워크/캐시 없음)"""
+
+    def __init__(self):
+        pass
+
+    def get_anime_translations(self, tv_id: int) -> dict[str, Any] | None:
+        return TRANSLATIONS.get(tv_id)
+
+
+def _translations_client() -> TMDBClient:
+    return _TranslationsClient()
+
+
+def _show(tv_id: int, name: str, original_name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=tv_id,
+        name=name,
+        original_name=original_name,
+        first_air_date="2023-09-29",
+        overview="",
+        poster_path="",
+        vote_average=9.0,
+        vote_count=100,
+        popularity=50.0,
+        media_type="tv",
+    )
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    def build(results, languages=("ko-KR", "en-US")):
+        tmdb_manager = TMDBManager.__new__(TMDBManager)
+        tmdb_manager.tmdb_client = _StubClient(results)
+        tmdb_manager.search_cache = {}
+        tmdb_manager.metadata_providers = {}
+        monkeypatch.setattr(tmdb_manager, "get_language_preference", lambda: list(languages))
+        return tmdb_manager
+
+    return build
+
+
+def _item(title: str) -> ParsedItem:
+    return ParsedItem(sourcePath=f"/in/{title} - 01.mkv", detectedTitle=title, title=title)
+
+
+def test_auto_match_searches_once_in_the_first_language(manager):
+    tmdb_manager = manager([_show(1, "Sousou no Frieren", "葬送のフリーレン")])
+
+    match = tmdb_manager.auto_match_anime(_item("Sousou no Frieren"))
+
+    assert match is not None
+    assert tmdb_manager.tmdb_client.searches == [("Sousou no Frieren", "ko-KR")]
+    assert match.localized_names["ko-KR"] == "장송의 프리렌"
+
+
+def test_translated_titles_are_scored(manager):
+    # 검색 결과 제목과는 맞지 않고 영어 번역 제목과만 일치
+    tmdb_manager = manager(
+        [_show(2, "Unrelated Show", "無関係"), _show(1, "葬送のフリーレン", "葬送のフリーレン")]
+    )
+
+    match = tmdb_manager.auto_match_anime(_item("Frieren: Beyond Journey's End"))
+
+    assert match is not None
+    assert match.tmdb_id == 1
+    assert match.confidence_score == 1.0
+    assert tmdb_manager.tmdb_client.translation_requests == [2, 1]
+
+
+def test_candidates_are_ranked_by_confidence_including_plugins(manager):
+    # TMDB 순서로는 4번째지만 제목이 정확히 일치하는 후보
+    tmdb_manager = manager(
+        [
+            _show(3, "Frieren Recap", "総集編"),
+            _show(4, "Fire Force", "炎炎ノ消防隊"),
+            _show(5, "Free!", "Free!"),
+            _show(1, "Sousou no Frieren", "葬送のフリーレン"),
+        ]
+    )
+
+    match = tmdb_manager.auto_match_anime(_item("Sousou no Frieren"))
+
+    assert match is not None
+    assert match.tmdb_id == 1
+    assert tmdb_manager.tmdb_client.translation_requests == [1]
+
+    plugin = SimpleNamespace(
+        is_available=lambda: True,
+        search_anime=lambda query, language: [{"id": 99, "title": "Sousou no Frieren"}],
+    )
+    tmdb_manager = manager([_show(3, "Frieren Recap", "総集編")])
+    tmdb_manager.metadata_providers = {"anidb": plugin}
+
+    match = tmdb_manager.auto_match_anime(_item("Sousou no Frieren"))
+
+    assert (match.tmdb_id, match.source) == (99, "anidb")
+    # 플러그인 결과의 ID는 TMDB ID가 아니므로 번역 정보를 조회하지 않음
+    assert tmdb_manager.tmdb_client.translation_requests == []
+
+
+def test_display_name_follows_language_preference_with_fallback(manager):
+    tmdb_manager = manager([_show(1, "Sousou no Frieren", "葬送のフリーレン")], ("ja-JP", "en-US"))
+
+    match = tmdb_manager.auto_match_anime(_item("Sousou no Frieren"))
+
+    # 일본어 번역 제목이 비어 있어 다음 언어(en-US)의 제목 사용
+    assert match.name == "Frieren: Beyond Journey's End"
+    # 우선순위의 어떤 언어에도 번역이 없으면 검색 결과 제목
+    original = replace(match, name="Sousou no Frieren")
+    assert tmdb_manager._select_display_name(original, ["de-DE"]) == "Sousou no Frieren"
+
+
+def test_localized_names_prefer_exact_region_then_language():
+    client = _translations_client()
+
+    names = client.get_localized_names(1, ["en-GB", "en-AU", "ko", "ja-JP"])
+
+    assert names == {
+        "en-GB": "Frieren (UK)",
+        "en-AU": "Frieren: Beyond Journey's End",
+        "ko": "장송의 프리렌",
+    }
+    assert client.get_localized_names(3, ["ko-KR"]) == {}
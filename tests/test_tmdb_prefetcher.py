@@ -0,0 +1,70 @@
+"""
+TMDB 시즌 프리페치 테스트
+"""
+
+import time
+
+from src.core.tmdb_prefetcher import TMDBSeasonPrefetcher
+from src.core.tmdb_rate_limiter import TMDBRateLimiter
+
+
+class _FakeClient:
+    """시즌 조회 횟수를 기록하는 TMDBClient 대역"""
+
+    language = "ko-KR"
+
+    def __init__(self):
+        self.rate_limiter = TMDBRateLimiter(requests_per_second=4, burst_limit=8)
+        self.seasons: dict[tuple[int, int, str], dict] = {}
+        self.calls: list[tuple[int, int, bool]] = []
+
+    def has_cached_season(self, tv_id, season_number, language=None):
+        return (tv_id, season_number, language or self.language) in self.seasons
+
+    def get_anime_season(self, tv_id, season_number, language=None, background=False):
+        self.calls.append((tv_id, season_number, background))
+        self.rate_limiter.record_request(success=True)
+        payload = {"episodes": [{"episode_number": n, "name": f"EP{n}"} for n in range(1, 25)]}
+        self.seasons[(tv_id, season_number, language or self.language)] = payload
+        return payload
+
+
+def test_prefetch_fetches_each_season_once_in_background():
+    client = _FakeClient()
+    prefetcher = TMDBSeasonPrefetcher(client)
+
+    assert prefetcher.prefetch_show(100, [2, 1]) == 2
+    prefetcher.prefetch_show(100, [1, 2])
+    assert prefetcher.wait_idle(timeout=5)
+
+    fetched = sorted({(tv_id, season) for tv_id, season, _bg in client.calls})
+    assert fetched == [(100, 1), (100, 2)]
+    assert all(background for _id, _season, background in client.calls)
+    assert len(client.calls) == 2
+    prefetcher.stop()
+
+
+def test_background_slot_yields_to_interactive_requests():
+    limiter = TMDBRateLimiter(requests_per_second=4, burst_limit=8)
+    limiter.wait_if_needed()
+
+    started = time.time()
+    assert limiter.wait_for_background_slot(quiet_period=0.3, poll_interval=0.01)
+    assert time.time() - started >= 0.25
+
+
+def test_background_slot_keeps_reserved_budget_for_interactive():
+    limiter = TMDBRateLimiter(requests_per_second=4, burst_limit=8)
+    for _ in range(3):
+        limiter.record_request(success=True)
+
+    started = time.time()
+    assert limiter.wait_for_background_slot(reserved=1, quiet_period=0, poll_interval=0.01)
+    assert time.time() - started >= 0.9
+
+
+def test_background_slot_can_be_cancelled():
+    limiter = TMDBRateLimiter(requests_per_second=4, burst_limit=8)
+    limiter.wait_if_needed()
+
+    assert not limiter.wait_for_background_slot(quiet_period=10, should_stop=lambda: True)
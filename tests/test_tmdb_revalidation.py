@@ -0,0 +1,128 @@
+"""
+TMDB 캐시 stale-while-revalidate 테스트
+
+로컬 HTTP 서버를 TMDB API 대역으로 사용하여 조건부 재검증 동작을 확인합니다.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.tmdb_cache import TMDBCacheManager
+from src.core.tmdb_revalidator import TMDBRevalidator
+
+
+class _StandInTMDB:
+    """ETag 기반 조건부 요청을 지원하는 로컬 TMDB 대역 서버"""
+
+    def __init__(self):
+        self.payload = {"id": 1, "name": "Season 1"}
+        self.etag = '"v1"'
+        self.requests: list[dict] = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                stand_in.requests.append(
+                    {"path": self.path, "if_none_match": self.headers.get("If-None-Match")}
+                )
+                if self.headers.get("If-None-Match") == stand_in.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", stand_in.etag)
+                    self.end_headers()
+                    return
+                body = json.dumps(stand_in.payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", stand_in.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/3"
+
+
+@pytest.fixture
+def stand_in():
+    server = _StandInTMDB()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TMDBCacheManager(tmp_path / "cache", cache_expiry=60, stale_ttl=3600)
+
+
+def _expire(cache: TMDBCacheManager, key: str) -> None:
+    entry = cache.get_cache_entry(key)
+    assert entry is not None
+    entry.stored_at = time.time() - 120
+
+
+def test_expired_entry_is_kept_and_served_as_stale(cache):
+    cache.set_cache("season_1_1_ko-KR", {"name": "old"})
+    _expire(cache, "season_1_1_ko-KR")
+
+    assert cache.get_cache("season_1_1_ko-KR") is None
+    entry = cache.get_cache_entry("season_1_1_ko-KR")
+    assert entry is not None
+    assert entry.data == {"name": "old"}
+
+
+def test_stale_entry_served_immediately_then_revalidated_with_304(cache, stand_in):
+    revalidator = TMDBRevalidator(cache, api_key="key", base_url=stand_in.base_url)
+    request = {"path": "tv/1/season/1", "params": {"language": "ko-KR"}}
+    cache.set_cache("season_1_1_ko-KR", stand_in.payload, etag='"v1"', request=request)
+    _expire(cache, "season_1_1_ko-KR")
+
+    assert revalidator.get("season_1_1_ko-KR") == stand_in.payload
+    assert revalidator.wait_idle(timeout=5)
+
+    assert stand_in.requests[0]["if_none_match"] == '"v1"'
+    assert stand_in.requests[0]["path"].startswith("/3/tv/1/season/1?")
+    assert revalidator.get_status()["not_modified"] == 1
+    assert cache.get_cache("season_1_1_ko-KR") == stand_in.payload
+    revalidator.shutdown()
+
+
+def test_changed_payload_replaces_entry_and_validator(cache, stand_in):
+    revalidator = TMDBRevalidator(cache, base_url=stand_in.base_url)
+    request = {"path": "tv/1/season/1", "params": {}}
+    cache.set_cache("season_1_1_ko-KR", {"name": "old"}, etag='"v0"', request=request)
+    _expire(cache, "season_1_1_ko-KR")
+
+    assert revalidator.get("season_1_1_ko-KR", transform=lambda d: {**d, "x": 1}) == {"name": "old"}
+    assert revalidator.wait_idle(timeout=5)
+
+    entry = cache.get_cache_entry("season_1_1_ko-KR")
+    assert entry.data == {**stand_in.payload, "x": 1}
+    assert entry.etag == '"v1"'
+    assert not entry.is_expired(cache.cache_expiry)
+    revalidator.shutdown()
+
+
+def test_concurrent_stale_reads_trigger_single_refresh(cache, stand_in):
+    revalidator = TMDBRevalidator(cache, base_url=stand_in.base_url)
+    cache.set_cache("translations_1", {"translations": []}, request={"path": "tv/1/translations"})
+    _expire(cache, "translations_1")
+
+    for _ in range(5):
+        revalidator.get("translations_1")
+    assert revalidator.wait_idle(timeout=5)
+
+    assert len(stand_in.requests) == 1
+    revalidator.shutdown()
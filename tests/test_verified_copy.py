@@ -0,0 +1,207 @@
+"""
+복사 중 검증 (단일 패스 해시) 테스트
+"""
+
+import hashlib
+import os
+import zlib
+from pathlib import Path
+
+import pytest
+
+from src.core.utils import verified_copy
+from src.core.utils.verified_copy import (
+    VerificationError,
+    VerificationMode,
+    copy_and_verify,
+    expected_crc32_from_filename,
+    resolve_verification_mode,
+)
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def content():
+    return os.urandom(3 * MB + 321)
+
+
+def _source(tmp_path, content, name="episode.mkv"):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def _corrupt_after_copy(monkeypatch, offset_of):
+    """복사 직후 대상 파일의 한 바이트를 바꾸는 _stream_copy"""
+    original = verified_copy._stream_copy
+
+    def corrupting_copy(source, destination, *args):
+        result = original(source, destination, *args)
+        with destination.open("r+b") as f:
+            f.seek(offset_of(result[0]))
+            byte = f.read(1)
+            f.seek(-1, os.SEEK_CUR)
+            f.write(bytes([byte[0] ^ 0xFF]))
+        return result
+
+    monkeypatch.setattr(verified_copy, "_stream_copy", corrupting_copy)
+
+
+def test_stream_copy_hashes_source_in_one_pass(tmp_path, content):
+    source = _source(tmp_path, content)
+    progress = []
+    result = copy_and_verify(
+        source,
+        tmp_path / "copy.mkv",
+        VerificationMode.STREAM,
+        buffer_size=MB,
+        progress_callback=lambda done, total: progress.append(done),
+    )
+
+    assert (tmp_path / "copy.mkv").read_bytes() == content
+    assert result.digest == hashlib.md5(content, usedforsecurity=False).hexdigest()
+    assert result.crc32 == f"{zlib.crc32(content):08X}"
+    assert result.verified and result.bytes_copied == len(content)
+    assert progress[-1] == len(content) and len(progress) == 4
+
+
+@pytest.mark.parametrize("mode", [VerificationMode.NONE, VerificationMode.SIZE])
+def test_cheap_modes_use_kernel_copy_without_hash(tmp_path, content, mode):
+    source = _source(tmp_path, content)
+    result = copy_and_verify(source, tmp_path / "copy.mkv", mode)
+
+    assert (tmp_path / "copy.mkv").read_bytes() == content
+    assert result.digest is None and result.crc32 is None
+
+
+def test_filename_crc32_is_checked(tmp_path, content):
+    crc = f"{zlib.crc32(content):08X}"
+    good = _source(tmp_path, content, f"[Group] Show - 01 [1080p][{crc}].mkv")
+    assert copy_and_verify(good, tmp_path / "good.mkv").verified
+
+    bad = _source(tmp_path, content, "[Group] Show - 02 [1080p][00000000].mkv")
+    with pytest.raises(VerificationError, match="CRC32"):
+        copy_and_verify(bad, tmp_path / "bad.mkv")
+    assert not (tmp_path / "bad.mkv").exists()
+
+    result = copy_and_verify(bad, tmp_path / "bad.mkv", strict_crc32=False)
+    # 복사본은 원본과 같으므로 남기고, 원본이 CRC와 다르다는 것만 알림
+    assert not result.verified
+    assert result.expected_crc32 == "00000000"
+    assert (tmp_path / "bad.mkv").read_bytes() == content
+
+
+def test_stream_mode_detects_corrupted_tail(tmp_path, content, monkeypatch):
+    source = _source(tmp_path, content)
+    _corrupt_after_copy(monkeypatch, lambda size: size - 10)
+
+    with pytest.raises(VerificationError):
+        copy_and_verify(source, tmp_path / "copy.mkv", VerificationMode.STREAM)
+    assert not (tmp_path / "copy.mkv").exists()
+
+
+def test_full_mode_detects_corruption_stream_samples_miss(tmp_path, content, monkeypatch):
+    source = _source(tmp_path, content)
+    _corrupt_after_copy(monkeypatch, lambda size: size // 2)
+
+    # 가운데는 stream 검증의 표본 구간 밖
+    copy_and_verify(source, tmp_path / "stream.mkv", VerificationMode.STREAM)
+    with pytest.raises(VerificationError):
+        copy_and_verify(source, tmp_path / "full.mkv", VerificationMode.FULL)
+    assert not (tmp_path / "full.mkv").exists()
+
+
+def test_verification_mode_per_operation_type():
+    assert resolve_verification_mode("backup") == VerificationMode.STREAM
+    assert resolve_verification_mode("copy") == VerificationMode.SIZE
+    assert resolve_verification_mode("COPY", {"copy": "full"}) == VerificationMode.FULL
+    assert resolve_verification_mode("copy", {"copy": "bogus"}) == VerificationMode.SIZE
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("[SubsPlease] Show - 01 (1080p) [A1B2C3D4].mkv", "A1B2C3D4"),
+        ("Show - 01 (deadbeef).mp4", "DEADBEEF"),
+        ("Show - 01 [1080p].mkv", None),
+        ("Show 12345678.mkv", None),
+    ],
+)
+def test_expected_crc32_from_filename(filename, expected):
+    assert expected_crc32_from_filename(filename) == expected
+
+
+def test_staging_reuses_stream_digest(tmp_path, content, monkeypatch):
+    from src.app.staging import staging_manager
+    from src.app.staging.staging_manager import StagingConfiguration, StagingManager
+
+    def unexpected_digest(path):
+        raise AssertionError("스테이징 파일을 다시 읽음")
+
+    monkeypatch.setattr(staging_manager, "file_digest", unexpected_digest)
+    manager = StagingManager(
+        StagingConfiguration(
+            staging_directory=tmp_path / "staging", temp_directory=tmp_path / "temp"
+        )
+    )
+    staged = manager.stage_file(_source(tmp_path, content), "move")
+
+    assert staged.checksum == hashlib.md5(content, usedforsecurity=False).hexdigest()
+    assert staged.staging_path.read_bytes() == content
+
+
+def test_staging_hashes_copy_when_mode_keeps_no_digest(tmp_path, content):
+    from src.app.staging.staging_manager import StagingConfiguration, StagingManager
+
+    manager = StagingManager(
+        StagingConfiguration(
+            staging_directory=tmp_path / "staging",
+            temp_directory=tmp_path / "temp",
+            verification_mode=VerificationMode.SIZE,
+        )
+    )
+    staged = manager.stage_file(_source(tmp_path, content), "move")
+
+    assert staged.checksum == hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+
+def test_staging_rejects_source_that_fails_filename_crc32(tmp_path, content):
+    from src.app.staging.staging_manager import StagingConfiguration, StagingManager
+
+    manager = StagingManager(
+        StagingConfiguration(
+            staging_directory=tmp_path / "staging", temp_directory=tmp_path / "temp"
+        )
+    )
+    source = _source(tmp_path, content, "[Group] Show - 01 [00000000].mkv")
+
+    with pytest.raises(VerificationError):
+        manager.stage_file(source, "move")
+    assert list((tmp_path / "staging" / "files").iterdir()) == []
+
+
+def test_backup_checksum_reuses_stream_digests(tmp_path, content, monkeypatch):
+    from src.app.safety import backup_manager
+    from src.app.safety.backup_manager import BackupConfiguration, BackupManager
+
+    folder = tmp_path / "Show"
+    folder.mkdir()
+    (folder / "01.mkv").write_bytes(content)
+    (folder / "02.mkv").write_bytes(content[::-1])
+    config = BackupConfiguration()
+    config.backup_directory = tmp_path / "backups"
+    manager = BackupManager(config)
+
+    def unexpected_digest(path):
+        raise AssertionError("백업 파일을 다시 읽음")
+
+    monkeypatch.setattr(backup_manager, "file_digest", unexpected_digest)
+    info = manager.create_backup([folder])
+
+    assert info is not None
+    checksum = hashlib.md5(usedforsecurity=False)
+    for name, data in (("01.mkv", content), ("02.mkv", content[::-1])):
+        checksum.update(str(Path("Show") / name).encode())
+        checksum.update(hashlib.md5(data, usedforsecurity=False).hexdigest().encode())
+    assert info.metadata["checksum"] == checksum.hexdigest()
@@ -0,0 +1,217 @@
+"""
+MKV/MP4 헤더 리더 테스트
+
+테스트 안에서 최소 구조의 합성 컨테이너를 만들어 검증합니다.
+ffprobe가 설치된 환경에서는 같은 파일에 대한 ffprobe 결과와도 비교합니다.
+"""
+
+import json
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from src.core.video_header_reader import read_video_header
+from src.core.video_metadata_extractor import VideoMetadataExtractor
+
+# ----------------------------------------------------------------------
+# Matroska 작성 도우미
+# ----------------------------------------------------------------------
+
+
+def _element(element_id: int, payload: bytes, unknown_size: bool = False) -> bytes:
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    if unknown_size:
+        return id_bytes + b"\x01\xff\xff\xff\xff\xff\xff\xff" + payload
+    # 8바이트 크기 표기 (0x01 + 7바이트)
+    return id_bytes + bytes([0x01]) + len(payload).to_bytes(7, "big") + payload
+
+
+def _uint(element_id: int, value: int) -> bytes:
+    return _element(element_id, value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big"))
+
+
+def _mkv(
+    width: int,
+    height: int,
+    codec_id: str,
+    duration_ms: float,
+    doc_type: str = "matroska",
+    tracks_after_cluster: bool = False,
+    with_audio_first: bool = True,
+) -> bytes:
+    ebml = _element(0x1A45DFA3, _uint(0x4286, 1) + _element(0x4282, doc_type.encode()))
+    info = _element(
+        0x1549A966, _uint(0x2AD7B1, 1_000_000) + _element(0x4489, struct.pack(">d", duration_ms))
+    )
+    entries = b""
+    if with_audio_first:
+        entries += _element(0xAE, _uint(0xD7, 1) + _uint(0x83, 2) + _element(0x86, b"A_AAC"))
+    video = _element(0xE0, _uint(0xB0, width) + _uint(0xBA, height))
+    entries += _element(
+        0xAE, _uint(0xD7, 2) + _uint(0x83, 1) + _element(0x86, codec_id.encode()) + video
+    )
+    tracks = _element(0x1654AE6B, entries)
+    cluster = _element(0x1F43B675, _uint(0xE7, 0) + _element(0xA3, b"\0" * 4096))
+
+    if not tracks_after_cluster:
+        return ebml + _element(0x18538067, info + tracks + cluster, unknown_size=True)
+
+    # SeekHead가 클러스터 뒤의 Tracks를 가리키는 구조
+    def seek_head(tracks_offset: int) -> bytes:
+        seek = _element(0x53AB, (0x1654AE6B).to_bytes(4, "big")) + _element(
+            0x53AC, tracks_offset.to_bytes(8, "big")
+        )
+        return _element(0x114D9B74, _element(0x4DBB, seek))
+
+    placeholder = seek_head(0)
+    tracks_offset = len(placeholder) + len(info) + len(cluster)
+    body = seek_head(tracks_offset) + info + cluster + tracks
+    return ebml + _element(0x18538067, body)
+
+
+# ----------------------------------------------------------------------
+# MP4 작성 도우미
+# ----------------------------------------------------------------------
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _full_box(box_type: bytes, version: int, payload: bytes) -> bytes:
+    return _box(box_type, bytes([version, 0, 0, 0]) + payload)
+
+
+def _mp4_track(handler: bytes, sample_entry: bytes, width: int, height: int, version: int) -> bytes:
+    if version == 1:
+        tkhd_body = struct.pack(">QQII", 0, 0, 1, 0) + struct.pack(">Q", 0)
+    else:
+        tkhd_body = struct.pack(">IIII", 0, 0, 1, 0) + struct.pack(">I", 0)
+    tkhd_body += b"\0" * 8 + b"\0" * 8 + b"\0" * 36 + struct.pack(">II", width << 16, height << 16)
+    tkhd = _full_box(b"tkhd", version, tkhd_body)
+    mdhd = _full_box(b"mdhd", 0, struct.pack(">IIII", 0, 0, 1000, 0) + b"\0" * 4)
+    hdlr = _full_box(b"hdlr", 0, b"\0" * 4 + handler + b"\0" * 12 + b"\0")
+    if handler == b"vide":
+        visual = b"\0" * 6 + struct.pack(">H", 1) + b"\0" * 16 + struct.pack(">HH", width, height)
+        visual += b"\0" * 50
+        entry = _box(sample_entry, visual)
+    else:
+        entry = _box(sample_entry, b"\0" * 28)
+    stsd = _full_box(b"stsd", 0, struct.pack(">I", 1) + entry)
+    stbl = _box(b"stbl", stsd)
+    minf = _box(b"minf", stbl)
+    mdia = _box(b"mdia", mdhd + hdlr + minf)
+    return _box(b"trak", tkhd + mdia)
+
+
+def _mp4(
+    width: int,
+    height: int,
+    sample_entry: bytes,
+    duration_s: float,
+    moov_at_end: bool = False,
+    version: int = 0,
+) -> bytes:
+    ftyp = _box(b"ftyp", b"isom" + struct.pack(">I", 512) + b"isomiso2mp41")
+    if version == 1:
+        mvhd_body = struct.pack(">QQIQ", 0, 0, 1000, int(duration_s * 1000))
+    else:
+        mvhd_body = struct.pack(">IIII", 0, 0, 1000, int(duration_s * 1000))
+    mvhd = _full_box(b"mvhd", version, mvhd_body + b"\0" * 80)
+    audio = _mp4_track(b"soun", b"mp4a", 0, 0, version)
+    video = _mp4_track(b"vide", sample_entry, width, height, version)
+    moov = _box(b"moov", mvhd + audio + video)
+    mdat = _box(b"mdat", b"\0" * 8192)
+    return ftyp + (mdat + moov if moov_at_end else moov + mdat)
+
+
+CORPUS = {
+    "h264_1080p.mkv": (
+        _mkv(1920, 1080, "V_MPEG4/ISO/AVC", 1_420_500.0),
+        (1920, 1080, "h264", "1420.500000"),
+    ),
+    "hevc_2160p.mkv": (
+        _mkv(3840, 2160, "V_MPEGH/ISO/HEVC", 60_000.0, tracks_after_cluster=True),
+        (3840, 2160, "hevc", "60.000000"),
+    ),
+    "vp9_720p.webm": (
+        _mkv(1280, 720, "V_VP9", 5_000.0, doc_type="webm"),
+        (1280, 720, "vp9", "5.000000"),
+    ),
+    "av1_480p.mkv": (
+        _mkv(854, 480, "V_AV1", 1_000.0, with_audio_first=False),
+        (854, 480, "av1", "1.000000"),
+    ),
+    "h264_720p.mp4": (_mp4(1280, 720, b"avc1", 24.0), (1280, 720, "h264", "24.000000")),
+    "hevc_1080p.mp4": (
+        _mp4(1920, 1080, b"hvc1", 1440.0, moov_at_end=True, version=1),
+        (1920, 1080, "hevc", "1440.000000"),
+    ),
+}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    paths = {}
+    for name, (content, _expected) in CORPUS.items():
+        path = tmp_path / name
+        path.write_bytes(content)
+        paths[name] = path
+    return paths
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_header_reader_extracts_video_stream(corpus, name):
+    width, height, codec_name, duration = CORPUS[name][1]
+
+    metadata = read_video_header(corpus[name])
+
+    assert metadata is not None
+    assert (metadata["width"], metadata["height"]) == (width, height)
+    assert metadata["codec_name"] == codec_name
+    assert metadata["duration"] == duration
+
+
+def test_unsupported_or_truncated_files_return_none(tmp_path):
+    avi = tmp_path / "movie.avi"
+    avi.write_bytes(b"RIFF" + b"\0" * 4 + b"AVI LIST" + b"\0" * 64)
+    truncated = tmp_path / "broken.mkv"
+    truncated.write_bytes(CORPUS["h264_1080p.mkv"][0][:40])
+    empty = tmp_path / "empty.mp4"
+    empty.write_bytes(b"")
+
+    assert read_video_header(avi) is None
+    assert read_video_header(truncated) is None
+    assert read_video_header(empty) is None
+    assert read_video_header(tmp_path / "missing.mkv") is None
+
+
+def test_extractor_reads_headers_without_ffprobe(corpus, monkeypatch):
+    extractor = VideoMetadataExtractor(use_persistent_cache=False)
+    monkeypatch.setattr(extractor, "_run_ffprobe", lambda path: pytest.fail("ffprobe 실행됨"))
+    paths = [str(path) for path in corpus.values()]
+
+    high, low = extractor.classify_files_by_quality(paths)
+
+    assert high == [str(corpus["hevc_2160p.mkv"])]
+    assert len(low) == len(paths) - 1
+    assert extractor.extract_resolution(str(corpus["h264_720p.mp4"])) == "1280x720"
+
+
+@pytest.mark.skipif(shutil.which("ffprobe") is None, reason="ffprobe가 설치되어 있지 않음")
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_header_reader_matches_ffprobe(corpus, name):
+    result = subprocess.run(
+        ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_streams", str(corpus[name])],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    streams = json.loads(result.stdout)["streams"]
+    video = next(s for s in streams if s.get("codec_type") == "video")
+    metadata = read_video_header(corpus[name])
+
+    assert (metadata["width"], metadata["height"]) == (video["width"], video["height"])
+    assert metadata["codec_name"] == video["codec_name"]
@@ -0,0 +1,175 @@
+"""
+비디오 메타데이터 추출기의 ffprobe 탐색, 분석 캐시, 병렬 분석 테스트
+
+실제 ffprobe 대신 호출 횟수를 기록하는 대역 스크립트를 사용합니다.
+"""
+
+import json
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+from src.core import video_metadata_extractor as vme
+from src.core.video_metadata_extractor import MediaQuality, VideoMetadataExtractor
+
+_FAKE_FFPROBE = """#!{python}
+import json, os, sys, time
+path = sys.argv[-1]
+with open({log!r}, "a", encoding="utf-8") as log:
+    log.write(f"{{time.monotonic()}} start {{path}}\\n")
+time.sleep({delay})
+height = 2160 if "4k" in os.path.basename(path) else 1080
+width = height * 16 // 9
+print(json.dumps({{
+    "streams": [{{"codec_type": "video", "codec_name": "hevc", "width": width, "height": height}}],
+    "format": {{"size": str(os.path.getsize(path)), "duration": "1420.5"}},
+}}))
+with open({log!r}, "a", encoding="utf-8") as log:
+    log.write(f"{{time.monotonic()}} end {{path}}\\n")
+"""
+
+
+@pytest.fixture
+def fake_ffprobe(tmp_path, monkeypatch):
+    log_file = tmp_path / "ffprobe.log"
+    script = tmp_path / "bin" / "ffprobe"
+    script.parent.mkdir()
+    script.write_text(
+        _FAKE_FFPROBE.format(python=sys.executable, log=str(log_file), delay=0.2),
+        encoding="utf-8",
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv(vme.FFPROBE_ENV_VAR, str(script))
+    vme.find_ffprobe(refresh=True)
+    yield log_file
+    monkeypatch.delenv(vme.FFPROBE_ENV_VAR)
+    vme.find_ffprobe(refresh=True)
+
+
+def _calls(log_file) -> list[str]:
+    if not log_file.exists():
+        return []
+    return [
+        line.split(" ", 2)[2] for line in log_file.read_text().splitlines() if " start " in line
+    ]
+
+
+def _videos(tmp_path, names):
+    paths = []
+    for name in names:
+        path = tmp_path / "videos" / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"\0" * 1024)
+        paths.append(str(path))
+    return paths
+
+
+def test_ffprobe_is_located_once_per_process(fake_ffprobe, monkeypatch):
+    lookups = []
+    original = vme._ffprobe_candidates
+    monkeypatch.setattr(vme, "_ffprobe_candidates", lambda: lookups.append(1) or original())
+    vme.find_ffprobe(refresh=True)
+
+    for _ in range(3):
+        VideoMetadataExtractor(use_persistent_cache=False)
+    assert len(lookups) == 1
+
+
+def test_probe_results_persist_across_instances(tmp_path, fake_ffprobe):
+    cache_file = tmp_path / "cache" / "probe.json"
+    (video,) = _videos(tmp_path, ["show_4k.mkv"])
+
+    first = VideoMetadataExtractor(cache_file=cache_file)
+    assert first.extract_resolution(video) == "3840x2160"
+    assert first.extract_video_metadata(video)["codec_name"] == "hevc"
+    assert len(_calls(fake_ffprobe)) == 1
+    first.flush_cache()
+
+    second = VideoMetadataExtractor(cache_file=cache_file)
+    assert second.extract_resolution(video) == "3840x2160"
+    assert len(_calls(fake_ffprobe)) == 1
+
+
+def test_single_probes_are_written_once_per_flush(tmp_path, fake_ffprobe, monkeypatch):
+    cache_file = tmp_path / "probe.json"
+    videos = _videos(tmp_path, ["a.mkv", "b.mkv"])
+    extractor = VideoMetadataExtractor(cache_file=cache_file)
+    writes = []
+    original = vme.atomic_write_bytes
+    monkeypatch.setattr(
+        vme, "atomic_write_bytes", lambda *args: writes.append(args[0]) or original(*args)
+    )
+
+    for video in videos:
+        extractor.extract_resolution(video)
+    assert writes == []
+    assert not cache_file.exists()
+
+    vme._flush_probe_caches()
+    assert writes == [cache_file]
+    assert set(json.loads(cache_file.read_text(encoding="utf-8"))["entries"]) == set(videos)
+
+
+def test_changed_file_is_probed_again(tmp_path, fake_ffprobe):
+    cache_file = tmp_path / "probe.json"
+    (video,) = _videos(tmp_path, ["episode.mkv"])
+    extractor = VideoMetadataExtractor(cache_file=cache_file)
+    extractor.extract_resolution(video)
+
+    later = time.time() + 10
+    os.utime(video, (later, later))
+    VideoMetadataExtractor(cache_file=cache_file).extract_resolution(video)
+
+    assert len(_calls(fake_ffprobe)) == 2
+
+
+def test_classification_probes_misses_in_parallel(tmp_path, fake_ffprobe):
+    names = [f"ep{index:02d}.mkv" for index in range(6)] + ["ep_4k.mkv"]
+    videos = _videos(tmp_path, names)
+    extractor = VideoMetadataExtractor(cache_file=tmp_path / "probe.json", max_workers=4)
+
+    started = time.monotonic()
+    high, low = extractor.classify_files_by_quality(videos)
+    elapsed = time.monotonic() - started
+
+    assert high == [videos[-1]]
+    assert sorted(low) == sorted(videos[:-1])
+    assert sorted(_calls(fake_ffprobe)) == sorted(videos)
+    # 7개 × 0.2초를 순차로 실행하면 1.4초 이상 걸림
+    assert elapsed < 1.2
+
+    summary = extractor.get_quality_summary(videos)
+    assert summary["quality_distribution"][MediaQuality.FHD_1080P.value] == 6
+    assert len(_calls(fake_ffprobe)) == len(videos)
+
+
+def test_filename_guess_without_ffprobe(tmp_path, monkeypatch):
+    monkeypatch.setattr(vme, "_ffprobe_candidates", list)
+    vme.find_ffprobe(refresh=True)
+    try:
+        (video,) = _videos(tmp_path, ["[Sub] Show - 01 [1080p].mkv"])
+        extractor = VideoMetadataExtractor(use_persistent_cache=False)
+        assert extractor.extract_resolution(video) is not None
+        assert extractor.probe_files([video]) == {video: None}
+    finally:
+        monkeypatch.undo()
+        vme.find_ffprobe(refresh=True)
+
+
+def test_probe_cache_flush_merges_with_other_writers(tmp_path):
+    cache_file = tmp_path / "probe.json"
+    first_video, second_video = _videos(tmp_path, ["a.mkv", "b.mkv"])
+    first = vme.VideoProbeCache(cache_file)
+    second = vme.VideoProbeCache(cache_file)
+
+    first.put(first_video, {"width": 1920, "height": 1080})
+    first.flush()
+    second.put(second_video, {"width": 1280, "height": 720})
+    second.flush()
+
+    entries = json.loads(cache_file.read_text(encoding="utf-8"))["entries"]
+    assert set(entries) == {first_video, second_video}
+    assert second.get(first_video) == {"width": 1920, "height": 1080}